@@ -17,6 +17,7 @@ from typing import (
     Iterator,
     Union,
     Set,
+    TypeVar,
 )
 
 import agate
@@ -49,7 +50,7 @@ from dbt.events.types import (
     CodeExecution,
     CodeExecutionStatus,
 )
-from dbt.utils import filter_null_values, executor
+from dbt.utils import filter_null_values, executor, lowercase
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -64,10 +65,14 @@ from dbt.adapters.cache import RelationsCache, _make_key
 
 
 SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
+T = TypeVar("T")
 
 
 GET_CATALOG_MACRO_NAME = "get_catalog"
+GET_CATALOG_VERSIONS_MACRO_NAME = "get_catalog_versions"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+# the most schemas to list in one list_relations_in_schemas query
+LIST_RELATIONS_BATCH_SIZE = 100
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -127,6 +132,10 @@ def _relation_name(rel: Optional[BaseRelation]) -> str:
         return str(rel)
 
 
+def _batched(items: List[T], size: int) -> List[List[T]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
 class BaseAdapter(metaclass=AdapterMeta):
     """The BaseAdapter provides an abstract base class for adapters.
 
@@ -233,7 +242,7 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     @available.parse(lambda *a, **k: ("", empty_table()))
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, columnar: bool = False
     ) -> Tuple[AdapterResponse, agate.Table]:
         """Execute the given SQL. This is a thin wrapper around
         ConnectionManager.execute.
@@ -242,9 +251,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         :param bool auto_begin: If set, and dbt is not currently inside a
             transaction, automatically begin one.
         :param bool fetch: If set, fetch results.
+        :param bool columnar: If set, return the results as a ColumnarTable,
+            which infers the types of its columns when they're read.
         :return: A tuple of the query status and results (empty if fetch=False).
         :rtype: Tuple[AdapterResponse, agate.Table]
         """
+        if columnar:
+            return self.connections.execute(
+                sql=sql, auto_begin=auto_begin, fetch=fetch, columnar=columnar
+            )
+        # connection managers that predate columnar results don't accept it
         return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch)
 
     @available.parse(lambda *a, **k: ("", empty_table()))
@@ -369,20 +385,37 @@ class BaseAdapter(metaclass=AdapterMeta):
             cache_schemas = self._get_cache_schemas(manifest)
         with executor(self.config) as tpe:
             futures: List[Future[List[BaseRelation]]] = []
-            for cache_schema in cache_schemas:
-                fut = tpe.submit_connected(
-                    self,
-                    f"list_{cache_schema.database}_{cache_schema.schema}",
-                    self.list_relations_without_caching,
-                    cache_schema,
-                )
-                futures.append(fut)
+            if self.supports_bulk_list_relations():
+                # a few queries over the whole information schema, instead
+                # of one query per schema
+                schema_map = SchemaSearchMap()
+                for cache_schema in cache_schemas:
+                    schema_map.add(cache_schema)
+                for information_schema, schemas in schema_map.items():
+                    batches = _batched(list(schemas), LIST_RELATIONS_BATCH_SIZE)
+                    for number, batch in enumerate(batches):
+                        fut = tpe.submit_connected(
+                            self,
+                            f"list_{information_schema.database}_{number}",
+                            self.list_relations_in_schemas,
+                            information_schema,
+                            set(batch),
+                        )
+                        futures.append(fut)
+            else:
+                for cache_schema in cache_schemas:
+                    fut = tpe.submit_connected(
+                        self,
+                        f"list_{cache_schema.database}_{cache_schema.schema}",
+                        self.list_relations_without_caching,
+                        cache_schema,
+                    )
+                    futures.append(fut)
 
             for future in as_completed(futures):
                 # if we can't read the relations we need to just raise anyway,
                 # so just call future.result() and let that raise on failure
-                for relation in future.result():
-                    self.cache.add(relation)
+                self.cache.add_many(future.result())
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
@@ -554,6 +587,30 @@ class BaseAdapter(metaclass=AdapterMeta):
             "`list_relations_without_caching` is not implemented for this " "adapter!"
         )
 
+    @classmethod
+    def supports_bulk_list_relations(cls) -> bool:
+        """Whether list_relations_in_schemas is implemented. If it isn't, the
+        cache is filled with one list_relations_without_caching call per
+        schema.
+        """
+        return False
+
+    def list_relations_in_schemas(
+        self, information_schema: InformationSchema, schemas: Set[Optional[str]]
+    ) -> List[BaseRelation]:
+        """List relations in many schemas of one database at once, bypassing
+        the cache. Adapters that implement this should also override
+        supports_bulk_list_relations.
+
+        :param information_schema: The information schema of the database
+        :param schemas: The lowercased names of the schemas to list
+        :return: The relations in all of the schemas
+        :rtype: List[self.Relation]
+        """
+        raise NotImplementedException(
+            "`list_relations_in_schemas` is not implemented for this adapter!"
+        )
+
     ###
     # Methods about grants
     ###
@@ -827,6 +884,32 @@ class BaseAdapter(metaclass=AdapterMeta):
         else:
             return column
 
+    @available
+    @classmethod
+    def supports_bulk_load(cls) -> bool:
+        """Whether bulk_load is implemented. If it isn't, seeds are loaded
+        with batches of insert statements.
+        """
+        return False
+
+    @available
+    def bulk_load(
+        self, relation: BaseRelation, agate_table: agate.Table, column_names: str
+    ) -> str:
+        """Load the rows of a table into an existing relation with the
+        database's own bulk loader. Adapters that implement this should also
+        override supports_bulk_load.
+
+        :param relation: The relation to load the rows into
+        :param agate_table: The rows to load. A seed's rows should be read
+            with agate_helper.iter_row_chunks, so they aren't all read from
+            the file at once.
+        :param column_names: The quoted names of the relation's columns, in
+            the order of the table's columns, separated by commas
+        :return: The statement that loaded the rows
+        """
+        raise NotImplementedException("`bulk_load` is not implemented for this adapter!")
+
     ###
     # Conversions: These must be implemented by concrete implementations, for
     # converting agate types into their sql equivalents.
@@ -1029,11 +1112,45 @@ class BaseAdapter(metaclass=AdapterMeta):
         return results
 
     def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
+        exceptions: List[Exception] = []
+        tables = list(self._iter_catalog_tables(manifest, exceptions))
+        return merge_tables(tables), exceptions
+
+    def get_catalog_tables(
+        self,
+        manifest: Manifest,
+        exceptions: List[Exception],
+        only_schemas: Optional[Set[Tuple[Optional[str], str]]] = None,
+    ) -> Iterator[agate.Table]:
+        """Yield the catalog of each information schema as soon as it's been
+        read, instead of merging them into one table like get_catalog does.
+        The exceptions raised while reading them are added to exceptions.
+
+        If only_schemas is given, only the schemas whose lowercased
+        (database, schema) are in it are read.
+        """
+        if type(self).get_catalog is not BaseAdapter.get_catalog:
+            # the adapter builds its catalog its own way
+            catalog, errors = self.get_catalog(manifest)
+            exceptions.extend(errors)
+            yield catalog
+            return
+        yield from self._iter_catalog_tables(manifest, exceptions, only_schemas)
+
+    def _iter_catalog_tables(
+        self,
+        manifest: Manifest,
+        exceptions: List[Exception],
+        only_schemas: Optional[Set[Tuple[Optional[str], str]]] = None,
+    ) -> Iterator[agate.Table]:
         schema_map = self._get_catalog_schemas(manifest)
 
         with executor(self.config) as tpe:
             futures: List[Future[agate.Table]] = []
             for info, schemas in schema_map.items():
+                if only_schemas is not None:
+                    database = lowercase(info.database)
+                    schemas = {s for s in schemas if (database, s) in only_schemas}
                 if len(schemas) == 0:
                     continue
                 name = ".".join([str(info.database), "information_schema"])
@@ -1043,9 +1160,57 @@ class BaseAdapter(metaclass=AdapterMeta):
                 )
                 futures.append(fut)
 
-            catalogs, exceptions = catch_as_completed(futures)
+            yield from iter_as_completed(futures, exceptions)
+
+    @classmethod
+    def supports_incremental_catalog(cls) -> bool:
+        """Whether the get_catalog_versions macro is implemented. If it isn't,
+        docs generate --incremental reads the whole catalog.
+        """
+        return False
 
-        return catalogs, exceptions
+    def _get_one_catalog_versions(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+    ) -> agate.Table:
+        kwargs = {"information_schema": information_schema, "schemas": schemas}
+        table = self.execute_macro(
+            GET_CATALOG_VERSIONS_MACRO_NAME,
+            kwargs=kwargs,
+            manifest=manifest,
+        )
+        return self._catalog_filter_table(table, manifest)
+
+    def get_catalog_versions(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
+        """Get a version of each relation in the catalog's schemas, which
+        changes whenever anything get_catalog returns for the relation does.
+        Adapters that implement this should also override
+        supports_incremental_catalog.
+
+        :return: A table with table_database, table_schema, table_name and
+            relation_version columns, and the exceptions raised reading it
+        """
+        if not self.supports_incremental_catalog():
+            raise NotImplementedException(
+                "`get_catalog_versions` is not implemented for this adapter!"
+            )
+        schema_map = self._get_catalog_schemas(manifest)
+
+        with executor(self.config) as tpe:
+            futures: List[Future[agate.Table]] = []
+            for info, schemas in schema_map.items():
+                if len(schemas) == 0:
+                    continue
+                name = ".".join([str(info.database), "information_schema"])
+
+                fut = tpe.submit_connected(
+                    self, name, self._get_one_catalog_versions, info, schemas, manifest
+                )
+                futures.append(fut)
+
+            return catch_as_completed(futures)
 
     def cancel_open_connections(self):
         """Cancel all open connections."""
@@ -1257,23 +1422,26 @@ def catch_as_completed(
     futures,  # typing: List[Future[agate.Table]]
 ) -> Tuple[agate.Table, List[Exception]]:
 
-    # catalogs: agate.Table = agate.Table(rows=[])
-    tables: List[agate.Table] = []
     exceptions: List[Exception] = []
+    tables = list(iter_as_completed(futures, exceptions))
+    return merge_tables(tables), exceptions
+
 
+def iter_as_completed(
+    futures,  # typing: List[Future[agate.Table]]
+    exceptions: List[Exception],
+) -> Iterator[agate.Table]:
     for future in as_completed(futures):
         exc = future.exception()
         # we want to re-raise on ctrl+c and BaseException
         if exc is None:
-            catalog = future.result()
-            tables.append(catalog)
+            yield future.result()
         elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
             raise exc
         else:
             warn_or_error(f"Encountered an error while generating catalog: {str(exc)}")
             # exc is not None, derives from Exception, and isn't ctrl+c
             exceptions.append(exc)
-    return merge_tables(tables), exceptions
 
 
 def log_code_execution(code_execution_function):
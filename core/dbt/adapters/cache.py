@@ -5,7 +5,7 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from dbt.adapters.reference_keys import _make_key, _ReferenceKey
 import dbt.exceptions
-from dbt.events.functions import fire_event
+from dbt.events.functions import event_enabled, fire_event, fire_lazy_event
 from dbt.events.types import (
     AddLink,
     AddRelation,
@@ -321,13 +321,30 @@ class RelationsCache:
         :param BaseRelation relation: The underlying relation.
         """
         cached = _CachedRelation(relation)
-        fire_event(AddRelation(relation=_make_key(cached)))
+        fire_lazy_event(AddRelation, lambda: AddRelation(relation=_make_key(cached)))
         fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
 
         with self.lock:
             self._setdefault(cached)
         fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
 
+    def add_many(self, relations: Iterable[Any]) -> None:
+        """Add many relations to the cache at once, holding the lock once and
+        dumping the graph once instead of once per relation.
+
+        :param Iterable[BaseRelation] relations: The underlying relations.
+        """
+        cached_relations = [_CachedRelation(relation) for relation in relations]
+        if event_enabled(AddRelation):
+            for cached in cached_relations:
+                fire_event(AddRelation(relation=_make_key(cached)))
+        fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        with self.lock:
+            for cached in cached_relations:
+                self._setdefault(cached)
+        fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
         cascade!
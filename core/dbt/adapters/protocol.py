@@ -55,6 +55,16 @@ class RelationProtocol(Protocol):
     ) -> Self:
         ...
 
+    @classmethod
+    def create(
+        cls: Type[Self],
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        identifier: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Self:
+        ...
+
 
 class CompilerProtocol(Protocol):
     def compile(self, manifest: Manifest, write=True) -> Graph:
@@ -156,7 +166,7 @@ class AdapterProtocol(  # type: ignore[misc]
         ...
 
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, columnar: bool = False
     ) -> Tuple[AdapterResponse, agate.Table]:
         ...
 
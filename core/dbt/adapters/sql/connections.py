@@ -8,7 +8,7 @@ import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.adapters.base import BaseConnectionManager
 from dbt.contracts.connection import Connection, ConnectionState, AdapterResponse
-from dbt.events.functions import fire_event
+from dbt.events.functions import fire_event, fire_lazy_event
 from dbt.events.types import ConnectionUsed, SQLQuery, SQLCommit, SQLQueryStatus
 
 
@@ -69,10 +69,11 @@ class SQLConnectionManager(BaseConnectionManager):
             cursor = connection.handle.cursor()
             cursor.execute(sql, bindings)
 
-            fire_event(
-                SQLQueryStatus(
+            fire_lazy_event(
+                SQLQueryStatus,
+                lambda: SQLQueryStatus(
                     status=str(self.get_response(cursor)), elapsed=round((time.time() - pre), 2)
-                )
+                ),
             )
 
             return connection, cursor
@@ -116,13 +117,28 @@ class SQLConnectionManager(BaseConnectionManager):
 
         return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
 
+    @classmethod
+    def get_columnar_result_from_cursor(cls, cursor: Any) -> agate.Table:
+        rows: List[Any] = []
+        column_names: List[str] = []
+
+        if cursor.description is not None:
+            column_names = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+            # renames duplicated columns the way it does for the other results
+            cls.process_results(column_names, [])
+
+        return dbt.clients.agate_helper.ColumnarTable(rows, column_names)
+
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, columnar: bool = False
     ) -> Tuple[AdapterResponse, agate.Table]:
         sql = self._add_query_comment(sql)
         _, cursor = self.add_query(sql, auto_begin)
         response = self.get_response(cursor)
-        if fetch:
+        if fetch and columnar:
+            table = self.get_columnar_result_from_cursor(cursor)
+        elif fetch:
             table = self.get_result_from_cursor(cursor)
         else:
             table = dbt.clients.agate_helper.empty_table()
@@ -1,5 +1,5 @@
 import agate
-from typing import Any, Optional, Tuple, Type, List
+from typing import Any, Optional, Tuple, Type, List, Set
 
 import dbt.clients.agate_helper
 from dbt.contracts.connection import Connection
@@ -11,9 +11,10 @@ from dbt.events.functions import fire_event
 from dbt.events.types import ColTypeChange, SchemaCreation, SchemaDrop
 
 
-from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.base.relation import BaseRelation, InformationSchema
 
 LIST_RELATIONS_MACRO_NAME = "list_relations_without_caching"
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = "list_relations_in_schemas"
 GET_COLUMNS_IN_RELATION_MACRO_NAME = "get_columns_in_relation"
 LIST_SCHEMAS_MACRO_NAME = "list_schemas"
 CHECK_SCHEMA_EXISTS_MACRO_NAME = "check_schema_exists"
@@ -40,6 +41,11 @@ class SQLAdapter(BaseAdapter):
         - get_catalog
         - list_relations_without_caching
         - get_columns_in_relation
+
+    Adapters can also implement the list_relations_in_schemas macro, or use
+    the information_schema query in its default implementation, and override
+    supports_bulk_list_relations to fill the cache with a few queries instead
+    of one per schema.
     """
 
     ConnectionManager: Type[SQLConnectionManager]
@@ -181,7 +187,21 @@ class SQLAdapter(BaseAdapter):
     ) -> List[BaseRelation]:
         kwargs = {"schema_relation": schema_relation}
         results = self.execute_macro(LIST_RELATIONS_MACRO_NAME, kwargs=kwargs)
+        return self._relations_from_results(results)
 
+    def list_relations_in_schemas(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[Optional[str]],
+    ) -> List[BaseRelation]:
+        kwargs = {"information_schema": information_schema, "schemas": schemas}
+        results = self.execute_macro(LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, kwargs=kwargs)
+        return self._relations_from_results(results)
+
+    def _relations_from_results(self, results: agate.Table) -> List[BaseRelation]:
+        """Build relations from the (database, name, schema, type) rows that
+        the list_relations macros return.
+        """
         relations = []
         quote_policy = {"database": True, "schema": True, "identifier": True}
         for _database, name, _schema, _type in results:
@@ -1,17 +1,22 @@
 from codecs import BOM_UTF8
 
 import agate
+import collections.abc
 import datetime
 import isodate
 import json
+import os
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from dbt.exceptions import RuntimeException
 
 
 BOM = BOM_UTF8.decode("utf-8")  # '\ufeff'
 
+# how many rows of a StreamingCsvTable are read from its file at a time
+CSV_CHUNK_SIZE = 10000
+
 
 class Number(agate.data_types.Number):
     # undo the change in https://github.com/wireservice/agate/pull/733
@@ -43,10 +48,9 @@ class ISODateTime(agate.data_types.DateTime):
         raise agate.exceptions.CastError('Can not parse value "%s" as datetime.' % d)
 
 
-def build_type_tester(
-    text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
-) -> agate.TypeTester:
-
+def _build_types(
+    text_columns: Iterable[str], string_null_values: Optional[Iterable[str]]
+) -> Tuple[List[agate.data_types.DataType], Dict[str, agate.data_types.DataType]]:
     types = [
         Number(null_values=("null", "")),
         agate.data_types.Date(null_values=("null", ""), date_format="%Y-%m-%d"),
@@ -57,7 +61,16 @@ def build_type_tester(
         ),
         agate.data_types.Text(null_values=string_null_values),
     ]
-    force = {k: agate.data_types.Text(null_values=string_null_values) for k in text_columns}
+    force: Dict[str, agate.data_types.DataType] = {
+        k: agate.data_types.Text(null_values=string_null_values) for k in text_columns
+    }
+    return types, force
+
+
+def build_type_tester(
+    text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
+) -> agate.TypeTester:
+    types, force = _build_types(text_columns, string_null_values)
     return agate.TypeTester(force=force, types=types)
 
 
@@ -123,6 +136,104 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     )
 
 
+# the types table_from_data_flat tests columns that aren't text only against,
+# in the order it prefers them. The last one is text.
+FLAT_COLUMN_TYPES, _ = _build_types((), string_null_values=())
+
+
+class ColumnarTable(agate.Table):
+    """The rows of a query result, kept as the sequences the cursor returned.
+
+    Each column's type is inferred, and its values cast, the first time it's
+    read, the way table_from_data_flat would. Reading a column with
+    columns[...] only does that for that column. Anything that reads rows,
+    like rows, print_table or order_by, does it for every column.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[Any]], column_names: Iterable[str]) -> None:
+        self._data = rows
+        self._column_names = tuple(column_names)
+        self._row_names = None
+        num_columns = len(self._column_names)
+        self._types: List[Optional[agate.data_types.DataType]] = [None] * num_columns
+        self._values: List[Optional[Tuple[Any, ...]]] = [None] * num_columns
+        self._row_cache: Optional[agate.MappedSequence] = None
+        self._column_cache: Optional[agate.MappedSequence] = None
+
+    def _infer(self, index: int) -> None:
+        values = [row[index] for row in self._data]
+        text_only = False
+        for i, value in enumerate(values):
+            if isinstance(value, (dict, list, tuple)):
+                # Represent container types as json strings
+                values[i] = json.dumps(value, cls=dbt.utils.JSONEncoder)
+                text_only = True
+            elif isinstance(value, str):
+                text_only = True
+
+        text = FLAT_COLUMN_TYPES[-1]
+        if text_only:
+            data_type = text
+        else:
+            hypotheses = list(FLAT_COLUMN_TYPES[:-1])
+            for value in values:
+                if not hypotheses:
+                    break
+                hypotheses = [t for t in hypotheses if t.test(value)]
+            data_type = hypotheses[0] if hypotheses else text
+        self._values[index] = tuple([data_type.cast(value) for value in values])
+        self._types[index] = data_type
+
+    def column_type(self, index: int) -> agate.data_types.DataType:
+        if self._types[index] is None:
+            self._infer(index)
+        return self._types[index]  # type: ignore[return-value]
+
+    def column_values(self, index: int) -> Tuple[Any, ...]:
+        if self._values[index] is None:
+            self._infer(index)
+        return self._values[index]  # type: ignore[return-value]
+
+    @property
+    def _column_types(self) -> Tuple[agate.data_types.DataType, ...]:  # type: ignore[override]
+        return tuple(self.column_type(i) for i in range(len(self._column_names)))
+
+    @property
+    def _rows(self) -> agate.MappedSequence:  # type: ignore[override]
+        if self._row_cache is None:
+            columns = [self.column_values(i) for i in range(len(self._column_names))]
+            rows = [agate.Row(values, self._column_names) for values in zip(*columns)]
+            self._row_cache = agate.MappedSequence(rows)
+        return self._row_cache
+
+    @property
+    def _columns(self) -> agate.MappedSequence:  # type: ignore[override]
+        if self._column_cache is None:
+            columns = [ColumnarColumn(self, i) for i in range(len(self._column_names))]
+            self._column_cache = agate.MappedSequence(columns, self._column_names)
+        return self._column_cache
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ColumnarColumn(agate.Column):
+    """A column of a ColumnarTable, which infers its type when it's read"""
+
+    def __init__(self, table: ColumnarTable, index: int) -> None:
+        self._table = table
+        self._index = index
+        self._name = table.column_names[index]
+        self._keys = None
+
+    @property
+    def data_type(self) -> agate.data_types.DataType:
+        return self._table.column_type(self._index)
+
+    def values(self) -> Tuple[Any, ...]:
+        return self._table.column_values(self._index)
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -132,17 +243,204 @@ def empty_table():
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
-    return [r.values() for r in table.rows.values()]
+    if isinstance(table, (ColumnarTable, StreamingCsvTable)):
+        return TableMatrix(table)
+    return [r.values() for r in table.rows]
+
+
+class TableMatrix(collections.abc.Sequence):
+    """The values of a table's rows, which are only read from the table when
+    they're used
+    """
+
+    def __init__(self, table) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table.rows)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [row.values() for row in self._table.rows[key]]
+        return self._table.rows[key].values()
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        for row in self._table.rows:
+            yield row.values()
+
+
+def _open_csv(abspath):
+    fp = open(abspath, encoding="utf-8")
+    if fp.read(1) != BOM:
+        fp.seek(0)
+    return fp
 
 
 def from_csv(abspath, text_columns):
     type_tester = build_type_tester(text_columns=text_columns)
-    with open(abspath, encoding="utf-8") as fp:
-        if fp.read(1) != BOM:
-            fp.seek(0)
+    with _open_csv(abspath) as fp:
         return agate.Table.from_csv(fp, column_types=type_tester)
 
 
+class StreamingCsvTable:
+    """A CSV file with the column names and types from_csv would give it,
+    whose rows are read from the file a chunk at a time as they're used.
+    Inferring the types takes one pass over the file, which only keeps the
+    row count and what convert_number_type needs.
+
+    Anything else agate.Table has, like columns or print_table, reads the
+    whole file into one the first time it's used.
+    """
+
+    def __init__(self, abspath: str, text_columns: Iterable[str]) -> None:
+        self.original_abspath = os.path.abspath(abspath)
+        self._path = abspath
+        self._table: Optional[agate.Table] = None
+        types, force = _build_types(text_columns, ("null", ""))
+
+        with _open_csv(abspath) as fp:
+            reader = agate.csv.reader(fp)
+            header: List[str] = next(reader, [])
+            self.column_names: Tuple[str, ...] = (
+                tuple(agate.utils.deduplicate(header, column_names=True)) if header else ()
+            )
+            num_columns = len(self.column_names)
+            # the types each column's values could all be cast to, in the
+            # order agate.TypeTester prefers them. Every value can be cast to
+            # text, so it's left out, and used if nothing else is left.
+            text = types[-1]
+            guesses = [t for t in types if t is not text]
+            hypotheses = [[] if name in force else list(guesses) for name in self.column_names]
+            self._decimal_places = [0] * num_columns
+            self.row_count = 0
+            for row in reader:
+                if len(row) > num_columns:
+                    raise ValueError(
+                        f"Row {self.row_count} has {len(row)} values, "
+                        f"but Table only has {num_columns} columns."
+                    )
+                for i, value in enumerate(row):
+                    if hypotheses[i]:
+                        hypotheses[i] = self._test(i, hypotheses[i], value)
+                self.row_count += 1
+        self.column_types: Tuple[agate.data_types.DataType, ...] = tuple(
+            hypothesis[0] if hypothesis else force.get(name, text)
+            for name, hypothesis in zip(self.column_names, hypotheses)
+        )
+
+    def _test(
+        self, index: int, hypothesis: List[agate.data_types.DataType], value: str
+    ) -> List[agate.data_types.DataType]:
+        remaining = []
+        for data_type in hypothesis:
+            try:
+                cast = data_type.cast(value)
+            except agate.exceptions.CastError:
+                continue
+            remaining.append(data_type)
+            if isinstance(data_type, agate.data_types.Number) and cast is not None:
+                if cast.is_finite():
+                    places = -cast.normalize().as_tuple().exponent
+                    self._decimal_places[index] = max(self._decimal_places[index], places)
+        return remaining
+
+    def iter_chunks(self, size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        """The rows, cast to the column types, size rows at a time"""
+        if self._table is not None:
+            rows = self._table.rows
+            for start in range(0, len(rows), size):
+                yield [tuple(row) for row in rows[start : start + size]]
+            return
+
+        num_columns = len(self.column_names)
+        casts = [data_type.cast for data_type in self.column_types]
+        with _open_csv(self._path) as fp:
+            reader = agate.csv.reader(fp)
+            next(reader, None)
+            chunk: List[Tuple[Any, ...]] = []
+            for index, row in enumerate(reader):
+                if len(row) < num_columns:
+                    row = row + [None] * (num_columns - len(row))
+                try:
+                    chunk.append(tuple([cast(value) for cast, value in zip(casts, row)]))
+                except agate.exceptions.CastError:
+                    self._raise_cast_error(index, row)
+                if len(chunk) >= size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    def _raise_cast_error(self, index: int, row: List[Optional[str]]) -> None:
+        # the same error agate.Table gives for the first value that doesn't cast
+        for data_type, name, value in zip(self.column_types, self.column_names, row):
+            try:
+                data_type.cast(value)
+            except agate.exceptions.CastError as exc:
+                raise agate.exceptions.CastError(f"{exc} Error at row {index} column {name}.")
+
+    @property
+    def rows(self) -> "StreamingCsvRows":
+        return StreamingCsvRows(self)
+
+    @property
+    def table(self) -> agate.Table:
+        """The whole file, read into an agate.Table"""
+        if self._table is None:
+            rows = list(self.rows)
+            # _is_fork to tell agate that the rows are already cast
+            self._table = agate.Table(rows, self.column_names, self.column_types, _is_fork=True)
+        return self._table
+
+    def aggregate(self, aggregations):
+        # SQLAdapter.convert_number_type asks for the MaxPrecision of number
+        # columns, which was worked out while inferring the types
+        if type(aggregations) is agate.MaxPrecision and self._table is None:
+            column = aggregations._column_name
+            if isinstance(column, str):
+                column = self.column_names.index(column)
+            return self._decimal_places[column]
+        return self.table.aggregate(aggregations)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.table, name)
+
+
+class StreamingCsvRows:
+    """The rows of a StreamingCsvTable, which are read from the file when
+    they're iterated over
+    """
+
+    def __init__(self, table: StreamingCsvTable) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.row_count
+
+    def __iter__(self) -> Iterator[agate.Row]:
+        column_names = self._table.column_names
+        for chunk in self._table.iter_chunks(CSV_CHUNK_SIZE):
+            for values in chunk:
+                yield agate.Row(values, column_names)
+
+    def __getitem__(self, key):
+        return self._table.table.rows[key]
+
+
+def iter_row_chunks(table, size: int) -> Iterator[Sequence[Sequence[Any]]]:
+    """The table's rows, size rows at a time. A StreamingCsvTable's rows are
+    read from its file as they're needed.
+    """
+    if isinstance(table, StreamingCsvTable):
+        yield from table.iter_chunks(size)
+        return
+    rows = table.rows
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
 class _NullMarker:
     pass
 
@@ -0,0 +1,110 @@
+# A client for `dbt daemon`. This module only uses the standard library, so
+# sending a command doesn't pay for importing dbt:
+#
+#   python -m dbt.clients.daemon run --select my_model
+#
+# The daemon listens on target/dbt.sock by default. Set DBT_DAEMON_SOCKET
+# to use a different socket.
+import json
+import os
+import socket
+import struct
+import sys
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+DAEMON_SOCKET_FILE_NAME = "dbt.sock"
+DAEMON_SOCKET_ENV_VAR = "DBT_DAEMON_SOCKET"
+
+# A request is one line of json, with the command line arguments, the working
+# directory and the environment of the client. The response is a series of
+# frames: a kind, the length of the payload, and the payload.
+_FRAME_HEADER = struct.Struct("<cI")
+OUTPUT_FRAME = b"o"
+EXIT_FRAME = b"x"
+
+# Same as ExitCodes.UnhandledError in dbt.utils
+_UNHANDLED_ERROR = 2
+
+
+def encode_request(args: List[str], cwd: str, env: Dict[str, str]) -> bytes:
+    return json.dumps({"args": args, "cwd": cwd, "env": env}).encode("utf-8") + b"\n"
+
+
+def read_request(conn: socket.socket) -> Dict:
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            raise ConnectionError("The client closed the connection before sending a request")
+        data += chunk
+    return json.loads(data)
+
+
+def send_frame(conn: socket.socket, kind: bytes, payload: bytes) -> None:
+    conn.sendall(_FRAME_HEADER.pack(kind, len(payload)) + payload)
+
+
+def send_exit_code(conn: socket.socket, exit_code: int) -> None:
+    send_frame(conn, EXIT_FRAME, str(exit_code).encode("ascii"))
+
+
+def _recv_exactly(conn: socket.socket, length: int) -> Optional[bytes]:
+    data = b""
+    while len(data) < length:
+        chunk = conn.recv(length - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def read_frames(conn: socket.socket) -> Iterator[Tuple[bytes, bytes]]:
+    while True:
+        header = _recv_exactly(conn, _FRAME_HEADER.size)
+        if header is None:
+            return
+        kind, length = _FRAME_HEADER.unpack(header)
+        payload = _recv_exactly(conn, length)
+        if payload is None:
+            return
+        yield kind, payload
+
+
+def default_socket_path() -> str:
+    return os.environ.get(DAEMON_SOCKET_ENV_VAR, os.path.join("target", DAEMON_SOCKET_FILE_NAME))
+
+
+def send_request(socket_path: str, args: List[str], output: BinaryIO) -> int:
+    """Run a dbt command in the daemon listening on socket_path, writing its
+    output to output. Returns the exit code of the command.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        conn.sendall(encode_request(args, os.getcwd(), dict(os.environ)))
+        for kind, payload in read_frames(conn):
+            if kind == OUTPUT_FRAME:
+                output.write(payload)
+                output.flush()
+            elif kind == EXIT_FRAME:
+                return int(payload)
+    # the command was killed before it could send its exit code
+    return _UNHANDLED_ERROR
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    if args is None:
+        args = sys.argv[1:]
+    socket_path = default_socket_path()
+    try:
+        return send_request(socket_path, args, sys.stdout.buffer)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.stderr.write(
+            f"No dbt daemon is listening on {socket_path}. Start one with `dbt daemon`.\n"
+        )
+        return _UNHANDLED_ERROR
+    except KeyboardInterrupt:
+        return _UNHANDLED_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,19 @@
 import codecs
+import hashlib
 import linecache
 import os
 import re
 import tempfile
 import threading
 from ast import literal_eval
+from collections import OrderedDict
 from contextlib import contextmanager
 from itertools import chain, islice
+from types import CodeType
 from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes  # type: ignore
 import jinja2.nodes
@@ -38,6 +42,7 @@ from dbt.exceptions import (
 )
 from dbt import flags
 from dbt.node_types import ModelLanguage
+from dbt.version import __version__
 
 
 SUPPORTED_LANG_ARG = jinja2.nodes.Name("supported_languages", "param")
@@ -185,6 +190,96 @@ class NativeSandboxTemplate(jinja2.nativetypes.NativeTemplate):  # mypy: ignore
 NativeSandboxEnvironment.template_class = NativeSandboxTemplate  # type: ignore
 
 
+class CompiledTemplateCache:
+    """The compiled Python code of template sources, shared by every thread.
+    Rendering the same source again, like a node's SQL at parse time and at
+    compile time, or the same test kwargs on many tests, only builds a new
+    Template from the code instead of lexing, parsing and compiling it.
+
+    Sources are keyed by a digest of their text, and the least recently used
+    are dropped once there are more than max_size of them.
+
+    With a bytecode directory set, the code of persisted sources, which are
+    the ones that are the same from run to run like macros, is also written
+    to disk and read back by later processes. Files are keyed by the digest
+    and the dbt version, and jinja checks them against the Jinja and Python
+    versions and the source itself.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self._code: "OrderedDict[Tuple[bool, str], CodeType]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytecode_cache: Optional[jinja2.bccache.BytecodeCache] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.loaded = 0
+
+    def set_bytecode_directory(self, directory: Optional[str]) -> None:
+        if directory is None:
+            self._bytecode_cache = None
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._bytecode_cache = jinja2.FileSystemBytecodeCache(directory)
+
+    def get_code(self, env: jinja2.Environment, source: str, persist: bool = False) -> CodeType:
+        if flags.MACRO_DEBUGGING:
+            # the code gets a new file name in the linecache each time
+            return env.compile(source)
+        # text and native templates compile to different code
+        native = isinstance(env, NativeSandboxEnvironment)
+        key = (native, hashlib.sha1(source.encode("utf-8")).hexdigest())
+        with self._lock:
+            code = self._code.get(key)
+            if code is not None:
+                self._code.move_to_end(key)
+                self.hits += 1
+                return code
+            self.misses += 1
+        # two threads might both compile a source, which is harmless
+        if persist and self._bytecode_cache is not None:
+            code = self._get_persisted_code(self._bytecode_cache, env, source, key)
+        else:
+            code = env.compile(source)
+        with self._lock:
+            self._code[key] = code
+            while len(self._code) > self.max_size:
+                self._code.popitem(last=False)
+                self.evictions += 1
+        return code
+
+    def _get_persisted_code(
+        self,
+        bytecode_cache: jinja2.bccache.BytecodeCache,
+        env: jinja2.Environment,
+        source: str,
+        key: Tuple[bool, str],
+    ) -> CodeType:
+        native, digest = key
+        name = f"{__version__}:{'native' if native else 'text'}:{digest}"
+        bucket = bytecode_cache.get_bucket(env, name, None, source)
+        if bucket.code is not None:
+            with self._lock:
+                self.loaded += 1
+            return bucket.code
+        code = env.compile(source)
+        bucket.code = code
+        try:
+            bytecode_cache.set_bucket(bucket)
+        except OSError:
+            # like a read-only target directory, the next process compiles it
+            pass
+        return code
+
+    def clear(self) -> None:
+        with self._lock:
+            self._code.clear()
+
+
+compiled_template_cache = CompiledTemplateCache()
+
+
 class TemplateCache:
     def __init__(self):
         self.file_cache: Dict[str, jinja2.Template] = {}
@@ -199,6 +294,7 @@ class TemplateCache:
             string=node.macro_sql,
             ctx={},
             node=node,
+            persist=True,
         )
 
         self.file_cache[key] = template
@@ -528,12 +624,20 @@ def get_template(
     node=None,
     capture_macros: bool = False,
     native: bool = False,
+    persist: bool = False,
 ):
+    """Build the template for the source. If persist is set, the source's
+    compiled code is kept in the bytecode directory, if there is one.
+    """
     with catch_jinja(node):
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
-        return env.from_string(template_source, globals=ctx)
+        # what env.from_string does, without compiling sources twice
+        code = compiled_template_cache.get_code(env, template_source, persist=persist)
+        return env.template_class.from_code(  # type: ignore[attr-defined]
+            env, code, env.make_globals(ctx), None
+        )
 
 
 def render_template(template, ctx: Dict[str, Any], node=None) -> str:
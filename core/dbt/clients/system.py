@@ -11,7 +11,7 @@ import sys
 import tarfile
 import requests
 import stat
-from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union
+from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union, Iterable
 
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -141,11 +141,19 @@ def supports_symlinks() -> bool:
 
 
 def write_file(path: str, contents: str = "") -> bool:
+    return write_file_chunks(path, (str(contents),))
+
+
+def write_file_chunks(path: str, chunks: Iterable[str]) -> bool:
+    """Write the chunks to the file one after another, so that the whole
+    contents never need to be in memory at once
+    """
     path = convert_path(path)
     try:
         make_directory(os.path.dirname(path))
         with open(path, "w", encoding="utf-8") as f:
-            f.write(str(contents))
+            for chunk in chunks:
+                f.write(chunk)
     except Exception as exc:
         # note that you can't just catch FileNotFound, because sometimes
         # windows apparently raises something else.
@@ -1,6 +1,8 @@
 import os
+import threading
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, cast, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Tuple, cast, Optional
 
 import networkx as nx  # type: ignore
 import pickle
@@ -10,6 +12,7 @@ from dbt import flags
 from dbt.adapters.factory import get_adapter
 from dbt.clients import jinja
 from dbt.clients.system import make_directory
+from dbt.compiled_sql_cache import get_compiled_sql_cache
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.manifest import Manifest, UniqueID
 from dbt.contracts.graph.compiled import (
@@ -26,7 +29,8 @@ from dbt.exceptions import (
     InternalException,
     RuntimeException,
 )
-from dbt.graph import Graph
+from dbt.graph import Graph, UniqueId
+from dbt.graph.compact import CompactGraph
 from dbt.events.functions import fire_event
 from dbt.events.types import FoundStats, CompilingNode, WritingInjectedSQLForNode
 from dbt.node_types import NodeType, ModelLanguage
@@ -126,40 +130,52 @@ class Linker:
     def __init__(self, data=None):
         if data is None:
             data = {}
-        self.graph = nx.DiGraph(**data)
+        # attributes of the graph written by write_graph
+        self.data = data
+        # the parents of each node, in the order they were added
+        self._parents: Dict[UniqueId, Dict[UniqueId, None]] = {}
+        self._graph: Optional[CompactGraph] = None
 
     def edges(self):
-        return self.graph.edges()
+        return [(parent, node) for node, parents in self._parents.items() for parent in parents]
 
     def nodes(self):
-        return self.graph.nodes()
+        return list(self._parents)
+
+    def get_graph(self) -> CompactGraph:
+        """Return the compact graph of the nodes and dependencies added so
+        far. It's built once, until more are added.
+        """
+        if self._graph is None:
+            self._graph = CompactGraph.from_parents(self._parents)
+        return self._graph
 
     def find_cycles(self):
-        try:
-            cycle = nx.find_cycle(self.graph)
-        except nx.NetworkXNoCycle:
+        cycle = self.get_graph().find_cycle()
+        if cycle is None:
             return None
-        else:
-            # cycles is a List[Tuple[str, ...]]
-            return " --> ".join(c[0] for c in cycle)
+        return " --> ".join(cycle)
 
     def dependency(self, node1, node2):
         "indicate that node1 depends on node2"
-        self.graph.add_node(node1)
-        self.graph.add_node(node2)
-        self.graph.add_edge(node2, node1)
+        self.add_node(node1)
+        self.add_node(node2)
+        self._parents[node1][node2] = None
 
     def add_node(self, node):
-        self.graph.add_node(node)
+        self._parents.setdefault(node, {})
+        self._graph = None
 
     def write_graph(self, outfile: str, manifest: Manifest):
-        """Write the graph to a gpickle file. Before doing so, serialize and
-        include all nodes in their corresponding graph entries.
+        """Write the graph to a gpickle file, as a networkx DiGraph. Before
+        doing so, serialize and include all nodes in their corresponding graph
+        entries.
         """
-        out_graph = self.graph.copy()
-        for node_id in self.graph:
+        out_graph = nx.DiGraph(**self.data)
+        for node_id in self._parents:
             data = manifest.expect(node_id).to_dict(omit_none=True)
             out_graph.add_node(node_id, **data)
+        out_graph.add_edges_from(self.edges())
         with open(outfile, "wb") as outfh:
             pickle.dump(out_graph, outfh, protocol=pickle.HIGHEST_PROTOCOL)
 
@@ -167,6 +183,9 @@ class Linker:
 class Compiler:
     def __init__(self, config):
         self.config = config
+        # Set once a node this compiler rendered has used the database, so
+        # what it compiled to depends on the state of the warehouse
+        self.introspected = False
 
     def initialize(self):
         make_directory(self.config.target_path)
@@ -189,6 +208,12 @@ class Compiler:
 
         return context
 
+    def _check_introspected(self, context: Dict[str, Any]) -> bool:
+        introspected = getattr(context.get("adapter"), "introspected", True)
+        if introspected:
+            self.introspected = True
+        return introspected
+
     def add_ephemeral_prefix(self, name: str):
         adapter = get_adapter(self.config)
         relation_cls = adapter.Relation
@@ -357,16 +382,7 @@ class Compiler:
 
         fire_event(CompilingNode(unique_id=node.unique_id))
 
-        data = node.to_dict(omit_none=True)
-        data.update(
-            {
-                "compiled": False,
-                "compiled_code": None,
-                "extra_ctes_injected": False,
-                "extra_ctes": [],
-            }
-        )
-        compiled_node = _compiled_type_for(node).from_dict(data)
+        compiled_node = _compiled_type_for(node).from_parsed(node)
 
         if compiled_node.language == ModelLanguage.python:
             # TODO could we also 'minify' this code at all? just aesthetic, not functional
@@ -378,23 +394,49 @@ class Compiler:
             self.config.quoting = {key: False for key in original_quoting.keys()}
             context = self._create_node_context(compiled_node, manifest, extra_context)
 
-            postfix = jinja.get_rendered(
-                "{{ py_script_postfix(model) }}",
-                context,
-                node,
-            )
+            try:
+                postfix = jinja.get_rendered(
+                    "{{ py_script_postfix(model) }}",
+                    context,
+                    node,
+                )
+            finally:
+                self._check_introspected(context)
             # we should NOT jinja render the python model's 'raw code'
             compiled_node.compiled_code = f"{node.raw_code}\n\n{postfix}"
             # restore quoting settings in the end since context is lazy evaluated
             self.config.quoting = original_quoting
 
         else:
-            context = self._create_node_context(compiled_node, manifest, extra_context)
-            compiled_node.compiled_code = jinja.get_rendered(
-                node.raw_code,
-                context,
-                node,
-            )
+            cache = get_compiled_sql_cache()
+            fingerprint = None
+            if cache is not None and not extra_context and node.unique_id in manifest.nodes:
+                fingerprint = cache.fingerprint(node)
+            cached = cache.get(node.unique_id, fingerprint) if cache is not None else None
+            if cached is not None:
+                compiled_node.compiled_code = cached.compiled_code
+                for cte_id in cached.cte_ids:
+                    compiled_node.set_cte(cte_id, None)
+            else:
+                context = self._create_node_context(compiled_node, manifest, extra_context)
+                try:
+                    compiled_node.compiled_code = jinja.get_rendered(
+                        node.raw_code,
+                        context,
+                        node,
+                    )
+                finally:
+                    introspected = self._check_introspected(context)
+                if cache is not None:
+                    # what a node renders to when it looks at the database
+                    # can change without anything in the fingerprint changing
+                    if fingerprint is None or introspected:
+                        cache.skip()
+                    else:
+                        cte_ids = [cte.id for cte in compiled_node.extra_ctes]
+                        cache.put(
+                            node.unique_id, fingerprint, compiled_node.compiled_code, cte_ids
+                        )
 
         compiled_node.relation_name = self._get_relation_name(node)
 
@@ -460,17 +502,19 @@ class Compiler:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
-        for node_id in linker.graph:
+        # The new edges only add tests upstream of nodes, and tests never have
+        # tests of their own, so the graph without them gives the same result
+        graph = linker.get_graph()
+        for node_id in graph:
             # If node is executable (in manifest.nodes) and does _not_
             # represent a test, continue.
             if (
                 node_id in manifest.nodes
                 and manifest.nodes[node_id].resource_type != NodeType.Test
             ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
+                # Get the set of everything upstream of the node, not
+                # including the current node.
+                upstream_nodes = set(graph.reachable([node_id], reverse=True))
 
                 # Get all tests that depend on any upstream nodes.
                 upstream_tests = []
@@ -490,7 +534,7 @@ class Compiler:
                     # is a subset of all upstream nodes of the current node,
                     # add an edge from the upstream test to the current node.
                     if test_depends_on.issubset(upstream_nodes):
-                        linker.graph.add_edge(upstream_test, node_id)
+                        linker.dependency(node_id, upstream_test)
 
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
@@ -504,7 +548,7 @@ class Compiler:
             self.write_graph_file(linker, manifest)
         print_compile_stats(stats)
 
-        return Graph(linker.graph)
+        return Graph(linker.get_graph())
 
     # writes the "compiled_code" into the target/compiled directory
     def _write_node(self, node: NonSourceCompiledNode) -> ManifestNode:
@@ -537,3 +581,94 @@ class Compiler:
         if write:
             self._write_node(node)
         return node
+
+
+class AheadOfTimeCompiler:
+    """Compiles nodes on a background thread, ahead of the runners that
+    execute them, so that rendering a node overlaps with the queries of the
+    nodes running before it instead of adding to them.
+
+    Nodes are compiled in the order they are submitted, which should be the
+    order they will run in. A runner that gets to a node before its
+    compilation has started takes it back and compiles it on its own thread,
+    so runners only ever wait on a node that is already being compiled.
+
+    A node that uses the database while it renders, like with run_query or
+    adapter.get_columns_in_relation, may have looked at its parents before
+    this run rebuilt them. Its result is thrown away, and its runner
+    compiles it again once the parents are done.
+    """
+
+    def __init__(self, compiler: Compiler, manifest: Manifest) -> None:
+        self.compiler = compiler
+        self.manifest = manifest
+        self.adapter = get_adapter(compiler.config)
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CompileAhead")
+
+    def _uncompiled_ephemerals(self, node: ManifestNode) -> Dict[str, ManifestNode]:
+        """The ephemeral ancestors that compiling the node will compile and
+        save into the manifest.
+        """
+        found: Dict[str, ManifestNode] = {}
+        pending = list(node.depends_on.nodes)
+        while pending:
+            unique_id = pending.pop()
+            parent = self.manifest.nodes.get(unique_id)
+            if (
+                parent is None
+                or unique_id in found
+                or not parent.is_ephemeral_model
+                or getattr(parent, "compiled", False)
+            ):
+                continue
+            found[unique_id] = parent
+            pending.extend(parent.depends_on.nodes)
+        return found
+
+    def _compile(self, node: ManifestNode) -> Optional[NonSourceCompiledNode]:
+        ephemerals = self._uncompiled_ephemerals(node)
+        self.compiler.introspected = False
+        with self.adapter.connection_for(node):
+            try:
+                compiled = self.compiler.compile_node(node, self.manifest, {})
+            except Exception:
+                # it may only have failed because its parents aren't built yet
+                if not self.compiler.introspected:
+                    raise
+                compiled = None
+        if self.compiler.introspected:
+            # the ephemeral ancestors compiled along with it get compiled
+            # again by the runner, too
+            for parent in ephemerals.values():
+                self.manifest.update_node(parent)
+            return None
+        return compiled
+
+    def submit(self, nodes: Iterable[ManifestNode]) -> None:
+        with self._lock:
+            for node in nodes:
+                self._futures[node.unique_id] = self._executor.submit(self._compile, node)
+
+    def take(self, unique_id: str) -> Optional[NonSourceCompiledNode]:
+        """Return the compiled node, waiting for it if it is being compiled,
+        or None if the caller should compile it, either because compiling it
+        hadn't started or because it used the database. Raises whatever
+        compiling the node raised.
+        """
+        with self._lock:
+            future = self._futures.pop(unique_id, None)
+        if future is None or future.cancel():
+            return None
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Drop the nodes that nobody took, like the ones that were skipped,
+        and wait for the one being compiled.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import msgpack  # type: ignore
+
+from dbt.adapters.factory import get_adapter
+from dbt.clients.system import make_directory
+from dbt.contracts.graph.compiled import ManifestNode
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.functions import fire_event
+from dbt.events.types import CompiledSqlCacheLoadFailed, CompiledSqlCacheStats
+from dbt.version import __version__
+
+COMPILED_SQL_CACHE_FILE_NAME = "compiled_sql_cache.msgpack"
+COMPILED_SQL_CACHE_FORMAT = 1
+
+# Context members whose values change between invocations, or that expose
+# more of the project than a node's fingerprint covers. A node is never
+# cached if its code, or any macro it calls, mentions one of them.
+VOLATILE_CONTEXT_MEMBERS = re.compile(
+    r"\b(run_started_at|invocation_id|env_var|modules|graph|flags|selected_resources)\b"
+)
+
+# Macros that replace a context member by name, and change how every node
+# renders without being in their depends_on
+OVERRIDABLE_CONTEXT_MEMBERS = ("ref", "source", "metric")
+
+# Node fields that don't change what the node renders to
+UNRENDERED_NODE_FIELDS = ("created_at", "compiled_path", "build_path", "deferred")
+
+
+class CachedSql(NamedTuple):
+    fingerprint: str
+    compiled_code: str
+    # the ids of the ephemeral models the node refers to
+    cte_ids: List[str]
+
+
+class CompiledSqlCache:
+    """The compiled code of nodes from earlier invocations, keyed by a
+    fingerprint of everything their rendering reads: the node itself, the
+    relations it refers to, the macros it calls, and the vars, target and
+    project files of the invocation.
+
+    Nodes that reach the database while rendering, like with run_query or
+    is_incremental, are not cached, because what they render to depends on
+    what's in the database. Neither are nodes that use a context member
+    whose value changes between invocations.
+    """
+
+    def __init__(self, path: str, manifest: Manifest, config) -> None:
+        self.path = path
+        self.manifest = manifest
+        self.config = config
+        self.adapter = get_adapter(config)
+        self._entries: Dict[str, CachedSql] = {}
+        self._macro_digests: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self._run_fingerprint = self._get_run_fingerprint()
+
+    @classmethod
+    def load(cls, manifest: Manifest, config) -> "CompiledSqlCache":
+        path = os.path.join(config.target_path, COMPILED_SQL_CACHE_FILE_NAME)
+        cache = cls(path, manifest, config)
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as fp:
+                    data = msgpack.unpackb(fp.read())
+                if (
+                    data["format"] == COMPILED_SQL_CACHE_FORMAT
+                    and data["dbt_version"] == __version__
+                ):
+                    cache._entries = {
+                        unique_id: CachedSql(*entry)
+                        for unique_id, entry in data["entries"].items()
+                    }
+            except Exception as exc:
+                fire_event(CompiledSqlCacheLoadFailed(path=path, exc=str(exc)))
+        return cache
+
+    def save(self) -> None:
+        fire_event(
+            CompiledSqlCacheStats(hits=self.hits, misses=self.misses, uncacheable=self.uncacheable)
+        )
+        with self._lock:
+            # forget the nodes that were removed from the project
+            entries = {
+                unique_id: list(entry)
+                for unique_id, entry in self._entries.items()
+                if unique_id in self.manifest.nodes
+            }
+        make_directory(os.path.dirname(self.path))
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as fp:
+            fp.write(
+                msgpack.packb(
+                    {
+                        "format": COMPILED_SQL_CACHE_FORMAT,
+                        "dbt_version": __version__,
+                        "entries": entries,
+                    }
+                )
+            )
+        os.replace(temp_path, self.path)
+
+    def _get_run_fingerprint(self) -> str:
+        overrides = [
+            self._macro_digest(unique_id)
+            for unique_id, macro in self.manifest.macros.items()
+            if macro.name in OVERRIDABLE_CONTEXT_MEMBERS
+            and macro.package_name == self.config.project_name
+        ]
+        data = {
+            "dbt_version": __version__,
+            "adapter_type": self.adapter.type(),
+            "target": self.config.to_target_dict(),
+            "state_check": self.manifest.state_check.to_dict(omit_none=True),
+            "overrides": overrides,
+        }
+        return _digest(data)
+
+    def _macro_digest(self, unique_id: str) -> Optional[str]:
+        """A digest of the macro's code, or None if it uses a volatile
+        context member
+        """
+        if unique_id not in self._macro_digests:
+            macro = self.manifest.macros.get(unique_id)
+            if macro is None:
+                digest: Optional[str] = "missing"
+            elif VOLATILE_CONTEXT_MEMBERS.search(macro.macro_sql):
+                digest = None
+            else:
+                digest = hashlib.sha256(macro.macro_sql.encode("utf-8")).hexdigest()
+            self._macro_digests[unique_id] = digest
+        return self._macro_digests[unique_id]
+
+    def _macro_closure(self, macro_ids: Iterable[str]) -> Optional[List[str]]:
+        """The digests of the macros, and of all the macros they call, or
+        None if any of them uses a volatile context member
+        """
+        seen = set()
+        stack = list(macro_ids)
+        digests = []
+        while stack:
+            unique_id = stack.pop()
+            if unique_id in seen:
+                continue
+            seen.add(unique_id)
+            digest = self._macro_digest(unique_id)
+            if digest is None:
+                return None
+            digests.append(f"{unique_id}:{digest}")
+            macro = self.manifest.macros.get(unique_id)
+            if macro is not None:
+                stack.extend(macro.depends_on.macros)
+        return sorted(digests)
+
+    def _dependency_key(self, unique_id: str) -> Any:
+        if unique_id in self.manifest.nodes:
+            node = self.manifest.nodes[unique_id]
+            relation = self.adapter.Relation.create_from(self.config, node)
+            return [unique_id, str(relation), node.config.materialized]
+        if unique_id in self.manifest.sources:
+            source = self.manifest.sources[unique_id]
+            return [unique_id, str(self.adapter.Relation.create_from_source(source))]
+        if unique_id in self.manifest.metrics:
+            return [unique_id, self.manifest.metrics[unique_id].to_dict(omit_none=True)]
+        return [unique_id, None]
+
+    def fingerprint(self, node: ManifestNode) -> Optional[str]:
+        """The fingerprint of what the node's rendering reads, or None if the
+        node can't be cached
+        """
+        if VOLATILE_CONTEXT_MEMBERS.search(node.raw_code):
+            return None
+        macros = self._macro_closure(node.depends_on.macros)
+        if macros is None:
+            return None
+        data = node.to_dict(omit_none=True)
+        for name in UNRENDERED_NODE_FIELDS:
+            data.pop(name, None)
+        dependencies = [self._dependency_key(unique_id) for unique_id in node.depends_on.nodes]
+        return _digest([self._run_fingerprint, data, dependencies, macros])
+
+    def get(self, unique_id: str, fingerprint: Optional[str]) -> Optional[CachedSql]:
+        if fingerprint is None:
+            return None
+        entry = self._entries.get(unique_id)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(
+        self, unique_id: str, fingerprint: str, compiled_code: str, cte_ids: List[str]
+    ) -> None:
+        with self._lock:
+            self.misses += 1
+            self._entries[unique_id] = CachedSql(fingerprint, compiled_code, cte_ids)
+
+    def skip(self) -> None:
+        """Count a node that couldn't be cached"""
+        with self._lock:
+            self.uncacheable += 1
+
+
+def _digest(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# the cache of the running task, if --cache-compiled-sql is set
+_COMPILED_SQL_CACHE: Optional[CompiledSqlCache] = None
+
+
+def get_compiled_sql_cache() -> Optional[CompiledSqlCache]:
+    return _COMPILED_SQL_CACHE
+
+
+def set_compiled_sql_cache(cache: Optional[CompiledSqlCache]) -> None:
+    global _COMPILED_SQL_CACHE
+    _COMPILED_SQL_CACHE = cache
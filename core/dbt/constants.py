@@ -1,2 +1,5 @@
 SECRET_ENV_PREFIX = "DBT_ENV_SECRET_"
 DEFAULT_ENV_PLACEHOLDER = "DBT_DEFAULT_PLACEHOLDER"
+# Profile fields read through `target` while parsing are saved with the
+# var names a file used, as "target.<field>"
+TARGET_VAR_PREFIX = "target."
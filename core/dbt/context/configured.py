@@ -1,13 +1,13 @@
 import os
 from typing import Any, Dict, Optional
 
-from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
+from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER, TARGET_VAR_PREFIX
 from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.node_types import NodeType
 from dbt.utils import MultiDict
 
 from dbt.context.base import contextproperty, contextmember, Var
-from dbt.context.target import TargetContext
+from dbt.context.target import ParseTargetDict, TargetContext
 from dbt.exceptions import raise_parsing_error, disallow_secret_env_var
 
 
@@ -68,8 +68,31 @@ class ConfiguredVar(Var):
 class SchemaYamlVars:
     def __init__(self):
         self.env_vars = {}
+        # var names, and profile fields as "target.<field>", that were read
         self.vars = {}
 
+    def add_var(self, var_name: str) -> None:
+        self.vars[var_name] = True
+
+    def add_target_field(self, field: str) -> None:
+        self.add_var(TARGET_VAR_PREFIX + field)
+
+
+class SchemaYamlVar(ConfiguredVar):
+    def __init__(
+        self,
+        context: Dict[str, Any],
+        config: AdapterRequiredConfig,
+        project_name: str,
+        schema_yaml_vars: SchemaYamlVars,
+    ):
+        super().__init__(context, config, project_name)
+        self._schema_yaml_vars = schema_yaml_vars
+
+    def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self._schema_yaml_vars.add_var(var_name)
+        return super().__call__(var_name, default)
+
 
 class SchemaYamlContext(ConfiguredContext):
     # subclass is DocsRuntimeContext
@@ -80,8 +103,17 @@ class SchemaYamlContext(ConfiguredContext):
 
     @contextproperty
     def var(self) -> ConfiguredVar:
+        if self.schema_yaml_vars:
+            return SchemaYamlVar(self._ctx, self.config, self._project_name, self.schema_yaml_vars)
         return ConfiguredVar(self._ctx, self.config, self._project_name)
 
+    @contextproperty
+    def target(self) -> Dict[str, Any]:
+        target = self.config.to_target_dict()
+        if self.schema_yaml_vars:
+            return ParseTargetDict(target, self.schema_yaml_vars.add_target_field)
+        return target
+
     @contextmember
     def env_var(self, var: str, default: Optional[str] = None) -> str:
         return_value = None
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from dbt.exceptions import (
     doc_invalid_args,
@@ -10,7 +10,7 @@ from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedMacro
 
 from dbt.context.base import contextmember
-from dbt.context.configured import SchemaYamlContext
+from dbt.context.configured import SchemaYamlContext, SchemaYamlVars
 
 
 class DocsRuntimeContext(SchemaYamlContext):
@@ -20,8 +20,9 @@ class DocsRuntimeContext(SchemaYamlContext):
         node: Union[ParsedMacro, CompileResultNode],
         manifest: Manifest,
         current_project: str,
+        schema_yaml_vars: Optional[SchemaYamlVars] = None,
     ) -> None:
-        super().__init__(config, current_project, None)
+        super().__init__(config, current_project, schema_yaml_vars)
         self.node = node
         self.manifest = manifest
 
@@ -79,7 +80,8 @@ def generate_runtime_docs_context(
     target: Any,
     manifest: Manifest,
     current_project: str,
+    schema_yaml_vars: Optional[SchemaYamlVars] = None,
 ) -> Dict[str, Any]:
-    ctx = DocsRuntimeContext(config, target, manifest, current_project)
+    ctx = DocsRuntimeContext(config, target, manifest, current_project, schema_yaml_vars)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
@@ -21,12 +21,14 @@ from dbt.clients.jinja import get_rendered, MacroGenerator, MacroStack
 from dbt.config import RuntimeConfig, Project
 from .base import contextmember, contextproperty, Var
 from .configured import FQNLookup
+from .target import ParseTargetDict
 from .context_config import ContextConfig
-from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
+from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER, TARGET_VAR_PREFIX
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from .macros import MacroNamespaceBuilder, MacroNamespace
 from .manifest import ManifestContext
 from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.files import SchemaSourceFile
 from dbt.contracts.graph.manifest import Manifest, Disabled
 from dbt.contracts.graph.compiled import (
     CompiledResource,
@@ -446,8 +448,16 @@ class RuntimeDatabaseWrapper(BaseDatabaseWrapper):
     available.
     """
 
+    def __init__(self, adapter, namespace: MacroNamespace):
+        super().__init__(adapter, namespace)
+        # Set when the code being rendered uses a method that has a parse
+        # replacement, which are the ones that reach the database
+        self.introspected = False
+
     def __getattr__(self, name):
         if name in self._adapter._available_:
+            if name in self._adapter._parse_replacements_:
+                self.introspected = True
             return getattr(self._adapter, name)
         else:
             raise AttributeError(
@@ -584,9 +594,11 @@ class ModelConfiguredVar(Var):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: CompiledResource,
+        manifest: Optional[Manifest] = None,
     ) -> None:
         self._node: CompiledResource
         self._config: RuntimeConfig = config
+        self._manifest: Optional[Manifest] = manifest
         super().__init__(context, config.cli_vars, node=node)
 
     def packages_for_node(self) -> Iterable[Project]:
@@ -616,7 +628,31 @@ class ModelConfiguredVar(Var):
         return merged
 
 
+def record_parse_var(manifest: Manifest, node: Any, var_name: str) -> None:
+    """Save a var name, or a profile field as "target.<field>", in the
+    source file of the node being parsed, the same way env_var does. When it
+    changes, partial parsing reparses just the files that used it.
+    """
+    # hooks come from dbt_project.yml which doesn't have a real file_id
+    if node.file_id not in manifest.files:
+        return
+    source_file = manifest.files[node.file_id]
+    if isinstance(source_file, SchemaSourceFile):
+        # generic tests are saved with the yaml entry that defined them
+        file_key_name = getattr(node, "file_key_name", None)
+        if file_key_name:
+            yaml_key, name = file_key_name.split(".", 1)
+            source_file.add_var(var_name, yaml_key, name)
+    else:
+        source_file.add_var(var_name)
+
+
 class ParseVar(ModelConfiguredVar):
+    def __call__(self, var_name, default=ModelConfiguredVar._VAR_NOTSET):
+        if self._manifest is not None:
+            record_parse_var(self._manifest, self._node, var_name)
+        return super().__call__(var_name, default)
+
     def get_missing_var(self, var_name):
         # in the parser, just always return None.
         return None
@@ -714,6 +750,18 @@ class ProviderContext(ManifestContext):
     def _sql_results(self) -> Dict[str, AttrDict]:
         return self.sql_results
 
+    @contextproperty
+    def target(self) -> Dict[str, Any]:
+        target = self.config.to_target_dict()
+        # Save the fields read while parsing. If this is compiling, do not
+        # save because it's irrelevant to parsing.
+        if self.provider.execute or hasattr(self.model, "compiled"):
+            return target
+        return ParseTargetDict(target, self._record_target_field)
+
+    def _record_target_field(self, field: str) -> None:
+        record_parse_var(self.manifest, self.model, TARGET_VAR_PREFIX + field)
+
     @contextmember
     def load_result(self, name: str) -> Optional[AttrDict]:
         return self.sql_results.get(name)
@@ -789,7 +837,7 @@ class ProviderContext(ManifestContext):
             raise_compiler_error(message_if_exception, self.model)
 
     @contextmember
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self) -> agate_helper.StreamingCsvTable:
         if not isinstance(self.model, (ParsedSeedNode, CompiledSeedNode)):
             raise_compiler_error(
                 "can only load_agate_table for seeds (got a {})".format(self.model.resource_type)
@@ -797,11 +845,9 @@ class ProviderContext(ManifestContext):
         path = os.path.join(self.model.root_path, self.model.original_file_path)
         column_types = self.model.config.column_types
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types)
+            return agate_helper.StreamingCsvTable(path, text_columns=column_types)
         except ValueError as e:
             raise_compiler_error(str(e))
-        table.original_abspath = os.path.abspath(path)
-        return table
 
     @contextproperty
     def ref(self) -> Callable:
@@ -1022,6 +1068,7 @@ class ProviderContext(ManifestContext):
             context=self._ctx,
             config=self.config,
             node=self.model,
+            manifest=self.manifest,
         )
 
     @contextproperty("adapter")
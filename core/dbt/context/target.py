@@ -1,10 +1,57 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from dbt.contracts.connection import HasCredentials
 
 from dbt.context.base import BaseContext, contextproperty
 
 
+class ParseTargetDict(dict):
+    """The `target` dict used while parsing. It reports every field that is
+    read to `record`, or "*" if the whole dict is used, so partial parsing
+    can reparse only the files that used a profile field when it changes.
+    """
+
+    def __init__(self, target=(), record: Optional[Callable[[str], None]] = None):
+        super().__init__(target)
+        self._record = record
+
+    def _read(self, key):
+        if self._record is not None:
+            self._record(key)
+
+    def __getitem__(self, key):
+        self._read(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self._read(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self._read(key)
+        return super().get(key, default)
+
+    def __iter__(self):
+        self._read("*")
+        return super().__iter__()
+
+    def keys(self):
+        self._read("*")
+        return super().keys()
+
+    def values(self):
+        self._read("*")
+        return super().values()
+
+    def items(self):
+        self._read("*")
+        return super().items()
+
+    def __repr__(self):
+        self._read("*")
+        return super().__repr__()
+
+
 class TargetContext(BaseContext):
     # subclass is ConfiguredContext
     def __init__(self, config: HasCredentials, cli_vars: Dict[str, Any]):
@@ -187,6 +187,8 @@ class SourceFile(BaseSourceFile):
     docs: List[str] = field(default_factory=list)
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
+    # var names, and profile fields as "target.<field>", read while parsing
+    vars: List[str] = field(default_factory=list)
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
@@ -199,6 +201,10 @@ class SourceFile(BaseSourceFile):
         if value not in self.nodes:
             self.nodes.append(value)
 
+    def add_var(self, var):
+        if var not in self.vars:
+            self.vars.append(var)
+
     # TODO: do this a different way. This remote file kludge isn't going
     # to work long term
     @classmethod
@@ -229,6 +235,8 @@ class SchemaSourceFile(BaseSourceFile):
     # created too, but those are in 'sources'
     sop: List[SourceKey] = field(default_factory=list)
     env_vars: Dict[str, Any] = field(default_factory=dict)
+    # var names and "target.<field>" names, by yaml_key and name like env_vars
+    vars: Dict[str, Any] = field(default_factory=dict)
     pp_dict: Optional[Dict[str, Any]] = None
     pp_test_index: Optional[Dict[str, Any]] = None
 
@@ -314,5 +322,19 @@ class SchemaSourceFile(BaseSourceFile):
             if not self.env_vars[yaml_key]:
                 del self.env_vars[yaml_key]
 
+    def add_var(self, var, yaml_key, name):
+        if yaml_key not in self.vars:
+            self.vars[yaml_key] = {}
+        if name not in self.vars[yaml_key]:
+            self.vars[yaml_key][name] = []
+        if var not in self.vars[yaml_key][name]:
+            self.vars[yaml_key][name].append(var)
+
+    def delete_from_vars(self, yaml_key, name):
+        if yaml_key in self.vars and name in self.vars[yaml_key]:
+            del self.vars[yaml_key][name]
+            if not self.vars[yaml_key]:
+                del self.vars[yaml_key]
+
 
 AnySourceFile = Union[SchemaSourceFile, SourceFile]
@@ -23,7 +23,7 @@ from dbt.contracts.util import Replaceable
 
 from dbt.dataclass_schema import dbtClassMixin
 from dataclasses import dataclass, field
-from typing import Optional, List, Union, Dict, Type
+from typing import Optional, List, Union, Dict, Type, TypeVar
 
 
 @dataclass
@@ -39,6 +39,9 @@ class CompiledNodeMixin(dbtClassMixin):
     compiled: bool
 
 
+T = TypeVar("T", bound="CompiledNode")
+
+
 @dataclass
 class CompiledNode(ParsedNode, CompiledNodeMixin):
     compiled_code: Optional[str] = None
@@ -47,6 +50,25 @@ class CompiledNode(ParsedNode, CompiledNodeMixin):
     relation_name: Optional[str] = None
     _pre_injected_sql: Optional[str] = None
 
+    @classmethod
+    def from_parsed(cls: Type[T], node: ParsedNode) -> T:
+        """Build the not yet compiled form of a parsed node, without a round
+        trip through to_dict and from_dict. The compiled node shares the
+        values of the parsed node's fields, like its config and columns,
+        instead of copying them, so it should replace the parsed node rather
+        than live alongside it.
+        """
+        compiled = cls.__new__(cls)
+        compiled.__dict__.update(node.__dict__)
+        compiled._event_status = {}
+        compiled.compiled = False
+        compiled.compiled_code = None
+        compiled.extra_ctes_injected = False
+        compiled.extra_ctes = []
+        compiled.relation_name = None
+        compiled._pre_injected_sql = None
+        return compiled
+
     def set_cte(self, cte_id: str, sql: str):
         """This is the equivalent of what self.extra_ctes[cte_id] = sql would
         do if extra_ctes were an OrderedDict
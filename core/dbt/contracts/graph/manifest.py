@@ -1,6 +1,8 @@
+import copy
 import enum
 from dataclasses import dataclass, field
 from itertools import chain, islice
+from pathlib import Path
 from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 from multiprocessing.synchronize import Lock
 from typing import (
@@ -48,6 +50,7 @@ from dbt.exceptions import (
     raise_duplicate_resource_name,
     raise_compiler_error,
 )
+from dbt.clients.yaml_helper import yaml
 from dbt.helper_types import PathSet
 from dbt.events.functions import fire_event
 from dbt.events.types import MergedFromState
@@ -256,6 +259,216 @@ class AnalysisLookup(RefableLookup):
     _lookup_types: ClassVar[set] = set([NodeType.Analysis])
 
 
+class SelectorLookup(dbtClassMixin):
+    """The unique ids of the manifest's resources, by the values node
+    selection methods match on, so that a selection method only looks at the
+    resources that can match instead of all of them. The methods still check
+    each resource they get from here, so an index may return more than the
+    matches, but never less.
+    """
+
+    def __init__(self, manifest: "Manifest"):
+        # nodes, sources, exposures and metrics
+        self.tags: Dict[str, List[UniqueID]] = {}
+        self.packages: Dict[str, List[UniqueID]] = {}
+        # nodes only
+        self.resource_types: Dict[NodeType, List[UniqueID]] = {}
+        self.test_names: Dict[str, List[UniqueID]] = {}
+        # the first part of a node's fqn, with and without its package, and
+        # the last part
+        self.fqn_parts: Dict[str, List[UniqueID]] = {}
+        # built the first time they're used
+        self._file_names: Optional[Dict[str, List[UniqueID]]] = None
+        self._paths: Optional[Dict[Tuple[str, str], List[UniqueID]]] = None
+        self._configs: Dict[Tuple[str, ...], List[Tuple[Any, List[UniqueID]]]] = {}
+        self.populate(manifest)
+
+    def populate(self, manifest: "Manifest"):
+        for node in manifest.nodes.values():
+            self.add_resource(node)
+            _add_to(self.resource_types, node.resource_type, node.unique_id)
+            test_metadata = getattr(node, "test_metadata", None)
+            if test_metadata is not None:
+                _add_to(self.test_names, test_metadata.name, node.unique_id)
+            fqn_parts = {node.fqn[-1], node.fqn[0].split(".")[0]}
+            if len(node.fqn) > 1:
+                fqn_parts.add(node.fqn[1].split(".")[0])
+            for part in fqn_parts:
+                _add_to(self.fqn_parts, part, node.unique_id)
+        for resource in chain(
+            manifest.sources.values(), manifest.exposures.values(), manifest.metrics.values()
+        ):
+            self.add_resource(resource)
+
+    def add_resource(self, resource):
+        for tag in set(resource.tags):
+            _add_to(self.tags, tag, resource.unique_id)
+        _add_to(self.packages, resource.package_name, resource.unique_id)
+
+    def file_names(self, manifest: "Manifest") -> Dict[str, List[UniqueID]]:
+        if self._file_names is None:
+            self._file_names = {}
+            for resource in _all_resources(manifest):
+                name = Path(resource.original_file_path).name
+                _add_to(self._file_names, name, resource.unique_id)
+        return self._file_names
+
+    def paths(self, manifest: "Manifest") -> Dict[Tuple[str, str], List[UniqueID]]:
+        """The resources by their root path, and their original file path and
+        each of its parent directories
+        """
+        if self._paths is None:
+            self._paths = {}
+            for resource in _all_resources(manifest):
+                root_path = str(Path(resource.root_path))
+                path = Path(resource.original_file_path)
+                for part in chain([path], path.parents):
+                    _add_to(self._paths, (root_path, str(part)), resource.unique_id)
+        return self._paths
+
+    def configs(
+        self, manifest: "Manifest", attrs: Tuple[str, ...], getter: Callable[[Any], Any]
+    ) -> List[Tuple[Any, List[UniqueID]]]:
+        """The distinct config values getter finds for attrs, with the nodes
+        and sources that have each one. Resources getter fails for are left
+        out.
+        """
+        if attrs not in self._configs:
+            groups: Dict[Tuple[type, Any], Tuple[Any, List[UniqueID]]] = {}
+            unhashable: List[Tuple[Any, List[UniqueID]]] = []
+            for resource in chain(manifest.nodes.values(), manifest.sources.values()):
+                try:
+                    value = getter(resource.config)
+                except AttributeError:
+                    continue
+                try:
+                    # keep values that are equal but of different types apart,
+                    # like 1 and True
+                    key = (type(value), value)
+                    if key not in groups:
+                        groups[key] = (value, [])
+                    groups[key][1].append(resource.unique_id)
+                except TypeError:
+                    unhashable.append((value, [resource.unique_id]))
+            self._configs[attrs] = list(groups.values()) + unhashable
+        return self._configs[attrs]
+
+
+def _add_to(storage: Dict[Any, List[UniqueID]], key: Any, unique_id: UniqueID) -> None:
+    if key not in storage:
+        storage[key] = []
+    storage[key].append(unique_id)
+
+
+def _all_resources(manifest: "Manifest"):
+    return chain(
+        manifest.nodes.values(),
+        manifest.sources.values(),
+        manifest.exposures.values(),
+        manifest.metrics.values(),
+    )
+
+
+# the value of a FlatGraphResources entry that hasn't been read
+_UNBUILT = object()
+
+
+class FlatGraphResources(Dict[str, Any]):
+    """The resources of one type in the 'graph' context member, as dicts.
+    Each dict is only built the first time it's read, and then kept, so
+    projects pay for the resources their macros look at. The resources are
+    the ones in the manifest when the graph was built, so reading one doesn't
+    depend on whether it has been compiled yet.
+
+    Until it's read, a resource's entry is a placeholder. Every method that
+    hands out values builds them first, so this is a dict to macros, tojson
+    and toyaml in every way but when the dicts are built.
+    """
+
+    def __init__(self, resources: Mapping[str, Any]) -> None:
+        # a copy, since the manifest's resources are replaced as they're
+        # compiled. Copying a section of a partial parse file doesn't
+        # deserialize its resources.
+        self._resources = copy.copy(resources)
+        self._dicts: Dict[str, Dict[str, Any]] = {}
+        super().__init__(dict.fromkeys(self._resources, _UNBUILT))
+
+    def _build(self, unique_id: str, value: Any) -> Any:
+        if value is not _UNBUILT:
+            # built already, or replaced by a macro
+            return value
+        resource = self._resources[unique_id]
+        # two threads may both build the dict, and they all keep the first one
+        value = self._dicts.setdefault(unique_id, resource.to_dict(omit_none=False))
+        super().__setitem__(unique_id, value)
+        return value
+
+    def _build_all(self) -> None:
+        for unique_id, value in list(super().items()):
+            self._build(unique_id, value)
+
+    def __getitem__(self, unique_id: str) -> Any:
+        return self._build(unique_id, super().__getitem__(unique_id))
+
+    def __iter__(self):
+        # overridden so dict(), ** and update() read the values through
+        # __getitem__ instead of copying the unbuilt entries
+        return super().__iter__()
+
+    def get(self, unique_id: str, default: Any = None) -> Any:
+        if unique_id in self:
+            return self[unique_id]
+        return default
+
+    def setdefault(self, unique_id: str, default: Any = None) -> Any:
+        if unique_id in self:
+            return self[unique_id]
+        return super().setdefault(unique_id, default)
+
+    def pop(self, unique_id: str, *default: Any) -> Any:
+        if unique_id in self:
+            self[unique_id]
+        return super().pop(unique_id, *default)
+
+    def popitem(self):
+        self._build_all()
+        return super().popitem()
+
+    def items(self):
+        self._build_all()
+        return super().items()
+
+    def values(self):
+        self._build_all()
+        return super().values()
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        self._build_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __ror__(self, other):
+        return other | self.copy()
+
+    def __repr__(self) -> str:
+        self._build_all()
+        return super().__repr__()
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+
+yaml.SafeDumper.add_representer(FlatGraphResources, yaml.SafeDumper.represent_dict)
+
+
 def _search_packages(
     current_project: str,
     node_package: str,
@@ -586,6 +799,8 @@ class MacroMethods:
 class ParsingInfo:
     static_analysis_parsed_path_count: int = 0
     static_analysis_path_count: int = 0
+    # dbt.parser.parse_cache.ParseCache, when partial parsing is enabled
+    parse_cache: Optional[Any] = None
 
 
 @dataclass
@@ -595,6 +810,10 @@ class ManifestStateCheck(dbtClassMixin):
     profile_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_hash: FileHash = field(default_factory=FileHash.empty)
     project_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # hashes of each cli var and profile target field, so partial parsing
+    # can reparse only the files that used a changed one
+    cli_vars_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    target_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
 
 
 @dataclass
@@ -613,7 +832,10 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     selectors: MutableMapping[str, Any] = field(default_factory=dict)
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     metadata: ManifestMetadata = field(default_factory=ManifestMetadata)
-    flat_graph: Dict[str, Any] = field(default_factory=dict)
+    flat_graph: Dict[str, Any] = field(
+        default_factory=dict,
+        metadata={"serialize": lambda x: {}, "deserialize": lambda x: {}},
+    )
     state_check: ManifestStateCheck = field(default_factory=ManifestStateCheck)
     source_patches: MutableMapping[SourceKey, SourcePatch] = field(default_factory=dict)
     disabled: MutableMapping[str, List[CompileResultNode]] = field(default_factory=dict)
@@ -637,6 +859,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     _analysis_lookup: Optional[AnalysisLookup] = field(
         default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
     )
+    _selector_lookup: Optional[SelectorLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
     _parsing_info: ParsingInfo = field(
         default_factory=ParsingInfo,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
@@ -692,12 +917,14 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         only build it once and avoid any concurrency issues around it.
         Make sure you don't call this until you're done with building your
         manifest!
+
+        The resources' dicts are built as they're read, see FlatGraphResources.
         """
         self.flat_graph = {
-            "exposures": {k: v.to_dict(omit_none=False) for k, v in self.exposures.items()},
-            "metrics": {k: v.to_dict(omit_none=False) for k, v in self.metrics.items()},
-            "nodes": {k: v.to_dict(omit_none=False) for k, v in self.nodes.items()},
-            "sources": {k: v.to_dict(omit_none=False) for k, v in self.sources.items()},
+            "exposures": FlatGraphResources(self.exposures),
+            "metrics": FlatGraphResources(self.metrics),
+            "nodes": FlatGraphResources(self.nodes),
+            "sources": FlatGraphResources(self.sources),
         }
 
     def build_disabled_by_file_id(self):
@@ -830,8 +1057,17 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             disabled=self.disabled,
             child_map=self.child_map,
             parent_map=self.parent_map,
+            state_fingerprints=self.state_fingerprints(),
         )
 
+    def state_fingerprints(self) -> Dict[UniqueID, str]:
+        fingerprints = {}
+        for unique_id, node in self.nodes.items():
+            fingerprint = node.state_fingerprint()
+            if fingerprint is not None:
+                fingerprints[unique_id] = fingerprint
+        return fingerprints
+
     def write(self, path):
         self.writable_manifest().write(path)
 
@@ -900,6 +1136,15 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._analysis_lookup = AnalysisLookup(self)
         return self._analysis_lookup
 
+    @property
+    def selector_lookup(self) -> SelectorLookup:
+        if self._selector_lookup is None:
+            self._selector_lookup = SelectorLookup(self)
+        return self._selector_lookup
+
+    def rebuild_selector_lookup(self):
+        self._selector_lookup = SelectorLookup(self)
+
     # Called by dbt.parser.manifest._resolve_refs_for_exposure
     # and dbt.parser.manifest._process_refs_for_node
     def resolve_ref(
@@ -1017,6 +1262,8 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             ):
                 merged.add(unique_id)
                 self.nodes[unique_id] = node.replace(deferred=True)
+        if merged:
+            self.rebuild_selector_lookup()
 
         # log up to 5 items
         sample = list(islice(merged, 5))
@@ -1140,6 +1387,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._metric_lookup,
             self._disabled_lookup,
             self._analysis_lookup,
+            self._selector_lookup,
         )
         return self.__class__, args
 
@@ -1157,7 +1405,7 @@ AnyManifest = Union[Manifest, MacroManifest]
 
 
 @dataclass
-@schema_version("manifest", 7)
+@schema_version("manifest", 8)
 class WritableManifest(ArtifactMixin):
     nodes: Mapping[UniqueID, ManifestNode] = field(
         metadata=dict(description=("The nodes defined in the dbt project and its dependencies"))
@@ -1200,10 +1448,16 @@ class WritableManifest(ArtifactMixin):
             description="Metadata about the manifest",
         )
     )
+    state_fingerprints: Optional[Mapping[UniqueID, str]] = field(
+        default=None,
+        metadata=dict(
+            description="A digest of the contents of each node, for state comparison",
+        ),
+    )
 
     @classmethod
     def compatible_previous_versions(self):
-        return [("manifest", 4), ("manifest", 5), ("manifest", 6)]
+        return [("manifest", 4), ("manifest", 5), ("manifest", 6), ("manifest", 7)]
 
     def __post_serialize__(self, dct):
         for unique_id, node in dct["nodes"].items():
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import time
 from dataclasses import dataclass, field
@@ -332,6 +334,28 @@ class ParsedNode(ParsedNodeDefaults, ParsedNodeMixins, SerializableType):
             and True
         )
 
+    def state_fingerprint(self) -> Optional[str]:
+        """A digest of everything same_contents compares, so a node with the
+        same fingerprint as the old version of itself is unchanged. None if
+        the node has to be compared with the old version to tell.
+        """
+        if self.checksum.name == "path":
+            # same_seeds warns about these when it compares them
+            return None
+        data = [
+            self.resource_type,
+            self.raw_code,
+            self.checksum.to_dict(),
+            self.unrendered_config,
+            self.fqn,
+            self._persist_relation_docs(),
+            self._persist_column_docs(),
+            self.description,
+            {name: column.description for name, column in self.columns.items()},
+        ]
+        encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
 
 @dataclass
 class ParsedAnalysisNode(ParsedNode):
@@ -234,6 +234,13 @@ class UserConfig(ExtensibleDbtClassMixin, Replaceable, UserConfigContract):
     static_parser: Optional[bool] = None
     indirect_selection: Optional[str] = None
     cache_selected_only: Optional[bool] = None
+    parse_workers: Optional[int] = None
+    async_logging: Optional[bool] = None
+    log_level_file: Optional[str] = None
+    compile_ahead: Optional[bool] = None
+    cache_compiled_sql: Optional[bool] = None
+    cache_jinja_bytecode: Optional[bool] = None
+    skip_unchanged_seeds: Optional[bool] = None
 
 
 @dataclass
@@ -15,11 +15,12 @@ from dbt.logger import (
     TimingProcessor,
     JsonOnly,
 )
-from dbt.utils import lowercase
+from dbt.utils import lowercase, JSONEncoder
 from dbt.dataclass_schema import dbtClassMixin, StrEnum
 
 import agate
 
+import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import (
@@ -28,11 +29,12 @@ from typing import (
     List,
     Optional,
     Any,
+    Iterator,
     NamedTuple,
     Sequence,
 )
 
-from dbt.clients.system import write_json
+from dbt.clients.system import write_json, write_file_chunks
 
 
 @dataclass
@@ -176,6 +178,20 @@ def process_run_result(result: RunResult) -> RunResultOutput:
     )
 
 
+@dataclass
+class SchedulingEstimate(dbtClassMixin):
+    """How long the selected nodes were expected to take with the scheduling
+    policy that was used, and with depth ordering, given the execution times
+    of a previous run.
+    """
+
+    policy: str
+    threads: int
+    estimated_makespan: float
+    estimated_depth_makespan: float
+    estimated_improvement: float
+
+
 @dataclass
 class RunExecutionResult(
     ExecutionResult,
@@ -183,6 +199,7 @@ class RunExecutionResult(
     results: Sequence[RunResult]
     args: Dict[str, Any] = field(default_factory=dict)
     generated_at: datetime = field(default_factory=datetime.utcnow)
+    scheduling: Optional[SchedulingEstimate] = None
 
     def write(self, path: str):
         writable = RunResultsArtifact.from_execution_results(
@@ -190,15 +207,17 @@ class RunExecutionResult(
             elapsed_time=self.elapsed_time,
             generated_at=self.generated_at,
             args=self.args,
+            scheduling=self.scheduling,
         )
         writable.write(path)
 
 
 @dataclass
-@schema_version("run-results", 4)
+@schema_version("run-results", 5)
 class RunResultsArtifact(ExecutionResult, ArtifactMixin):
     results: Sequence[RunResultOutput]
     args: Dict[str, Any] = field(default_factory=dict)
+    scheduling: Optional[SchedulingEstimate] = None
 
     @classmethod
     def from_execution_results(
@@ -207,13 +226,24 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
         elapsed_time: float,
         generated_at: datetime,
         args: Dict,
+        scheduling: Optional[SchedulingEstimate] = None,
     ):
         processed_results = [process_run_result(result) for result in results]
         meta = RunResultsMetadata(
             dbt_schema_version=str(cls.dbt_schema_version),
             generated_at=generated_at,
         )
-        return cls(metadata=meta, results=processed_results, elapsed_time=elapsed_time, args=args)
+        return cls(
+            metadata=meta,
+            results=processed_results,
+            elapsed_time=elapsed_time,
+            args=args,
+            scheduling=scheduling,
+        )
+
+    @classmethod
+    def compatible_previous_versions(self):
+        return [("run-results", 4)]
 
     def write(self, path: str):
         write_json(path, self.to_dict(omit_none=False))
@@ -486,3 +516,30 @@ class CatalogArtifact(CatalogResults, ArtifactMixin):
             errors=errors,
             _compile_results=compile_results,
         )
+
+    def write(self, path: str):
+        write_file_chunks(path, self._iter_json())
+
+    def _iter_json(self) -> Iterator[str]:
+        """The JSON write_json would write, with the nodes and sources
+        encoded one table at a time instead of all at once
+        """
+        encoder = JSONEncoder()
+        tables = {"nodes": self.nodes, "sources": self.sources}
+        data = dataclasses.replace(self, nodes={}, sources={}).to_dict(omit_none=False)
+        yield "{"
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                yield ", "
+            yield f"{encoder.encode(key)}: "
+            if key not in tables:
+                yield encoder.encode(value)
+                continue
+            yield "{"
+            for table_index, (unique_id, table) in enumerate(tables[key].items()):
+                if table_index:
+                    yield ", "
+                yield f"{encoder.encode(unique_id)}: "
+                yield encoder.encode(table.to_dict(omit_none=False))
+            yield "}"
+        yield "}"
@@ -1,27 +1,50 @@
+from dataclasses import dataclass
 from pathlib import Path
+from .graph.compiled import ManifestNode
 from .graph.manifest import WritableManifest
+from .graph.parsed import ParsedExposure, ParsedMetric, ParsedSourceDefinition
 from .results import RunResultsArtifact
 from .results import FreshnessExecutionResultArtifact
-from typing import Optional
+from typing import Any, Dict, Optional, Union
+from dbt.dataclass_schema import dbtClassMixin
 from dbt.exceptions import IncompatibleSchemaException
+from dbt.version import __version__
+
+PreviousResource = Union[ManifestNode, ParsedSourceDefinition, ParsedExposure, ParsedMetric]
+
+
+@dataclass
+class _PreviousNode(dbtClassMixin):
+    # picks the node's class the same way WritableManifest.nodes does
+    node: ManifestNode
 
 
 class PreviousState:
     def __init__(self, path: Path, current_path: Path):
         self.path: Path = path
         self.current_path: Path = current_path
-        self.manifest: Optional[WritableManifest] = None
         self.results: Optional[RunResultsArtifact] = None
         self.sources: Optional[FreshnessExecutionResultArtifact] = None
         self.sources_current: Optional[FreshnessExecutionResultArtifact] = None
+        self._manifest: Optional[WritableManifest] = None
+        # the previous manifest's JSON, until the whole manifest is needed.
+        # Until then, its resources are deserialized one at a time.
+        self._manifest_data: Optional[Dict[str, Any]] = None
+        self._resources: Dict[str, Optional[PreviousResource]] = {}
+        self._fingerprints: Dict[str, str] = {}
 
         manifest_path = self.path / "manifest.json"
         if manifest_path.exists() and manifest_path.is_file():
             try:
-                self.manifest = WritableManifest.read_and_check_versions(str(manifest_path))
+                self._manifest_data = WritableManifest.read_data_and_check_versions(
+                    str(manifest_path)
+                )
             except IncompatibleSchemaException as exc:
                 exc.add_filename(str(manifest_path))
                 raise
+            # fingerprints from another version of dbt might not be comparable
+            if self._manifest_data["metadata"].get("dbt_version") == __version__:
+                self._fingerprints = self._manifest_data.get("state_fingerprints") or {}
 
         results_path = self.path / "run_results.json"
         if results_path.exists() and results_path.is_file():
@@ -50,3 +73,76 @@ class PreviousState:
             except IncompatibleSchemaException as exc:
                 exc.add_filename(str(sources_current_path))
                 raise
+
+    @property
+    def manifest(self) -> Optional[WritableManifest]:
+        if self._manifest is None and self._manifest_data is not None:
+            self._manifest = WritableManifest.from_dict(self._manifest_data)
+            self._manifest_data = None
+            self._resources = {}
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, manifest: Optional[WritableManifest]) -> None:
+        self._manifest = manifest
+        self._manifest_data = None
+        self._resources = {}
+        self._fingerprints = {}
+
+    @property
+    def has_manifest(self) -> bool:
+        return self._manifest is not None or self._manifest_data is not None
+
+    def macro_sql(self) -> Dict[str, str]:
+        """The code of each macro in the previous manifest"""
+        if self._manifest_data is not None:
+            return {
+                unique_id: macro["macro_sql"]
+                for unique_id, macro in self._manifest_data["macros"].items()
+            }
+        if self._manifest is not None:
+            return {
+                unique_id: macro.macro_sql for unique_id, macro in self._manifest.macros.items()
+            }
+        return {}
+
+    def same_fingerprint(self, unique_id: str, fingerprint: Optional[str]) -> bool:
+        """Whether the node had the same fingerprint in the previous manifest.
+        If not, it might still be unchanged, so compare it with
+        get_resource(unique_id) to tell.
+        """
+        return fingerprint is not None and self._fingerprints.get(unique_id) == fingerprint
+
+    def get_resource(self, unique_id: str) -> Optional[PreviousResource]:
+        """The node, source, exposure or metric in the previous manifest"""
+        if self._manifest is not None:
+            return _find_resource(self._manifest, unique_id)
+        if unique_id not in self._resources:
+            self._resources[unique_id] = self._deserialize_resource(unique_id)
+        return self._resources[unique_id]
+
+    def _deserialize_resource(self, unique_id: str) -> Optional[PreviousResource]:
+        data = self._manifest_data
+        if data is None:
+            return None
+        if unique_id in data["nodes"]:
+            return _PreviousNode.from_dict({"node": data["nodes"][unique_id]}).node
+        elif unique_id in data["sources"]:
+            return ParsedSourceDefinition.from_dict(data["sources"][unique_id])
+        elif unique_id in data["exposures"]:
+            return ParsedExposure.from_dict(data["exposures"][unique_id])
+        elif unique_id in data["metrics"]:
+            return ParsedMetric.from_dict(data["metrics"][unique_id])
+        return None
+
+
+def _find_resource(manifest: WritableManifest, unique_id: str) -> Optional[PreviousResource]:
+    if unique_id in manifest.nodes:
+        return manifest.nodes[unique_id]
+    elif unique_id in manifest.sources:
+        return manifest.sources[unique_id]
+    elif unique_id in manifest.exposures:
+        return manifest.exposures[unique_id]
+    elif unique_id in manifest.metrics:
+        return manifest.metrics[unique_id]
+    return None
@@ -239,6 +239,12 @@ class VersionedSchema(dbtClassMixin):
 
     @classmethod
     def read_and_check_versions(cls, path: str):
+        data = cls.read_data_and_check_versions(path)
+        return cls.from_dict(data)  # type: ignore
+
+    @classmethod
+    def read_data_and_check_versions(cls, path: str) -> Dict[str, Any]:
+        """Read the artifact's JSON, without deserializing it"""
         try:
             data = read_json(path)
         except (EnvironmentError, ValueError) as exc:
@@ -260,7 +266,7 @@ class VersionedSchema(dbtClassMixin):
                     )
         if get_manifest_schema_version(data) <= 6:
             data = upgrade_manifest_json(data)
-        return cls.from_dict(data)  # type: ignore
+        return data
 
 
 T = TypeVar("T", bound="ArtifactMixin")
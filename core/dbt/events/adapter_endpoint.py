@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from dbt.events.functions import fire_event
+from dbt.events.functions import event_enabled, fire_event
 from dbt.events.types import (
     AdapterEventDebug,
     AdapterEventInfo,
@@ -13,6 +13,9 @@ class AdapterLogger:
     name: str
 
     def debug(self, msg, *args, exc_info=None, extra=None, stack_info=False):
+        # adapters log a lot at debug level, often from loops
+        if not event_enabled(AdapterEventDebug):
+            return
         event = AdapterEventDebug(name=self.name, base_msg=msg, args=args)
 
         event.exc_info = exc_info
@@ -1,6 +1,18 @@
 from colorama import Style
 import dbt.events.functions as this  # don't worry I hate it too.
-from dbt.events.base_types import NoStdOut, Event, NoFile, ShowException, Cache
+from dbt.events.base_types import (
+    NoStdOut,
+    Event,
+    NoFile,
+    ShowException,
+    Cache,
+    TestLevel,
+    DebugLevel,
+    InfoLevel,
+    WarnLevel,
+    ErrorLevel,
+)
+from dbt.events.history import EventHistory
 from dbt.events.types import EventBufferFull, T_Event, MainReportVersion, EmptyLine
 import dbt.flags as flags
 from dbt.constants import SECRET_ENV_PREFIX
@@ -19,17 +31,18 @@ from logging.handlers import RotatingFileHandler
 import os
 import uuid
 import threading
-from typing import Any, Dict, List, Optional, Union
+import atexit
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Type, Union
 from collections import deque
 
 global LOG_VERSION
 LOG_VERSION = 2
 
-# create the global event history buffer with the default max size (10k)
-# python 3.7 doesn't support type hints on globals, but mypy requires them. hence the ignore.
+# create the global event history buffer, which keeps nothing until
+# --event-buffer-bytes is set
 # TODO the flags module has not yet been resolved when this is created
 global EVENT_HISTORY
-EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+EVENT_HISTORY = EventHistory(flags.EVENT_BUFFER_BYTES, flags.EVENT_BUFFER_SIZE)
 
 # create the global file logger with no configuration
 global FILE_LOG
@@ -52,9 +65,13 @@ invocation_id: Optional[str] = None
 
 
 def setup_event_logger(log_path, level_override=None):
+    # events fired so far go to the loggers, and use the format, they were
+    # fired with
+    flush_events()
+
     # flags have been resolved, and log_path is known
     global EVENT_HISTORY
-    EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+    EVENT_HISTORY = EventHistory(flags.EVENT_BUFFER_BYTES, flags.EVENT_BUFFER_SIZE)
 
     make_log_dir_if_missing(log_path)
     this.format_json = flags.LOG_FORMAT == "json"
@@ -116,7 +133,15 @@ def stop_capture_stdout_logs() -> None:
     ]
 
 
+# the async event writer looks up the secrets once per batch of events, instead
+# of once per log line
+_batch_secrets = threading.local()
+
+
 def env_secrets() -> List[str]:
+    secrets = getattr(_batch_secrets, "secrets", None)
+    if secrets is not None:
+        return secrets
     return [v for k, v in os.environ.items() if k.startswith(SECRET_ENV_PREFIX) and v.strip()]
 
 
@@ -132,7 +157,7 @@ def scrub_secrets(msg: str, secrets: List[str]) -> str:
 # returns a dictionary representation of the event fields.
 # the message may contain secrets which must be scrubbed at the usage site.
 def event_to_serializable_dict(
-    e: T_Event,
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
 ) -> Dict[str, Any]:
 
     log_line = dict()
@@ -152,13 +177,13 @@ def event_to_serializable_dict(
     event_dict = {
         "type": "log_line",
         "log_version": LOG_VERSION,
-        "ts": get_ts_rfc3339(),
+        "ts": get_ts_rfc3339(ts),
         "pid": e.get_pid(),
         "msg": e.message(),
         "level": e.level_tag(),
         "data": log_line,
         "invocation_id": e.get_invocation_id(),
-        "thread_name": e.get_thread_name(),
+        "thread_name": thread_name or e.get_thread_name(),
         "code": e.code,
     }
 
@@ -171,52 +196,64 @@ def reset_color() -> str:
     return "" if not this.format_color else Style.RESET_ALL
 
 
-def create_info_text_log_line(e: T_Event) -> str:
+# the time stamp and thread name default to now and the current thread, but the
+# async event writer passes the ones the event was fired with
+def create_info_text_log_line(e: T_Event, ts: Optional[datetime] = None) -> str:
     color_tag: str = reset_color()
-    ts: str = get_ts().strftime("%H:%M:%S")
+    ts_str: str = (ts or get_ts()).strftime("%H:%M:%S")
     scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
-    log_line: str = f"{color_tag}{ts}  {scrubbed_msg}"
+    log_line: str = f"{color_tag}{ts_str}  {scrubbed_msg}"
     return log_line
 
 
-def create_debug_text_log_line(e: T_Event) -> str:
+def create_debug_text_log_line(
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
+) -> str:
     log_line: str = ""
+    ts = ts or get_ts()
     # Create a separator if this is the beginning of an invocation
     if type(e) == MainReportVersion:
         separator = 30 * "="
-        log_line = f"\n\n{separator} {get_ts()} | {get_invocation_id()} {separator}\n"
+        log_line = f"\n\n{separator} {ts} | {get_invocation_id()} {separator}\n"
     color_tag: str = reset_color()
-    ts: str = get_ts().strftime("%H:%M:%S.%f")
+    ts_str: str = ts.strftime("%H:%M:%S.%f")
     scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
     level: str = e.level_tag() if len(e.level_tag()) == 5 else f"{e.level_tag()} "
     thread = ""
-    if threading.current_thread().name:
-        thread_name = threading.current_thread().name
+    thread_name = thread_name or threading.current_thread().name
+    if thread_name:
         thread_name = thread_name[:10]
         thread_name = thread_name.ljust(10, " ")
         thread = f" [{thread_name}]:"
-    log_line = log_line + f"{color_tag}{ts} [{level}]{thread} {scrubbed_msg}"
+    log_line = log_line + f"{color_tag}{ts_str} [{level}]{thread} {scrubbed_msg}"
     return log_line
 
 
 # translates an Event to a completely formatted json log line
-def create_json_log_line(e: T_Event) -> Optional[str]:
+def create_json_log_line(
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
+) -> Optional[str]:
     if type(e) == EmptyLine:
         return None  # will not be sent to logger
     # using preformatted ts string instead of formatting it here to be extra careful about timezone
-    values = event_to_serializable_dict(e)
+    values = event_to_serializable_dict(e, ts, thread_name)
     raw_log_line = json.dumps(values, sort_keys=True)
     return scrub_secrets(raw_log_line, env_secrets())
 
 
 # calls create_stdout_text_log_line() or create_json_log_line() according to logger config
-def create_log_line(e: T_Event, file_output=False) -> Optional[str]:
+def create_log_line(
+    e: T_Event,
+    file_output=False,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+) -> Optional[str]:
     if this.format_json:
-        return create_json_log_line(e)  # json output, both console and file
+        return create_json_log_line(e, ts, thread_name)  # json output, both console and file
     elif file_output is True or flags.DEBUG:
-        return create_debug_text_log_line(e)  # default file output
+        return create_debug_text_log_line(e, ts, thread_name)  # default file output
     else:
-        return create_info_text_log_line(e)  # console output
+        return create_info_text_log_line(e, ts)  # console output
 
 
 # allows for reuse of this obnoxious if else tree.
@@ -261,23 +298,102 @@ def send_exc_to_logger(
         )
 
 
+# the levels that --log-level-file accepts, from the most verbose
+LEVEL_RANKS = {"test": 0, "debug": 0, "info": 1, "warn": 2, "error": 3, "none": 4}
+_LEVEL_CLASSES = [
+    (TestLevel, "test"),
+    (DebugLevel, "debug"),
+    (InfoLevel, "info"),
+    (WarnLevel, "warn"),
+    (ErrorLevel, "error"),
+]
+
+
+class EventClassInfo(NamedTuple):
+    level_tag: Optional[str]
+    no_file: bool
+    no_stdout: bool
+    cache: bool
+
+
+_event_class_info: Dict[type, EventClassInfo] = {}
+
+
+def event_class_info(event_cls: type) -> EventClassInfo:
+    """The parts of an event type that decide where its events go"""
+    info = _event_class_info.get(event_cls)
+    if info is None:
+        level_tag = next(
+            (tag for level_cls, tag in _LEVEL_CLASSES if issubclass(event_cls, level_cls)), None
+        )
+        info = EventClassInfo(
+            level_tag=level_tag,
+            no_file=issubclass(event_cls, NoFile),
+            no_stdout=issubclass(event_cls, NoStdOut),
+            cache=issubclass(event_cls, Cache),
+        )
+        _event_class_info[event_cls] = info
+    return info
+
+
+def logs_to_file(info: EventClassInfo, level_tag: str) -> bool:
+    if info.no_file:
+        return False
+    # an unknown level, from an env var or profiles.yml, means the default
+    file_level = LEVEL_RANKS.get(flags.LOG_LEVEL_FILE or "debug", 0)
+    return LEVEL_RANKS[level_tag] >= file_level
+
+
+def shows_on_stdout(info: EventClassInfo, level_tag: str) -> bool:
+    if info.no_stdout:
+        return False
+    # explicitly checking the debug flag here so that potentially expensive-to-construct
+    # log messages are not constructed if debug messages are never shown.
+    if level_tag == "debug" and not flags.DEBUG:
+        return False  # eat the message in case it was one of the expensive ones
+    if level_tag != "error" and flags.QUIET:
+        return False  # eat all non-exception messages in quiet mode
+    return True
+
+
+def event_enabled(event_cls: Type[Event]) -> bool:
+    """Whether an event of this type would be logged, or kept in the event
+    history, if it was fired now.
+    """
+    info = event_class_info(event_cls)
+    if info.cache and not flags.LOG_CACHE_EVENTS:
+        return False
+    if EVENT_HISTORY.enabled or flags.ENABLE_LEGACY_LOGGER or info.level_tag is None:
+        return True
+    return logs_to_file(info, info.level_tag) or shows_on_stdout(info, info.level_tag)
+
+
+def fire_lazy_event(event_cls: Type[T_Event], make_event: Callable[[], T_Event]) -> None:
+    """Fire the event that make_event builds, only if an event of that type
+    would go anywhere. For events that are expensive to build, or that are
+    fired in loops over every node or file, so that they cost nothing at log
+    levels that drop them.
+
+        fire_lazy_event(PartialParsingFile, lambda: PartialParsingFile(file_dict=f.to_dict()))
+    """
+    if event_enabled(event_cls):
+        fire_event(make_event())
+
+
 # top-level method for accessing the new eventing system
 # this is where all the side effects happen branched by event type
 # (i.e. - mutating the event history, printing to stdout, logging
 # to files, etc.)
 def fire_event(e: Event) -> None:
+    info = event_class_info(type(e))
     # skip logs when `--log-cache-events` is not passed
-    if isinstance(e, Cache) and not flags.LOG_CACHE_EVENTS:
+    if info.cache and not flags.LOG_CACHE_EVENTS:
         return
 
-    # if and only if the event history deque will be completely filled by this event
+    # if and only if the event history will be completely filled by this event
     # fire warning that old events are now being dropped
-    global EVENT_HISTORY
-    if len(EVENT_HISTORY) == (flags.EVENT_BUFFER_SIZE - 1):
-        EVENT_HISTORY.append(e)
+    if EVENT_HISTORY.append(e):
         fire_event(EventBufferFull())
-    else:
-        EVENT_HISTORY.append(e)
 
     # backwards compatibility for plugins that require old logger (dbt-rpc)
     if flags.ENABLE_LEGACY_LOGGER:
@@ -288,29 +404,35 @@ def fire_event(e: Event) -> None:
             send_to_logger(GLOBAL_LOGGER, e.level_tag(), log_line)
         return  # exit the function to avoid using the current logger as well
 
-    # always logs debug level regardless of user input
-    if not isinstance(e, NoFile):
+    level_tag = e.level_tag()
+    to_file = logs_to_file(info, level_tag)
+    to_stdout = shows_on_stdout(info, level_tag)
+    if flags.ASYNC_LOGGING and (to_file or to_stdout):
+        exc_info = e.exc_info if isinstance(e, ShowException) else None
+        if exc_info is True:
+            # the writer thread isn't handling this exception
+            exc_info = sys.exc_info()
+        get_event_writer().put(
+            FiredEvent(e, get_ts(), threading.current_thread().name, to_file, to_stdout, exc_info)
+        )
+        return
+
+    # logs debug level regardless of the debug flag, unless --log-level-file says otherwise
+    if to_file:
         log_line = create_log_line(e, file_output=True)
         # doesn't send exceptions to exception logger
         if log_line:
-            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
-
-    if not isinstance(e, NoStdOut):
-        # explicitly checking the debug flag here so that potentially expensive-to-construct
-        # log messages are not constructed if debug messages are never shown.
-        if e.level_tag() == "debug" and not flags.DEBUG:
-            return  # eat the message in case it was one of the expensive ones
-        if e.level_tag() != "error" and flags.QUIET:
-            return  # eat all non-exception messages in quiet mode
+            send_to_logger(FILE_LOG, level_tag=level_tag, log_line=log_line)
 
+    if to_stdout:
         log_line = create_log_line(e)
         if log_line:
             if not isinstance(e, ShowException):
-                send_to_logger(STDOUT_LOG, level_tag=e.level_tag(), log_line=log_line)
+                send_to_logger(STDOUT_LOG, level_tag=level_tag, log_line=log_line)
             else:
                 send_exc_to_logger(
                     STDOUT_LOG,
-                    level_tag=e.level_tag(),
+                    level_tag=level_tag,
                     log_line=log_line,
                     exc_info=e.exc_info,
                     stack_info=e.stack_info,
@@ -318,6 +440,191 @@ def fire_event(e: Event) -> None:
                 )
 
 
+class FiredEvent(NamedTuple):
+    """An event waiting for the async writer, with what it needs from the
+    thread that fired it.
+    """
+
+    event: Event
+    ts: datetime
+    thread_name: str
+    to_file: bool
+    to_stdout: bool
+    exc_info: Any
+
+
+class AsyncEventWriter:
+    """Formats and writes events on a dedicated thread, so that firing an
+    event only costs an append to a queue.
+
+    Events are written in the order they were fired. The writer wakes up
+    every FLUSH_INTERVAL seconds, or as soon as BATCH_SIZE events are
+    waiting, and writes everything in the queue. Consecutive lines for the
+    same logger and level are sent as one record, so each handler takes its
+    lock and flushes its stream once per batch instead of once per event.
+    """
+
+    FLUSH_INTERVAL = 0.05
+    BATCH_SIZE = 1000
+
+    def __init__(self) -> None:
+        # appending to and popping from a deque are atomic, so the threads
+        # firing events never wait on each other or on the writer
+        self._queue: Deque[Union[FiredEvent, threading.Event]] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="EventWriter", daemon=True)
+        self._thread.start()
+
+    def put(self, fired: FiredEvent) -> None:
+        self._queue.append(fired)
+        if self._stopping:
+            # fired while dbt is exiting, after the writer thread is gone
+            self._write_queued()
+        elif len(self._queue) >= self.BATCH_SIZE:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Wait until every event fired before this call has been written"""
+        if not self._thread.is_alive():
+            self._write_queued()
+            return
+        done = threading.Event()
+        self._queue.append(done)
+        self._wakeup.set()
+        done.wait()
+
+    def stop(self) -> None:
+        """Write everything in the queue, and stop the writer thread. Events
+        put after this are written right away, on the thread that fired them.
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        # the thread may have died with events left, or never run
+        self._write_queued()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self._write_queued()
+
+    def _write_queued(self) -> None:
+        if not self._queue:
+            return
+        _batch_secrets.secrets = env_secrets()
+        try:
+            self._write_batch()
+        finally:
+            _batch_secrets.secrets = None
+
+    def _write_batch(self) -> None:
+        batch = _LineBatch()
+        while self._queue:
+            fired = self._queue.popleft()
+            if isinstance(fired, threading.Event):
+                batch.write()
+                fired.set()
+                continue
+            try:
+                self._add_event(batch, fired)
+            except Exception:
+                # a broken event shouldn't lose the ones after it
+                batch.write()
+                STDOUT_LOG.exception(f"Could not write event {type(fired.event).__name__}")
+        batch.write()
+
+    def _add_event(self, batch: "_LineBatch", fired: FiredEvent) -> None:
+        e = fired.event
+        level_tag = e.level_tag()
+        if fired.to_file:
+            log_line = create_log_line(e, True, fired.ts, fired.thread_name)
+            if log_line:
+                batch.add(FILE_LOG, level_tag, log_line)
+        if fired.to_stdout:
+            log_line = create_log_line(e, False, fired.ts, fired.thread_name)
+            if not log_line:
+                return
+            if isinstance(e, ShowException):
+                batch.write()
+                send_exc_to_logger(
+                    STDOUT_LOG,
+                    level_tag=level_tag,
+                    log_line=log_line,
+                    exc_info=fired.exc_info,
+                    stack_info=e.stack_info,
+                    extra=e.extra,
+                )
+            else:
+                batch.add(STDOUT_LOG, level_tag, log_line)
+
+
+class _LineBatch:
+    """Joins the lines sent to each logger while the logger and level stay
+    the same.
+    """
+
+    def __init__(self) -> None:
+        self.lines: Dict[Logger, List[str]] = {}
+        self.level_tags: Dict[Logger, str] = {}
+
+    def add(self, logger: Logger, level_tag: str, log_line: str) -> None:
+        if self.level_tags.get(logger, level_tag) != level_tag:
+            self.write_one(logger)
+        self.level_tags[logger] = level_tag
+        self.lines.setdefault(logger, []).append(log_line)
+
+    def write_one(self, logger: Logger) -> None:
+        lines = self.lines.pop(logger, None)
+        if lines:
+            send_to_logger(logger, self.level_tags.pop(logger), "\n".join(lines))
+
+    def write(self) -> None:
+        for logger in list(self.lines):
+            self.write_one(logger)
+
+
+global EVENT_WRITER
+EVENT_WRITER: Optional[AsyncEventWriter] = None
+_event_writer_lock = threading.Lock()
+
+
+def get_event_writer() -> AsyncEventWriter:
+    global EVENT_WRITER
+    if EVENT_WRITER is None:
+        with _event_writer_lock:
+            if EVENT_WRITER is None:
+                EVENT_WRITER = AsyncEventWriter()
+    return EVENT_WRITER
+
+
+def flush_events() -> None:
+    """Wait for the async writer to write the events fired so far"""
+    if EVENT_WRITER is not None:
+        EVENT_WRITER.flush()
+
+
+def stop_event_writer() -> None:
+    if EVENT_WRITER is not None:
+        EVENT_WRITER.stop()
+
+
+def _reset_event_writer_in_child() -> None:
+    # the writer thread doesn't survive a fork, and its queue was flushed
+    # before forking, so the child starts its own writer when it needs one
+    global EVENT_WRITER, _event_writer_lock
+    EVENT_WRITER = None
+    _event_writer_lock = threading.Lock()
+
+
+# drain the queue when dbt exits, whether or not the command failed
+atexit.register(stop_event_writer)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=flush_events, after_in_child=_reset_event_writer_in_child)
+
+
 def get_invocation_id() -> str:
     global invocation_id
     if invocation_id is None:
@@ -339,7 +646,7 @@ def get_ts() -> datetime:
 
 
 # preformatted time stamp
-def get_ts_rfc3339() -> str:
-    ts = get_ts()
+def get_ts_rfc3339(ts: Optional[datetime] = None) -> str:
+    ts = ts or get_ts()
     ts_rfc3339 = ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return ts_rfc3339
@@ -0,0 +1,75 @@
+import sys
+import threading
+from collections import deque
+from typing import Deque, Iterator
+
+from dbt.events.base_types import Event
+
+
+def approximate_size(e: Event) -> int:
+    """The size of the event and of the values of its fields, not counting
+    what those values contain. Cheap enough to run on every event, at the
+    cost of undercounting nested values like file dicts.
+    """
+    return sys.getsizeof(e) + sum(map(sys.getsizeof, vars(e).values()))
+
+
+class EventHistory:
+    """The most recent events, for callers that read them back after firing
+    them. Holds at most max_events events, and at most about max_bytes bytes
+    of them, dropping the oldest events first. With max_bytes of 0, no events
+    are kept.
+    """
+
+    def __init__(self, max_bytes: int = 0, max_events: int = 0) -> None:
+        self.max_bytes = max_bytes
+        self.max_events = max_events
+        self.nbytes = 0
+        # set the first time an event is dropped
+        self.full = False
+        self._events: Deque[Event] = deque()
+        self._sizes: Deque[int] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.max_events > 0
+
+    def append(self, e: Event) -> bool:
+        """Keep the event, and return True if the history just became full"""
+        if not self.enabled:
+            return False
+        size = approximate_size(e)
+        with self._lock:
+            self._events.append(e)
+            self._sizes.append(size)
+            self.nbytes += size
+            # leave the newest event even if it's bigger than max_bytes
+            while len(self._events) > 1 and (
+                len(self._events) > self.max_events or self.nbytes > self.max_bytes
+            ):
+                self._events.popleft()
+                self.nbytes -= self._sizes.popleft()
+            if self.full:
+                return False
+            self.full = len(self._events) >= self.max_events or self.nbytes >= self.max_bytes
+            return self.full
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.full = False
+
+    def count(self, e: Event) -> int:
+        return self._events.count(e)
+
+    def __getitem__(self, index: int) -> Event:
+        return self._events[index]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(list(self._events))
@@ -1221,6 +1221,18 @@ class InvalidRefInTestNode(DebugLevel):
         return self.msg
 
 
+@dataclass
+class PartialParsingDependentInputsChanged(InfoLevel):
+    inputs: List[str]
+    code: str = "I052"
+
+    def message(self) -> str:
+        return (
+            "Partial parsing: reparsing files that used changed vars or profile fields: "
+            f"{', '.join(self.inputs)}"
+        )
+
+
 @dataclass
 class RunningOperationCaughtError(ErrorLevel):
     exc: Exception
@@ -1567,6 +1579,28 @@ class BuildingCatalog(InfoLevel):
         return "Building catalog"
 
 
+@dataclass
+class BuildingIncrementalCatalog(InfoLevel):
+    refreshed: int
+    schemas: int
+    code: str = "E045"
+
+    def message(self) -> str:
+        return (
+            f"Reading the catalog of {self.refreshed} of {self.schemas} schemas, "
+            "the others haven't changed"
+        )
+
+
+@dataclass
+class IncrementalCatalogUnavailable(InfoLevel):
+    reason: str
+    code: str = "E046"
+
+    def message(self) -> str:
+        return f"Reading the whole catalog: {self.reason}"
+
+
 @dataclass
 class CompileComplete(InfoLevel):
     code: str = "Q002"
@@ -2188,6 +2222,23 @@ class ConcurrencyLine(InfoLevel):
         return f"Concurrency: {self.num_threads} threads (target='{self.target_name}')"
 
 
+@dataclass
+class SchedulingEstimated(InfoLevel):
+    policy: str
+    timed_nodes: int
+    num_nodes: int
+    estimated_makespan: float
+    estimated_depth_makespan: float
+    code: str = "Q036"
+
+    def message(self) -> str:
+        return (
+            f"Scheduling by {self.policy}, with execution times for {self.timed_nodes} of "
+            f"{self.num_nodes} nodes: estimated {self.estimated_makespan:0.2f}s, against "
+            f"{self.estimated_depth_makespan:0.2f}s by depth"
+        )
+
+
 @dataclass
 class NodeCompiling(DebugLevel, NodeInfo):
     unique_id: str
@@ -2374,6 +2425,30 @@ class WritingInjectedSQLForNode(DebugLevel):
         return f'Writing injected SQL for node "{self.unique_id}"'
 
 
+@dataclass
+class CompiledSqlCacheLoadFailed(DebugLevel):
+    path: str
+    exc: str
+    code: str = "Q037"
+
+    def message(self) -> str:
+        return f"Failed to load the compiled SQL cache file at {self.path}: {self.exc}"
+
+
+@dataclass
+class CompiledSqlCacheStats(DebugLevel):
+    hits: int
+    misses: int
+    uncacheable: int
+    code: str = "Q038"
+
+    def message(self) -> str:
+        return (
+            f"Reused the cached compiled SQL of {self.hits} nodes, cached {self.misses}, "
+            f"and compiled {self.uncacheable} that can't be cached"
+        )
+
+
 @dataclass
 class DisableTracking(DebugLevel):
     code: str = "Z039"
@@ -2477,6 +2552,61 @@ class RecordRetryException(DebugLevel):
         return f"External call exception: {self.exc}"
 
 
+@dataclass
+class DaemonListening(InfoLevel):
+    socket_path: str
+    code: str = "Z049"
+
+    def message(self) -> str:
+        return f"Serving dbt commands on {self.socket_path}. Press Ctrl+C to exit."
+
+
+@dataclass
+class DaemonProjectChanged(InfoLevel):
+    paths: List[str]
+    code: str = "Z050"
+
+    def message(self) -> str:
+        return f"Updating the manifest, {pluralize(len(self.paths), 'project file')} changed"
+
+
+@dataclass
+class DaemonManifestLoadFailed(ErrorLevel):
+    exc: str
+    code: str = "Z051"
+
+    def message(self) -> str:
+        return (
+            f"Could not load the manifest: {self.exc}\n"
+            "Commands will parse the project until the problem is fixed."
+        )
+
+
+@dataclass
+class DaemonRunningCommand(InfoLevel):
+    args: List[str]
+    code: str = "Z052"
+
+    def message(self) -> str:
+        return f"Running `dbt {' '.join(self.args)}`"
+
+
+@dataclass
+class JinjaTemplateCacheStats(DebugLevel):
+    hits: int
+    misses: int
+    evictions: int
+    loaded: int
+    code: str = "Z053"
+
+    def message(self) -> str:
+        return (
+            f"Compiled {self.misses - self.loaded} Jinja templates, loaded {self.loaded} "
+            f"from the bytecode cache, reused {self.hits}, "
+            f"and dropped {self.evictions} from the cache"
+        )
+
+
 # since mypy doesn't run on every file we need to suggest to mypy that every
 # class gets instantiated. But we don't actually want to run this code.
 # making the conditional `if False` causes mypy to skip it as dead code so
@@ -2617,6 +2747,7 @@ if 1 == 0:
     PartialParsingDeletedExposure(unique_id="")
     InvalidDisabledSourceInTestNode(msg="")
     InvalidRefInTestNode(msg="")
+    PartialParsingDependentInputsChanged(inputs=[])
     RunningOperationCaughtError(exc=Exception(""))
     RunningOperationUncaughtError(exc=Exception(""))
     DbtProjectError()
@@ -2650,6 +2781,8 @@ if 1 == 0:
     CatalogWritten(path="")
     CannotGenerateDocs()
     BuildingCatalog()
+    BuildingIncrementalCatalog(refreshed=0, schemas=0)
+    IncrementalCatalogUnavailable(reason="")
     CompileComplete()
     FreshnessCheckComplete()
     ServingDocsPort(address="", port=0)
@@ -2811,6 +2944,9 @@ if 1 == 0:
     NodeFinished(node_info={}, unique_id="", run_result={})
     QueryCancelationUnsupported(type="")
     ConcurrencyLine(num_threads=0, target_name="")
+    SchedulingEstimated(
+        policy="", timed_nodes=0, num_nodes=0, estimated_makespan=0.0, estimated_depth_makespan=0.0
+    )
     NodeCompiling(node_info={}, unique_id="")
     NodeExecuting(node_info={}, unique_id="")
     StarterProjectPath(dir="")
@@ -2830,6 +2966,8 @@ if 1 == 0:
     FoundStats(stat_line="")
     CompilingNode(unique_id="")
     WritingInjectedSQLForNode(unique_id="")
+    CompiledSqlCacheLoadFailed(path="", exc="")
+    CompiledSqlCacheStats(hits=0, misses=0, uncacheable=0)
     DisableTracking()
     SendingEvent(kwargs="")
     SendEventFailure()
@@ -2841,3 +2979,8 @@ if 1 == 0:
     GeneralWarningException(exc=Exception(""), log_fmt="")
     EventBufferFull()
     RecordRetryException(exc=Exception(""))
+    DaemonListening(socket_path="")
+    DaemonProjectChanged(paths=[])
+    DaemonManifestLoadFailed(exc="")
+    DaemonRunningCommand(args=[])
+    JinjaTemplateCacheStats(hits=0, misses=0, evictions=0, loaded=0)
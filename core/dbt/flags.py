@@ -34,11 +34,19 @@ WHICH = None
 INDIRECT_SELECTION = None
 LOG_CACHE_EVENTS = None
 EVENT_BUFFER_SIZE = 100000
+EVENT_BUFFER_BYTES = 0
+LOG_LEVEL_FILE = None
 QUIET = None
 NO_PRINT = None
 CACHE_SELECTED_ONLY = None
 TARGET_PATH = None
 LOG_PATH = None
+PARSE_WORKERS = 0
+ASYNC_LOGGING = None
+COMPILE_AHEAD = None
+CACHE_COMPILED_SQL = None
+CACHE_JINJA_BYTECODE = None
+SKIP_UNCHANGED_SEEDS = None
 
 _NON_BOOLEAN_FLAGS = [
     "LOG_FORMAT",
@@ -46,8 +54,11 @@ _NON_BOOLEAN_FLAGS = [
     "PROFILES_DIR",
     "INDIRECT_SELECTION",
     "EVENT_BUFFER_SIZE",
+    "EVENT_BUFFER_BYTES",
+    "LOG_LEVEL_FILE",
     "TARGET_PATH",
     "LOG_PATH",
+    "PARSE_WORKERS",
 ]
 
 _NON_DBT_ENV_FLAGS = ["DO_NOT_TRACK"]
@@ -72,11 +83,19 @@ flag_defaults = {
     "INDIRECT_SELECTION": "eager",
     "LOG_CACHE_EVENTS": False,
     "EVENT_BUFFER_SIZE": 100000,
+    "EVENT_BUFFER_BYTES": 0,
+    "LOG_LEVEL_FILE": "debug",
     "QUIET": False,
     "NO_PRINT": False,
     "CACHE_SELECTED_ONLY": False,
     "TARGET_PATH": None,
     "LOG_PATH": None,
+    "PARSE_WORKERS": 0,
+    "ASYNC_LOGGING": False,
+    "COMPILE_AHEAD": False,
+    "CACHE_COMPILED_SQL": False,
+    "CACHE_JINJA_BYTECODE": True,
+    "SKIP_UNCHANGED_SEEDS": False,
 }
 
 
@@ -127,7 +146,8 @@ def set_from_args(args, user_config):
     global WRITE_JSON, PARTIAL_PARSE, USE_COLORS, STORE_FAILURES, PROFILES_DIR, DEBUG, LOG_FORMAT
     global INDIRECT_SELECTION, VERSION_CHECK, FAIL_FAST, SEND_ANONYMOUS_USAGE_STATS
     global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET, NO_PRINT, CACHE_SELECTED_ONLY
-    global TARGET_PATH, LOG_PATH
+    global TARGET_PATH, LOG_PATH, PARSE_WORKERS, ASYNC_LOGGING, EVENT_BUFFER_BYTES, LOG_LEVEL_FILE
+    global COMPILE_AHEAD, CACHE_COMPILED_SQL, CACHE_JINJA_BYTECODE, SKIP_UNCHANGED_SEEDS
 
     STRICT_MODE = False  # backwards compatibility
     # cli args without user_config or env var option
@@ -152,11 +172,19 @@ def set_from_args(args, user_config):
     INDIRECT_SELECTION = get_flag_value("INDIRECT_SELECTION", args, user_config)
     LOG_CACHE_EVENTS = get_flag_value("LOG_CACHE_EVENTS", args, user_config)
     EVENT_BUFFER_SIZE = get_flag_value("EVENT_BUFFER_SIZE", args, user_config)
+    EVENT_BUFFER_BYTES = get_flag_value("EVENT_BUFFER_BYTES", args, user_config)
+    LOG_LEVEL_FILE = get_flag_value("LOG_LEVEL_FILE", args, user_config)
     QUIET = get_flag_value("QUIET", args, user_config)
     NO_PRINT = get_flag_value("NO_PRINT", args, user_config)
     CACHE_SELECTED_ONLY = get_flag_value("CACHE_SELECTED_ONLY", args, user_config)
     TARGET_PATH = get_flag_value("TARGET_PATH", args, user_config)
     LOG_PATH = get_flag_value("LOG_PATH", args, user_config)
+    PARSE_WORKERS = get_flag_value("PARSE_WORKERS", args, user_config)
+    ASYNC_LOGGING = get_flag_value("ASYNC_LOGGING", args, user_config)
+    COMPILE_AHEAD = get_flag_value("COMPILE_AHEAD", args, user_config)
+    CACHE_COMPILED_SQL = get_flag_value("CACHE_COMPILED_SQL", args, user_config)
+    CACHE_JINJA_BYTECODE = get_flag_value("CACHE_JINJA_BYTECODE", args, user_config)
+    SKIP_UNCHANGED_SEEDS = get_flag_value("SKIP_UNCHANGED_SEEDS", args, user_config)
 
     _set_overrides_from_env()
 
@@ -174,7 +202,8 @@ def _set_overrides_from_env():
 def get_flag_value(flag, args, user_config):
     flag_value = _load_flag_value(flag, args, user_config)
 
-    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE"]:  # must be ints
+    # must be ints
+    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE", "EVENT_BUFFER_BYTES", "PARSE_WORKERS"]:
         flag_value = int(flag_value)
     if flag == "PROFILES_DIR":
         flag_value = os.path.abspath(flag_value)
@@ -236,6 +265,8 @@ def get_flag_dict():
         "indirect_selection": INDIRECT_SELECTION,
         "log_cache_events": LOG_CACHE_EVENTS,
         "event_buffer_size": EVENT_BUFFER_SIZE,
+        "event_buffer_bytes": EVENT_BUFFER_BYTES,
+        "log_level_file": LOG_LEVEL_FILE,
         "quiet": QUIET,
         "no_print": NO_PRINT,
     }
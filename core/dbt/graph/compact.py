@@ -0,0 +1,276 @@
+from array import array
+from collections import Counter
+from itertools import accumulate, repeat
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, NewType, Optional, Tuple
+
+UniqueId = NewType("UniqueId", str)
+
+
+def _compressed_rows(size: int, rows: array, columns: array) -> Tuple[array, array]:
+    """Group the edges (rows[i], columns[i]) by row. The columns of row r end
+    up in `packed[offsets[r]:offsets[r + 1]]`, in the order they were given.
+    """
+    counts = Counter(rows)
+    offsets = array("i", [0])
+    offsets.extend(accumulate(map(counts.__getitem__, range(size))))
+    # sorting is stable, and doesn't allocate a container per row
+    order = sorted(range(len(rows)), key=rows.__getitem__)
+    return offsets, array("i", map(columns.__getitem__, order))
+
+
+class CompactGraph:
+    """An immutable directed graph, stored as arrays of integers.
+
+    Nodes are numbered in the order they were given. The children of node i
+    are `successors[succ_offsets[i]:succ_offsets[i + 1]]`, and its parents are
+    stored the same way, so a traversal only touches flat arrays instead of a
+    dict per node and per edge, and the garbage collector has nothing to scan.
+    """
+
+    def __init__(self, nodes: Iterable[UniqueId], edges: Iterable[Tuple[UniqueId, UniqueId]] = ()):
+        ids = list(dict.fromkeys(nodes))
+        index = {unique_id: position for position, unique_id in enumerate(ids)}
+        sources, targets = array("i"), array("i")
+        # dropping duplicate edges, but keeping their order
+        for source, target in dict.fromkeys(edges):
+            for unique_id in (source, target):
+                if unique_id not in index:
+                    index[unique_id] = len(ids)
+                    ids.append(unique_id)
+            sources.append(index[source])
+            targets.append(index[target])
+        self._init(ids, index, sources, targets)
+
+    @classmethod
+    def from_parents(cls, parents: Mapping[UniqueId, Iterable[UniqueId]]) -> "CompactGraph":
+        """Build the graph from the parents of every node. The parents of a
+        node must not repeat.
+        """
+        ids = list(parents)
+        index = {unique_id: position for position, unique_id in enumerate(ids)}
+        sources, targets = array("i"), array("i")
+        for position, node_parents in enumerate(parents.values()):
+            if node_parents:
+                sources.extend(map(index.__getitem__, node_parents))
+                targets.extend(repeat(position, len(sources) - len(targets)))
+        graph = cls.__new__(cls)
+        graph._init(ids, index, sources, targets)
+        return graph
+
+    def _init(
+        self, ids: List[UniqueId], index: Dict[UniqueId, int], sources: array, targets: array
+    ) -> None:
+        self._ids = ids
+        self._index = index
+        self._succ_offsets, self._successors = _compressed_rows(len(ids), sources, targets)
+        self._pred_offsets, self._predecessors = _compressed_rows(len(ids), targets, sources)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[UniqueId]:
+        return iter(self._ids)
+
+    def __contains__(self, unique_id) -> bool:
+        return unique_id in self._index
+
+    def nodes(self) -> List[UniqueId]:
+        return list(self._ids)
+
+    def number_of_edges(self) -> int:
+        return len(self._successors)
+
+    def edges(self) -> Iterator[Tuple[UniqueId, UniqueId]]:
+        for source, unique_id in enumerate(self._ids):
+            for target in self._children(source):
+                yield unique_id, self._ids[target]
+
+    def _children(self, position: int) -> array:
+        return self._successors[self._succ_offsets[position] : self._succ_offsets[position + 1]]
+
+    def _parents(self, position: int) -> array:
+        return self._predecessors[self._pred_offsets[position] : self._pred_offsets[position + 1]]
+
+    def successors(self, unique_id: UniqueId) -> List[UniqueId]:
+        return [self._ids[child] for child in self._children(self._index[unique_id])]
+
+    def predecessors(self, unique_id: UniqueId) -> List[UniqueId]:
+        return [self._ids[parent] for parent in self._parents(self._index[unique_id])]
+
+    def in_degrees(self) -> Dict[UniqueId, int]:
+        offsets = self._pred_offsets
+        return {
+            unique_id: offsets[position + 1] - offsets[position]
+            for position, unique_id in enumerate(self._ids)
+        }
+
+    def reachable(
+        self, sources: Iterable[UniqueId], max_depth: Optional[int] = None, reverse: bool = False
+    ) -> List[UniqueId]:
+        """Return the nodes that can be reached from any of the sources in
+        at least one step, and at most max_depth steps. With reverse, follow
+        the edges backwards, to find ancestors instead of descendants.
+        """
+        neighbors = self._parents if reverse else self._children
+        expanded = bytearray(len(self._ids))
+        found = bytearray(len(self._ids))
+        frontier = []
+        for unique_id in sources:
+            position = self._index[unique_id]
+            if not expanded[position]:
+                expanded[position] = 1
+                frontier.append(position)
+        result = []
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for position in frontier:
+                for neighbor in neighbors(position):
+                    if not found[neighbor]:
+                        found[neighbor] = 1
+                        result.append(self._ids[neighbor])
+                    # a source found from another source was already expanded
+                    if not expanded[neighbor]:
+                        expanded[neighbor] = 1
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return result
+
+    def find_cycle(self) -> Optional[List[UniqueId]]:
+        """Return the nodes of a cycle, in order, or None if there isn't one"""
+        # 0: not visited, 1: on the current path, 2: done
+        state = bytearray(len(self._ids))
+        for root in range(len(self._ids)):
+            if state[root]:
+                continue
+            state[root] = 1
+            path = [root]
+            stack = [iter(self._children(root))]
+            while stack:
+                for child in stack[-1]:
+                    if state[child] == 1:
+                        return [self._ids[position] for position in path[path.index(child) :]]
+                    if state[child] == 0:
+                        state[child] = 1
+                        path.append(child)
+                        stack.append(iter(self._children(child)))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    stack.pop()
+        return None
+
+    def subgraph(self, nodes: Iterable[UniqueId]) -> "CompactGraph":
+        """Return the graph of the given nodes and the edges between them.
+        Nodes that aren't in the graph are ignored.
+        """
+        keep = bytearray(len(self._ids))
+        for unique_id in nodes:
+            if unique_id in self._index:
+                keep[self._index[unique_id]] = 1
+        return self._subset(keep, transitive=False)
+
+    def transitive_subgraph(self, nodes: Iterable[UniqueId]) -> "CompactGraph":
+        """Return the graph of the given nodes, with an edge between two of
+        them wherever the original graph has a path between them that only
+        goes through nodes that were left out.
+        """
+        keep = bytearray(len(self._ids))
+        for unique_id in nodes:
+            keep[self._index[unique_id]] = 1
+        return self._subset(keep, transitive=True)
+
+    def _nearest_kept(self, keep: bytearray) -> Optional[Dict[int, FrozenSet[int]]]:
+        """For every left out node below a kept one, find the kept nodes it
+        reaches through left out nodes only, in one pass over the graph.
+
+        Each left out node is expanded once, and the set of its nearest kept
+        nodes is shared by all of its parents, so a hub between many kept
+        parents and many kept descendants is walked once instead of once per
+        parent. Returns None if the left out nodes have a cycle.
+        """
+        nearest: Dict[int, FrozenSet[int]] = {}
+        empty: FrozenSet[int] = frozenset()
+        on_path = bytearray(len(self._ids))
+        for root in range(len(self._ids)):
+            if keep[root] or root in nearest:
+                continue
+            on_path[root] = 1
+            path = [root]
+            stack = [iter(self._children(root))]
+            while stack:
+                for child in stack[-1]:
+                    if keep[child] or child in nearest:
+                        continue
+                    if on_path[child]:
+                        return None
+                    on_path[child] = 1
+                    path.append(child)
+                    stack.append(iter(self._children(child)))
+                    break
+                else:
+                    # every child is resolved, so this node can be
+                    position = path.pop()
+                    stack.pop()
+                    on_path[position] = 0
+                    children = self._children(position)
+                    kept_children = [child for child in children if keep[child]]
+                    parts = [nearest[child] for child in children if not keep[child]]
+                    parts = [part for part in parts if part]
+                    if not kept_children and len(parts) == 1:
+                        nearest[position] = parts[0]
+                    elif kept_children or parts:
+                        nearest[position] = frozenset(kept_children).union(*parts)
+                    else:
+                        nearest[position] = empty
+        return nearest
+
+    def _subset(self, keep: bytearray, transitive: bool) -> "CompactGraph":
+        kept = [position for position in range(len(self._ids)) if keep[position]]
+        if len(kept) == len(self._ids):
+            # nothing to leave out, and the graph can't change
+            return self
+        renumbered = {position: new for new, position in enumerate(kept)}
+        nearest = self._nearest_kept(keep) if transitive else {}
+        sources, targets = array("i"), array("i")
+        for position in kept:
+            source = renumbered[position]
+            found: Iterable[int]
+            if not transitive:
+                found = (child for child in self._children(position) if keep[child])
+            elif nearest is not None:
+                reached: Dict[int, None] = {}
+                for child in self._children(position):
+                    if keep[child]:
+                        reached[child] = None
+                    else:
+                        reached.update(dict.fromkeys(nearest[child]))
+                found = reached
+            else:
+                found = self._kept_descendants(keep, position)
+            for child in found:
+                sources.append(source)
+                targets.append(renumbered[child])
+        ids = [self._ids[position] for position in kept]
+        graph = CompactGraph.__new__(CompactGraph)
+        graph._init(ids, {unique_id: new for new, unique_id in enumerate(ids)}, sources, targets)
+        return graph
+
+    def _kept_descendants(self, keep: bytearray, position: int) -> List[int]:
+        """The nearest kept nodes below `position`, found with a walk of its
+        own. Only used when the left out nodes have a cycle.
+        """
+        found = []
+        seen = set()
+        stack = list(self._children(position))
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            if keep[child]:
+                found.append(child)
+            else:
+                stack.extend(self._children(child))
+        return found
@@ -1,19 +1,23 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
-import networkx as nx  # type: ignore
+from typing import Set, Iterable, Iterator, Optional
 
 from dbt.exceptions import InternalException
-
-UniqueId = NewType("UniqueId", str)
+from dbt.graph.compact import CompactGraph, UniqueId
 
 
 class Graph:
-    """A wrapper around the networkx graph that understands SelectionCriteria
-    and how they interact with the graph.
+    """A wrapper around the compact dependency graph that understands
+    SelectionCriteria and how they interact with the graph.
+
+    The graph can also be given as anything with networkx-style `nodes()` and
+    `edges()`, like a networkx DiGraph.
     """
 
     def __init__(self, graph):
-        self.graph = graph
+        if isinstance(graph, Graph):
+            graph = graph.graph
+        elif not isinstance(graph, CompactGraph):
+            graph = CompactGraph(graph.nodes(), graph.edges())
+        self.graph: CompactGraph = graph
 
     def nodes(self) -> Set[UniqueId]:
         return set(self.graph.nodes())
@@ -24,20 +28,18 @@ class Graph:
     def __iter__(self) -> Iterator[UniqueId]:
         return iter(self.graph.nodes())
 
+    def _check_nodes(self, nodes: Iterable[UniqueId]) -> None:
+        for node in nodes:
+            if node not in self.graph:
+                raise InternalException(f"Node {node} not found in the graph!")
+
     def ancestors(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes having a path to `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise InternalException(f"Node {node} not found in the graph!")
-        return {
-            child
-            for _, child in nx.bfs_edges(self.graph, node, reverse=True, depth_limit=max_depth)
-        }
+        return self.select_parents({node}, max_depth)
 
     def descendants(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes reachable from `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise InternalException(f"Node {node} not found in the graph!")
-        return {child for _, child in nx.bfs_edges(self.graph, node, depth_limit=max_depth)}
+        return self.select_children({node}, max_depth)
 
     def select_childrens_parents(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         ancestors_for = self.select_children(selected) | selected
@@ -46,57 +48,34 @@ class Graph:
     def select_children(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        descendants: Set[UniqueId] = set()
-        for node in selected:
-            descendants.update(self.descendants(node, max_depth))
-        return descendants
+        self._check_nodes(selected)
+        return set(self.graph.reachable(selected, max_depth))
 
     def select_parents(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        ancestors: Set[UniqueId] = set()
-        for node in selected:
-            ancestors.update(self.ancestors(node, max_depth))
-        return ancestors
+        self._check_nodes(selected)
+        return set(self.graph.reachable(selected, max_depth, reverse=True))
 
     def select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
-        successors: Set[UniqueId] = set()
-        for node in selected:
-            successors.update(self.graph.successors(node))
-        return successors
+        return set(self.graph.reachable(selected, max_depth=1))
 
     def get_subset_graph(self, selected: Iterable[UniqueId]) -> "Graph":
-        """Create and return a new graph that is a shallow copy of the graph,
-        but with only the nodes in include_nodes. Transitive edges across
-        removed nodes are preserved as explicit new edges.
+        """Create and return a new graph with only the nodes in selected.
+        Transitive edges across removed nodes are preserved as explicit new
+        edges.
         """
-
-        new_graph = self.graph.copy()
         include_nodes = set(selected)
-
-        for node in self:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target) for source, target in new_edges if source != target
-                ]  # removes cyclic refs
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is " "it disabled?".format(node)
                 )
 
-        return Graph(new_graph)
+        return Graph(self.graph.transitive_subgraph(include_nodes))
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         return Graph(self.graph.subgraph(nodes))
 
     def get_dependent_nodes(self, node: UniqueId):
-        return nx.descendants(self.graph, node)
+        return self.descendants(node)
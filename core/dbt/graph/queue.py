@@ -1,26 +1,76 @@
-import networkx as nx  # type: ignore
+import heapq
+import statistics
 import threading
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Generator, Optional, Tuple
 
+from .compact import CompactGraph
 from .graph import UniqueId
 from dbt.contracts.graph.parsed import ParsedSourceDefinition, ParsedExposure, ParsedMetric
 from dbt.contracts.graph.compiled import GraphMemberNode
 from dbt.contracts.graph.manifest import Manifest
+from dbt.dataclass_schema import StrEnum
 from dbt.node_types import NodeType
 
 
+class SchedulingPolicy(StrEnum):
+    # run the nodes with the fewest unfinished ancestors first
+    Depth = "depth"
+    # run the nodes with the most expected time left below them first
+    CriticalPath = "critical-path"
+
+
+def simulate_makespan(
+    graph: CompactGraph,
+    scores: Dict[str, float],
+    execution_times: Dict[str, float],
+    threads: int,
+) -> float:
+    """Estimate how long it takes to run the graph on the given number of
+    threads, if every node takes its execution time and the ready node with
+    the lowest score is always started first, the way GraphQueue hands them
+    out.
+    """
+    in_degree = graph.in_degrees()
+    ready = [(scores[node], node) for node, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    running: List[Tuple[float, UniqueId]] = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < max(threads, 1):
+            _, node = heapq.heappop(ready)
+            heapq.heappush(running, (now + execution_times[node], node))
+        now, node = heapq.heappop(running)
+        for child in graph.successors(node):
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                heapq.heappush(ready, (scores[child], child))
+    return now
+
+
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
+
+    The graph is never changed. Each node keeps a count of its unfinished
+    parents, so marking a node done only touches its children.
+
+    If execution_times are given, nodes are handed out by critical path: the
+    node with the longest expected time left along its descendants goes
+    first. Otherwise, nodes are handed out by depth.
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]):
+    def __init__(
+        self,
+        graph: CompactGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        execution_times: Optional[Dict[str, float]] = None,
+    ):
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -31,18 +81,39 @@ class GraphQueue:
         self.in_progress: Set[UniqueId] = set()
         # things that are in the queue
         self.queued: Set[UniqueId] = set()
+        # the number of nodes that haven't been marked done
+        self.remaining: int = len(graph)
+        # the number of unfinished parents of each node
+        self._in_degree: Dict[UniqueId, int] = graph.in_degrees()
         # this lock controls most things
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self.policy = SchedulingPolicy.Depth
+        self.execution_times: Optional[Dict[str, float]] = None
+        # the number of nodes with a known execution time
+        self.timed_nodes: int = 0
+        self._scores: Dict[str, float]
+        if execution_times is None:
+            self._scores = self._get_scores(self.graph)
+        else:
+            self.policy = SchedulingPolicy.CriticalPath
+            self.timed_nodes = sum(1 for node in self.graph if node in execution_times)
+            self.execution_times = self._fill_execution_times(self.graph, execution_times)
+            self._scores = self._get_critical_path_scores(self.graph, self.execution_times)
         # populate the initial queue
-        self._find_new_additions()
+        for node, in_degree in self._in_degree.items():
+            if in_degree == 0:
+                self._add_to_queue(node)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
     def get_selected_nodes(self) -> Set[UniqueId]:
         return self._selected.copy()
 
+    def execution_order(self) -> List[UniqueId]:
+        """The nodes in the order they are most likely to be handed out"""
+        return sorted(self.graph, key=lambda node: (self._scores[node], node))
+
     def _include_in_cost(self, node_id: UniqueId) -> bool:
         node = self.manifest.expect(node_id)
         if node.resource_type != NodeType.Model:
@@ -55,8 +126,8 @@ class GraphQueue:
 
     @staticmethod
     def _grouped_topological_sort(
-        graph: nx.DiGraph,
-    ) -> Generator[List[str], None, None]:
+        graph: CompactGraph,
+    ) -> Generator[List[UniqueId], None, None]:
         """Topological sort of given graph that groups ties.
 
         Adapted from `nx.topological_sort`, this function returns a topo sort of a graph however
@@ -69,20 +140,21 @@ class GraphQueue:
         Returns:
             A generator that yields lists of nodes, one list per graph depth level.
         """
-        indegree_map = {v: d for v, d in graph.in_degree() if d > 0}
-        zero_indegree = [v for v, d in graph.in_degree() if d == 0]
+        in_degrees = graph.in_degrees()
+        indegree_map = {v: d for v, d in in_degrees.items() if d > 0}
+        zero_indegree = [v for v, d in in_degrees.items() if d == 0]
 
         while zero_indegree:
             yield zero_indegree
             new_zero_indegree = []
             for v in zero_indegree:
-                for _, child in graph.edges(v):
+                for child in graph.successors(v):
                     indegree_map[child] -= 1
                     if not indegree_map[child]:
                         new_zero_indegree.append(child)
             zero_indegree = new_zero_indegree
 
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _get_scores(self, graph: CompactGraph) -> Dict[str, float]:
         """Scoring nodes for processing order.
 
         Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
@@ -93,19 +165,66 @@ class GraphQueue:
         Returns:
             A dictionary consisting of `node name`:`score` pairs.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
-
-        # score all nodes in all subgraphs
-        scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
+        # A node's level is the longest path to it from a node with no
+        # parents, so unconnected parts of the graph don't need to be
+        # sorted separately
+        scores: Dict[str, float] = {}
+        for level, group in enumerate(self._grouped_topological_sort(graph)):
+            for node in group:
+                scores[node] = level
 
         return scores
 
+    @staticmethod
+    def _fill_execution_times(
+        graph: CompactGraph, execution_times: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Give nodes without a known execution time, like new nodes, the
+        median of the known times, or 1 second if none are known.
+        """
+        known = [execution_times[node] for node in graph if node in execution_times]
+        default = statistics.median(known) if known else 1.0
+        return {node: execution_times.get(node, default) for node in graph}
+
+    def _get_critical_path_scores(
+        self, graph: CompactGraph, execution_times: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Scoring nodes by critical path.
+
+        A node's remaining time is its own execution time plus the longest
+        remaining time of its children, so it's how long the run takes after
+        the node starts, with enough threads. The node with the longest
+        remaining time has the lowest score and should be processed first.
+
+        Args:
+            graph: The graph to be scored.
+            execution_times: The expected execution time of every node.
+
+        Returns:
+            A dictionary consisting of `node name`:`score` pairs.
+        """
+        remaining: Dict[str, float] = {}
+        groups = list(self._grouped_topological_sort(graph))
+        for group in reversed(groups):
+            for node in group:
+                remaining[node] = execution_times[node] + max(
+                    (remaining[child] for child in graph.successors(node)), default=0.0
+                )
+        return {node: -time for node, time in remaining.items()}
+
+    def estimate_makespans(self, threads: int) -> Optional[Tuple[float, float]]:
+        """Estimate how long it takes to run the queue's nodes in its order,
+        and in depth order. Only queues with execution times can tell.
+        """
+        if self.execution_times is None:
+            return None
+        return (
+            simulate_makespan(self.graph, self._scores, self.execution_times, threads),
+            simulate_makespan(
+                self.graph, self._get_scores(self.graph), self.execution_times, threads
+            ),
+        )
+
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -131,7 +250,7 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self.remaining - len(self.in_progress)
 
     def empty(self) -> bool:
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -141,25 +260,13 @@ class GraphQueue:
         """
         return len(self) == 0
 
-    def _already_known(self, node: UniqueId) -> bool:
-        """Decide if a node is already known (either handed out as a task, or
-        in the queue).
-
-        Callers must hold the lock.
-
-        :param str node: The node ID to check
-        :returns bool: If the node is in progress/queued.
-        """
-        return node in self.in_progress or node in self.queued
+    def _add_to_queue(self, node: UniqueId) -> None:
+        """Add a node whose parents are all done to the internal queue.
 
-    def _find_new_additions(self) -> None:
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+        Callers must hold the lock, except in __init__.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
+        self.inner.put((self._scores[node], node))
+        self.queued.add(node)
 
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
@@ -170,8 +277,11 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self.remaining -= 1
+            for child in self.graph.successors(node_id):
+                self._in_degree[child] -= 1
+                if self._in_degree[child] == 0:
+                    self._add_to_queue(child)
             self.inner.task_done()
             self.some_task_done.notify_all()
 
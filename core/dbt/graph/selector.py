@@ -1,4 +1,4 @@
-from typing import Set, List, Optional, Tuple
+from typing import Dict, Set, List, Optional, Tuple
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
@@ -266,15 +266,18 @@ class NodeSelector(MethodManager):
 
         return filtered_nodes
 
-    def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
+    def get_graph_queue(
+        self, spec: SelectionSpec, execution_times: Optional[Dict[str, float]] = None
+    ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If execution_times are given, the queue schedules by
+        critical path.
         """
         selected_nodes = self.get_selected(spec)
         selected_resources.set_selected_resources(selected_nodes)
         new_graph = self.full_graph.get_subset_graph(selected_nodes)
         # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes)
+        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, execution_times)
 
 
 class ResourceTypeSelector(NodeSelector):
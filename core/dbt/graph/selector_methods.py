@@ -1,7 +1,19 @@
 import abc
 from itertools import chain
 from pathlib import Path
-from typing import Set, List, Dict, Iterator, Tuple, Any, Union, Type, Optional, Callable
+from typing import (
+    Set,
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    Any,
+    Union,
+    Type,
+    Optional,
+    Callable,
+)
 
 from dbt.dataclass_schema import StrEnum
 
@@ -13,9 +25,10 @@ from dbt.contracts.graph.compiled import (
     CompileResultNode,
     ManifestNode,
 )
-from dbt.contracts.graph.manifest import Manifest, WritableManifest
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import (
     HasTestMetadata,
+    ParsedNode,
     ParsedSingularTestNode,
     ParsedExposure,
     ParsedMetric,
@@ -127,6 +140,23 @@ class SelectorMethod(metaclass=abc.ABCMeta):
                 continue
             yield unique_id, metric
 
+    def indexed_nodes(
+        self, included_nodes: Set[UniqueId], unique_ids: Iterable[str]
+    ) -> Iterator[Tuple[UniqueId, SelectorTarget]]:
+        """The included resources out of unique_ids, from an index in the
+        manifest's selector_lookup
+        """
+        seen: Set[str] = set()
+        for key in unique_ids:
+            unique_id = UniqueId(key)
+            if unique_id not in included_nodes or unique_id in seen:
+                continue
+            seen.add(unique_id)
+            if unique_id in self.manifest.nodes:
+                yield unique_id, self.manifest.nodes[unique_id]
+            else:
+                yield unique_id, self.manifest.expect(unique_id)
+
     def all_nodes(
         self, included_nodes: Set[UniqueId]
     ) -> Iterator[Tuple[UniqueId, SelectorTarget]]:
@@ -184,8 +214,19 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        parsed_nodes = list(self.parsed_nodes(included_nodes))
-        for node, real_node in parsed_nodes:
+        first_part = selector.split(".")[0]
+        candidates: Iterator[Tuple[UniqueId, SelectorTarget]]
+        if first_part == SELECTOR_GLOB:
+            candidates = self.parsed_nodes(included_nodes)
+        else:
+            # a match starts with the selector's first part, with or without
+            # the package, or ends with the whole selector
+            fqn_parts = self.manifest.selector_lookup.fqn_parts
+            candidates = self.indexed_nodes(
+                included_nodes,
+                chain(fqn_parts.get(selector, []), fqn_parts.get(first_part, [])),
+            )
+        for node, real_node in candidates:
             if self.node_is_match(selector, real_node.fqn):
                 yield node
 
@@ -193,9 +234,9 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if selector in real_node.tags:
-                yield node
+        tagged = self.manifest.selector_lookup.tags.get(selector, [])
+        for node, real_node in self.indexed_nodes(included_nodes, tagged):
+            yield node
 
 
 class SourceSelectorMethod(SelectorMethod):
@@ -285,30 +326,27 @@ class PathSelectorMethod(SelectorMethod):
         # use '.' and not 'root' for easy comparison
         root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
-        for node, real_node in self.all_nodes(included_nodes):
-            if Path(real_node.root_path) != root:
-                continue
-            ofp = Path(real_node.original_file_path)
-            if ofp in paths:
-                yield node
-            elif any(parent in paths for parent in ofp.parents):
-                yield node
+        # the resources in root whose file, or one of its parents, is in paths
+        by_path = self.manifest.selector_lookup.paths(self.manifest)
+        matches = chain.from_iterable(by_path.get((str(root), str(path)), []) for path in paths)
+        for node, real_node in self.indexed_nodes(included_nodes, matches):
+            yield node
 
 
 class FileSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that match the given file name."""
-        for node, real_node in self.all_nodes(included_nodes):
-            if Path(real_node.original_file_path).name == selector:
-                yield node
+        matches = self.manifest.selector_lookup.file_names(self.manifest).get(selector, [])
+        for node, real_node in self.indexed_nodes(included_nodes, matches):
+            yield node
 
 
 class PackageSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that have the specified package"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if real_node.package_name == selector:
-                yield node
+        matches = self.manifest.selector_lookup.packages.get(selector, [])
+        for node, real_node in self.indexed_nodes(included_nodes, matches):
+            yield node
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -350,13 +388,12 @@ class ConfigSelectorMethod(SelectorMethod):
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
-        for node, real_node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(real_node.config, parts)
-            except AttributeError:
-                continue
-            else:
-                if selector == value:
+        configs = self.manifest.selector_lookup.configs(
+            self.manifest, tuple(parts), lambda config: _getattr_descend(config, parts)
+        )
+        for value, unique_ids in configs:
+            if selector == value:
+                for node, real_node in self.indexed_nodes(included_nodes, unique_ids):
                     yield node
 
 
@@ -366,17 +403,17 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise RuntimeException(f'Invalid resource_type selector "{selector}"') from exc
-        for node, real_node in self.parsed_nodes(included_nodes):
-            if real_node.resource_type == resource_type:
-                yield node
+        matches = self.manifest.selector_lookup.resource_types.get(resource_type, [])
+        for node, real_node in self.indexed_nodes(included_nodes, matches):
+            yield node
 
 
 class TestNameSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
-        for node, real_node in self.parsed_nodes(included_nodes):
+        matches = self.manifest.selector_lookup.test_names.get(selector, [])
+        for node, real_node in self.indexed_nodes(included_nodes, matches):
             if isinstance(real_node, HasTestMetadata):
-                if real_node.test_metadata.name == selector:
-                    yield node
+                yield node
 
 
 class TestTypeSelectorMethod(SelectorMethod):
@@ -392,7 +429,8 @@ class TestTypeSelectorMethod(SelectorMethod):
                 f'Invalid test type selector {selector}: expected "generic" or ' '"singular"'
             )
 
-        for node, real_node in self.parsed_nodes(included_nodes):
+        tests = self.manifest.selector_lookup.resource_types.get(NodeType.Test, [])
+        for node, real_node in self.indexed_nodes(included_nodes, tests):
             if isinstance(real_node, search_types):
                 yield node
 
@@ -401,67 +439,53 @@ class StateSelectorMethod(SelectorMethod):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.modified_macros: Optional[List[str]] = None
+        self.affected_macros: Optional[Set[str]] = None
 
     def _macros_modified(self) -> List[str]:
         # we checked in the caller!
-        if self.previous_state is None or self.previous_state.manifest is None:
+        if self.previous_state is None or not self.previous_state.has_manifest:
             raise InternalException("No comparison manifest in _macros_modified")
-        old_macros = self.previous_state.manifest.macros
+        old_macros = self.previous_state.macro_sql()
         new_macros = self.manifest.macros
 
         modified = []
         for uid, macro in new_macros.items():
             if uid in old_macros:
-                old_macro = old_macros[uid]
-                if macro.macro_sql != old_macro.macro_sql:
+                if macro.macro_sql != old_macros[uid]:
                     modified.append(uid)
             else:
                 modified.append(uid)
 
-        for uid, macro in old_macros.items():
+        for uid in old_macros:
             if uid not in new_macros:
                 modified.append(uid)
 
         return modified
 
-    def recursively_check_macros_modified(self, node, visited_macros):
-        for macro_uid in node.depends_on.macros:
-            if macro_uid in visited_macros:
-                continue
-            visited_macros.append(macro_uid)
-
-            if macro_uid in self.modified_macros:
-                return True
-
-            # this macro hasn't been modified, but depends on other
-            # macros which each need to be tested for modification
-            macro_node = self.manifest.macros[macro_uid]
-            if len(macro_node.depends_on.macros) > 0:
-                upstream_macros_changed = self.recursively_check_macros_modified(
-                    macro_node, visited_macros
-                )
-                if upstream_macros_changed:
-                    return True
-                continue
-
-            # this macro hasn't been modified, but we haven't checked
-            # the other macros the node depends on, so keep looking
-            if len(node.depends_on.macros) > len(visited_macros):
-                continue
-
-        return False
+    def _macros_affected(self, modified: List[str]) -> Set[str]:
+        """The modified macros, and every macro that calls one of them,
+        directly or through other macros
+        """
+        callers: Dict[str, List[str]] = {}
+        for uid, macro in self.manifest.macros.items():
+            for macro_uid in macro.depends_on.macros:
+                callers.setdefault(macro_uid, []).append(uid)
+
+        affected = set(modified)
+        stack = list(modified)
+        while stack:
+            for caller in callers.get(stack.pop(), []):
+                if caller not in affected:
+                    affected.add(caller)
+                    stack.append(caller)
+        return affected
 
     def check_macros_modified(self, node):
         # check if there are any changes in macros the first time
-        if self.modified_macros is None:
+        if self.affected_macros is None:
             self.modified_macros = self._macros_modified()
-        # no macros have been modified, skip looping entirely
-        if not self.modified_macros:
-            return False
-        # recursively loop through upstream macros to see if any is modified
-        else:
-            visited_macros = []
-            return self.recursively_check_macros_modified(node, visited_macros)
+            self.affected_macros = self._macros_affected(self.modified_macros)
+        return any(macro_uid in self.affected_macros for macro_uid in node.depends_on.macros)
 
     # TODO check modifed_content and check_modified macro seems a bit redundent
     def check_modified_content(self, old: Optional[SelectorTarget], new: SelectorTarget) -> bool:
@@ -490,7 +514,7 @@ class StateSelectorMethod(SelectorMethod):
         return old is None
 
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
-        if self.previous_state is None or self.previous_state.manifest is None:
+        if self.previous_state is None or not self.previous_state.has_manifest:
             raise RuntimeException("Got a state selector method, but no comparison manifest")
 
         state_checks = {
@@ -513,19 +537,19 @@ class StateSelectorMethod(SelectorMethod):
                 f'Got an invalid selector "{selector}", expected one of ' f'"{list(state_checks)}"'
             )
 
-        manifest: WritableManifest = self.previous_state.manifest
-
+        previous_state = self.previous_state
         for node, real_node in self.all_nodes(included_nodes):
-            previous_node: Optional[SelectorTarget] = None
-            if node in manifest.nodes:
-                previous_node = manifest.nodes[node]
-            elif node in manifest.sources:
-                previous_node = manifest.sources[node]
-            elif node in manifest.exposures:
-                previous_node = manifest.exposures[node]
-            elif node in manifest.metrics:
-                previous_node = manifest.metrics[node]
+            if isinstance(real_node, ParsedNode) and previous_state.same_fingerprint(
+                node, real_node.state_fingerprint()
+            ):
+                # the node is unchanged, but the macros it calls might not be
+                if selector in ("modified", "modified.macros") and self.check_macros_modified(
+                    real_node
+                ):
+                    yield node
+                continue
 
+            previous_node = previous_state.get_resource(node)
             if checker(previous_node, real_node):
                 yield node
 
@@ -13,6 +13,21 @@
 {% endmacro %}
 
 
+{% macro get_catalog_versions(information_schema, schemas) -%}
+  {{ return(adapter.dispatch('get_catalog_versions', 'dbt')(information_schema, schemas)) }}
+{%- endmacro %}
+
+{% macro default__get_catalog_versions(information_schema, schemas) -%}
+
+  {% set typename = adapter.type() %}
+  {% set msg -%}
+    get_catalog_versions not implemented for {{ typename }}
+  {%- endset %}
+
+  {{ exceptions.raise_compiler_error(msg) }}
+{% endmacro %}
+
+
 {% macro information_schema_name(database) %}
   {{ return(adapter.dispatch('information_schema_name', 'dbt')(database)) }}
 {% endmacro %}
@@ -63,3 +78,25 @@
   {{ exceptions.raise_not_implemented(
     'list_relations_without_caching macro not implemented for adapter '+adapter.type()) }}
 {% endmacro %}
+
+
+{% macro list_relations_in_schemas(information_schema, schemas) %}
+  {{ return(adapter.dispatch('list_relations_in_schemas', 'dbt')(information_schema, schemas)) }}
+{% endmacro %}
+
+{% macro default__list_relations_in_schemas(information_schema, schemas) %}
+  {% call statement('list_relations_in_schemas', fetch_result=True) -%}
+    select
+      table_catalog as database,
+      table_name as name,
+      table_schema as schema,
+      case when table_type = 'VIEW' then 'view' else 'table' end as type
+    from {{ information_schema.replace(information_schema_view='TABLES') }}
+    where lower(table_schema) in (
+      {%- for schema in schemas -%}
+        '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+      {%- endfor -%}
+    )
+  {%- endcall %}
+  {{ return(load_result('list_relations_in_schemas').table) }}
+{% endmacro %}
@@ -1,7 +1,7 @@
 {#--
 The macro override naming method (spark__statement) only works for macros which are called with adapter.dispatch. For macros called directly, you can just redefine them.
 --#}
-{%- macro statement(name=None, fetch_result=False, auto_begin=True, language='sql') -%}
+{%- macro statement(name=None, fetch_result=False, auto_begin=True, language='sql', columnar=False) -%}
   {%- if execute: -%}
     {%- set compiled_code = caller() -%}
 
@@ -9,7 +9,9 @@ The macro override naming method (spark__statement) only works for macros which
       {{ log('Writing runtime {} for node "{}"'.format(language, model['unique_id'])) }}
       {{ write(compiled_code) }}
     {%- endif -%}
-    {%- if language == 'sql'-%}
+    {%- if language == 'sql' and columnar -%}
+      {%- set res, table = adapter.execute(compiled_code, auto_begin=auto_begin, fetch=fetch_result, columnar=True) -%}
+    {%- elif language == 'sql'-%}
       {%- set res, table = adapter.execute(compiled_code, auto_begin=auto_begin, fetch=fetch_result) -%}
     {%- elif language == 'python' -%}
       {%- set res = adapter.submit_python_job(model, compiled_code) -%}
@@ -43,8 +45,8 @@ The macro override naming method (spark__statement) only works for macros which
 
 
 {# a user-friendly interface into statements #}
-{% macro run_query(sql) %}
-  {% call statement("run_query_statement", fetch_result=true, auto_begin=false) %}
+{% macro run_query(sql, columnar=False) %}
+  {% call statement("run_query_statement", fetch_result=true, auto_begin=false, columnar=columnar) %}
     {{ sql }}
   {% endcall %}
 
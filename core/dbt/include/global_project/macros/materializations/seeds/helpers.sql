@@ -94,6 +94,11 @@
   {% set batch_size = get_batch_size() %}
 
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+  {% if adapter.supports_bulk_load() %}
+    {{ return(adapter.bulk_load(this, agate_table, cols_sql)) }}
+  {% endif %}
+
   {% set bindings = [] %}
 
   {% set statements = [] %}
@@ -126,3 +131,66 @@
   {# Return SQL so we can render it out into the compiled files #}
   {{ return(statements[0]) }}
 {% endmacro %}
+
+
+{% macro get_seed_checksums_relation(relation) %}
+  {{ return(relation.incorporate(path={"identifier": "dbt_seed_checksums"}, type="table")) }}
+{% endmacro %}
+
+
+{% macro get_seed_checksum(relation) -%}
+  {{ return(adapter.dispatch('get_seed_checksum', 'dbt')(relation)) }}
+{%- endmacro %}
+
+{% macro default__get_seed_checksum(relation) %}
+  {%- set seed_relation = adapter.get_relation(database=relation.database, schema=relation.schema, identifier=relation.identifier) -%}
+  {%- set checksums_relation = get_seed_checksums_relation(relation) -%}
+  {%- set existing = adapter.get_relation(database=checksums_relation.database, schema=checksums_relation.schema, identifier=checksums_relation.identifier) -%}
+  {% if seed_relation is none or not seed_relation.is_table or existing is none %}
+    {{ return(none) }}
+  {% endif %}
+
+  {% set sql %}
+    select checksum from {{ checksums_relation }}
+    where seed_relation = '{{ relation.identifier | replace("'", "''") }}'
+  {% endset %}
+  {% set result = run_query(sql) %}
+  {% if result.rows | length == 0 %}
+    {{ return(none) }}
+  {% endif %}
+  {{ return(result.rows[0][0]) }}
+{% endmacro %}
+
+
+{% macro create_seed_checksums_table(relation) -%}
+  {{ return(adapter.dispatch('create_seed_checksums_table', 'dbt')(relation)) }}
+{%- endmacro %}
+
+{% macro default__create_seed_checksums_table(relation) %}
+  {%- set checksums_relation = get_seed_checksums_relation(relation) -%}
+  {% call statement('create_seed_checksums') %}
+    create table if not exists {{ checksums_relation }} (
+      seed_relation {{ dbt.type_string() }},
+      checksum {{ dbt.type_string() }},
+      loaded_at {{ dbt.type_timestamp() }}
+    )
+  {% endcall %}
+{% endmacro %}
+
+
+{% macro set_seed_checksum(relation, checksum) -%}
+  {{ return(adapter.dispatch('set_seed_checksum', 'dbt')(relation, checksum)) }}
+{%- endmacro %}
+
+{% macro default__set_seed_checksum(relation, checksum) %}
+  {%- set checksums_relation = get_seed_checksums_relation(relation) -%}
+  {%- set identifier = relation.identifier | replace("'", "''") -%}
+
+  {% call statement('delete_seed_checksum') %}
+    delete from {{ checksums_relation }} where seed_relation = '{{ identifier }}'
+  {% endcall %}
+  {% call statement('insert_seed_checksum') %}
+    insert into {{ checksums_relation }} (seed_relation, checksum, loaded_at)
+    values ('{{ identifier }}', '{{ checksum }}', {{ dbt.current_timestamp() }})
+  {% endcall %}
+{% endmacro %}
@@ -10,8 +10,10 @@ from contextlib import contextmanager
 from pathlib import Path
 
 import dbt.version
-from dbt.events.functions import fire_event, setup_event_logger
+from dbt.clients.jinja import compiled_template_cache
+from dbt.events.functions import fire_event, flush_events, setup_event_logger
 from dbt.events.types import (
+    JinjaTemplateCacheStats,
     MainEncounteredError,
     MainKeyboardInterrupt,
     MainReportVersion,
@@ -23,6 +25,7 @@ import dbt.flags as flags
 import dbt.task.build as build_task
 import dbt.task.clean as clean_task
 import dbt.task.compile as compile_task
+import dbt.task.daemon as daemon_task
 import dbt.task.debug as debug_task
 import dbt.task.deps as deps_task
 import dbt.task.freshness as freshness_task
@@ -44,6 +47,7 @@ import dbt.tracking
 from dbt.utils import ExitCodes, args_to_dict
 from dbt.config.profile import DEFAULT_PROFILES_DIR, read_user_config
 from dbt.exceptions import InternalException, NotImplementedException, FailedToConnectException
+from dbt.graph import SchedulingPolicy
 
 
 class DBTVersion(argparse.Action):
@@ -146,6 +150,7 @@ def main(args=None):
             fire_event(MainStackTrace(stack_trace=traceback.format_exc()))
             exit_code = ExitCodes.UnhandledError.value
 
+    flush_events()
     sys.exit(exit_code)
 
 
@@ -236,6 +241,14 @@ def run_from_args(parsed):
 
     with track_run(task):
         results = task.run()
+    fire_event(
+        JinjaTemplateCacheStats(
+            hits=compiled_template_cache.hits,
+            misses=compiled_template_cache.misses,
+            evictions=compiled_template_cache.evictions,
+            loaded=compiled_template_cache.loaded,
+        )
+    )
     return task, results
 
 
@@ -496,6 +509,21 @@ def _add_defer_argument(*subparsers):
         )
 
 
+def _add_scheduling_argument(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            "--scheduling",
+            choices=[policy.value for policy in SchedulingPolicy],
+            default=SchedulingPolicy.Depth.value,
+            help="""
+            The order to run ready nodes in. 'depth' runs the nodes with the
+            fewest ancestors first. 'critical-path' runs the nodes with the
+            longest chain of slow descendants first, using the execution
+            times in the run_results.json of the --state directory.
+            """,
+        )
+
+
 def _build_run_subparser(subparsers, base_subparser):
     run_sub = subparsers.add_parser(
         "run",
@@ -546,6 +574,29 @@ def _build_parse_subparser(subparsers, base_subparser):
     return sub
 
 
+def _build_daemon_subparser(subparsers, base_subparser):
+    sub = subparsers.add_parser(
+        "daemon",
+        parents=[base_subparser],
+        help="""
+        Keeps the parsed project in memory, updates it when files change, and
+        runs build, compile, list, parse, run and test commands sent with
+        `python -m dbt.clients.daemon <command>`.
+        """,
+    )
+    sub.set_defaults(cls=daemon_task.DaemonTask, which="daemon", rpc_method=None)
+    sub.add_argument(
+        "--socket",
+        default=None,
+        type=str,
+        help="""
+        The Unix socket to listen on. Defaults to dbt.sock in the target
+        directory. Clients use the DBT_DAEMON_SOCKET environment variable.
+        """,
+    )
+    return sub
+
+
 def _build_docs_generate_subparser(subparsers, base_subparser):
     # it might look like docs_sub is the correct parents entry, but that
     # will cause weird errors about 'conflicting option strings'.
@@ -561,6 +612,15 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         """,
     )
+    generate_sub.add_argument(
+        "--incremental",
+        action="store_true",
+        help="""
+        Only read the catalog of schemas whose relations changed since the
+        last docs generate --incremental, and reuse the rest of its
+        catalog.json
+        """,
+    )
     _add_defer_argument(generate_sub)
     return generate_sub
 
@@ -1053,6 +1113,18 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        type=int,
+        default=None,
+        help="""
+        Parse models, snapshots, analyses, singular tests and, on a full
+        parse, schema yaml files in this many worker processes. Values below
+        2 parse in a single process.
+        """,
+    )
+
     p.add_argument(
         "--profiles-dir",
         default=None,
@@ -1090,7 +1162,88 @@ def parse_args(args, cls=DBTArgumentParser):
         "--event-buffer-size",
         dest="event_buffer_size",
         help="""
-        Sets the max number of events to buffer in EVENT_HISTORY
+        Sets the max number of events to buffer in EVENT_HISTORY, when
+        --event-buffer-bytes is set
+        """,
+    )
+
+    p.add_argument(
+        "--event-buffer-bytes",
+        dest="event_buffer_bytes",
+        help="""
+        Keep the most recent events in EVENT_HISTORY, up to about this many
+        bytes of them. By default, no events are kept.
+        """,
+    )
+
+    p.add_argument(
+        "--log-level-file",
+        dest="log_level_file",
+        choices=["debug", "info", "warn", "error", "none"],
+        default=None,
+        help="""
+        The lowest level of events to write to the log file. Defaults to
+        debug. Events below this level, and below the level shown on the
+        console, aren't built at all.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--async-logging",
+        enable_help="""
+        Format and write log lines on a background thread, in batches,
+        instead of on the thread that logged them.
+        """,
+        disable_help="""
+        Write each log line on the thread that logged it.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--compile-ahead",
+        enable_help="""
+        Compile the selected nodes on a background thread before they run,
+        so rendering them overlaps with the queries of the nodes ahead of
+        them. Nodes that query the database while compiling, like with
+        run_query, are compiled again once their parents have run.
+        """,
+        disable_help="""
+        Compile each node on the thread that runs it, just before running it.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--cache-compiled-sql",
+        enable_help="""
+        Reuse the compiled SQL of nodes from earlier invocations when nothing
+        they render from has changed. The cache is kept in the target path.
+        Nodes that query the database while compiling are always compiled.
+        """,
+        disable_help="""
+        Compile every selected node.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--cache-jinja-bytecode",
+        enable_help="""
+        Keep the compiled Jinja code of macros in the target directory, so
+        later invocations don't compile them again. This is the default.
+        """,
+        disable_help="""
+        Compile the Jinja of every macro that's called.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--skip-unchanged-seeds",
+        enable_help="""
+        Don't reload a seed when its file and config haven't changed since it
+        was last loaded. dbt records what it loaded in a dbt_seed_checksums
+        table in the seed's schema.
+        """,
+        disable_help="""
+        Reload every selected seed.
         """,
     )
 
@@ -1156,6 +1309,7 @@ def parse_args(args, cls=DBTArgumentParser):
     run_sub = _build_run_subparser(subs, base_subparser)
     compile_sub = _build_compile_subparser(subs, base_subparser)
     parse_sub = _build_parse_subparser(subs, base_subparser)
+    _build_daemon_subparser(subs, base_subparser)
     generate_sub = _build_docs_generate_subparser(docs_subs, base_subparser)
     test_sub = _build_test_subparser(subs, base_subparser)
     seed_sub = _build_seed_subparser(subs, base_subparser)
@@ -1168,6 +1322,8 @@ def parse_args(args, cls=DBTArgumentParser):
     _add_selection_arguments(run_sub, compile_sub, generate_sub, test_sub, snapshot_sub, seed_sub)
     # --defer
     _add_defer_argument(run_sub, test_sub, build_sub, snapshot_sub, compile_sub)
+    # --scheduling
+    _add_scheduling_argument(run_sub, test_sub, build_sub, snapshot_sub, seed_sub)
     # --full-refresh
     _add_table_mutability_arguments(run_sub, compile_sub, build_sub)
 
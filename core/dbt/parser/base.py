@@ -15,6 +15,7 @@ from dbt.adapters.factory import get_adapter  # noqa: F401
 from dbt.clients.jinja import get_rendered
 from dbt.config import Project, RuntimeConfig
 from dbt.context.context_config import ContextConfig
+from dbt.contracts.files import SourceFile
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import HasUniqueID, ManifestNodes
 from dbt.contracts.graph.unparsed import UnparsedNode, Docs
@@ -385,11 +386,59 @@ class ConfiguredParser(
             config=config,
             fqn=fqn,
         )
-        self.render_update(node, config)
+        # _parsing_info isn't serialized, so it's None in a loaded manifest
+        parsing_info = self.manifest._parsing_info
+        parse_cache = parsing_info.parse_cache if parsing_info is not None else None
+        if (
+            parse_cache is not None
+            and isinstance(block.file, SourceFile)
+            and parse_cache.can_cache(node)
+        ):
+            self.render_update_with_cache(parse_cache, block.file, node, config)
+        else:
+            self.render_update(node, config)
         result = self.transform(node)
         self.add_result_node(block, result)
         return result
 
+    def render_update_with_cache(
+        self,
+        parse_cache: Any,
+        source_file: SourceFile,
+        node: IntermediateNode,
+        config: ContextConfig,
+    ) -> None:
+        entry = parse_cache.lookup(self.manifest, source_file, node)
+        if entry is not None:
+            parse_cache.apply(entry, self.manifest, source_file, node, config)
+            try:
+                self.update_parsed_node_config(node, config)
+            except ValidationError as exc:
+                msg = validator_error_message(exc)
+                raise ParsingException(msg, node=node) from exc
+            return
+
+        env_vars_start = len(source_file.env_vars)
+        parsing_info = self.manifest._parsing_info
+        static_parsed_count = parsing_info.static_analysis_parsed_path_count
+        # rendering updates the config, but it's rendered with this one
+        base_config = node.config.to_dict(omit_none=True)
+        self.render_update(node, config)
+        parse_cache.record(
+            self.manifest,
+            source_file,
+            node,
+            config,
+            # vars are only saved once per file, so a file with several
+            # snapshots uses all of them
+            var_names=list(source_file.vars),
+            env_var_names=source_file.env_vars[env_vars_start:],
+            statically_parsed=(
+                parsing_info.static_analysis_parsed_path_count > static_parsed_count
+            ),
+            base_config=base_config,
+        )
+
     @abc.abstractmethod
     def parse_file(self, file_block: FileBlock) -> None:
         pass
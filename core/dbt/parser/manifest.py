@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
+import json
 import os
+import re
 import traceback
-from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple
-from itertools import chain
+from typing import Dict, Optional, Mapping, Callable, Any, List, Set, Type, Union, Tuple
 import time
 
 import dbt.exceptions
@@ -17,7 +18,7 @@ from dbt.adapters.factory import (
     get_adapter_package_names,
 )
 from dbt.helper_types import PathSet
-from dbt.events.functions import fire_event, get_invocation_id
+from dbt.events.functions import fire_event, fire_lazy_event, get_invocation_id
 from dbt.events.types import (
     PartialParsingFullReparseBecauseOfError,
     PartialParsingExceptionFile,
@@ -38,20 +39,27 @@ from dbt.events.types import (
     InvalidRefInTestNode,
     PartialParsingProjectEnvVarsChanged,
     PartialParsingProfileEnvVarsChanged,
+    PartialParsingDependentInputsChanged,
 )
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType
 from dbt.clients.jinja import get_rendered, MacroStack
 from dbt.clients.jinja_static import statically_extract_macro_calls
-from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
 from dbt.context.docs import generate_runtime_docs_context
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
-from dbt.context.configured import generate_macro_context
+from dbt.context.configured import generate_macro_context, SchemaYamlVars
 from dbt.context.providers import ParseProvider
 from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
 from dbt.parser.read_files import read_files, load_source_file
-from dbt.parser.partial import PartialParsing, special_override_macros
+from dbt.parser.partial import PartialParsing, saved_env_vars_changed, special_override_macros
+from dbt.parser.partial_parse_file import (
+    read_partial_parse_file,
+    saved_disabled_fqns,
+    saved_node_relation,
+    saved_resource_fqns,
+    write_partial_parse_file,
+)
 from dbt.contracts.graph.compiled import ManifestNode
 from dbt.contracts.graph.manifest import (
     Manifest,
@@ -85,18 +93,50 @@ from dbt.parser.docs import DocumentationParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
+from dbt.parser.parse_cache import ParseCache
 from dbt.parser.schemas import SchemaParser
 from dbt.parser.search import FileBlock
 from dbt.parser.seeds import SeedParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import SourcePatcher
+from dbt.parser.workers import ParseWorkerPool, merge_chunk, use_parse_workers
 from dbt.ui import warning_tag
 from dbt.version import __version__
+from dbt.constants import TARGET_VAR_PREFIX
 
 from dbt.dataclass_schema import StrEnum, dbtClassMixin
 
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
 PARSING_STATE = DbtProcessState("parsing")
+# Parsers that can be run in worker processes when --parse-workers is set
+PARALLEL_PARSER_TYPES = (
+    ModelParser,
+    SnapshotParser,
+    AnalysisParser,
+    SingularTestParser,
+    SchemaParser,
+)
+# Profile fields that are used without going through the 'target' context
+# value (node schema and database defaults, adapter dispatch, user config),
+# so a change to any of them always needs a full reparse
+FULL_REPARSE_TARGET_FIELDS = ("schema", "database", "type", "config")
+PROJECT_VAR_CALL = re.compile(r"\bvar\(\s*(\S)")
+PROJECT_VAR_NAME = re.compile(r"""\bvar\(\s*['"]([^'"]+)['"]""")
+PROJECT_TARGET_USE = re.compile(r"\btarget\s*[.\[|)}]")
+
+# A process that keeps the manifest in memory between commands, like
+# `dbt daemon`, sets this to use it as the saved manifest instead of
+# reading the partial parse file.
+_hot_manifest: Optional[Manifest] = None
+# The root of the project whose files haven't changed since the hot manifest
+# was loaded, so they don't need to be read again
+_hot_manifest_unchanged_project_root: Optional[str] = None
+
+
+def set_hot_manifest(manifest: Optional[Manifest], unchanged_project_root: Optional[str] = None):
+    global _hot_manifest, _hot_manifest_unchanged_project_root
+    _hot_manifest = manifest
+    _hot_manifest_unchanged_project_root = unchanged_project_root
 
 
 class ReparseReason(StrEnum):
@@ -187,6 +227,14 @@ class ManifestLoader:
         # have been enabled, but not happening because of some issue.
         self.partially_parsing = False
         self.partial_parser = None
+        self.parse_cache: Optional[ParseCache] = None
+        # Vars and profile fields that changed since the saved manifest,
+        # set by is_partial_parsable when only their files need reparsing
+        self.changed_parse_vars: Optional[List[str]] = None
+        # Set when the saved manifest is the hot manifest and no project
+        # file changed since it was loaded
+        self.saved_files_unchanged = False
+        self.reused_saved_manifest = False
 
         # This is a saved manifest from a previous run that's used for partial parsing
         self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
@@ -233,6 +281,19 @@ class ManifestLoader:
 
     # This is where the main action happens
     def load(self):
+        # A hot manifest with no changed files, vars or env vars can be
+        # used as it is, without reading the project files
+        if (
+            self.saved_manifest is not None
+            and self.saved_files_unchanged
+            and self.changed_parse_vars is None
+            and not saved_env_vars_changed(self.saved_manifest)
+        ):
+            fire_event(PartialParsingSkipParsing())
+            self.manifest = self.saved_manifest
+            self.reused_saved_manifest = True
+            return self.manifest
+
         # Read files creates a dictionary of projects to a dictionary
         # of parsers to lists of file strings. The file strings are
         # used to get the SourceFiles from the manifest files.
@@ -249,8 +310,12 @@ class ManifestLoader:
 
         skip_parsing = False
         if self.saved_manifest is not None:
-            self.partial_parser = PartialParsing(self.saved_manifest, self.manifest.files)
-            skip_parsing = self.partial_parser.skip_parsing()
+            self.partial_parser = PartialParsing(
+                self.saved_manifest, self.manifest.files, changed_vars=self.changed_parse_vars
+            )
+            # if the vars or profile changed the manifest must be rewritten
+            # with the new state check, even if no file used them
+            skip_parsing = self.partial_parser.skip_parsing() and self.changed_parse_vars is None
             if skip_parsing:
                 # nothing changed, so we don't need to generate project_parser_files
                 self.manifest = self.saved_manifest
@@ -291,8 +356,10 @@ class ManifestLoader:
                         if source_file:
                             parse_file_type = source_file.parse_file_type
                             fire_event(PartialParsingExceptionFile(file=file_id))
-                            file_dict = source_file.to_dict()
-                            fire_event(PartialParsingFile(file_dict=file_dict))
+                            fire_lazy_event(
+                                PartialParsingFile,
+                                lambda: PartialParsingFile(file_dict=source_file.to_dict()),
+                            )
                     exc_info["parse_file_type"] = parse_file_type
                     fire_event(PartialParsingException(exc_info=exc_info))
 
@@ -329,6 +396,13 @@ class ManifestLoader:
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
 
+            # The parse cache lets unchanged sql files skip rendering, even
+            # when the saved manifest couldn't be used for partial parsing
+            if flags.PARTIAL_PARSE:
+                self.parse_cache = ParseCache.read(self.root_project)
+                self.parse_cache.prepare(self.manifest)
+                self.manifest._parsing_info.parse_cache = self.parse_cache
+
             # Now that the macros are parsed, parse the rest of the files.
             # This is currently done on a per project basis.
             start_parse_projects = time.perf_counter()
@@ -391,6 +465,7 @@ class ManifestLoader:
             self.process_refs(self.root_project.project_name)
             self.process_docs(self.root_project)
             self.process_metrics(self.root_project)
+            self.manifest.rebuild_selector_lookup()
 
             # update tracking data
             self._perf_info.process_manifest_elapsed = time.perf_counter() - start_process
@@ -403,6 +478,9 @@ class ManifestLoader:
 
             # write out the fully parsed manifest
             self.write_manifest_for_partial_parse()
+            if self.parse_cache is not None:
+                self.manifest._parsing_info.parse_cache = None
+                self.parse_cache.write(self.manifest)
 
         return self.manifest
 
@@ -458,7 +536,18 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
+            file_ids = parser_files[parser_name]
+            # Partial parsing applies schema file changes to existing nodes,
+            # so yaml files are only parsed in workers on a full parse
+            if (
+                parser_cls in PARALLEL_PARSER_TYPES
+                and not (self.partially_parsing and parser_cls is SchemaParser)
+                and use_parse_workers(flags.PARSE_WORKERS, len(file_ids))
+            ):
+                self.parse_files_in_workers(project, parser, file_ids)
+                project_parsed_path_count = len(file_ids)
+                file_ids = []
+            for file_id in file_ids:
                 block = FileBlock(self.manifest.files[file_id])
                 if isinstance(parser, SchemaParser):
                     assert isinstance(block.file, SchemaSourceFile)
@@ -506,6 +595,24 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # Parse the files for a single parser in a pool of forked worker processes
+    # and merge the results into the manifest in file order. Chunks that fail
+    # in a worker are parsed again here so errors are raised exactly as they
+    # would be by the serial path.
+    def parse_files_in_workers(self, project: Project, parser: Parser, file_ids) -> None:
+        with ParseWorkerPool(self, flags.PARSE_WORKERS) as pool:
+            for chunk in pool.imap(project.project_name, type(parser), file_ids):
+                if not chunk.failed:
+                    merge_chunk(self.manifest, parser, chunk)
+                    continue
+                for file_id in chunk.file_ids:
+                    block = FileBlock(self.manifest.files[file_id])
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        parser.parse_file(block, dct=block.file.dict_from_yaml)
+                    else:
+                        parser.parse_file(block)
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -548,10 +655,7 @@ class ManifestLoader:
                     ManifestWrongMetadataVersion(version=self.manifest.metadata.dbt_version)
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack()
-            make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            write_partial_parse_file(self.manifest, path)
         except Exception:
             raise
 
@@ -571,11 +675,28 @@ class ManifestLoader:
             )
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
-        if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
+        # If only vars or profile fields changed, the files that used them
+        # can be reparsed instead of the whole project
+        changed_parse_vars = None
+        if (
+            self.manifest.state_check.vars_hash != manifest.state_check.vars_hash
+            or self.manifest.state_check.profile_hash != manifest.state_check.profile_hash
+            or self.manifest.state_check.profile_env_vars_hash
+            != manifest.state_check.profile_env_vars_hash
+        ):
+            changed_parse_vars = self.build_changed_parse_vars(manifest)
+
+        if (
+            self.manifest.state_check.vars_hash != manifest.state_check.vars_hash
+            and changed_parse_vars is None
+        ):
             fire_event(PartialParsingFailedBecauseConfigChange())
             valid = False
             reparse_reason = ReparseReason.vars_changed
-        if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
+        if (
+            self.manifest.state_check.profile_hash != manifest.state_check.profile_hash
+            and changed_parse_vars is None
+        ):
             # Note: This should be made more granular. We shouldn't need to invalidate
             # partial parsing if a non-used profile section has changed.
             fire_event(PartialParsingFailedBecauseProfileChange())
@@ -591,6 +712,7 @@ class ManifestLoader:
         if (
             self.manifest.state_check.profile_env_vars_hash
             != manifest.state_check.profile_env_vars_hash
+            and changed_parse_vars is None
         ):
             fire_event(PartialParsingProfileEnvVarsChanged())
             valid = False
@@ -613,8 +735,56 @@ class ManifestLoader:
                     fire_event(PartialParsingFailedBecauseHashChanged())
                     valid = False
                     reparse_reason = ReparseReason.project_config_changed
+
+        if valid and changed_parse_vars is not None:
+            self.changed_parse_vars = changed_parse_vars
+            if changed_parse_vars:
+                fire_event(PartialParsingDependentInputsChanged(inputs=changed_parse_vars))
         return valid, reparse_reason
 
+    # Returns the var names and "target.<field>" names that have changed
+    # since the saved manifest, or None if the change can't be limited to
+    # the files that used them.
+    def build_changed_parse_vars(self, manifest: Manifest) -> Optional[List[str]]:
+        saved_state = manifest.state_check
+        state = self.manifest.state_check
+        # saved by a version of dbt that didn't record these
+        if not saved_state.target_hashes:
+            return None
+
+        changed_vars = _changed_keys(saved_state.cli_vars_hashes, state.cli_vars_hashes)
+        changed_fields = _changed_keys(saved_state.target_hashes, state.target_hashes)
+        if changed_fields.intersection(FULL_REPARSE_TARGET_FIELDS):
+            return None
+
+        # dbt_project.yml files are rendered before parsing and the
+        # generate_x_name macros are called outside of the node context,
+        # so neither records what it used
+        if changed_fields:
+            for macro in manifest.macros.values():
+                if macro.name in special_override_macros and macro.package_name != "dbt":
+                    return None
+        for project in self.all_projects.values():
+            path = os.path.join(project.project_root, "dbt_project.yml")
+            with open(path) as fp:
+                project_contents = fp.read()
+            if changed_fields and PROJECT_TARGET_USE.search(project_contents):
+                return None
+            if changed_vars:
+                for match in PROJECT_VAR_CALL.finditer(project_contents):
+                    # var called with something other than a string literal
+                    if match.group(1) not in ("'", '"'):
+                        return None
+                if changed_vars.intersection(PROJECT_VAR_NAME.findall(project_contents)):
+                    return None
+
+        changed_parse_vars = sorted(changed_vars)
+        if changed_fields:
+            changed_parse_vars.extend(TARGET_VAR_PREFIX + f for f in sorted(changed_fields))
+            # for files that used the whole target dict
+            changed_parse_vars.append(TARGET_VAR_PREFIX + "*")
+        return changed_parse_vars
+
     def skip_partial_parsing_because_of_macros(self):
         if not self.partial_parser:
             return False
@@ -642,21 +812,24 @@ class ManifestLoader:
 
         reparse_reason = None
 
-        if os.path.exists(path):
+        if _hot_manifest is not None:
+            is_partial_parsable, reparse_reason = self.is_partial_parsable(_hot_manifest)
+            if is_partial_parsable:
+                self.saved_files_unchanged = (
+                    _hot_manifest_unchanged_project_root == self.root_project.project_root
+                )
+                return self.refresh_saved_manifest(_hot_manifest)
+        elif os.path.exists(path):
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp)  # type: ignore
+                # Only the index is read here. Files and nodes are read when
+                # they are used.
+                manifest = read_partial_parse_file(path)
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
                 is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
                 if is_partial_parsable:
-                    # We don't want to have stale generated_at dates
-                    manifest.metadata.generated_at = datetime.utcnow()
-                    # or invocation_ids
-                    manifest.metadata.invocation_id = get_invocation_id()
-                    return manifest
+                    return self.refresh_saved_manifest(manifest)
             except Exception as exc:
                 fire_event(ParsedFileLoadFailed(path=path, exc=exc))
                 reparse_reason = ReparseReason.load_file_failure
@@ -670,6 +843,16 @@ class ManifestLoader:
 
         return None
 
+    def refresh_saved_manifest(self, manifest: Manifest) -> Manifest:
+        # Save the current vars and profile hashes, which may
+        # have changed without requiring a full reparse
+        manifest.state_check = self.manifest.state_check
+        # We don't want to have stale generated_at dates
+        manifest.metadata.generated_at = datetime.utcnow()
+        # or invocation_ids
+        manifest.metadata.invocation_id = get_invocation_id()
+        return manifest
+
     def build_perf_info(self):
         mli = ManifestLoaderInfo(
             is_partial_parse_enabled=flags.PARTIAL_PARSE,
@@ -684,12 +867,9 @@ class ManifestLoader:
             mli._project_index[project.project_name] = project_info
         return mli
 
-    # TODO: this should be calculated per-file based on the vars() calls made in
-    # parsing, so changing one var doesn't invalidate everything. also there should
-    # be something like that for env_var - currently changing env_vars in way that
-    # impact graph selection or configs will result in weird test failures.
-    # finally, we should hash the actual profile used, not just root project +
-    # profiles.yml + relevant args. While sufficient, it is definitely overkill.
+    # The vars, profile and profile env var hashes are only used to detect that
+    # something changed. The per-var and per-field hashes are then compared in
+    # build_changed_parse_vars to find which files used the changed values.
     def build_manifest_state_check(self):
         config = self.root_project
         all_projects = self.all_projects
@@ -739,6 +919,17 @@ class ManifestLoader:
             with open(path) as fp:
                 project_hashes[name] = FileHash.from_contents(fp.read())
 
+        # Create FileHashes of each cli var and profile target field, so a
+        # change to one of them only reparses the files that used it
+        cli_vars_hashes = {
+            name: FileHash.from_contents(json.dumps(value, sort_keys=True, default=str))
+            for name, value in config.cli_vars.items()
+        }
+        target_hashes = {
+            name: FileHash.from_contents(json.dumps(value, sort_keys=True, default=str))
+            for name, value in config.to_target_dict().items()
+        }
+
         # Create the ManifestStateCheck object
         state_check = ManifestStateCheck(
             project_env_vars_hash=project_env_vars_hash,
@@ -746,6 +937,8 @@ class ManifestLoader:
             vars_hash=vars_hash,
             profile_hash=profile_hash,
             project_hashes=project_hashes,
+            cli_vars_hashes=cli_vars_hashes,
+            target_hashes=target_hashes,
         )
         return state_check
 
@@ -860,53 +1053,90 @@ class ManifestLoader:
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
+            schema_yaml_vars = SchemaYamlVars()
             ctx = generate_runtime_docs_context(
                 config,
                 node,
                 self.manifest,
                 config.project_name,
+                schema_yaml_vars,
             )
             _process_docs_for_node(ctx, node)
+            self.store_docs_vars(
+                schema_yaml_vars, node.patch_path, node.resource_type.pluralize(), node.name
+            )
         for source in self.manifest.sources.values():
             if source.created_at < self.started_at:
                 continue
+            schema_yaml_vars = SchemaYamlVars()
             ctx = generate_runtime_docs_context(
                 config,
                 source,
                 self.manifest,
                 config.project_name,
+                schema_yaml_vars,
             )
             _process_docs_for_source(ctx, source)
+            self.store_docs_vars(schema_yaml_vars, source.file_id, "sources", source.source_name)
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
+            schema_yaml_vars = SchemaYamlVars()
             ctx = generate_runtime_docs_context(
                 config,
                 macro,
                 self.manifest,
                 config.project_name,
+                schema_yaml_vars,
             )
             _process_docs_for_macro(ctx, macro)
+            self.store_docs_vars(schema_yaml_vars, macro.patch_path, "macros", macro.name)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
+            schema_yaml_vars = SchemaYamlVars()
             ctx = generate_runtime_docs_context(
                 config,
                 exposure,
                 self.manifest,
                 config.project_name,
+                schema_yaml_vars,
             )
             _process_docs_for_exposure(ctx, exposure)
+            self.store_docs_vars(schema_yaml_vars, exposure.file_id, "exposures", exposure.name)
         for metric in self.manifest.metrics.values():
             if metric.created_at < self.started_at:
                 continue
+            schema_yaml_vars = SchemaYamlVars()
             ctx = generate_runtime_docs_context(
                 config,
                 metric,
                 self.manifest,
                 config.project_name,
+                schema_yaml_vars,
             )
             _process_docs_for_metrics(ctx, metric)
+            self.store_docs_vars(schema_yaml_vars, metric.file_id, "metrics", metric.name)
+
+    # Descriptions are rendered after the schema files are parsed, so the
+    # vars and env vars they used are added to the yaml element they came from
+    def store_docs_vars(
+        self,
+        schema_yaml_vars: SchemaYamlVars,
+        file_id: Optional[str],
+        yaml_key: str,
+        name: str,
+    ) -> None:
+        if not file_id or file_id not in self.manifest.files:
+            return
+        schema_file = self.manifest.files[file_id]
+        if not isinstance(schema_file, SchemaSourceFile):
+            return
+        self.manifest.env_vars.update(schema_yaml_vars.env_vars)
+        for var in schema_yaml_vars.env_vars.keys():
+            schema_file.add_env_var(var, yaml_key, name)
+        for var in schema_yaml_vars.vars.keys():
+            schema_file.add_var(var, yaml_key, name)
 
     # Loops through all nodes and exposures, for each element in
     # 'sources' array finds the source node and updates the
@@ -925,6 +1155,14 @@ class ManifestLoader:
             _process_sources_for_exposure(self.manifest, current_project, exposure)
 
 
+def _changed_keys(
+    saved_hashes: Mapping[str, FileHash], hashes: Mapping[str, FileHash]
+) -> Set[str]:
+    keys = set(saved_hashes).symmetric_difference(hashes)
+    keys.update(k for k in hashes if k in saved_hashes and saved_hashes[k] != hashes[k])
+    return keys
+
+
 def invalid_ref_fail_unless_test(node, target_model_name, target_model_package, disabled):
 
     if node.resource_type == NodeType.Test:
@@ -972,36 +1210,47 @@ def _check_resource_uniqueness(
     manifest: Manifest,
     config: RuntimeConfig,
 ) -> None:
-    names_resources: Dict[str, ManifestNode] = {}
-    alias_resources: Dict[str, ManifestNode] = {}
-
-    for resource, node in manifest.nodes.items():
-        if not node.is_relational:
+    # unique_ids, so nodes that were saved by partial parsing are only
+    # deserialized to report an error
+    names_resources: Dict[str, str] = {}
+    alias_resources: Dict[str, str] = {}
+    relation_cls = get_relation_class_by_name(config.credentials.type)
+
+    for unique_id in manifest.nodes:
+        node_relation = saved_node_relation(manifest.nodes, unique_id)
+        if node_relation is None:
             continue
 
-        name = node.name
-        # the full node name is really defined by the adapter's relation
-        relation_cls = get_relation_class_by_name(config.credentials.type)
-        relation = relation_cls.create_from(config=config, node=node)
+        name, database, schema, alias = node_relation
+        # the full node name is really defined by the adapter's relation,
+        # this is what relation_cls.create_from makes for a node
+        relation = relation_cls.create(
+            database=database,
+            schema=schema,
+            identifier=alias,
+            quote_policy=config.quoting,
+        )
         full_node_name = str(relation)
 
         existing_node = names_resources.get(name)
         if existing_node is not None:
-            dbt.exceptions.raise_duplicate_resource_name(existing_node, node)
+            dbt.exceptions.raise_duplicate_resource_name(
+                manifest.nodes[existing_node], manifest.nodes[unique_id]
+            )
 
         existing_alias = alias_resources.get(full_node_name)
         if existing_alias is not None:
-            dbt.exceptions.raise_ambiguous_alias(existing_alias, node, full_node_name)
+            dbt.exceptions.raise_ambiguous_alias(
+                manifest.nodes[existing_alias], manifest.nodes[unique_id], full_node_name
+            )
 
-        names_resources[name] = node
-        alias_resources[full_node_name] = node
+        names_resources[name] = unique_id
+        alias_resources[full_node_name] = unique_id
 
 
 def _warn_for_unused_resource_config_paths(manifest: Manifest, config: RuntimeConfig) -> None:
-    resource_fqns: Mapping[str, PathSet] = manifest.get_resource_fqns()
-    disabled_fqns: PathSet = frozenset(
-        tuple(n.fqn) for n in list(chain.from_iterable(manifest.disabled.values()))
-    )
+    resource_fqns: Mapping[str, PathSet] = saved_resource_fqns(manifest)
+    disabled_fqns: PathSet = frozenset(saved_disabled_fqns(manifest))
     config.warn_for_unused_resource_config_paths(resource_fqns, disabled_fqns)
 
 
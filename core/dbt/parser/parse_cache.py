@@ -0,0 +1,284 @@
+import json
+import os
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+
+import dbt.flags as flags
+from dbt.clients.system import make_directory
+from dbt.config import RuntimeConfig
+from dbt.constants import DEFAULT_ENV_PLACEHOLDER
+from dbt.context.context_config import ContextConfig
+from dbt.context.providers import ParseVar
+from dbt.contracts.files import FileHash, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.events.functions import fire_event
+from dbt.events.types import ParsedFileLoadFailed
+from dbt.node_types import ModelLanguage, NodeType
+from dbt.version import __version__
+
+PARSE_CACHE_FILE_NAME = "parse_cache.msgpack"
+
+# Resource types parsed by ConfiguredParser.parse_node from their own sql
+# file. Hooks, seeds and sql operations are not worth caching.
+PARSE_CACHE_RESOURCE_TYPES = (
+    NodeType.Model,
+    NodeType.Snapshot,
+    NodeType.Analysis,
+    NodeType.Test,
+)
+
+
+@dataclass
+class ParseCacheEntry(dbtClassMixin):
+    """The inputs a node read while it was rendered at parse time, and what
+    rendering added to the node. Project configs, patches and the
+    generate_x_name macros are not part of the entry; they are always
+    computed fresh from the current project.
+    """
+
+    original_file_path: str
+    checksum: str
+    fingerprint: str
+    statically_parsed: bool
+    vars: List[str] = field(default_factory=list)
+    env_vars: List[str] = field(default_factory=list)
+    refs: List[List[str]] = field(default_factory=list)
+    sources: List[List[str]] = field(default_factory=list)
+    metrics: List[List[str]] = field(default_factory=list)
+    macros: List[str] = field(default_factory=list)
+    config_call_dict: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ParseCacheState(DataClassMessagePackMixin, dbtClassMixin):
+    dbt_version: str
+    adapter_type: str
+    static_parser: bool
+    use_experimental_parser: bool
+    entries: Dict[str, ParseCacheEntry] = field(default_factory=dict)
+
+
+class ParseCache:
+    """A cache of rendered sql nodes, keyed by unique_id, that is kept next
+    to the partial parsing file. An entry is reused when the file checksum
+    and a fingerprint of the vars, env vars and macros the node actually
+    used, and of the config it was rendered with, are unchanged, so files
+    survive a full reparse caused by an unrelated change.
+    """
+
+    def __init__(self, root_project: RuntimeConfig, state: Optional[ParseCacheState] = None):
+        self.root_project = root_project
+        self.state = self.new_state() if state is None else state
+        # entries recorded in this process, so parse workers can send them
+        # back to the parent
+        self.recorded: Dict[str, ParseCacheEntry] = {}
+        self._macro_hashes: Dict[str, str] = {}
+        self._macro_namespace_hash = ""
+        self._target_hash = ""
+
+    def new_state(self) -> ParseCacheState:
+        return ParseCacheState(
+            dbt_version=__version__,
+            adapter_type=self.root_project.credentials.type,
+            static_parser=bool(flags.STATIC_PARSER),
+            use_experimental_parser=bool(flags.USE_EXPERIMENTAL_PARSER),
+        )
+
+    @classmethod
+    def path(cls, root_project: RuntimeConfig) -> str:
+        return os.path.join(
+            root_project.project_root, root_project.target_path, PARSE_CACHE_FILE_NAME
+        )
+
+    @classmethod
+    def read(cls, root_project: RuntimeConfig) -> "ParseCache":
+        cache = cls(root_project)
+        path = cls.path(root_project)
+        if not os.path.exists(path):
+            return cache
+        try:
+            with open(path, "rb") as fp:
+                state: ParseCacheState = ParseCacheState.from_msgpack(fp.read())  # type: ignore
+        except Exception as exc:
+            fire_event(ParsedFileLoadFailed(path=path, exc=exc))
+            return cache
+        # entries from a different dbt version, adapter or parser mode
+        # could have been rendered differently, so throw them all away
+        new_state = cache.new_state()
+        new_state.entries = state.entries
+        if new_state == state:
+            cache.state = state
+        return cache
+
+    def write(self, manifest: Manifest) -> None:
+        # Only keep entries for nodes that are still in the project
+        self.state.entries = {
+            unique_id: entry
+            for unique_id, entry in self.state.entries.items()
+            if unique_id in manifest.nodes or unique_id in manifest.disabled
+        }
+        path = self.path(self.root_project)
+        make_directory(os.path.dirname(path))
+        with open(path, "wb") as fp:
+            fp.write(self.state.to_msgpack())
+
+    def prepare(self, manifest: Manifest) -> None:
+        """Compute the fingerprint inputs that are shared by every node.
+        This must be called after the macros have been loaded.
+        """
+        self._macro_hashes = {}
+        self._macro_namespace_hash = FileHash.from_contents(
+            "\x00".join(sorted(manifest.macros))
+        ).checksum
+        target = self.root_project.to_target_dict()
+        # changing the number of threads shouldn't invalidate parsing
+        target.pop("threads", None)
+        self._target_hash = FileHash.from_contents(
+            json.dumps(target, sort_keys=True, default=str)
+        ).checksum
+
+    @staticmethod
+    def can_cache(node: Any) -> bool:
+        return (
+            node.resource_type in PARSE_CACHE_RESOURCE_TYPES and node.language == ModelLanguage.sql
+        )
+
+    def _macro_closure(self, manifest: Manifest, macro_ids: List[str]) -> Optional[Dict[str, str]]:
+        closure: Dict[str, str] = {}
+        stack = list(macro_ids)
+        while stack:
+            macro_id = stack.pop()
+            if macro_id in closure:
+                continue
+            macro = manifest.macros.get(macro_id)
+            if macro is None:
+                return None
+            if macro_id not in self._macro_hashes:
+                self._macro_hashes[macro_id] = FileHash.from_contents(macro.macro_sql).checksum
+            closure[macro_id] = self._macro_hashes[macro_id]
+            stack.extend(macro.depends_on.macros)
+        return closure
+
+    def fingerprint(
+        self,
+        manifest: Manifest,
+        node: Any,
+        var_names: List[str],
+        env_var_names: List[str],
+        macros: List[str],
+        statically_parsed: bool,
+        base_config: Dict[str, Any],
+    ) -> Optional[str]:
+        """base_config is the node config before rendering, which is what
+        'model.config' holds while it renders.
+        """
+        macro_closure = self._macro_closure(manifest, macros)
+        if macro_closure is None:
+            return None
+        parse_var = ParseVar(context={}, config=self.root_project, node=node)
+        inputs: Dict[str, Any] = {
+            "original_file_path": node.original_file_path,
+            "vars": {
+                name: [parse_var.has_var(name), parse_var._merged.get(name)] for name in var_names
+            },
+            "env_vars": {name: os.environ.get(name) for name in env_var_names},
+            "macros": macro_closure,
+        }
+        # Jinja rendering can also see the target, the node's config from
+        # the project and resolve any macro by name, so an added override, a
+        # profile change or a project config change invalidates it
+        if not statically_parsed:
+            inputs["macro_namespace"] = self._macro_namespace_hash
+            inputs["target"] = self._target_hash
+            inputs["config"] = base_config
+        return FileHash.from_contents(json.dumps(inputs, sort_keys=True, default=str)).checksum
+
+    def lookup(
+        self, manifest: Manifest, source_file: SourceFile, node: Any
+    ) -> Optional[ParseCacheEntry]:
+        entry = self.state.entries.get(node.unique_id)
+        if entry is None:
+            return None
+        if (
+            entry.checksum != source_file.checksum.checksum
+            or entry.original_file_path != node.original_file_path
+        ):
+            return None
+        # lookup happens before rendering, so this is the base config
+        fingerprint = self.fingerprint(
+            manifest,
+            node,
+            entry.vars,
+            entry.env_vars,
+            entry.macros,
+            entry.statically_parsed,
+            node.config.to_dict(omit_none=True),
+        )
+        if fingerprint != entry.fingerprint:
+            return None
+        return entry
+
+    def apply(
+        self,
+        entry: ParseCacheEntry,
+        manifest: Manifest,
+        source_file: SourceFile,
+        node: Any,
+        config: ContextConfig,
+    ) -> None:
+        """Put everything rendering would have added back on the node,
+        source_file and manifest. The caller still needs to build the node
+        config from the ContextConfig.
+        """
+        node.refs = deepcopy(entry.refs)
+        node.sources = deepcopy(entry.sources)
+        node.metrics = deepcopy(entry.metrics)
+        node.depends_on.macros = list(entry.macros)
+        config._config_call_dict = deepcopy(entry.config_call_dict)
+        for var in entry.env_vars:
+            manifest.env_vars[var] = os.environ.get(var, DEFAULT_ENV_PLACEHOLDER)
+        source_file.env_vars.extend(entry.env_vars)
+        for var in entry.vars:
+            source_file.add_var(var)
+
+    def record(
+        self,
+        manifest: Manifest,
+        source_file: SourceFile,
+        node: Any,
+        config: ContextConfig,
+        var_names: List[str],
+        env_var_names: List[str],
+        statically_parsed: bool,
+        base_config: Dict[str, Any],
+    ) -> None:
+        # Hooks are rendered after the config is built, so refs and macros
+        # from hooks can't be told apart from the ones in the sql. Tests
+        # don't have hooks.
+        if getattr(node.config, "pre_hook", None) or getattr(node.config, "post_hook", None):
+            return
+        macros = list(node.depends_on.macros)
+        fingerprint = self.fingerprint(
+            manifest, node, var_names, env_var_names, macros, statically_parsed, base_config
+        )
+        if fingerprint is None:
+            return
+        entry = ParseCacheEntry(
+            original_file_path=node.original_file_path,
+            checksum=source_file.checksum.checksum,
+            fingerprint=fingerprint,
+            statically_parsed=statically_parsed,
+            vars=list(var_names),
+            env_vars=list(env_var_names),
+            refs=deepcopy(node.refs),
+            sources=deepcopy(node.sources),
+            metrics=deepcopy(node.metrics),
+            macros=macros,
+            config_call_dict=deepcopy(config._config_call_dict),
+        )
+        self.state.entries[node.unique_id] = entry
+        self.recorded[node.unique_id] = entry
@@ -1,6 +1,6 @@
 import os
 from copy import deepcopy
-from typing import MutableMapping, Dict, List
+from typing import MutableMapping, Dict, List, Optional
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.files import (
     AnySourceFile,
@@ -8,6 +8,7 @@ from dbt.contracts.files import (
     parse_file_type_to_parser,
 )
 from dbt.events.functions import fire_event
+from dbt.parser.partial_parse_file import saved_file_checksum, saved_file_uses_vars
 from dbt.events.types import (
     PartialParsingEnabled,
     PartialParsingAddedFile,
@@ -67,6 +68,19 @@ special_override_macros = [
 ]
 
 
+# Whether any env var used by the saved manifest has a different value now.
+# This is the same check as PartialParsing.build_env_vars_to_files, without
+# looking at the files.
+def saved_env_vars_changed(saved_manifest: Manifest) -> bool:
+    for env_var, prev_value in saved_manifest.env_vars.items():
+        current_value = os.getenv(env_var)
+        if current_value is None and prev_value == DEFAULT_ENV_PLACEHOLDER:
+            continue
+        if prev_value != current_value:
+            return True
+    return False
+
+
 # Partial parsing. Create a diff of files from saved manifest and current
 # files and produce a project_parser_file dictionary to drive parsing of
 # only the necessary changes.
@@ -75,7 +89,12 @@ special_override_macros = [
 # to preserve an unchanged file object in case we need to drop back to a
 # a full parse (such as for certain macro changes)
 class PartialParsing:
-    def __init__(self, saved_manifest: Manifest, new_files: MutableMapping[str, AnySourceFile]):
+    def __init__(
+        self,
+        saved_manifest: Manifest,
+        new_files: MutableMapping[str, AnySourceFile],
+        changed_vars: Optional[List[str]] = None,
+    ):
         self.saved_manifest = saved_manifest
         self.new_files = new_files
         self.project_parser_files: Dict = {}
@@ -87,6 +106,9 @@ class PartialParsing:
             self.env_vars_changed_source_files,
             self.env_vars_changed_schema_files,
         ) = self.build_env_vars_to_files()
+        # Files that used a changed var or profile field are scheduled the
+        # same way as files that used a changed env var
+        self.add_vars_changed_files(changed_vars or [])
         self.build_file_diff()
         self.processing_file = None
         self.deleted_special_override_macro = False
@@ -126,7 +148,7 @@ class PartialParsing:
         changed_schema_files = []
         unchanged = []
         for file_id in common:
-            if self.saved_files[file_id].checksum == self.new_files[file_id].checksum:
+            if saved_file_checksum(self.saved_files, file_id) == self.new_files[file_id].checksum:
                 unchanged.append(file_id)
             else:
                 # separate out changed schema files
@@ -806,6 +828,7 @@ class PartialParsing:
             if not found:
                 pp_dict[key].append(patch)
         schema_file.delete_from_env_vars(key, patch["name"])
+        schema_file.delete_from_vars(key, patch["name"])
         self.add_to_pp_files(schema_file)
 
     # For model, seed, snapshot, analysis schema dictionary keys,
@@ -985,10 +1008,10 @@ class PartialParsing:
         # a list of vars.
         # Create a list of file_ids for source_files that need to be reparsed, and
         # a dictionary of file_ids to yaml_keys to names.
-        for source_file in self.saved_files.values():
-            file_id = source_file.file_id
-            if not source_file.env_vars:
+        for file_id in self.saved_files:
+            if not saved_file_uses_vars(self.saved_files, file_id, env_vars=True):
                 continue
+            source_file = self.saved_files[file_id]
             if source_file.parse_file_type == ParseFileType.Schema:
                 for yaml_key in source_file.env_vars.keys():
                     for name in source_file.env_vars[yaml_key].keys():
@@ -1009,3 +1032,30 @@ class PartialParsing:
                         break  # if one env_var is changed we can stop
 
         return (env_vars_changed_source_files, env_vars_changed_schema_files)
+
+    # Add the files that used one of the changed_vars to the files
+    # built in build_env_vars_to_files. changed_vars has var names and
+    # profile fields as "target.<field>".
+    def add_vars_changed_files(self, changed_vars):
+        if not changed_vars:
+            return
+        changed = set(changed_vars)
+        for file_id in self.saved_files:
+            if not saved_file_uses_vars(self.saved_files, file_id, env_vars=False):
+                continue
+            source_file = self.saved_files[file_id]
+            if source_file.parse_file_type == ParseFileType.Schema:
+                for yaml_key in source_file.vars.keys():
+                    for name in source_file.vars[yaml_key].keys():
+                        if not changed.intersection(source_file.vars[yaml_key][name]):
+                            continue
+                        if file_id not in self.env_vars_changed_schema_files:
+                            self.env_vars_changed_schema_files[file_id] = {}
+                        schema_file_changes = self.env_vars_changed_schema_files[file_id]
+                        if yaml_key not in schema_file_changes:
+                            schema_file_changes[yaml_key] = []
+                        if name not in schema_file_changes[yaml_key]:
+                            schema_file_changes[yaml_key].append(name)
+            elif changed.intersection(source_file.vars):
+                if file_id not in self.env_vars_changed_source_files:
+                    self.env_vars_changed_source_files.append(file_id)
@@ -0,0 +1,368 @@
+import mmap
+import os
+import struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import msgpack  # type: ignore
+
+from dbt import flags
+from dbt.clients.system import make_directory
+from dbt.contracts.files import AnySourceFile, FileHash, SchemaSourceFile, SourceFile
+from dbt.contracts.graph.compiled import GraphMemberNode
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedDocumentation, ParsedMacro
+from dbt.exceptions import IncompatibleSchemaException
+from dbt.node_types import NodeType
+
+PARTIAL_PARSE_FILE_MAGIC = b"dbtpp"
+# Increment this when the layout of the file changes
+PARTIAL_PARSE_FILE_FORMAT = 2
+# magic, format, length of the header
+_PREAMBLE = struct.Struct("<5sIQ")
+
+# Manifest attributes that are stored one object at a time, so that each
+# object is only deserialized when it is used
+LAZY_SECTIONS = (
+    "nodes",
+    "sources",
+    "macros",
+    "docs",
+    "exposures",
+    "metrics",
+    "files",
+    "disabled",
+)
+
+_CLASSES: Dict[str, Type[Any]] = {
+    cls.__name__: cls
+    for cls in (
+        *GraphMemberNode.__args__,  # type: ignore[attr-defined]
+        ParsedMacro,
+        ParsedDocumentation,
+        SourceFile,
+        SchemaSourceFile,
+    )
+}
+
+# The index entry of a serialized object: offset, length and class name.
+# Lists of objects (manifest.disabled) have an empty class name.
+IndexEntry = List[Any]
+# The file checksum, and whether the file used env vars or vars, so
+# partial parsing can diff the saved files without deserializing them
+FileSummary = List[Any]
+# The resource type and fqn of a node or source, and for nodes what
+# _check_resource_uniqueness needs: the name, database, schema, alias and
+# store_failures config. The fqns of a disabled list. Loading an unchanged
+# manifest checks these instead of deserializing every object.
+ResourceSummary = List[Any]
+
+
+class LazySection(MutableMapping):
+    """A mapping of unique_ids or file_ids to objects that are deserialized
+    from the partial parse file the first time they are looked up. Objects
+    that were never looked up are copied to the new file as they are.
+    """
+
+    def __init__(
+        self,
+        buffer: Any,
+        index: Dict[str, IndexEntry],
+        summaries: Optional[Dict[str, List[Any]]] = None,
+    ) -> None:
+        self._buffer = buffer
+        # entries that haven't been deserialized yet
+        self._index = index
+        self._summaries = summaries or {}
+        self._values: Dict[str, Any] = {}
+        # keeps the order of the mapping
+        self._keys: Dict[str, None] = dict.fromkeys(index)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            entry = self._index.get(key)
+        if entry is None:
+            # another thread deserialized it meanwhile, or it doesn't exist
+            return self._values[key]
+        offset, length, class_name = entry
+        value = _decode(self._buffer[offset : offset + length], class_name)
+        # threads may both deserialize an object, and they all get the kept one
+        value = self._values.setdefault(key, value)
+        self._index.pop(key, None)
+        # the object can be changed now, so the summary can't be trusted
+        self._summaries.pop(key, None)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._index.pop(key, None)
+        self._summaries.pop(key, None)
+        self._values[key] = value
+        self._keys.setdefault(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._keys[key]
+        self._index.pop(key, None)
+        self._summaries.pop(key, None)
+        self._values.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LazySection({len(self._keys)} items, {len(self._values)} loaded)"
+
+    # Can't pickle the memory map, so send a plain dict instead
+    def __reduce__(self):
+        return (dict, (list(self.items()),))
+
+    def __copy__(self) -> "LazySection":
+        # shares the buffer, and only copies the index
+        section = LazySection(self._buffer, dict(self._index), dict(self._summaries))
+        section._values = dict(self._values)
+        section._keys = dict(self._keys)
+        return section
+
+    def raw(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """The serialized object and its class name, if it hasn't been
+        deserialized.
+        """
+        if key not in self._index:
+            return None
+        offset, length, class_name = self._index[key]
+        return bytes(self._buffer[offset : offset + length]), class_name
+
+    def summary(self, key: str) -> Optional[List[Any]]:
+        return self._summaries.get(key)
+
+
+def _encode(value: Any) -> Tuple[bytes, str]:
+    if isinstance(value, list):
+        items = [[type(item).__name__, item.to_dict()] for item in value]
+        return msgpack.packb(items), ""
+    return msgpack.packb(value.to_dict()), type(value).__name__
+
+
+def _decode(data: Any, class_name: str) -> Any:
+    value = msgpack.unpackb(data)
+    if class_name:
+        return _CLASSES[class_name].from_dict(value)
+    return [_CLASSES[item_class].from_dict(item) for item_class, item in value]
+
+
+def _summarize_file(source_file: AnySourceFile) -> FileSummary:
+    return [
+        source_file.checksum.name,
+        source_file.checksum.checksum,
+        bool(source_file.env_vars),
+        bool(source_file.vars),
+    ]
+
+
+def _summarize_node(node: Any) -> ResourceSummary:
+    return [
+        node.resource_type,
+        node.fqn,
+        node.name,
+        node.database,
+        node.schema,
+        node.alias,
+        getattr(node.config, "store_failures", None),
+    ]
+
+
+def _summarize_source(source: Any) -> ResourceSummary:
+    return [source.resource_type, source.fqn]
+
+
+def _summarize_disabled(disabled: List[Any]) -> ResourceSummary:
+    return [item.fqn for item in disabled]
+
+
+_SUMMARIZERS: Dict[str, Callable[[Any], List[Any]]] = {
+    "files": _summarize_file,
+    "nodes": _summarize_node,
+    "sources": _summarize_source,
+    "disabled": _summarize_disabled,
+}
+
+
+def saved_file_checksum(files: MutableMapping[str, AnySourceFile], file_id: str) -> FileHash:
+    if isinstance(files, LazySection):
+        summary = files.summary(file_id)
+        if summary is not None:
+            return FileHash(name=summary[0], checksum=summary[1])
+    return files[file_id].checksum
+
+
+def saved_file_uses_vars(
+    files: MutableMapping[str, AnySourceFile], file_id: str, env_vars: bool
+) -> bool:
+    """Whether the saved file used any env vars, or any vars or profile
+    fields if env_vars is False.
+    """
+    if isinstance(files, LazySection):
+        summary = files.summary(file_id)
+        if summary is not None:
+            return summary[2] if env_vars else summary[3]
+    source_file = files[file_id]
+    return bool(source_file.env_vars if env_vars else source_file.vars)
+
+
+def saved_resource_fqns(manifest: Manifest) -> Dict[str, Set[Tuple[str, ...]]]:
+    """Manifest.get_resource_fqns, reading the fqns of saved nodes and
+    sources from their summaries.
+    """
+    resource_fqns: Dict[str, Set[Tuple[str, ...]]] = {}
+    sections: Tuple[MutableMapping[str, Any], ...] = (
+        manifest.exposures,
+        manifest.nodes,
+        manifest.sources,
+        manifest.metrics,
+    )
+    for section in sections:
+        for key in section:
+            summary = section.summary(key) if isinstance(section, LazySection) else None
+            if summary is not None:
+                resource_type, fqn = NodeType(summary[0]), summary[1]
+            else:
+                resource = section[key]
+                resource_type, fqn = resource.resource_type, resource.fqn
+            resource_fqns.setdefault(resource_type.pluralize(), set()).add(tuple(fqn))
+    return resource_fqns
+
+
+def saved_disabled_fqns(manifest: Manifest) -> Set[Tuple[str, ...]]:
+    disabled = manifest.disabled
+    disabled_fqns: Set[Tuple[str, ...]] = set()
+    for key in disabled:
+        summary = disabled.summary(key) if isinstance(disabled, LazySection) else None
+        if summary is None:
+            summary = _summarize_disabled(disabled[key])
+        disabled_fqns.update(tuple(fqn) for fqn in summary)
+    return disabled_fqns
+
+
+def saved_node_relation(
+    nodes: MutableMapping[str, Any], unique_id: str
+) -> Optional[Tuple[str, Optional[str], str, str]]:
+    """The name, database, schema and alias of a node that maps to an object
+    in the database, or None if it doesn't.
+    """
+    summary = nodes.summary(unique_id) if isinstance(nodes, LazySection) else None
+    if summary is None:
+        node = nodes[unique_id]
+        if not node.is_relational:
+            return None
+        return node.name, node.database, node.schema, node.alias
+    resource_type, _, name, database, schema, alias, store_failures = summary
+    # ParsedNode.is_relational
+    if store_failures is None:
+        store_failures = flags.STORE_FAILURES
+    if resource_type in NodeType.refable() or (resource_type == NodeType.Test and store_failures):
+        return name, database, schema, alias
+    return None
+
+
+def write_partial_parse_file(manifest: Manifest, path: str) -> None:
+    blobs: List[bytes] = []
+    offset = 0
+    sections: Dict[str, Dict[str, IndexEntry]] = {}
+    summaries: Dict[str, Dict[str, List[Any]]] = {}
+    for name in LAZY_SECTIONS:
+        section = getattr(manifest, name)
+        index: Dict[str, IndexEntry] = {}
+        summarize = _SUMMARIZERS.get(name)
+        section_summaries: Dict[str, List[Any]] = {}
+        for key in section:
+            raw = section.raw(key) if isinstance(section, LazySection) else None
+            if raw is None:
+                value = section[key]
+                data, class_name = _encode(value)
+                if summarize is not None:
+                    section_summaries[key] = summarize(value)
+            else:
+                data, class_name = raw
+                if summarize is not None:
+                    section_summaries[key] = section.summary(key)
+            index[key] = [offset, len(data), class_name]
+            blobs.append(data)
+            offset += len(data)
+        sections[name] = index
+        if summarize is not None:
+            summaries[name] = section_summaries
+
+    # Everything else in the manifest is small, and always needed
+    rest = Manifest(
+        selectors=manifest.selectors,
+        metadata=manifest.metadata,
+        state_check=manifest.state_check,
+        env_vars=manifest.env_vars,
+    )
+    header = msgpack.packb(
+        {
+            "manifest": rest.to_dict(),
+            "sections": sections,
+            "summaries": summaries,
+        }
+    )
+
+    # The saved manifest may still be reading objects from the old file,
+    # so write a new file and move it into place
+    make_directory(os.path.dirname(path))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(_PREAMBLE.pack(PARTIAL_PARSE_FILE_MAGIC, PARTIAL_PARSE_FILE_FORMAT, len(header)))
+        fp.write(header)
+        for data in blobs:
+            fp.write(data)
+    os.replace(tmp_path, path)
+
+
+def _open_buffer(path: str) -> Any:
+    with open(path, "rb") as fp:
+        # A file that's memory mapped can't be replaced on Windows
+        if os.name == "nt":
+            return fp.read()
+        return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_partial_parse_file(path: str) -> Manifest:
+    """Read the partial parse file. Only the index and the small parts of
+    the manifest are deserialized here.
+    """
+    buffer = _open_buffer(path)
+    magic, file_format, header_length = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != PARTIAL_PARSE_FILE_MAGIC or file_format != PARTIAL_PARSE_FILE_FORMAT:
+        exc = IncompatibleSchemaException(
+            expected=str(PARTIAL_PARSE_FILE_FORMAT),
+            found=str(file_format) if magic == PARTIAL_PARSE_FILE_MAGIC else None,
+        )
+        exc.add_filename(path)
+        raise exc
+    view = memoryview(buffer)
+    header = msgpack.unpackb(view[_PREAMBLE.size : _PREAMBLE.size + header_length])
+    data = view[_PREAMBLE.size + header_length :]
+
+    manifest = Manifest.from_dict(header["manifest"])
+    for name in LAZY_SECTIONS:
+        summaries = header["summaries"].get(name)
+        setattr(manifest, name, LazySection(data, header["sections"][name], summaries))
+    return manifest
@@ -297,6 +297,9 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
             if self.schema_yaml_vars.env_vars:
                 self.store_env_vars(target, schema_file_id, self.schema_yaml_vars.env_vars)
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                self.store_vars(target, schema_file_id, self.schema_yaml_vars.vars)
+                self.schema_yaml_vars.vars = {}
 
         except ParsingException as exc:
             context = _trimmed(str(target))
@@ -361,17 +364,28 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
         self.manifest.env_vars.update(env_vars)
         if schema_file_id in self.manifest.files:
             schema_file = self.manifest.files[schema_file_id]
-            if isinstance(target, UnpatchedSourceDefinition):
-                search_name = target.source.name
-                yaml_key = target.source.yaml_key
-                if "." in search_name:  # source file definitions
-                    (search_name, _) = search_name.split(".")
-            else:
-                search_name = target.name
-                yaml_key = target.yaml_key
+            yaml_key, search_name = self._get_yaml_key_and_name(target)
             for var in env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
 
+    def store_vars(self, target, schema_file_id, vars):
+        if schema_file_id in self.manifest.files:
+            schema_file = self.manifest.files[schema_file_id]
+            yaml_key, search_name = self._get_yaml_key_and_name(target)
+            for var in vars.keys():
+                schema_file.add_var(var, yaml_key, search_name)
+
+    def _get_yaml_key_and_name(self, target):
+        if isinstance(target, UnpatchedSourceDefinition):
+            search_name = target.source.name
+            yaml_key = target.source.yaml_key
+            if "." in search_name:  # source file definitions
+                (search_name, _) = search_name.split(".")
+        else:
+            search_name = target.name
+            yaml_key = target.yaml_key
+        return yaml_key, search_name
+
     # This does special shortcut processing for the two
     # most common internal macros, not_null and unique,
     # which avoids the jinja rendering to resolve config
@@ -653,6 +667,12 @@ class YamlReader(metaclass=ABCMeta):
                 for var in self.schema_yaml_vars.env_vars.keys():
                     schema_file.add_env_var(var, self.key, entry["name"])
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                schema_file = self.yaml.file
+                assert isinstance(schema_file, SchemaSourceFile)
+                for var in self.schema_yaml_vars.vars.keys():
+                    schema_file.add_var(var, self.key, entry["name"])
+                self.schema_yaml_vars.vars = {}
 
             yield entry
 
@@ -0,0 +1,328 @@
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TYPE_CHECKING
+
+from dbt.contracts.files import ParseFileType, SchemaSourceFile, SourceFile, SourceKey
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedExposure, ParsedMetric
+from dbt.contracts.graph.unparsed import SourcePatch
+from dbt.parser.base import Parser
+from dbt.parser.schemas import SchemaParser
+from dbt.parser.search import FileBlock
+
+if TYPE_CHECKING:
+    from dbt.parser.manifest import ManifestLoader
+
+
+# Worker processes parse files against the ManifestLoader that existed in the
+# parent when the pool was created. The pool is always created with the
+# 'fork' start method, so this is inherited by the children and never
+# pickled.
+_WORKER_LOADER: Optional["ManifestLoader"] = None
+
+# Below this many files per worker, the cost of forking is not worth it
+MIN_FILES_PER_WORKER = 20
+# Number of chunks handed to each worker, so that slow files don't leave
+# the other workers idle at the end of the pool
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class ParsedFileResult:
+    """Everything a parser added to the manifest while parsing one file.
+
+    Nodes are stored in the order they were added, along with whether they
+    were enabled, so the parent process can replay them exactly. The schema
+    file fields are only populated for yaml files.
+    """
+
+    file_id: str
+    nodes: List[Tuple[bool, Any]] = field(default_factory=list)
+    env_vars: Any = None
+    vars: Any = None
+    manifest_env_vars: Dict[str, str] = field(default_factory=dict)
+    # Set if the file did something the parent can't replay from a copy,
+    # like patching a macro or a disabled node. The parent parses it again.
+    reparse: bool = False
+    tests: Dict[str, Any] = field(default_factory=dict)
+    sources: List[Any] = field(default_factory=list)
+    exposures: List[ParsedExposure] = field(default_factory=list)
+    metrics: List[ParsedMetric] = field(default_factory=list)
+    patched_nodes: List[Any] = field(default_factory=list)
+    source_patches: List[Tuple[SourceKey, SourcePatch]] = field(default_factory=list)
+
+
+@dataclass
+class ParsedChunkResult:
+    file_ids: List[str]
+    files: List[ParsedFileResult] = field(default_factory=list)
+    static_analysis_path_count: int = 0
+    static_analysis_parsed_path_count: int = 0
+    # parse cache entries recorded by the worker, by unique_id
+    parse_cache_entries: Dict[str, Any] = field(default_factory=dict)
+    # env vars and vars read by macros that were called while parsing,
+    # like generate_schema_name, by macro file_id
+    macro_file_env_vars: Dict[str, List[str]] = field(default_factory=dict)
+    macro_file_vars: Dict[str, List[str]] = field(default_factory=dict)
+    manifest_env_vars: Dict[str, str] = field(default_factory=dict)
+    # Set if parsing failed in the worker. The parent reparses the chunk
+    # serially so the original exception is raised in the parent process.
+    failed: bool = False
+
+
+def fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def use_parse_workers(workers: Optional[int], file_count: int) -> bool:
+    if not workers or workers < 2:
+        return False
+    if file_count < MIN_FILES_PER_WORKER * 2:
+        return False
+    return fork_available()
+
+
+def chunk_file_ids(file_ids: Sequence[str], workers: int) -> List[List[str]]:
+    chunk_count = workers * CHUNKS_PER_WORKER
+    chunk_size = max(MIN_FILES_PER_WORKER, -(-len(file_ids) // chunk_count))
+    return [list(file_ids[i : i + chunk_size]) for i in range(0, len(file_ids), chunk_size)]
+
+
+def _collect_nodes(
+    manifest: Manifest, file_id: str, unique_ids: Sequence[str]
+) -> List[Tuple[bool, Any]]:
+    nodes: List[Tuple[bool, Any]] = []
+    seen_enabled = set()
+    disabled_seen: Dict[str, int] = {}
+    for unique_id in unique_ids:
+        node: Any = manifest.nodes.get(unique_id)
+        if node is not None and node.file_id == file_id and unique_id not in seen_enabled:
+            seen_enabled.add(unique_id)
+            nodes.append((True, node))
+            continue
+        candidates = [n for n in manifest.disabled.get(unique_id, []) if n.file_id == file_id]
+        index = disabled_seen.get(unique_id, 0)
+        disabled_seen[unique_id] = index + 1
+        nodes.append((False, candidates[index]))
+    return nodes
+
+
+def _collect_file_result(manifest: Manifest, file_id: str, start: int) -> ParsedFileResult:
+    source_file = manifest.files[file_id]
+    if isinstance(source_file, SchemaSourceFile):
+        return _collect_schema_file_result(manifest, source_file)
+    result = ParsedFileResult(
+        file_id=file_id,
+        nodes=_collect_nodes(manifest, file_id, source_file.nodes[start:]),
+        env_vars=list(source_file.env_vars),
+        vars=list(source_file.vars),
+    )
+    for var in source_file.env_vars:
+        if var in manifest.env_vars:
+            result.manifest_env_vars[var] = manifest.env_vars[var]
+    return result
+
+
+def _collect_schema_file_result(
+    manifest: Manifest, source_file: SchemaSourceFile
+) -> ParsedFileResult:
+    file_id = source_file.file_id
+    result = ParsedFileResult(
+        file_id=file_id,
+        nodes=_collect_nodes(manifest, file_id, source_file.get_all_test_ids()),
+        env_vars=source_file.env_vars,
+        vars=source_file.vars,
+        tests=source_file.tests,
+        sources=[manifest.sources[unique_id] for unique_id in source_file.sources],
+        exposures=[manifest.exposures[unique_id] for unique_id in source_file.exposures],
+        metrics=[manifest.metrics[unique_id] for unique_id in source_file.metrics],
+        patched_nodes=[manifest.nodes[unique_id] for unique_id in source_file.node_patches],
+        source_patches=[(key, manifest.source_patches[key]) for key in source_file.source_patches],
+    )
+    for yaml_key in source_file.env_vars.values():
+        for env_vars in yaml_key.values():
+            for var in env_vars:
+                if var in manifest.env_vars:
+                    result.manifest_env_vars[var] = manifest.env_vars[var]
+    if source_file.macro_patches:
+        result.reparse = True
+    for disabled in manifest.disabled.values():
+        if any(node.patch_path == file_id for node in disabled):
+            result.reparse = True
+    return result
+
+
+def parse_chunk(task: Tuple[str, Type[Parser], List[str]]) -> ParsedChunkResult:
+    """Parse a chunk of files in a worker process."""
+    project_name, parser_cls, file_ids = task
+    loader = _WORKER_LOADER
+    assert loader is not None
+    result = ParsedChunkResult(file_ids=file_ids)
+    manifest = loader.manifest
+    parsing_info = manifest._parsing_info
+    assert parsing_info is not None
+    start_static_path_count = parsing_info.static_analysis_path_count
+    start_static_parsed_count = parsing_info.static_analysis_parsed_path_count
+    parse_cache = parsing_info.parse_cache
+    if parse_cache is not None:
+        parse_cache.recorded = {}
+    try:
+        parser = parser_cls(loader.all_projects[project_name], manifest, loader.root_project)
+        for file_id in file_ids:
+            source_file = manifest.files[file_id]
+            block = FileBlock(source_file)
+            if isinstance(parser, SchemaParser):
+                assert isinstance(source_file, SchemaSourceFile)
+                parser.parse_file(block, dct=source_file.dict_from_yaml)
+                start = 0
+            else:
+                assert isinstance(source_file, SourceFile)
+                start = len(source_file.nodes)
+                parser.parse_file(block)
+            result.files.append(_collect_file_result(manifest, file_id, start))
+    except Exception:
+        return ParsedChunkResult(file_ids=file_ids, failed=True)
+    result.static_analysis_path_count = (
+        parsing_info.static_analysis_path_count - start_static_path_count
+    )
+    result.static_analysis_parsed_path_count = (
+        parsing_info.static_analysis_parsed_path_count - start_static_parsed_count
+    )
+    if parse_cache is not None:
+        result.parse_cache_entries = parse_cache.recorded
+    for file_id, source_file in manifest.files.items():
+        if source_file.parse_file_type != ParseFileType.Macro:
+            continue
+        assert isinstance(source_file, SourceFile)
+        if source_file.env_vars:
+            result.macro_file_env_vars[file_id] = list(source_file.env_vars)
+            for var in source_file.env_vars:
+                if var in manifest.env_vars:
+                    result.manifest_env_vars[var] = manifest.env_vars[var]
+        if source_file.vars:
+            result.macro_file_vars[file_id] = list(source_file.vars)
+    return result
+
+
+class ParseWorkerPool:
+    """A context manager around a forked process pool that parses chunks of
+    files for one parser type in one project.
+    """
+
+    def __init__(self, loader: "ManifestLoader", workers: int) -> None:
+        self.loader = loader
+        self.workers = workers
+        self._pool: Optional[Any] = None
+
+    def __enter__(self) -> "ParseWorkerPool":
+        global _WORKER_LOADER
+        _WORKER_LOADER = self.loader
+        self._pool = multiprocessing.get_context("fork").Pool(self.workers)
+        return self
+
+    def __exit__(self, *args) -> None:
+        global _WORKER_LOADER
+        assert self._pool is not None
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+        _WORKER_LOADER = None
+
+    def imap(self, project_name: str, parser_cls: Type[Parser], file_ids: Sequence[str]):
+        assert self._pool is not None
+        tasks = [
+            (project_name, parser_cls, chunk) for chunk in chunk_file_ids(file_ids, self.workers)
+        ]
+        # imap preserves the order of the tasks, so results are merged in the
+        # same order the serial parser would have produced them
+        return self._pool.imap(parse_chunk, tasks)
+
+
+def _conflicts(manifest: Manifest, result: ParsedFileResult) -> bool:
+    """Check for anything in a worker result that collides with what was
+    merged from earlier chunks. Those files are parsed again in the parent,
+    which raises the same error the serial path would.
+    """
+    if any(enabled and node.unique_id in manifest.nodes for enabled, node in result.nodes):
+        return True
+    if any(source.unique_id in manifest.sources for source in result.sources):
+        return True
+    if any(exposure.unique_id in manifest.exposures for exposure in result.exposures):
+        return True
+    if any(metric.unique_id in manifest.metrics for metric in result.metrics):
+        return True
+    if any(key in manifest.source_patches for key, _ in result.source_patches):
+        return True
+    for node in result.patched_nodes:
+        existing = manifest.nodes.get(node.unique_id)
+        if existing is None or existing.patch_path:
+            return True
+    return False
+
+
+def merge_chunk(manifest: Manifest, parser: Parser, chunk: ParsedChunkResult) -> None:
+    """Add the results of a parsed chunk to the manifest in the parent
+    process. Nodes go through the same Manifest methods as the serial
+    parsers, so duplicate checks and SourceFile bookkeeping are identical.
+    """
+    assert manifest._parsing_info is not None
+    for result in chunk.files:
+        source_file = manifest.files[result.file_id]
+        if isinstance(source_file, SchemaSourceFile):
+            if result.reparse or _conflicts(manifest, result):
+                assert isinstance(parser, SchemaParser)
+                parser.parse_file(FileBlock(source_file), dct=source_file.dict_from_yaml)
+            else:
+                _merge_schema_file(manifest, source_file, result)
+            continue
+        for enabled, node in result.nodes:
+            if enabled:
+                manifest.add_node(source_file, node)
+            else:
+                manifest.add_disabled(source_file, node)
+        source_file.env_vars = result.env_vars
+        source_file.vars = result.vars
+        manifest.env_vars.update(result.manifest_env_vars)
+    for file_id, env_vars in chunk.macro_file_env_vars.items():
+        macro_file = manifest.files[file_id]
+        for var in env_vars:
+            if var not in macro_file.env_vars:
+                macro_file.env_vars.append(var)  # type: ignore[union-attr]
+    for file_id, vars in chunk.macro_file_vars.items():
+        macro_file = manifest.files[file_id]
+        assert isinstance(macro_file, SourceFile)
+        for var in vars:
+            macro_file.add_var(var)
+    manifest.env_vars.update(chunk.manifest_env_vars)
+    if manifest._parsing_info.parse_cache is not None:
+        manifest._parsing_info.parse_cache.state.entries.update(chunk.parse_cache_entries)
+    manifest._parsing_info.static_analysis_path_count += chunk.static_analysis_path_count
+    manifest._parsing_info.static_analysis_parsed_path_count += (
+        chunk.static_analysis_parsed_path_count
+    )
+
+
+def _merge_schema_file(
+    manifest: Manifest, source_file: SchemaSourceFile, result: ParsedFileResult
+) -> None:
+    for enabled, node in result.nodes:
+        if enabled:
+            manifest.add_node_nofile(node)
+        else:
+            manifest.add_disabled_nofile(node)
+    source_file.tests = result.tests
+    for node in result.patched_nodes:
+        manifest.nodes[node.unique_id] = node
+        source_file.node_patches.append(node.unique_id)
+    for source in result.sources:
+        manifest.add_source(source_file, source)
+    for key, patch in result.source_patches:
+        manifest.source_patches[key] = patch
+        source_file.source_patches.append(key)
+    for exposure in result.exposures:
+        manifest.add_exposure(source_file, exposure)
+    for metric in result.metrics:
+        manifest.add_metric(source_file, metric)
+    source_file.env_vars = result.env_vars
+    source_file.vars = result.vars
+    manifest.env_vars.update(result.manifest_env_vars)
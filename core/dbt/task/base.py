@@ -6,6 +6,8 @@ from typing import Type, Union, Dict, Any, Optional
 
 from dbt import tracking
 from dbt import flags
+from dbt.clients.jinja import compiled_template_cache
+from dbt.compilation import AheadOfTimeCompiler
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
     NodeStatus,
@@ -22,7 +24,7 @@ from dbt.exceptions import (
 )
 from dbt.logger import log_manager
 import dbt.events.functions as event_logger
-from dbt.events.functions import fire_event
+from dbt.events.functions import fire_event, fire_lazy_event
 from dbt.events.types import (
     DbtProjectError,
     DbtProjectErrorException,
@@ -49,6 +51,8 @@ from dbt.config import RuntimeConfig, Project
 from dbt.config.profile import read_profile
 import dbt.exceptions
 
+JINJA_BYTECODE_DIR_NAME = "jinja_bytecode"
+
 
 class NoneConfig:
     @classmethod
@@ -178,6 +182,12 @@ class ConfiguredTask(BaseTask):
     def __init__(self, args, config):
         super().__init__(args, config)
         register_adapter(self.config)
+        if flags.CACHE_JINJA_BYTECODE:
+            compiled_template_cache.set_bytecode_directory(
+                os.path.join(self.config.target_path, JINJA_BYTECODE_DIR_NAME)
+            )
+        else:
+            compiled_template_cache.set_bytecode_directory(None)
 
     @classmethod
     def from_args(cls, args):
@@ -196,6 +206,10 @@ class ExecutionContext:
 
 
 class BaseRunner(metaclass=ABCMeta):
+    # whether compile() renders the node with Compiler.compile_node, so it
+    # can be compiled ahead of time instead
+    compiles_ahead: bool = False
+
     def __init__(self, config, adapter, node, node_index, num_nodes):
         self.config = config
         self.adapter = adapter
@@ -205,6 +219,7 @@ class BaseRunner(metaclass=ABCMeta):
 
         self.skip = False
         self.skip_cause: Optional[RunResult] = None
+        self.ahead_of_time: Optional[AheadOfTimeCompiler] = None
 
     @abstractmethod
     def compile(self, manifest: Manifest) -> Any:
@@ -311,11 +326,12 @@ class BaseRunner(metaclass=ABCMeta):
         result = None
         with self.adapter.connection_for(self.node):
             ctx.node._event_status["node_status"] = RunningStatus.Compiling
-            fire_event(
-                NodeCompiling(
+            fire_lazy_event(
+                NodeCompiling,
+                lambda: NodeCompiling(
                     node_info=ctx.node.node_info,
                     unique_id=ctx.node.unique_id,
-                )
+                ),
             )
             with collect_timing_info("compile") as timing_info:
                 # if we fail here, we still have a compiled node to return
@@ -327,11 +343,12 @@ class BaseRunner(metaclass=ABCMeta):
             # for ephemeral nodes, we only want to compile, not run
             if not ctx.node.is_ephemeral_model:
                 ctx.node._event_status["node_status"] = RunningStatus.Executing
-                fire_event(
-                    NodeExecuting(
+                fire_lazy_event(
+                    NodeExecuting,
+                    lambda: NodeExecuting(
                         node_info=ctx.node.node_info,
                         unique_id=ctx.node.unique_id,
-                    )
+                    ),
                 )
                 with collect_timing_info("execute") as timing_info:
                     result = self.run(ctx.node, manifest)
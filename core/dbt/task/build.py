@@ -1,6 +1,6 @@
 from .run import RunTask, ModelRunner as run_model_runner
 from .snapshot import SnapshotRunner as snapshot_model_runner
-from .seed import SeedRunner as seed_runner
+from .seed import SeedRunner as seed_runner, create_seed_checksums_tables
 from .test import TestRunner as test_runner
 
 from dbt.adapters.factory import get_adapter
@@ -61,6 +61,10 @@ class BuildTask(RunTask):
             resource_types=resource_types,
         )
 
+    def before_run(self, adapter, selected_uids):
+        super().before_run(adapter, selected_uids)
+        create_seed_checksums_tables(adapter, self.config, self.manifest, selected_uids)
+
     def get_runner_type(self, node):
         return self.RUNNER_MAP.get(node.resource_type)
 
@@ -14,6 +14,8 @@ from dbt.node_types import NodeType
 
 
 class CompileRunner(BaseRunner):
+    compiles_ahead = True
+
     def before_execute(self):
         pass
 
@@ -33,6 +35,12 @@ class CompileRunner(BaseRunner):
         )
 
     def compile(self, manifest):
+        if self.ahead_of_time is not None:
+            # None if it used the database while compiling, which it may have
+            # done before its parents were rebuilt, so it's compiled again now
+            compiled = self.ahead_of_time.take(self.node.unique_id)
+            if compiled is not None:
+                return compiled
         compiler = self.adapter.get_compiler()
         return compiler.compile_node(self.node, manifest, {})
 
@@ -0,0 +1,270 @@
+import os
+import socket
+import sys
+import threading
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from dbt import flags
+from dbt.adapters.factory import register_adapter, reset_adapters
+from dbt.clients.daemon import (
+    DAEMON_SOCKET_FILE_NAME,
+    OUTPUT_FRAME,
+    read_request,
+    send_exit_code,
+    send_frame,
+)
+from dbt.clients.system import make_directory
+from dbt.config import RuntimeConfig
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.functions import fire_event, set_invocation_id
+from dbt.events.types import (
+    DaemonListening,
+    DaemonManifestLoadFailed,
+    DaemonProjectChanged,
+    DaemonRunningCommand,
+)
+from dbt.exceptions import RuntimeException
+from dbt.logger import log_manager
+from dbt.parser.manifest import ManifestLoader, set_hot_manifest
+from dbt.task.base import ConfiguredTask
+from dbt.utils import ExitCodes
+
+# Commands that use the manifest, and so can be sent to the daemon
+DAEMON_COMMANDS = ("build", "compile", "list", "parse", "run", "test")
+# Seconds between checks for changed project files
+DAEMON_POLL_INTERVAL = 1.0
+# Seconds to wait for a client to send its request
+DAEMON_REQUEST_TIMEOUT = 10.0
+# Files outside of the resource paths that change how a project is parsed
+PROJECT_FILES = ("dbt_project.yml", "packages.yml", "selectors.yml")
+
+# The modification time and size of each file, by path
+FileStamps = Dict[str, Tuple[int, int]]
+
+
+def _stamp_file(path: str, stamps: FileStamps) -> None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+
+def _stamp_dir(path: str, stamps: FileStamps) -> None:
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                _stamp_dir(entry.path, stamps)
+            else:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stamps[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+
+def scan_project_files(config: RuntimeConfig) -> FileStamps:
+    """Stamp every file that is read when the project is parsed. Comparing
+    two scans tells whether anything was added, changed or deleted.
+    """
+    stamps: FileStamps = {}
+    for project in config.load_dependencies().values():
+        for name in PROJECT_FILES:
+            _stamp_file(os.path.join(project.project_root, name), stamps)
+        for path in set(chain(project.all_source_paths, project.test_paths, project.docs_paths)):
+            _stamp_dir(os.path.join(project.project_root, path), stamps)
+    # installing or removing a package
+    packages_path = os.path.join(config.project_root, config.packages_install_path)
+    if os.path.isdir(packages_path):
+        for name in os.listdir(packages_path):
+            _stamp_file(os.path.join(packages_path, name, "dbt_project.yml"), stamps)
+    _stamp_file(os.path.join(flags.PROFILES_DIR, "profiles.yml"), stamps)
+    return stamps
+
+
+def _changed_paths(old: FileStamps, new: FileStamps) -> List[str]:
+    return sorted(path for path in old.keys() | new.keys() if old.get(path) != new.get(path))
+
+
+def _relay_output(read_fd: int, conn: socket.socket) -> None:
+    with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+        while True:
+            data = pipe.read(65536)
+            if not data:
+                return
+            try:
+                send_frame(conn, OUTPUT_FRAME, data)
+            except OSError:
+                # the client went away, but the command keeps running
+                pass
+
+
+def run_daemon_command(args: List[str]) -> int:
+    # dbt.main imports this module to build the subcommand
+    import dbt.main
+
+    try:
+        parsed = dbt.main.parse_args(args)
+        if parsed.which not in DAEMON_COMMANDS:
+            sys.stderr.write(
+                f"dbt daemon can't run `{parsed.which}`. "
+                f"It runs these commands: {', '.join(DAEMON_COMMANDS)}\n"
+            )
+            return ExitCodes.UnhandledError.value
+        dbt.main.main(args)
+    except SystemExit as exc:
+        if exc.code is None:
+            return ExitCodes.Success.value
+        return exc.code if isinstance(exc.code, int) else ExitCodes.UnhandledError.value
+    return ExitCodes.Success.value
+
+
+class DaemonTask(ConfiguredTask):
+    """Keep the manifest in memory, update it when project files change, and
+    run the commands sent by clients over a Unix socket. Each command runs in
+    a forked process, which starts with the manifest already loaded.
+    """
+
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.manifest: Optional[Manifest] = None
+        self.file_stamps: FileStamps = {}
+
+    def get_socket_path(self) -> str:
+        if self.args.socket is not None:
+            return os.path.abspath(self.args.socket)
+        return os.path.join(
+            self.config.project_root, self.config.target_path, DAEMON_SOCKET_FILE_NAME
+        )
+
+    def load_manifest(self, reload_config: bool = False) -> None:
+        # The current manifest is used for partial parsing, and replaced
+        # by the new one
+        set_hot_manifest(self.manifest)
+        self.manifest = None
+        try:
+            if reload_config:
+                # dbt_project.yml or profiles.yml may have changed
+                reset_adapters()
+                self.config = RuntimeConfig.from_args(self.args)
+                register_adapter(self.config)
+            self.manifest = ManifestLoader.get_full_manifest(self.config)
+        except Exception as exc:
+            # Requests will show the error until it's fixed
+            fire_event(DaemonManifestLoadFailed(exc=str(exc)))
+        finally:
+            set_hot_manifest(self.manifest, unchanged_project_root=self.config.project_root)
+
+    def refresh_manifest(self) -> None:
+        file_stamps = scan_project_files(self.config)
+        if file_stamps == self.file_stamps:
+            return
+        fire_event(DaemonProjectChanged(paths=_changed_paths(self.file_stamps, file_stamps)))
+        self.file_stamps = file_stamps
+        self.load_manifest(reload_config=True)
+
+    def bind(self, socket_path: str) -> socket.socket:
+        make_directory(os.path.dirname(socket_path))
+        if os.path.exists(socket_path):
+            # A socket left behind by a daemon that didn't exit cleanly is
+            # replaced, but not one that's still in use
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(socket_path)
+                except OSError:
+                    os.unlink(socket_path)
+                else:
+                    raise RuntimeException(f"A dbt daemon is already listening on {socket_path}")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen()
+        server.settimeout(DAEMON_POLL_INTERVAL)
+        return server
+
+    def run(self):
+        if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+            raise RuntimeException("dbt daemon is not supported on this platform")
+        socket_path = self.get_socket_path()
+        server = self.bind(socket_path)
+        try:
+            self.file_stamps = scan_project_files(self.config)
+            self.load_manifest()
+            fire_event(DaemonListening(socket_path=socket_path))
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    self.refresh_manifest()
+                else:
+                    with conn:
+                        self.handle_request(server, conn)
+                self.reap_children()
+        finally:
+            server.close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+    def handle_request(self, server: socket.socket, conn: socket.socket) -> None:
+        conn.settimeout(DAEMON_REQUEST_TIMEOUT)
+        try:
+            request = read_request(conn)
+        except (OSError, ValueError):
+            return
+        # pick up files saved just before the command was sent
+        self.refresh_manifest()
+        fire_event(DaemonRunningCommand(args=request["args"]))
+        if os.fork() != 0:
+            return
+        exit_code = ExitCodes.UnhandledError.value
+        try:
+            server.close()
+            conn.settimeout(None)
+            exit_code = self.run_request(conn, request)
+        finally:
+            os._exit(exit_code)
+
+    def run_request(self, conn: socket.socket, request: Dict) -> int:
+        """Run a command in a forked process, like the client would have run
+        it, and send its output to the client.
+        """
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        set_invocation_id()
+        # the daemon already set up its own log file
+        log_manager.reset_handlers()
+
+        # Send everything written to stdout and stderr, including by
+        # subprocesses, to the client
+        read_fd, write_fd = os.pipe()
+        relay = threading.Thread(target=_relay_output, args=(read_fd, conn))
+        relay.start()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(write_fd, sys.stdout.fileno())
+        os.dup2(write_fd, sys.stderr.fileno())
+        os.close(write_fd)
+        try:
+            exit_code = run_daemon_command(request["args"])
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.close(sys.stdout.fileno())
+            os.close(sys.stderr.fileno())
+            relay.join()
+        send_exit_code(conn, exit_code)
+        return exit_code
+
+    def reap_children(self) -> None:
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
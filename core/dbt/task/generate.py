@@ -1,13 +1,17 @@
 import os
 import shutil
 from datetime import datetime
+from itertools import chain
 from typing import Dict, List, Any, Optional, Tuple, Set
 
+import agate
+
 from dbt.dataclass_schema import ValidationError
 
 from .compile import CompileTask
 
 from dbt.adapters.factory import get_adapter
+from dbt.clients.system import read_json, write_json
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
@@ -30,6 +34,8 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    BuildingIncrementalCatalog,
+    IncrementalCatalogUnavailable,
 )
 from dbt.parser.manifest import ManifestLoader
 import dbt.utils
@@ -38,6 +44,10 @@ import dbt.exceptions
 
 
 CATALOG_FILENAME = "catalog.json"
+# the relation versions the last catalog.json was built from, for --incremental
+CATALOG_VERSIONS_FILENAME = "catalog_versions.json"
+
+SchemaKey = Tuple[Optional[str], str]
 
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
@@ -92,6 +102,12 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             self[key] = table
         return table
 
+    def add_table(self, table: agate.Table) -> None:
+        """Add the columns in the rows of a table get_catalog returned"""
+        column_names = table.column_names
+        for row in table:
+            self.add_column(dict(zip(column_names, map(dbt.utils._coerce_decimal, row))))
+
     def add_column(self, data: PrimitiveDict):
         table = self.get_table(data)
         column_data = get_stripped_prefix(data, "column_")
@@ -102,6 +118,13 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         column = ColumnMetadata.from_dict(column_data)
         table.columns[column.name] = column
 
+    def add_previous_tables(self, tables: Dict[CatalogKey, CatalogTable]) -> None:
+        """Add the tables of an earlier catalog that aren't in this one"""
+        keys = {table.key() for table in self.values()}
+        for key, table in tables.items():
+            if key not in keys:
+                self[key] = table.replace(unique_id=None)
+
     def make_unique_id_map(
         self, manifest: Manifest
     ) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
@@ -198,6 +221,36 @@ def get_unique_id_mapping(
     return node_map, source_map
 
 
+def plan_incremental_catalog(
+    manifest: Manifest,
+    versions: Dict[CatalogKey, str],
+    previous_tables: Dict[CatalogKey, CatalogTable],
+    previous_versions: Dict[CatalogKey, str],
+) -> Tuple[Set[SchemaKey], Dict[CatalogKey, CatalogTable]]:
+    """Work out which schemas' catalogs to read again, and which tables of
+    the previous catalog can be used as they are.
+
+    A schema is read again if any relation in it that a node or source maps
+    to has a different version than it had, or wasn't in the previous
+    catalog. Previous tables are kept if their relation still exists and
+    their schema isn't read again.
+    """
+    node_map, source_map = get_unique_id_mapping(manifest)
+    changed: Set[SchemaKey] = set()
+    for key in chain(node_map, source_map):
+        if key not in versions:
+            # the relation doesn't exist
+            continue
+        if key not in previous_tables or previous_versions.get(key) != versions[key]:
+            changed.add((key.database, key.schema))
+    unchanged = {
+        key: table
+        for key, table in previous_tables.items()
+        if key in versions and (key.database, key.schema) not in changed
+    }
+    return changed, unchanged
+
+
 class GenerateTask(CompileTask):
     def _get_manifest(self) -> Manifest:
         if self.manifest is None:
@@ -235,16 +288,34 @@ class GenerateTask(CompileTask):
             raise InternalException("self.manifest was None in run!")
 
         adapter = get_adapter(self.config)
+        catalog = Catalog([])
+        exceptions: List[Exception] = []
+        versions: Optional[Dict[CatalogKey, str]] = None
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+            only_schemas: Optional[Set[SchemaKey]] = None
+            unchanged: Dict[CatalogKey, CatalogTable] = {}
+            if getattr(self.args, "incremental", False):
+                versions = self.get_catalog_versions(adapter)
+                previous = None if versions is None else self.read_previous_catalog()
+                if versions is not None and previous is not None:
+                    only_schemas, unchanged = plan_incremental_catalog(
+                        self.manifest, versions, *previous
+                    )
+                    schemas = {(key.database, key.schema) for key in versions}
+                    fire_event(
+                        BuildingIncrementalCatalog(
+                            refreshed=len(only_schemas), schemas=len(schemas)
+                        )
+                    )
+            # add each information schema's tables as soon as they're read, so
+            # only one of them is held at a time
+            if only_schemas is None or only_schemas:
+                for catalog_table in adapter.get_catalog_tables(
+                    self.manifest, exceptions, only_schemas
+                ):
+                    catalog.add_table(catalog_table)
+            catalog.add_previous_tables(unchanged)
 
         errors: Optional[List[str]] = None
         if exceptions:
@@ -261,6 +332,17 @@ class GenerateTask(CompileTask):
 
         path = os.path.join(self.config.target_path, CATALOG_FILENAME)
         results.write(path)
+        versions_path = os.path.join(self.config.target_path, CATALOG_VERSIONS_FILENAME)
+        if versions is not None and not exceptions:
+            write_json(
+                versions_path,
+                {
+                    "invocation_id": results.metadata.invocation_id,
+                    "relations": [[*key, version] for key, version in versions.items()],
+                },
+            )
+        elif os.path.exists(versions_path):
+            os.remove(versions_path)
         if self.args.compile:
             self.write_manifest()
 
@@ -269,6 +351,68 @@ class GenerateTask(CompileTask):
         fire_event(CatalogWritten(path=os.path.abspath(path)))
         return results
 
+    def get_catalog_versions(self, adapter) -> Optional[Dict[CatalogKey, str]]:
+        """The version of each relation in the catalog's schemas, or None if
+        the adapter can't get them
+        """
+        if not adapter.supports_incremental_catalog():
+            fire_event(
+                IncrementalCatalogUnavailable(
+                    reason=f"the {adapter.type()} adapter can't tell which relations changed"
+                )
+            )
+            return None
+        table, exceptions = adapter.get_catalog_versions(self._get_manifest())
+        if exceptions:
+            fire_event(
+                IncrementalCatalogUnavailable(reason="the relations' versions couldn't be read")
+            )
+            return None
+        versions: Dict[CatalogKey, str] = {}
+        for row in table:
+            key = CatalogKey(
+                dbt.utils.lowercase(row["table_database"]),
+                row["table_schema"].lower(),
+                row["table_name"].lower(),
+            )
+            versions[key] = str(row["relation_version"])
+        return versions
+
+    def read_previous_catalog(
+        self,
+    ) -> Optional[Tuple[Dict[CatalogKey, CatalogTable], Dict[CatalogKey, str]]]:
+        """The tables of the previous catalog.json, and the versions of the
+        relations it was built from, or None if there isn't one that
+        --incremental wrote
+        """
+        path = os.path.join(self.config.target_path, CATALOG_FILENAME)
+        versions_path = os.path.join(self.config.target_path, CATALOG_VERSIONS_FILENAME)
+        try:
+            previous = CatalogArtifact.read_and_check_versions(path)
+            versions = read_json(versions_path)
+        except Exception:
+            previous = None
+        if (
+            previous is None
+            or previous.errors
+            or versions.get("invocation_id") != previous.metadata.invocation_id
+        ):
+            fire_event(
+                IncrementalCatalogUnavailable(
+                    reason="there's no catalog from an earlier docs generate --incremental"
+                )
+            )
+            return None
+
+        tables: Dict[CatalogKey, CatalogTable] = {}
+        for table in chain(previous.nodes.values(), previous.sources.values()):
+            tables[table.key()] = table
+        relation_versions = {
+            CatalogKey(database, schema, name): version
+            for database, schema, name, version in versions["relations"]
+        }
+        return tables, relation_versions
+
     def get_catalog_results(
         self,
         nodes: Dict[str, CatalogTable],
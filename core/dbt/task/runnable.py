@@ -14,6 +14,12 @@ from .printer import (
 )
 
 from dbt.clients.system import write_file
+from dbt.compilation import AheadOfTimeCompiler
+from dbt.compiled_sql_cache import (
+    CompiledSqlCache,
+    get_compiled_sql_cache,
+    set_compiled_sql_cache,
+)
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.base import BaseRelation
 from dbt.adapters.factory import get_adapter
@@ -26,7 +32,7 @@ from dbt.logger import (
     ModelMetadata,
     NodeCount,
 )
-from dbt.events.functions import fire_event
+from dbt.events.functions import fire_event, fire_lazy_event
 from dbt.events.types import (
     EmptyLine,
     PrintCancelLine,
@@ -35,11 +41,17 @@ from dbt.events.types import (
     NodeFinished,
     QueryCancelationUnsupported,
     ConcurrencyLine,
+    SchedulingEstimated,
 )
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedSourceDefinition
-from dbt.contracts.results import NodeStatus, RunExecutionResult, RunningStatus
+from dbt.contracts.results import (
+    NodeStatus,
+    RunExecutionResult,
+    RunningStatus,
+    SchedulingEstimate,
+)
 from dbt.contracts.state import PreviousState
 from dbt.exceptions import (
     InternalException,
@@ -49,7 +61,14 @@ from dbt.exceptions import (
     warn_or_error,
 )
 
-from dbt.graph import GraphQueue, NodeSelector, SelectionSpec, parse_difference, Graph
+from dbt.graph import (
+    GraphQueue,
+    NodeSelector,
+    SchedulingPolicy,
+    SelectionSpec,
+    parse_difference,
+    Graph,
+)
 from dbt.parser.manifest import ManifestLoader
 import dbt.tracking
 
@@ -107,7 +126,9 @@ class GraphRunnableTask(ManifestTask):
     def __init__(self, args, config):
         super().__init__(args, config)
         self.job_queue: Optional[GraphQueue] = None
+        self.scheduling_estimate: Optional[SchedulingEstimate] = None
         self._flattened_nodes: Optional[List[CompileResultNode]] = None
+        self.ahead_of_time: Optional[AheadOfTimeCompiler] = None
 
         self.run_count: int = 0
         self.num_nodes: int = 0
@@ -152,10 +173,49 @@ class GraphRunnableTask(ManifestTask):
     def get_node_selector(self) -> NodeSelector:
         raise NotImplementedException(f"get_node_selector not implemented for task {type(self)}")
 
+    def get_execution_times(self) -> Optional[Dict[str, float]]:
+        """Get the execution time of each node in the --state run results,
+        if the nodes should be scheduled by critical path.
+        """
+        if getattr(self.args, "scheduling", None) != SchedulingPolicy.CriticalPath:
+            return None
+        if self.previous_state is None or self.previous_state.results is None:
+            # the queue gives every node the same time
+            return {}
+        return {
+            result.unique_id: result.execution_time
+            for result in self.previous_state.results.results
+            if result.execution_time > 0
+        }
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, self.get_execution_times())
+
+    def estimate_scheduling(self, num_threads: int) -> Optional[SchedulingEstimate]:
+        if self.job_queue is None:
+            raise InternalException("estimate_scheduling called before the job queue was built")
+        makespans = self.job_queue.estimate_makespans(num_threads)
+        if makespans is None:
+            return None
+        makespan, depth_makespan = makespans
+        fire_event(
+            SchedulingEstimated(
+                policy=self.job_queue.policy.value,
+                timed_nodes=self.job_queue.timed_nodes,
+                num_nodes=len(self.job_queue.graph),
+                estimated_makespan=makespan,
+                estimated_depth_makespan=depth_makespan,
+            )
+        )
+        return SchedulingEstimate(
+            policy=self.job_queue.policy.value,
+            threads=num_threads,
+            estimated_makespan=makespan,
+            estimated_depth_makespan=depth_makespan,
+            estimated_improvement=depth_makespan - makespan,
+        )
 
     def _runtime_initialize(self):
         super()._runtime_initialize()
@@ -201,7 +261,9 @@ class GraphRunnableTask(ManifestTask):
             num_nodes = self.num_nodes
 
         cls = self.get_runner_type(node)
-        return cls(self.config, adapter, node, run_count, num_nodes)
+        runner = cls(self.config, adapter, node, run_count, num_nodes)
+        runner.ahead_of_time = self.ahead_of_time
+        return runner
 
     def call_runner(self, runner):
         uid_context = UniqueID(runner.node.unique_id)
@@ -213,11 +275,12 @@ class GraphRunnableTask(ManifestTask):
             extended_metadata = ModelMetadata(runner.node, index)
 
             with startctx, extended_metadata:
-                fire_event(
-                    NodeStart(
+                fire_lazy_event(
+                    NodeStart,
+                    lambda: NodeStart(
                         node_info=runner.node.node_info,
                         unique_id=runner.node.unique_id,
-                    )
+                    ),
                 )
             status: Dict[str, str] = {}
             try:
@@ -228,12 +291,13 @@ class GraphRunnableTask(ManifestTask):
             finally:
                 finishctx = TimestampNamed("finished_at")
                 with finishctx, DbtModelState(status):
-                    fire_event(
-                        NodeFinished(
+                    fire_lazy_event(
+                        NodeFinished,
+                        lambda: NodeFinished(
                             node_info=runner.node.node_info,
                             unique_id=runner.node.unique_id,
                             run_result=result.to_dict(),
-                        )
+                        ),
                     )
             # `_event_status` dict is only used for logging.  Make sure
             # it gets deleted when we're done with it
@@ -367,16 +431,40 @@ class GraphRunnableTask(ManifestTask):
 
         pool.join()
 
+    def compile_ahead(self) -> Optional[AheadOfTimeCompiler]:
+        """With --compile-ahead, start compiling the selected nodes that
+        their runners would compile, in the order they are likely to run.
+        """
+        if not flags.COMPILE_AHEAD or self.config.args.single_threaded:
+            return None
+        if self.manifest is None or self.job_queue is None:
+            raise InternalException("compile_ahead called before the job queue was built")
+        nodes = []
+        for unique_id in self.job_queue.execution_order():
+            node = self.manifest.nodes.get(unique_id)
+            if node is None:
+                continue
+            runner_type = self.get_runner_type(node)
+            if runner_type is not None and runner_type.compiles_ahead:
+                nodes.append(node)
+        if not nodes:
+            return None
+        ahead_of_time = AheadOfTimeCompiler(get_adapter(self.config).get_compiler(), self.manifest)
+        ahead_of_time.submit(nodes)
+        return ahead_of_time
+
     def execute_nodes(self):
         num_threads = self.config.threads
         target_name = self.config.target_name
 
         with NodeCount(self.num_nodes):
             fire_event(ConcurrencyLine(num_threads=num_threads, target_name=target_name))
+        self.scheduling_estimate = self.estimate_scheduling(num_threads)
         with TextOnly():
             fire_event(EmptyLine())
 
         pool = ThreadPool(num_threads)
+        self.ahead_of_time = self.compile_ahead()
         try:
             self.run_queue(pool)
 
@@ -390,6 +478,11 @@ class GraphRunnableTask(ManifestTask):
             print_run_end_messages(self.node_results, keyboard_interrupt=True)
             raise
 
+        finally:
+            if self.ahead_of_time is not None:
+                self.ahead_of_time.shutdown()
+                self.ahead_of_time = None
+
         pool.close()
         pool.join()
 
@@ -443,6 +536,16 @@ class GraphRunnableTask(ManifestTask):
         result = self.get_result(results=res, elapsed_time=elapsed, generated_at=datetime.utcnow())
         return result
 
+    def load_compiled_sql_cache(self) -> None:
+        if flags.CACHE_COMPILED_SQL and self.manifest is not None:
+            set_compiled_sql_cache(CompiledSqlCache.load(self.manifest, self.config))
+
+    def save_compiled_sql_cache(self) -> None:
+        cache = get_compiled_sql_cache()
+        set_compiled_sql_cache(None)
+        if cache is not None:
+            cache.save()
+
     def write_result(self, result):
         result.write(self.result_path())
 
@@ -469,7 +572,11 @@ class GraphRunnableTask(ManifestTask):
             with TextOnly():
                 fire_event(EmptyLine())
             selected_uids = frozenset(n.unique_id for n in self._flattened_nodes)
-            result = self.execute_with_hooks(selected_uids)
+            self.load_compiled_sql_cache()
+            try:
+                result = self.execute_with_hooks(selected_uids)
+            finally:
+                self.save_compiled_sql_cache()
 
         if flags.WRITE_JSON:
             self.write_manifest()
@@ -583,6 +690,7 @@ class GraphRunnableTask(ManifestTask):
             elapsed_time=elapsed_time,
             generated_at=generated_at,
             args=dbt.utils.args_to_dict(self.args),
+            scheduling=self.scheduling_estimate,
         )
 
     def task_end_messages(self, results):
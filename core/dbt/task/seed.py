@@ -1,11 +1,18 @@
+import hashlib
+import json
+import os
 import random
+import threading
+from typing import Dict, Optional, Tuple
 
 from .run import ModelRunner, RunTask
 from .printer import (
     print_run_end_messages,
 )
 
-from dbt.contracts.results import RunStatus
+from dbt import flags
+from dbt.adapters.base import BaseRelation
+from dbt.contracts.results import RunResult, RunStatus
 from dbt.exceptions import InternalException
 from dbt.graph import ResourceTypeSelector
 from dbt.logger import TextOnly
@@ -19,10 +26,44 @@ from dbt.events.types import (
     PrintStartLine,
 )
 from dbt.node_types import NodeType
+from dbt.utils import lowercase
 from dbt.contracts.results import NodeStatus
+from dbt.version import __version__
+
+UNCHANGED_SEED_MESSAGE = "UNCHANGED"
+
+
+def create_seed_checksums_tables(adapter, config, manifest, selected_uids) -> None:
+    """With --skip-unchanged-seeds, create the checksums table in each
+    selected seed's schema. This runs on one thread before the seeds do, so
+    their threads only write their own rows to it.
+    """
+    if not flags.SKIP_UNCHANGED_SEEDS:
+        return
+    if manifest is None:
+        raise InternalException("manifest was None in create_seed_checksums_tables")
+    relations: Dict[Tuple[Optional[str], str], BaseRelation] = {}
+    for uid in selected_uids:
+        node = manifest.nodes.get(uid)
+        if node is None or node.resource_type != NodeType.Seed:
+            continue
+        relation = adapter.Relation.create_from(config, node)
+        relations.setdefault((lowercase(relation.database), relation.schema.lower()), relation)
+    if not relations:
+        return
+    with adapter.connection_named("master"):
+        for relation in relations.values():
+            adapter.execute_macro(
+                "create_seed_checksums_table",
+                kwargs={"relation": relation},
+                manifest=manifest,
+            )
+        adapter.commit_if_has_connection()
 
 
 class SeedRunner(ModelRunner):
+    compiles_ahead = False
+
     def describe_node(self):
         return "seed file {}".format(self.get_node_representation())
 
@@ -45,6 +86,65 @@ class SeedRunner(ModelRunner):
     def compile(self, manifest):
         return self.node
 
+    def seed_checksum(self, model) -> str:
+        """A digest of everything that decides what a seed loads: the file,
+        the config (which has the column types), and the dbt version and
+        adapter that infer the types of the other columns
+        """
+        if model.checksum.name == "sha256":
+            file_digest = model.checksum.checksum
+        else:
+            # big seeds are only checksummed by path when they're parsed
+            digest = hashlib.sha256()
+            path = os.path.join(model.root_path, model.original_file_path)
+            with open(path, "rb") as fp:
+                for block in iter(lambda: fp.read(1024 * 1024), b""):
+                    digest.update(block)
+            file_digest = digest.hexdigest()
+        data = {
+            "dbt_version": __version__,
+            "adapter_type": self.adapter.type(),
+            "file": file_digest,
+            "config": model.config.to_dict(omit_none=True),
+            "description": model.description,
+            "columns": {name: column.description for name, column in model.columns.items()},
+        }
+        encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def execute(self, model, manifest):
+        full_refresh = model.config.full_refresh
+        if full_refresh is None:
+            full_refresh = flags.FULL_REFRESH
+        if not flags.SKIP_UNCHANGED_SEEDS or full_refresh:
+            return super().execute(model, manifest)
+
+        relation = self.adapter.Relation.create_from(self.config, model)
+        checksum = self.seed_checksum(model)
+        loaded = self.adapter.execute_macro(
+            "get_seed_checksum", kwargs={"relation": relation}, manifest=manifest
+        )
+        if loaded == checksum:
+            return RunResult(
+                node=model,
+                status=RunStatus.Success,
+                timing=[],
+                thread_id=threading.current_thread().name,
+                execution_time=0,
+                message=UNCHANGED_SEED_MESSAGE,
+                adapter_response={},
+                failures=None,
+            )
+
+        result = super().execute(model, manifest)
+        self.adapter.execute_macro(
+            "set_seed_checksum",
+            kwargs={"relation": relation, "checksum": checksum},
+            manifest=manifest,
+        )
+        self.adapter.commit_if_has_connection()
+        return result
+
     def print_result_line(self, result):
         model = result.node
         if result.status == NodeStatus.Error:
@@ -81,6 +181,10 @@ class SeedTask(RunTask):
     def raise_on_first_error(self):
         return False
 
+    def before_run(self, adapter, selected_uids):
+        super().before_run(adapter, selected_uids)
+        create_seed_checksums_tables(adapter, self.config, self.manifest, selected_uids)
+
     def get_node_selector(self):
         if self.manifest is None or self.graph is None:
             raise InternalException("manifest and graph must be set to get perform node selection")
@@ -119,5 +223,6 @@ class SeedTask(RunTask):
 
     def show_tables(self, results):
         for result in results:
-            if result.status != RunStatus.Error:
+            # unchanged seeds weren't read
+            if result.status != RunStatus.Error and result.agate_table is not None:
                 self.show_table(result)
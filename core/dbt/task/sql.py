@@ -18,6 +18,8 @@ SQLResult = TypeVar("SQLResult", bound=RemoteCompileResultMixin)
 
 
 class GenericSqlRunner(CompileRunner, Generic[SQLResult]):
+    compiles_ahead = False
+
     def __init__(self, config, adapter, node, node_index, num_nodes):
         CompileRunner.__init__(self, config, adapter, node, node_index, num_nodes)
 
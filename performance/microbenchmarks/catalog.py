@@ -0,0 +1,116 @@
+"""Measure how long it takes to turn the catalog queries' results into
+catalog.json, and how much memory that takes.
+
+dbt docs generate used to merge the table each information schema's catalog
+query returned into one agate.Table, make a dict of each of its rows, build
+the catalog from those, and write catalog.json from one dict of the whole
+artifact. It now adds each information schema's table to the catalog as soon
+as it's read, and writes catalog.json one table at a time. This fakes the
+tables of a number of databases, made as they're read like the queries'
+results would be, and builds catalog.json both ways. tracemalloc measures
+the peak memory in a separate pass.
+
+    python performance/microbenchmarks/catalog.py --databases 4 --tables 2000 --columns 20
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+
+from dbt.adapters.base.impl import merge_tables
+from dbt.clients.agate_helper import table_from_rows
+from dbt.clients.system import write_json
+from dbt.contracts.results import CatalogArtifact
+from dbt.task.generate import Catalog
+import dbt.utils
+
+COLUMN_NAMES = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "table_owner",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+]
+
+
+def make_manifest(databases, tables):
+    nodes = {}
+    for d in range(databases):
+        for t in range(tables):
+            node = SimpleNamespace(database=f"db_{d}", schema="analytics", identifier=f"table_{t}")
+            nodes[f"model.bench.db_{d}_table_{t}"] = node
+    return SimpleNamespace(nodes=nodes, sources={})
+
+
+def catalog_tables(databases, tables, columns):
+    for d in range(databases):
+        rows = [
+            (f"db_{d}", "analytics", f"table_{t}", "BASE TABLE", None, "dbt")
+            + (f"column_{c}", c + 1, "integer", None)
+            for t in range(tables)
+            for c in range(columns)
+        ]
+        yield table_from_rows(
+            rows, COLUMN_NAMES, text_only_columns=["table_database", "table_schema", "table_name"]
+        )
+
+
+def merged(manifest, tables, path):
+    catalog_table = merge_tables(list(tables))
+    catalog_data = [
+        dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
+        for row in catalog_table
+    ]
+    nodes, sources = Catalog(catalog_data).make_unique_id_map(manifest)
+    artifact = CatalogArtifact.from_results(datetime.utcnow(), nodes, sources, None, None)
+    write_json(path, artifact.to_dict(omit_none=False))
+
+
+def streamed(manifest, tables, path):
+    catalog = Catalog([])
+    for table in tables:
+        catalog.add_table(table)
+    nodes, sources = catalog.make_unique_id_map(manifest)
+    artifact = CatalogArtifact.from_results(datetime.utcnow(), nodes, sources, None, None)
+    artifact.write(path)
+
+
+def measure(build, manifest, args, path):
+    start = time.perf_counter()
+    build(manifest, catalog_tables(args.databases, args.tables, args.columns), path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    build(manifest, catalog_tables(args.databases, args.tables, args.columns), path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--databases", type=int, default=4)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    manifest = make_manifest(args.databases, args.tables)
+    columns = args.databases * args.tables * args.columns
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "catalog.json")
+        print(f"{'catalog':>8} {'columns':>8} {'seconds':>8} {'peak MiB':>9}")
+        for name, build in (("merged", merged), ("streamed", streamed)):
+            elapsed, peak = measure(build, manifest, args, path)
+            print(f"{name:>8} {columns:>8} {elapsed:>8.2f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
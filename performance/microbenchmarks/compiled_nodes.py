@@ -0,0 +1,104 @@
+"""Measure how long it takes to turn parsed models into compiled ones.
+
+Compiler._compile_node used to build each compiled node with a round trip
+through to_dict and from_dict, which copies and validates the config,
+columns and depends_on of every node. It now uses CompiledNode.from_parsed.
+This times both ways over the same parsed models, and reports the memory
+each allocates, which tracemalloc measures in a separate pass.
+
+    python performance/microbenchmarks/compiled_nodes.py --models 10000 --columns 20
+"""
+import argparse
+import time
+import tracemalloc
+
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.contracts.graph.parsed import ColumnInfo, DependsOn, ParsedModelNode
+from dbt.contracts.graph.model_config import NodeConfig
+from dbt.node_types import NodeType
+
+
+def make_models(count, columns):
+    models = []
+    for i in range(count):
+        name = f"model_{i}"
+        models.append(
+            ParsedModelNode(
+                name=name,
+                database="dbt",
+                schema="analytics",
+                alias=name,
+                resource_type=NodeType.Model,
+                unique_id=f"model.bench.{name}",
+                fqn=["bench", "staging", name],
+                package_name="bench",
+                root_path="/usr/src/app",
+                path=f"staging/{name}.sql",
+                original_file_path=f"models/staging/{name}.sql",
+                language="sql",
+                raw_code=f"select * from {{{{ ref('model_{max(i - 1, 0)}') }}}}",
+                checksum=FileHash.from_contents(name),
+                config=NodeConfig.from_dict({"materialized": "view", "tags": ["nightly"]}),
+                tags=["nightly"],
+                refs=[[f"model_{max(i - 1, 0)}"]],
+                depends_on=DependsOn(nodes=[f"model.bench.model_{max(i - 1, 0)}"]),
+                columns={
+                    f"column_{c}": ColumnInfo(name=f"column_{c}", description="a column")
+                    for c in range(columns)
+                },
+                meta={"owner": "analytics"},
+            )
+        )
+    return models
+
+
+def round_trip(node):
+    data = node.to_dict(omit_none=True)
+    data.update(
+        {
+            "compiled": False,
+            "compiled_code": None,
+            "extra_ctes_injected": False,
+            "extra_ctes": [],
+        }
+    )
+    return CompiledModelNode.from_dict(data)
+
+
+def from_parsed(node):
+    return CompiledModelNode.from_parsed(node)
+
+
+def measure(convert, models):
+    start = time.perf_counter()
+    compiled = [convert(node) for node in models]
+    elapsed = time.perf_counter() - start
+    del compiled
+
+    tracemalloc.start()
+    compiled = [convert(node) for node in models]
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del compiled
+    return elapsed, allocated, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    models = make_models(args.models, args.columns)
+    print(f"{'method':>12} {'models':>7} {'seconds':>8} {'retained MiB':>13} {'peak MiB':>9}")
+    for name, convert in (("round trip", round_trip), ("from_parsed", from_parsed)):
+        elapsed, allocated, peak = measure(convert, models)
+        print(
+            f"{name:>12} {len(models):>7} {elapsed:>8.3f} "
+            f"{allocated / 2**20:>13.1f} {peak / 2**20:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure how many events per second dbt can log, with and without
+--async-logging.
+
+Every thread fires debug events as fast as it can, like node threads running
+with --debug. The log file goes to a temporary directory and stdout to
+/dev/null. "fire" is how fast the threads got through fire_event, and
+"written" includes waiting for the async writer to finish.
+
+    python performance/microbenchmarks/event_logging.py --threads 1 8 32 --events 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import dbt.flags as flags
+import dbt.events.functions as event_funcs
+from dbt.events.types import SQLQuery
+
+
+def fire_events(count):
+    for n in range(count):
+        event_funcs.fire_event(SQLQuery(conn_name="bench", sql=f"select {n} as id"))
+
+
+def measure(threads, events_per_thread, async_logging):
+    flags.ASYNC_LOGGING = async_logging
+    workers = [
+        threading.Thread(target=fire_events, args=(events_per_thread,), name=f"Thread-{i}")
+        for i in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    fired = time.perf_counter() - start
+    event_funcs.flush_events()
+    written = time.perf_counter() - start
+    return fired, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--events", type=int, default=20000, help="events per thread")
+    args = parser.parse_args()
+
+    flags.DEBUG = True
+    flags.USE_COLORS = False
+    flags.LOG_FORMAT = "text"
+    sys.stdout = open(os.devnull, "w")
+    with tempfile.TemporaryDirectory() as log_path:
+        event_funcs.setup_event_logger(log_path)
+        results = []
+        for threads in args.threads:
+            total = threads * args.events
+            for async_logging in (False, True):
+                fired, written = measure(threads, args.events, async_logging)
+                results.append((threads, async_logging, total / fired, total / written))
+        event_funcs.stop_event_writer()
+    sys.stdout = sys.__stdout__
+
+    print(f"{'threads':>7} {'mode':>6} {'fire events/s':>14} {'written events/s':>17}")
+    for threads, async_logging, fire_rate, write_rate in results:
+        mode = "async" if async_logging else "sync"
+        print(f"{threads:>7} {mode:>6} {fire_rate:>14,.0f} {write_rate:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
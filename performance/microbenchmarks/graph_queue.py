@@ -0,0 +1,85 @@
+"""Measure the scheduling overhead of GraphQueue.
+
+Builds a random DAG, then drains it the way GraphRunnableTask.run_queue
+does: the main thread takes nodes off the queue and submits them to a
+thread pool, and each finished node is marked done from the pool's
+callback. The nodes do no work, so the time is all scheduling.
+
+    python performance/microbenchmarks/graph_queue.py --nodes 10000 50000 --threads 4 64
+"""
+import argparse
+import random
+import time
+from multiprocessing.dummy import Pool as ThreadPool
+from types import SimpleNamespace
+
+from dbt.graph.compact import CompactGraph
+from dbt.graph.queue import GraphQueue
+from dbt.node_types import NodeType
+
+
+class FakeManifest:
+    def __init__(self, graph):
+        self.nodes = {
+            node: SimpleNamespace(unique_id=node, resource_type=NodeType.Model, is_ephemeral=False)
+            for node in graph
+        }
+
+    def expect(self, unique_id):
+        return self.nodes[unique_id]
+
+
+def make_graph(nodes, max_parents, seed):
+    rng = random.Random(seed)
+    edges = []
+    for i in range(1, nodes):
+        # mostly recent parents, like layers of staging and mart models
+        for _ in range(rng.randint(0, max_parents)):
+            parent = rng.randint(max(0, i - 500), i - 1)
+            edges.append((f"model.bench.m_{parent}", f"model.bench.m_{i}"))
+    return CompactGraph((f"model.bench.m_{i}" for i in range(nodes)), edges)
+
+
+def run_queue(queue, threads):
+    pool = ThreadPool(threads)
+    try:
+        while not queue.empty():
+            node = queue.get()
+            pool.apply_async(
+                lambda unique_id: unique_id,
+                args=(node.unique_id,),
+                callback=queue.mark_done,
+            )
+        queue.join()
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--max-parents", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'edges':>8} {'threads':>8} {'init s':>8} {'run s':>8} {'us/node':>8}")
+    for nodes in args.nodes:
+        graph = make_graph(nodes, args.max_parents, args.seed)
+        manifest = FakeManifest(graph)
+        for threads in args.threads:
+            start = time.perf_counter()
+            queue = GraphQueue(graph, manifest, set(graph))
+            init = time.perf_counter() - start
+            start = time.perf_counter()
+            run_queue(queue, threads)
+            run = time.perf_counter() - start
+            print(
+                f"{nodes:>8} {graph.number_of_edges():>8} {threads:>8} "
+                f"{init:>8.2f} {run:>8.2f} {run / nodes * 1e6:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
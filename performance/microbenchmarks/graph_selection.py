@@ -0,0 +1,125 @@
+"""Measure linking, selection and queue setup on a large dbt-shaped graph.
+
+Builds a random DAG of models, each with a couple of tests (some of them
+relationship tests with two parents), links it the way the Compiler does,
+then selects `tag:bench+` and builds the graph queue the way a task does.
+
+    python performance/microbenchmarks/graph_selection.py --models 20000 --tests-per-model 2
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from dbt import flags
+from dbt.compilation import Linker
+from dbt.contracts.project import UserConfig
+from dbt.graph import Graph, NodeSelector, parse_difference
+from dbt.node_types import NodeType
+
+
+class FakeManifest:
+    def __init__(self, parents, tagged):
+        self.nodes = {}
+        for unique_id, node_parents in parents.items():
+            resource_type = NodeType.Test if unique_id.startswith("test.") else NodeType.Model
+            self.nodes[unique_id] = SimpleNamespace(
+                unique_id=unique_id,
+                fqn=unique_id.split(".")[1:],
+                package_name="bench",
+                resource_type=resource_type,
+                tags=["bench"] if unique_id in tagged else [],
+                empty=False,
+                is_ephemeral=False,
+                config=SimpleNamespace(enabled=True),
+                depends_on=SimpleNamespace(nodes=node_parents),
+            )
+        self.sources = {}
+        self.exposures = {}
+        self.metrics = {}
+
+    def expect(self, unique_id):
+        return self.nodes[unique_id]
+
+
+def make_project(models, tests_per_model, max_parents, seed):
+    """Return the parents of every node, and the models tagged `bench`"""
+    rng = random.Random(seed)
+    parents = {}
+    for i in range(models):
+        unique_id = f"model.bench.m_{i}"
+        parents[unique_id] = [
+            f"model.bench.m_{rng.randint(max(0, i - 500), i - 1)}"
+            for _ in range(rng.randint(0, max_parents) if i else 0)
+        ]
+        for j in range(tests_per_model):
+            test_parents = [unique_id]
+            if i and j == 0:
+                # a relationship test
+                test_parents.append(f"model.bench.m_{rng.randint(0, i - 1)}")
+            parents[f"test.bench.t_{i}_{j}"] = test_parents
+    tagged = set(rng.sample(sorted(p for p in parents if p.startswith("model.")), models // 100))
+    return parents, tagged
+
+
+def link(parents):
+    linker = Linker()
+    for unique_id, node_parents in parents.items():
+        linker.add_node(unique_id)
+        for parent in node_parents:
+            linker.dependency(unique_id, parent)
+    return linker
+
+
+def graph_memory(parents):
+    """The memory held by the graph once the linker is gone, in bytes"""
+    tracemalloc.start()
+    linker = link(parents)
+    graph = Graph(linker.get_graph())
+    del linker
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del graph
+    return size
+
+
+def timed(results, name, func, *args):
+    start = time.perf_counter()
+    value = func(*args)
+    results[name] = time.perf_counter() - start
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--tests-per-model", type=int, default=2)
+    parser.add_argument("--max-parents", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    flags.set_from_args(argparse.Namespace(), UserConfig())
+
+    columns = ["link", "graph", "cycles", "selector", "queue"]
+    print(
+        f"{'nodes':>8} {'edges':>8} " + " ".join(f"{c + ' s':>9}" for c in columns) + " graph MB"
+    )
+    for models in args.models:
+        parents, tagged = make_project(models, args.tests_per_model, args.max_parents, args.seed)
+        manifest = FakeManifest(parents, tagged)
+        results = {}
+        linker = timed(results, "link", link, parents)
+        graph = timed(results, "graph", lambda: Graph(linker.get_graph()))
+        timed(results, "cycles", linker.find_cycles)
+        selector = timed(results, "selector", NodeSelector, graph, manifest)
+        spec = parse_difference(["tag:bench+"], None)
+        queue = timed(results, "queue", selector.get_graph_queue, spec)
+        print(
+            f"{len(graph.nodes()):>8} {sum(1 for _ in graph.edges()):>8} "
+            + " ".join(f"{results[c]:>9.3f}" for c in columns)
+            + f" {graph_memory(parents) / 2**20:>8.1f}  ({len(queue)} queued)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure how long it takes to turn the rows a query fetched into the table
+run_query returns, and read one column of it, and how much memory that takes.
+
+SQLConnectionManager.execute turns the rows into an agate.Table with
+table_from_data_flat, which makes a dict of each row, tests every value
+against every type and casts it. With run_query(sql, columnar=true) it keeps
+the cursor's rows in a ColumnarTable, which only infers the type of a column
+when it's read. This fakes a cursor's rows, builds both tables, and reads
+one column the way macros that build SQL from a query usually do.
+tracemalloc measures the peak memory in a separate pass.
+
+    python performance/microbenchmarks/query_results.py --rows 100000 --columns 8
+"""
+import argparse
+import datetime
+import time
+import tracemalloc
+from decimal import Decimal
+
+from dbt.adapters.sql.connections import SQLConnectionManager
+
+
+class FakeCursor:
+    def __init__(self, rows, columns):
+        self.description = [(f"column_{c}",) for c in range(columns)]
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+def make_rows(count, columns):
+    values = [
+        lambda i: i,
+        lambda i: f"name {i}",
+        lambda i: Decimal(i) / 100,
+        lambda i: datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=i),
+        lambda i: i % 2 == 0,
+    ]
+    return [tuple(values[c % len(values)](i) for c in range(columns)) for i in range(count)]
+
+
+def agate_table(cursor):
+    table = SQLConnectionManager.get_result_from_cursor(cursor)
+    return table.columns["column_1"].values()
+
+
+def columnar_table(cursor):
+    table = SQLConnectionManager.get_columnar_result_from_cursor(cursor)
+    return table.columns["column_1"].values()
+
+
+def measure(load, cursor):
+    start = time.perf_counter()
+    load(cursor)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    load(cursor)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=8)
+    args = parser.parse_args()
+
+    cursor = FakeCursor(make_rows(args.rows, args.columns), args.columns)
+    print(f"{'table':>9} {'rows':>8} {'seconds':>8} {'peak MiB':>9}")
+    for name, load in (("agate", agate_table), ("columnar", columnar_table)):
+        elapsed, peak = measure(load, cursor)
+        print(f"{name:>9} {args.rows:>8} {elapsed:>8.2f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
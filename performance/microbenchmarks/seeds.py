@@ -0,0 +1,76 @@
+"""Measure how long it takes to read a seed's CSV file and turn it into the
+data a bulk load sends, and how much memory that takes.
+
+load_agate_table used to read the whole file into an agate.Table. It now
+returns a StreamingCsvTable, which infers the column types in one pass over
+the file and then reads and casts the rows a chunk at a time as they're
+loaded. This writes a CSV file, reads it both ways, and formats the rows the
+way Postgres' COPY ... FROM STDIN reads them. tracemalloc measures the peak
+memory in a separate pass.
+
+    python performance/microbenchmarks/seeds.py --rows 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from dbt.adapters.postgres.connections import CopyData
+from dbt.clients import agate_helper
+
+
+def write_csv(path, rows):
+    with open(path, "w") as fp:
+        fp.write("id,amount,flag,day,created_at,name\n")
+        for i in range(rows):
+            fp.write(
+                f"{i},{random.randint(0, 10000) / 100},{random.choice(['true', 'false'])},"
+                f"2022-01-{i % 28 + 1:02d},2022-01-01 10:00:{i % 60:02d},name {i}\n"
+            )
+
+
+def agate_table(path):
+    table = agate_helper.from_csv(path, ())
+    return CopyData(agate_helper.iter_row_chunks(table, agate_helper.CSV_CHUNK_SIZE))
+
+
+def streaming_table(path):
+    table = agate_helper.StreamingCsvTable(path, ())
+    return CopyData(agate_helper.iter_row_chunks(table, agate_helper.CSV_CHUNK_SIZE))
+
+
+def drain(data):
+    while data.read(1024 * 1024):
+        pass
+
+
+def measure(load, path):
+    start = time.perf_counter()
+    drain(load(path))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    drain(load(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "seed.csv")
+        write_csv(path, args.rows)
+        print(f"{'table':>10} {'rows':>8} {'seconds':>8} {'peak MiB':>9}")
+        for name, load in (("agate", agate_table), ("streaming", streaming_table)):
+            elapsed, peak = measure(load, path)
+            print(f"{name:>10} {args.rows:>8} {elapsed:>8.2f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
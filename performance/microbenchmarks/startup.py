@@ -0,0 +1,91 @@
+"""Measure how long dbt commands take with a cold and a warm Jinja bytecode
+cache.
+
+Every macro dbt calls, from the global project, the adapter plugins and
+installed packages, is compiled from Jinja to Python code the first time it
+is called in a process. The compiled code is kept in target/jinja_bytecode
+and read back by later processes. This runs each command against a copy of
+the project with the cache emptied before every run ("cold"), with the
+cache left from the previous run ("warm"), and with --no-cache-jinja-bytecode
+("off"). Partial parsing is off by default, so every run renders the whole
+project. Commands like compile need the database in the profile to be
+reachable.
+
+    python performance/microbenchmarks/startup.py --commands ls compile --runs 3
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PERFORMANCE_DIR = os.path.dirname(HERE)
+BYTECODE_DIR = os.path.join("target", "jinja_bytecode")
+
+
+def run_dbt(dbt, command, profiles_dir, extra_args):
+    args = [dbt, *extra_args, command, "--profiles-dir", profiles_dir]
+    start = time.perf_counter()
+    result = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start, result.returncode
+
+
+def measure(dbt, command, profiles_dir, extra_args, mode, runs):
+    if mode == "off":
+        extra_args = [*extra_args, "--no-cache-jinja-bytecode"]
+    else:
+        # fill the cache for the warm runs
+        run_dbt(dbt, command, profiles_dir, extra_args)
+    timings, failures = [], 0
+    for _ in range(runs):
+        if mode == "cold":
+            shutil.rmtree(BYTECODE_DIR, ignore_errors=True)
+        elapsed, returncode = run_dbt(dbt, command, profiles_dir, extra_args)
+        timings.append(elapsed)
+        failures += returncode != 0
+    return timings, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--project-dir",
+        default=os.path.join(PERFORMANCE_DIR, "projects", "01_2000_simple_models"),
+    )
+    parser.add_argument("--profiles-dir", default=os.path.join(PERFORMANCE_DIR, "project_config"))
+    parser.add_argument("--commands", nargs="+", default=["ls", "compile"])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--dbt", default="dbt", help="the dbt executable")
+    parser.add_argument("--partial-parse", action="store_true", help="leave partial parsing on")
+    args = parser.parse_args()
+
+    extra_args = [] if args.partial_parse else ["--no-partial-parse"]
+    profiles_dir = os.path.abspath(args.profiles_dir)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        project_dir = os.path.join(workdir, "project")
+        shutil.copytree(
+            args.project_dir, project_dir, ignore=shutil.ignore_patterns("target", "logs")
+        )
+        cwd = os.getcwd()
+        os.chdir(project_dir)
+        try:
+            for command in args.commands:
+                for mode in ("off", "cold", "warm"):
+                    timings, failures = measure(
+                        args.dbt, command, profiles_dir, extra_args, mode, args.runs
+                    )
+                    results.append((command, mode, timings, failures))
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'command':>8} {'cache':>6} {'min s':>7} {'mean s':>7} {'failed':>7}")
+    for command, mode, timings, failures in results:
+        mean = sum(timings) / len(timings)
+        print(f"{command:>8} {mode:>6} {min(timings):>7.2f} {mean:>7.2f} {failures:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure Graph.get_subset_graph on graphs with high-degree hub nodes.
+
+Each hub is an unselected node with many selected parents and many
+unselected children, like a staging model between a wide layer of sources
+and a wide layer of marts. Below every child is a short chain of unselected
+models that ends in a selected test. The subset graph has an edge from every
+parent of a hub to every test below it, and finding them should cost about
+that many edges, not parents times descendants.
+
+    python performance/microbenchmarks/subset_graph.py --hubs 1 10 --degree 100 300
+"""
+import argparse
+import time
+
+import networkx as nx  # type: ignore
+
+from dbt.graph import Graph
+
+
+def make_graph(hubs, degree, depth):
+    """Return the graph, and the selected nodes"""
+    graph = nx.DiGraph()
+    selected = set()
+    for hub in range(hubs):
+        hub_id = f"model.bench.hub_{hub}"
+        graph.add_node(hub_id)
+        for i in range(degree):
+            source_id = f"source.bench.src_{hub}_{i}"
+            graph.add_edge(source_id, hub_id)
+            selected.add(source_id)
+        for i in range(degree):
+            parent_id = hub_id
+            for level in range(depth):
+                model_id = f"model.bench.m_{hub}_{i}_{level}"
+                graph.add_edge(parent_id, model_id)
+                parent_id = model_id
+            test_id = f"test.bench.t_{hub}_{i}"
+            graph.add_edge(parent_id, test_id)
+            selected.add(test_id)
+    return graph, selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hubs", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--degree", type=int, nargs="+", default=[100, 300])
+    parser.add_argument("--depth", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'hubs':>6} {'degree':>6} {'nodes':>8} {'selected':>8} {'edges out':>9} {'subset s':>9}"
+    )
+    for hubs in args.hubs:
+        for degree in args.degree:
+            nx_graph, selected = make_graph(hubs, degree, args.depth)
+            graph = Graph(nx_graph)
+            start = time.perf_counter()
+            subset = graph.get_subset_graph(selected)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{hubs:>6} {degree:>6} {len(nx_graph):>8} {len(selected):>8} "
+                f"{sum(1 for _ in subset.edges()):>9} {elapsed:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,18 @@ use std::{cmp, fs};
 
 // TODO these should not be defined here anymore. they need to be split at the github action level.
 // To add a new metric to the test suite, simply define it in this list
-static METRICS: [HyperfineCmd; 1] = [HyperfineCmd {
-    name: "parse",
-    prepare: "dbt clean",
-    cmd: "dbt parse --no-version-check",
-}];
+static METRICS: [HyperfineCmd; 2] = [
+    HyperfineCmd {
+        name: "parse",
+        prepare: "dbt clean",
+        cmd: "dbt parse --no-version-check",
+    },
+    HyperfineCmd {
+        name: "parse_4_workers",
+        prepare: "dbt clean",
+        cmd: "dbt --parse-workers 4 parse --no-version-check",
+    },
+];
 
 pub fn from_json_files<T: DeserializeOwned>(
     dir: &dyn AsRef<Path>,
@@ -1,20 +1,30 @@
+import time
 from contextlib import contextmanager
+from decimal import Decimal
 
 import psycopg2
 
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.events import AdapterLogger
+from dbt.events.functions import fire_event
+from dbt.events.types import ConnectionUsed, SQLQuery, SQLQueryStatus
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
 
 
 logger = AdapterLogger("Postgres")
 
+# how much of the data COPY ... FROM STDIN sends to the server at a time
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# the characters the text format of COPY needs escaped
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
 
 @dataclass
 class PostgresCredentials(Credentials):
@@ -56,9 +66,70 @@ class PostgresCredentials(Credentials):
         )
 
 
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, Decimal):
+        # integer columns don't accept exponents, like in 1E+3
+        return format(value, "f")
+    return str(value).translate(COPY_ESCAPES)
+
+
+class CopyData:
+    """The rows to send to COPY ... FROM STDIN, in its text format, as a
+    file that's only written as it's read
+    """
+
+    def __init__(self, chunks: Iterable[Sequence[Sequence[Any]]]) -> None:
+        self._lines: Iterator[str] = (
+            "\t".join(map(_copy_value, row)) + "\n" for chunk in chunks for row in chunk
+        )
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            parts.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = "".join(parts)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
 
+    def copy_from(
+        self, sql: str, chunks: Iterable[Sequence[Sequence[Any]]]
+    ) -> Tuple[Connection, Any]:
+        """Run a COPY ... FROM STDIN statement that reads the text format,
+        sending it the rows in chunks as it reads them
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+
+        with self.exception_handler(sql):
+            fire_event(SQLQuery(conn_name=connection.name, sql=sql))
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, CopyData(chunks), size=COPY_BUFFER_SIZE)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(self.get_response(cursor)), elapsed=round((time.time() - pre), 2)
+                )
+            )
+            return connection, cursor
+
     @contextmanager
     def exception_handler(self, sql):
         try:
@@ -7,6 +7,7 @@ from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres import PostgresColumn
 from dbt.adapters.postgres import PostgresRelation
+from dbt.clients import agate_helper
 from dbt.dataclass_schema import dbtClassMixin, ValidationError
 import dbt.exceptions
 import dbt.utils
@@ -59,6 +60,7 @@ class PostgresConfig(AdapterConfig):
 class PostgresAdapter(SQLAdapter):
     Relation = PostgresRelation
     ConnectionManager = PostgresConnectionManager
+    connections: PostgresConnectionManager
     Column = PostgresColumn
 
     AdapterSpecificConfigs = PostgresConfig
@@ -67,6 +69,14 @@ class PostgresAdapter(SQLAdapter):
     def date_function(cls):
         return "now()"
 
+    @classmethod
+    def supports_bulk_list_relations(cls) -> bool:
+        return True
+
+    @classmethod
+    def supports_incremental_catalog(cls) -> bool:
+        return True
+
     @available
     def verify_database(self, database):
         if database.startswith('"'):
@@ -85,6 +95,19 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @classmethod
+    def supports_bulk_load(cls) -> bool:
+        # Adapters built on this one, like redshift, don't necessarily
+        # support copy from stdin, so they have to opt in themselves
+        return cls.type() == "postgres"
+
+    @available
+    def bulk_load(self, relation: PostgresRelation, agate_table: Any, column_names: str) -> str:
+        sql = f"copy {relation.render()} ({column_names}) from stdin"
+        chunks = agate_helper.iter_row_chunks(agate_table, agate_helper.CSV_CHUNK_SIZE)
+        self.connections.copy_from(sql, chunks)
+        return sql
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
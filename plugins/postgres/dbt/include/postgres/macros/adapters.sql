@@ -90,6 +90,37 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__list_relations_in_schemas(information_schema, schemas) %}
+  {% set database = information_schema.database %}
+  {{ adapter.verify_database(database) }}
+  {% call statement('list_relations_in_schemas', fetch_result=True) -%}
+    select
+      '{{ database }}' as database,
+      tablename as name,
+      schemaname as schema,
+      'table' as type
+    from pg_tables
+    where lower(schemaname) in (
+      {%- for schema in schemas -%}
+        '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+      {%- endfor -%}
+    )
+    union all
+    select
+      '{{ database }}' as database,
+      viewname as name,
+      schemaname as schema,
+      'view' as type
+    from pg_views
+    where lower(schemaname) in (
+      {%- for schema in schemas -%}
+        '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+      {%- endfor -%}
+    )
+  {% endcall %}
+  {{ return(load_result('list_relations_in_schemas').table) }}
+{% endmacro %}
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
@@ -51,3 +51,57 @@
   {{ return(load_result('catalog').table) }}
 
 {%- endmacro %}
+
+
+{% macro postgres__get_catalog_versions(information_schema, schemas) -%}
+
+  {%- call statement('catalog_versions', fetch_result=True) -%}
+    {% set database = information_schema.database %}
+    {{ adapter.verify_database(database) }}
+
+    {#
+      One row per relation, with a digest of everything postgres__get_catalog
+      returns for it. Relations that are rebuilt get a new oid.
+    #}
+    select
+        '{{ database }}' as table_database,
+        sch.nspname as table_schema,
+        tbl.relname as table_name,
+        md5(concat_ws('|',
+            tbl.oid,
+            tbl.relkind,
+            quote_nullable(pg_get_userbyid(tbl.relowner)),
+            quote_nullable(tbl_desc.description),
+            (
+                select string_agg(concat_ws(':',
+                    col.attnum,
+                    quote_ident(col.attname),
+                    quote_nullable(pg_catalog.format_type(col.atttypid, col.atttypmod)),
+                    quote_nullable(col_desc.description)
+                ), '|' order by col.attnum)
+                from pg_catalog.pg_attribute col
+                left outer join pg_catalog.pg_description col_desc on (col_desc.objoid = tbl.oid and col_desc.objsubid = col.attnum)
+                where col.attrelid = tbl.oid
+                  and col.attnum > 0
+                  and not col.attisdropped
+            )
+        )) as relation_version
+
+    from pg_catalog.pg_namespace sch
+    join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
+    left outer join pg_catalog.pg_description tbl_desc on (tbl_desc.objoid = tbl.oid and tbl_desc.objsubid = 0)
+
+    where (
+        {%- for schema in schemas -%}
+          upper(sch.nspname) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+        {%- endfor -%}
+      )
+      and not pg_is_other_temp_schema(sch.oid)
+      and tbl.relpersistence in ('p', 'u')
+      and tbl.relkind in ('r', 'v', 'f', 'p')
+
+  {%- endcall -%}
+
+  {{ return(load_result('catalog_versions').table) }}
+
+{%- endmacro %}
@@ -71,6 +71,44 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def test_streaming_csv(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        tbl = agate_helper.StreamingCsvTable(path, ())
+        expected = agate_helper.from_csv(path, ())
+        self.assertEqual(tbl.column_names, expected.column_names)
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertEqual(len(tbl.rows), len(EXPECTED))
+        self.assertEqual([list(row) for row in tbl.rows], EXPECTED)
+        self.assertEqual(
+            list(agate_helper.iter_row_chunks(tbl, 1)), [[tuple(row)] for row in EXPECTED]
+        )
+        self.assertEqual(tbl.aggregate(agate.MaxPrecision('d')), 1)
+        self.assertEqual([list(row) for row in agate_helper.as_matrix(tbl)], EXPECTED)
+        # nothing has read the whole file yet
+        self.assertIsNone(tbl._table)
+        self.assertEqual(tbl.aggregate(agate.Max('a')), 2)
+        self.assertIsNotNone(tbl._table)
+
+    def test_streaming_csv_text_columns(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        tbl = agate_helper.StreamingCsvTable(path, ['a', 'd'])
+        self.assertIsInstance(tbl.column_types[0], agate.data_types.Text)
+        self.assertIsInstance(tbl.column_types[3], agate.data_types.Text)
+        self.assertEqual([row[0] for row in tbl.rows], ['1', '2'])
+
+    def test_streaming_csv_long_row(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(b'a,b\n1,2\n3,4,5\n')
+        with self.assertRaises(ValueError):
+            agate_helper.StreamingCsvTable(path, ())
+
     def test_from_data(self):
         column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
         data = [
@@ -179,3 +217,28 @@ class TestAgateHelper(unittest.TestCase):
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
 
+
+    def test_columnar_table(self):
+        column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+        rows = [
+            ('0005', 10, 1.5, True, {'x': 1}, datetime(2022, 1, 1, 10), None),
+            ('0006', 11, None, False, [1, 2], datetime(2022, 1, 2), None),
+        ]
+        tbl = agate_helper.ColumnarTable(rows, column_names)
+        expected = agate_helper.table_from_data_flat(
+            data=[dict(zip(column_names, row)) for row in rows], column_names=column_names
+        )
+        self.assertIsInstance(tbl, agate.Table)
+        self.assertEqual(len(tbl), 2)
+
+        # reading one column only infers that column's type
+        self.assertEqual(tbl.columns['b'].values(), (Decimal(10), Decimal(11)))
+        self.assertIsInstance(tbl.columns['b'].data_type, agate.data_types.Number)
+        self.assertEqual(tbl._types.count(None), len(column_names) - 1)
+        self.assertEqual(list(agate_helper.as_matrix(tbl)[0])[:2], ['0005', Decimal(10)])
+
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertEqual([list(row) for row in tbl], [list(row) for row in expected])
+        self.assertEqual(tbl.order_by('b', reverse=True).rows[0]['a'], '0006')
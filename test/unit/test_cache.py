@@ -48,6 +48,20 @@ class TestEmpty(TestCache):
         self.assertEqual(len(self.cache.relations), 0)
         self.assertEqual(len(self.cache.get_relations('dbt', 'test')), 0)
 
+class TestAddMany(TestCache):
+    def test_add_many(self):
+        self.cache.add(make_relation('dbt', 'foo', 'bar'))
+        self.cache.add_many([
+            make_relation('dbt', 'foo', 'bar'),
+            make_relation('dbt', 'foo', 'baz'),
+            make_relation('DBT', 'FOO_2', 'bar'),
+        ])
+        self.assertEqual(len(self.cache.relations), 3)
+        self.assert_relations_exist('dbt', 'foo', 'bar', 'baz')
+        self.assert_relations_exist('DBT', 'FOO_2', 'bar')
+        self.assertIn(('dbt', 'foo_2'), self.cache)
+
+
 class TestDrop(TestCache):
     def setUp(self):
         super().setUp()
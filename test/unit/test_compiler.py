@@ -1,13 +1,22 @@
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
 import dbt.flags
 import dbt.compilation
 from dbt.adapters.postgres import Plugin
+from dbt.compiled_sql_cache import (
+    CompiledSqlCache, COMPILED_SQL_CACHE_FILE_NAME, set_compiled_sql_cache
+)
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.parsed import NodeConfig, DependsOn, ParsedModelNode
+from dbt.contracts.graph.parsed import (
+    NodeConfig, DependsOn, MacroDependsOn, ParsedMacro, ParsedModelNode
+)
 from dbt.contracts.graph.compiled import CompiledModelNode, InjectedCTE
+from dbt.exceptions import CompilationException
 from dbt.node_types import NodeType
 
 from datetime import datetime
@@ -584,3 +593,209 @@ class CompilerTest(unittest.TestCase):
             'select * from __dbt__cte__inner_ephemeral')
         )
 
+    def _model(self, name):
+        return ParsedModelNode(
+            name=name,
+            database='dbt',
+            schema='analytics',
+            alias=name,
+            resource_type=NodeType.Model,
+            unique_id=f'model.root.{name}',
+            fqn=['root', name],
+            package_name='root',
+            root_path='/usr/src/app',
+            config=self.model_config,
+            path=f'{name}.sql',
+            original_file_path=f'{name}.sql',
+            language='sql',
+            raw_code='select 1 as id',
+            checksum=FileHash.from_contents(''),
+        )
+
+    def test__compile_ahead(self):
+        first, second = self._model('first'), self._model('second')
+        done = threading.Event()
+
+        def compile_node(node, manifest, extra_context):
+            if node.name == 'second':
+                done.set()
+            return node.name
+
+        compiler = dbt.compilation.Compiler(self.config)
+        with patch.object(compiler, 'compile_node', side_effect=compile_node):
+            ahead_of_time = dbt.compilation.AheadOfTimeCompiler(compiler, MagicMock())
+            ahead_of_time.submit([first, second])
+            done.wait(10)
+            self.assertEqual(ahead_of_time.take('model.root.second'), 'second')
+            self.assertEqual(ahead_of_time.take('model.root.first'), 'first')
+            # each node is only handed out once
+            self.assertIsNone(ahead_of_time.take('model.root.first'))
+            ahead_of_time.shutdown()
+
+    def test__compile_ahead_take_back(self):
+        first, second = self._model('first'), self._model('second')
+        started, release = threading.Event(), threading.Event()
+
+        def compile_node(node, manifest, extra_context):
+            started.set()
+            release.wait(10)
+            if node.name == 'first':
+                raise CompilationException('bad jinja', node)
+            return node.name
+
+        compiler = dbt.compilation.Compiler(self.config)
+        with patch.object(compiler, 'compile_node', side_effect=compile_node) as mock_compile:
+            ahead_of_time = dbt.compilation.AheadOfTimeCompiler(compiler, MagicMock())
+            ahead_of_time.submit([first, second])
+            started.wait(10)
+            # the first node is being compiled, so the caller compiles the second
+            self.assertIsNone(ahead_of_time.take('model.root.second'))
+            release.set()
+            with self.assertRaises(CompilationException):
+                ahead_of_time.take('model.root.first')
+            ahead_of_time.shutdown()
+            self.assertEqual(mock_compile.call_count, 1)
+
+    def test__compile_ahead_introspected(self):
+        first, second = self._model('first'), self._model('second')
+        ephemeral = self._model('ephemeral')
+        ephemeral.config = self.model_config.replace(materialized='ephemeral')
+        second.depends_on.nodes.append(ephemeral.unique_id)
+        manifest = self._cache_manifest(first, second, ephemeral)
+        compiler = dbt.compilation.Compiler(self.config)
+        started = threading.Event()
+
+        def compile_node(node, manifest, extra_context):
+            compiler.introspected = True
+            if node.name == 'first':
+                # like run_query against a parent that doesn't exist yet
+                raise CompilationException('relation does not exist', node)
+            started.set()
+            manifest.update_node(MagicMock(unique_id=ephemeral.unique_id))
+            return node.name
+
+        with patch.object(compiler, 'compile_node', side_effect=compile_node) as mock_compile:
+            ahead_of_time = dbt.compilation.AheadOfTimeCompiler(compiler, manifest)
+            ahead_of_time.submit([first, second])
+            started.wait(10)
+            # both used the database, so the callers compile them again
+            self.assertIsNone(ahead_of_time.take('model.root.first'))
+            self.assertIsNone(ahead_of_time.take('model.root.second'))
+            ahead_of_time.shutdown()
+            self.assertEqual(mock_compile.call_count, 2)
+        # and the ephemeral compiled along with the second node is put back
+        self.assertIs(manifest.nodes[ephemeral.unique_id], ephemeral)
+
+    def _cache_manifest(self, *nodes):
+        return Manifest(
+            macros={},
+            nodes={node.unique_id: node for node in nodes},
+            sources={},
+            docs={},
+            disabled=[],
+            files={},
+            exposures={},
+            metrics={},
+            selectors={},
+        )
+
+    def _compile_with_cache(self, cache, node, manifest, introspected=False):
+        adapter = MagicMock(introspected=introspected)
+        self.mock_generate_runtime_model_context.side_effect = lambda model, config, manifest: {
+            'adapter': adapter
+        }
+        set_compiled_sql_cache(cache)
+        try:
+            compiler = dbt.compilation.Compiler(self.config)
+            return compiler.compile_node(node, manifest, write=False)
+        finally:
+            set_compiled_sql_cache(None)
+
+    def test__compiled_sql_cache(self):
+        model = self._model('model')
+        manifest = self._cache_manifest(model)
+        cache = CompiledSqlCache('/tmp/does-not-exist', manifest, self.config)
+
+        result = self._compile_with_cache(cache, model, manifest)
+        self.assertEqual(result.compiled_code, 'select 1 as id')
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        self.mock_generate_runtime_model_context.reset_mock()
+        result = self._compile_with_cache(cache, self._model('model'), manifest)
+        self.assertEqual(result.compiled_code, 'select 1 as id')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.mock_generate_runtime_model_context.assert_not_called()
+
+        changed = self._model('model')
+        changed.raw_code = 'select 2 as id'
+        manifest = self._cache_manifest(changed)
+        result = self._compile_with_cache(cache, changed, manifest)
+        self.assertEqual(result.compiled_code, 'select 2 as id')
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test__compiled_sql_cache_fingerprint(self):
+        upstream, model = self._model('upstream'), self._model('model')
+        model.depends_on = DependsOn(nodes=['model.root.upstream'])
+        manifest = self._cache_manifest(upstream, model)
+        fingerprint = CompiledSqlCache('', manifest, self.config).fingerprint(model)
+
+        # unrendered fields don't matter, where the upstream model is built does
+        model.created_at = 0
+        self.assertEqual(CompiledSqlCache('', manifest, self.config).fingerprint(model), fingerprint)
+        upstream.alias = 'renamed'
+        self.assertNotEqual(CompiledSqlCache('', manifest, self.config).fingerprint(model), fingerprint)
+
+        model.raw_code = 'select * from {{ ref("upstream") }} where day = {{ run_started_at }}'
+        self.assertIsNone(CompiledSqlCache('', manifest, self.config).fingerprint(model))
+
+    def test__compiled_sql_cache_volatile_macro(self):
+        model = self._model('model')
+        model.depends_on = DependsOn(macros=['macro.root.outer'])
+        manifest = self._cache_manifest(model)
+        for name, sql, macros in (
+            ('outer', '{% macro outer() %}{{ inner() }}{% endmacro %}', ['macro.root.inner']),
+            ('inner', '{% macro inner() %}{{ env_var("DAY") }}{% endmacro %}', []),
+        ):
+            manifest.macros[f'macro.root.{name}'] = ParsedMacro(
+                name=name,
+                resource_type=NodeType.Macro,
+                unique_id=f'macro.root.{name}',
+                package_name='root',
+                root_path='/usr/src/app',
+                path=f'{name}.sql',
+                original_file_path=f'{name}.sql',
+                macro_sql=sql,
+                depends_on=MacroDependsOn(macros=macros),
+            )
+        self.assertIsNone(CompiledSqlCache('', manifest, self.config).fingerprint(model))
+
+    def test__compiled_sql_cache_introspection(self):
+        model = self._model('model')
+        manifest = self._cache_manifest(model)
+        cache = CompiledSqlCache('', manifest, self.config)
+        self._compile_with_cache(cache, model, manifest, introspected=True)
+        self.assertEqual((cache.hits, cache.misses, cache.uncacheable), (0, 0, 1))
+        self._compile_with_cache(cache, self._model('model'), manifest, introspected=True)
+        self.assertEqual((cache.hits, cache.misses, cache.uncacheable), (0, 0, 2))
+
+    def test__compiled_sql_cache_save_load(self):
+        model, removed = self._model('model'), self._model('removed')
+        manifest = self._cache_manifest(model, removed)
+        with tempfile.TemporaryDirectory() as target_path:
+            self.config.target_path = target_path
+            cache = CompiledSqlCache.load(manifest, self.config)
+            self._compile_with_cache(cache, model, manifest)
+            self._compile_with_cache(cache, removed, manifest)
+            del manifest.nodes['model.root.removed']
+            cache.save()
+
+            loaded = CompiledSqlCache.load(manifest, self.config)
+            self.assertEqual(list(loaded._entries), ['model.root.model'])
+            entry = loaded.get('model.root.model', loaded.fingerprint(model))
+            self.assertEqual(entry.compiled_code, 'select 1 as id')
+            self.assertEqual(entry.cte_ids, [])
+
+            # a cache that can't be read is started over
+            with open(os.path.join(target_path, COMPILED_SQL_CACHE_FILE_NAME), 'wb') as fp:
+                fp.write(b'not msgpack')
+            self.assertEqual(CompiledSqlCache.load(manifest, self.config)._entries, {})
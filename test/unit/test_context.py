@@ -9,7 +9,7 @@ import pytest
 from dbt.adapters import postgres
 from dbt.adapters import factory
 from dbt.adapters.base import AdapterConfig
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroStack, get_rendered
 from dbt.contracts.graph.parsed import (
     ParsedModelNode,
     NodeConfig,
@@ -132,6 +132,22 @@ class TestParseWrapper(unittest.TestCase):
         self.responder.get_relation.assert_not_called()
 
 
+class TestParseTargetDict(unittest.TestCase):
+    def setUp(self):
+        self.read = []
+        self.target = target.ParseTargetDict({"name": "dev", "threads": 4}, self.read.append)
+
+    def test_records_fields(self):
+        self.assertEqual(get_rendered("{{ target.name }}", {"target": self.target}), "dev")
+        self.assertEqual(self.target.get("threads"), 4)
+        self.assertFalse("schema" in self.target)
+        self.assertEqual(self.read, ["name", "threads", "schema"])
+
+    def test_records_whole_dict(self):
+        self.assertEqual(dict(self.target), {"name": "dev", "threads": 4})
+        self.assertIn("*", self.read)
+
+
 class TestRuntimeWrapper(unittest.TestCase):
     def setUp(self):
         self.mock_config = mock.MagicMock()
@@ -1,12 +1,14 @@
 import pickle
 import pytest
+from dataclasses import fields
 
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.compiled import (
-    CompiledModelNode, InjectedCTE, CompiledGenericTestNode
+    CompiledModelNode, InjectedCTE, CompiledGenericTestNode, COMPILED_TYPES
 )
 from dbt.contracts.graph.parsed import (
-    DependsOn, NodeConfig, TestConfig, TestMetadata, ColumnInfo
+    DependsOn, NodeConfig, TestConfig, TestMetadata, ColumnInfo, ParsedModelNode,
+    ParsedGenericTestNode
 )
 from dbt.node_types import NodeType
 
@@ -616,3 +618,38 @@ def test_compare_to_compiled(basic_uncompiled_schema_test_node, basic_compiled_s
     fixed_compiled = compiled.replace(
         config=fixed_config, unrendered_config=uncompiled.unrendered_config)
     assert uncompiled.same_contents(fixed_compiled)
+
+
+def _uncompiled(dct):
+    dct = dict(dct)
+    for key in ('compiled', 'extra_ctes', 'extra_ctes_injected'):
+        dct.pop(key, None)
+    return dct
+
+
+def test_compiled_types_have_parsed_fields():
+    for parsed_type, compiled_type in COMPILED_TYPES.items():
+        parsed_fields = {f.name for f in fields(parsed_type)}
+        compiled_fields = {f.name for f in fields(compiled_type)}
+        assert parsed_fields <= compiled_fields, compiled_type
+
+
+@pytest.mark.parametrize('parsed_type,compiled_type,fixture', [
+    (ParsedModelNode, CompiledModelNode, 'basic_uncompiled_dict'),
+    (ParsedGenericTestNode, CompiledGenericTestNode, 'basic_uncompiled_schema_test_dict'),
+])
+def test_compiled_from_parsed(parsed_type, compiled_type, fixture, request):
+    dct = request.getfixturevalue(fixture)
+    parsed = parsed_type.from_dict(_uncompiled(dct))
+    parsed._event_status['node_status'] = 'compiling'
+
+    compiled = compiled_type.from_parsed(parsed)
+    assert type(compiled) is compiled_type
+    # the same as rebuilding the node from its dict
+    assert compiled == compiled_type.from_dict(
+        {**parsed.to_dict(omit_none=True), 'compiled': False, 'extra_ctes': []}
+    )
+    assert compiled._event_status == {}
+    assert compiled._pre_injected_sql is None
+    compiled.extra_ctes.append(InjectedCTE(id='model.test.other', sql='select 1'))
+    assert not hasattr(parsed, 'extra_ctes')
@@ -0,0 +1,138 @@
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from argparse import Namespace
+from unittest import mock
+
+from dbt.clients.daemon import (
+    EXIT_FRAME,
+    OUTPUT_FRAME,
+    encode_request,
+    read_frames,
+    read_request,
+    send_exit_code,
+    send_frame,
+    send_request,
+)
+from dbt.task.daemon import _changed_paths, run_daemon_command, scan_project_files
+
+
+class TestDaemonProtocol(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def test_request(self):
+        self.client.sendall(encode_request(['run', '-s', 'my_model'], '/project', {'A': 'b'}))
+        self.assertEqual(
+            read_request(self.server),
+            {'args': ['run', '-s', 'my_model'], 'cwd': '/project', 'env': {'A': 'b'}},
+        )
+
+    def test_response(self):
+        send_frame(self.server, OUTPUT_FRAME, b'some output\n')
+        send_frame(self.server, OUTPUT_FRAME, b'')
+        send_exit_code(self.server, 1)
+        self.server.close()
+        self.assertEqual(
+            list(read_frames(self.client)),
+            [(OUTPUT_FRAME, b'some output\n'), (OUTPUT_FRAME, b''), (EXIT_FRAME, b'1')],
+        )
+
+    def test_send_request(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, 'dbt.sock')
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+                server.bind(socket_path)
+                server.listen()
+                output = io.BytesIO()
+                results = []
+                client = threading.Thread(
+                    target=lambda: results.append(send_request(socket_path, ['ls'], output))
+                )
+                client.start()
+                conn, _ = server.accept()
+                with conn:
+                    self.assertEqual(read_request(conn)['args'], ['ls'])
+                    send_frame(conn, OUTPUT_FRAME, b'some output\n')
+                    send_exit_code(conn, 1)
+                client.join()
+        self.assertEqual(results, [1])
+        self.assertEqual(output.getvalue(), b'some output\n')
+
+
+class TestScanProjectFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.project_root = self.tmpdir.name
+        for path in ('models/staging', 'macros', 'tests', 'dbt_packages/my_package'):
+            os.makedirs(os.path.join(self.project_root, path))
+        self.write('dbt_project.yml', 'name: my_project')
+        self.write('models/staging/my_model.sql', 'select 1')
+        self.write('macros/my_macro.sql', '{% macro my_macro() %}{% endmacro %}')
+        project = Namespace(
+            project_root=self.project_root,
+            all_source_paths=['models', 'macros'],
+            test_paths=['tests'],
+            docs_paths=['models', 'macros'],
+        )
+        self.config = mock.MagicMock(
+            project_root=self.project_root, packages_install_path='dbt_packages'
+        )
+        self.config.load_dependencies.return_value = {'my_project': project}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, path, contents):
+        path = os.path.join(self.project_root, path)
+        with open(path, 'w') as fp:
+            fp.write(contents)
+        return path
+
+    def scan(self):
+        with mock.patch('dbt.flags.PROFILES_DIR', self.project_root):
+            return scan_project_files(self.config)
+
+    def test_scan(self):
+        stamps = self.scan()
+        self.assertEqual(
+            sorted(os.path.relpath(path, self.project_root) for path in stamps),
+            [
+                'dbt_project.yml',
+                os.path.join('macros', 'my_macro.sql'),
+                os.path.join('models', 'staging', 'my_model.sql'),
+            ],
+        )
+        self.assertEqual(self.scan(), stamps)
+
+    def test_changes(self):
+        stamps = self.scan()
+        changed = self.write('models/staging/my_model.sql', 'select 1 as id')
+        added = self.write('tests/my_test.sql', 'select 1 where false')
+        package = self.write('dbt_packages/my_package/dbt_project.yml', 'name: my_package')
+        os.remove(os.path.join(self.project_root, 'macros', 'my_macro.sql'))
+        deleted = os.path.join(self.project_root, 'macros', 'my_macro.sql')
+        self.assertEqual(
+            _changed_paths(stamps, self.scan()), sorted([changed, added, package, deleted])
+        )
+
+
+class TestRunDaemonCommand(unittest.TestCase):
+    @mock.patch('dbt.main.main')
+    def test_unsupported_command(self, mock_main):
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            self.assertEqual(run_daemon_command(['debug']), 2)
+        self.assertIn("dbt daemon can't run `debug`", stderr.getvalue())
+        mock_main.assert_not_called()
+
+    @mock.patch('dbt.main.main', side_effect=SystemExit(1))
+    def test_exit_code(self, mock_main):
+        self.assertEqual(run_daemon_command(['run', '-s', 'my_model']), 1)
+        mock_main.assert_called_once_with(['run', '-s', 'my_model'])
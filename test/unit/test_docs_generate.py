@@ -1,9 +1,14 @@
 from datetime import datetime
 from decimal import Decimal
 from unittest import mock
+import os
+import tempfile
 import unittest
 
+import agate
+
 import dbt.flags
+from dbt.clients.system import write_json
 from dbt.task import generate
 
 
@@ -352,3 +357,105 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def test__add_tables(self):
+        column_names = [
+            'table_database', 'table_schema', 'table_name', 'table_type', 'table_comment',
+            'column_name', 'column_index', 'column_type', 'column_comment',
+        ]
+        rows = [
+            ('test_database', 'test_schema', 'test_table', 'BASE TABLE', None,
+             'id', Decimal('1'), 'integer', None),
+            ('test_database', 'test_schema', 'test_table', 'BASE TABLE', None,
+             'name', Decimal('2'), 'text', None),
+            ('other_test_database', 'test_schema', 'test_table', 'BASE TABLE', None,
+             'id', Decimal('1'), 'integer', None),
+        ]
+        self.map_uids([
+            ('test_database', 'test_schema', 'test_table', 'test.model.test_table'),
+            ('other_test_database', 'test_schema', 'test_table', 'test.model.test_table_otherdb'),
+        ])
+        expected = self.generate_catalog_dict([dict(zip(column_names, row)) for row in rows])
+
+        # the tables of each information schema are added as they're read
+        catalog = generate.Catalog([])
+        catalog.add_table(agate.Table(rows[:2], column_names))
+        catalog.add_table(agate.Table(rows[2:], column_names))
+        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        result = generate.CatalogResults(nodes=nodes, sources=sources, errors=None)
+        self.assertEqual(result.to_dict(omit_none=False)['nodes'], expected)
+
+        # the artifact is written one table at a time, the same as write_json would
+        artifact = generate.CatalogArtifact.from_results(
+            generated_at=datetime.utcnow(),
+            nodes=nodes,
+            sources=sources,
+            compile_results=None,
+            errors=['boom'],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            streamed = os.path.join(tmpdir, 'streamed.json')
+            artifact.write(streamed)
+            whole = os.path.join(tmpdir, 'whole.json')
+            write_json(whole, artifact.to_dict(omit_none=False))
+            with open(streamed) as fp, open(whole) as expected_fp:
+                self.assertEqual(fp.read(), expected_fp.read())
+
+    def test__plan_incremental_catalog(self):
+        column_names = [
+            'table_database', 'table_schema', 'table_name', 'table_type', 'table_comment',
+            'column_name', 'column_index', 'column_type', 'column_comment',
+        ]
+        rows = [
+            ('test_database', 'test_schema', 'test_table', 'BASE TABLE', None,
+             'id', Decimal('1'), 'integer', None),
+            ('test_database', 'other_schema', 'other_table', 'BASE TABLE', None,
+             'id', Decimal('1'), 'integer', None),
+            ('test_database', 'dropped_schema', 'dropped_table', 'BASE TABLE', None,
+             'id', Decimal('1'), 'integer', None),
+        ]
+        self.map_uids([
+            ('test_database', 'test_schema', 'test_table', 'test.model.test_table'),
+            ('test_database', 'other_schema', 'other_table', 'test.model.other_table'),
+            ('test_database', 'dropped_schema', 'dropped_table', 'test.model.dropped_table'),
+            ('test_database', 'new_schema', 'new_table', 'test.model.new_table'),
+        ])
+        catalog = generate.Catalog([])
+        catalog.add_table(agate.Table(rows, column_names))
+        nodes, _ = catalog.make_unique_id_map(self.manifest)
+        previous_tables = {table.key(): table for table in nodes.values()}
+        previous_versions = {
+            generate.CatalogKey('test_database', 'test_schema', 'test_table'): 'a',
+            generate.CatalogKey('test_database', 'other_schema', 'other_table'): 'b',
+            generate.CatalogKey('test_database', 'dropped_schema', 'dropped_table'): 'c',
+        }
+        versions = {
+            generate.CatalogKey('test_database', 'test_schema', 'test_table'): 'a2',
+            generate.CatalogKey('test_database', 'other_schema', 'other_table'): 'b',
+            generate.CatalogKey('test_database', 'new_schema', 'new_table'): 'd',
+        }
+
+        changed, unchanged = generate.plan_incremental_catalog(
+            self.manifest, versions, previous_tables, previous_versions
+        )
+        # the changed relation's schema and the new relation's are read again,
+        # the dropped relation's is not
+        self.assertEqual(changed, {
+            ('test_database', 'test_schema'), ('test_database', 'new_schema'),
+        })
+        self.assertEqual(list(unchanged), [
+            generate.CatalogKey('test_database', 'other_schema', 'other_table'),
+        ])
+
+        # the unchanged tables are added unless they were read again
+        refreshed = generate.Catalog([])
+        refreshed.add_table(agate.Table(rows[:1], column_names))
+        refreshed.add_previous_tables(unchanged)
+        refreshed.add_previous_tables(previous_tables)
+        nodes, _ = refreshed.make_unique_id_map(self.manifest)
+        self.assertEqual(sorted(nodes), [
+            'test.model.dropped_table', 'test.model.other_table', 'test.model.test_table',
+        ])
+        self.assertEqual(nodes['test.model.other_table'], previous_tables[
+            generate.CatalogKey('test_database', 'other_schema', 'other_table')
+        ])
@@ -2,6 +2,7 @@ from dbt.adapters.reference_keys import _ReferenceKey
 from dbt.events.test_types import UnitTestInfo
 from dbt.events import AdapterLogger
 from dbt.events.functions import event_to_serializable_dict
+from dbt.events.history import EventHistory, approximate_size
 from dbt.events.base_types import NodeInfo
 from dbt.events.types import *
 from dbt.events.test_types import *
@@ -13,6 +14,7 @@ import dbt.flags as flags
 from dbt.helper_types import Lazy
 import inspect
 import json
+import threading
 from unittest import TestCase
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn
@@ -97,6 +99,12 @@ class TestEventBuffer(TestCase):
 
     def setUp(self) -> None:
         flags.EVENT_BUFFER_SIZE = 10
+        flags.EVENT_BUFFER_BYTES = 1000000
+        reload(event_funcs)
+
+    def tearDown(self) -> None:
+        flags.EVENT_BUFFER_SIZE = 100000
+        flags.EVENT_BUFFER_BYTES = 0
         reload(event_funcs)
 
     # ensure events are populated to the buffer exactly once
@@ -123,6 +131,130 @@ class TestEventBuffer(TestCase):
              event_funcs.EVENT_HISTORY.count(UnitTestInfo(msg='Test Event 1', code='T006')) == 0
          )
 
+class TestEventHistory(TestCase):
+
+    def test_history_is_opt_in(self):
+        history = EventHistory()
+        self.assertFalse(history.enabled)
+        self.assertFalse(history.append(UnitTestInfo(msg='dropped')))
+        self.assertEqual(len(history), 0)
+
+    def test_history_bounded_by_bytes(self):
+        size = approximate_size(UnitTestInfo(msg='x' * 100))
+        history = EventHistory(max_bytes=size * 3, max_events=100)
+        self.assertFalse(history.append(UnitTestInfo(msg='a' * 100)))
+        self.assertFalse(history.append(UnitTestInfo(msg='b' * 100)))
+        # full, and only says so once
+        self.assertTrue(history.append(UnitTestInfo(msg='c' * 100)))
+        self.assertFalse(history.append(UnitTestInfo(msg='d' * 100)))
+        self.assertEqual([e.msg[0] for e in history], ['b', 'c', 'd'])
+        self.assertLessEqual(history.nbytes, size * 3)
+        # the newest event is kept, however big it is
+        history.append(UnitTestInfo(msg='e' * 10000))
+        self.assertEqual([e.msg[0] for e in history], ['e'])
+
+
+class TestEventGating(TestCase):
+
+    def setUp(self) -> None:
+        reload(event_funcs)
+
+    def tearDown(self) -> None:
+        flags.LOG_LEVEL_FILE = None
+        flags.DEBUG = None
+
+    def test_event_enabled(self):
+        flags.DEBUG = False
+        # the log file takes debug events by default
+        self.assertTrue(event_funcs.event_enabled(SQLQuery))
+        flags.LOG_LEVEL_FILE = 'info'
+        self.assertFalse(event_funcs.event_enabled(SQLQuery))
+        self.assertTrue(event_funcs.event_enabled(MainReportVersion))
+        flags.DEBUG = True
+        self.assertTrue(event_funcs.event_enabled(SQLQuery))
+        # NoFile events only go to stdout
+        flags.DEBUG = False
+        flags.LOG_LEVEL_FILE = 'none'
+        self.assertTrue(event_funcs.event_enabled(UnitTestInfo))
+        self.assertFalse(event_funcs.event_enabled(SQLQuery))
+        # cache events need --log-cache-events
+        flags.LOG_LEVEL_FILE = 'debug'
+        self.assertFalse(event_funcs.event_enabled(AddRelation))
+
+    def test_fire_lazy_event(self):
+        built = []
+
+        def make_event():
+            built.append(True)
+            return SQLQuery(conn_name='test', sql='select 1')
+
+        flags.DEBUG = False
+        flags.LOG_LEVEL_FILE = 'info'
+        event_funcs.fire_lazy_event(SQLQuery, make_event)
+        self.assertEqual(built, [])
+        flags.LOG_LEVEL_FILE = 'debug'
+        event_funcs.fire_lazy_event(SQLQuery, make_event)
+        self.assertEqual(built, [True])
+
+
+class TestAsyncEventWriter(TestCase):
+
+    def setUp(self) -> None:
+        flags.ASYNC_LOGGING = True
+        flags.DEBUG = True
+        reload(event_funcs)
+        self.buffer = event_funcs.capture_stdout_logs()
+
+    def tearDown(self) -> None:
+        event_funcs.stop_event_writer()
+        event_funcs.stop_capture_stdout_logs()
+        flags.ASYNC_LOGGING = None
+        flags.DEBUG = None
+
+    def lines(self):
+        return [line for line in self.buffer.getvalue().split('\n') if 'Unit Test:' in line]
+
+    def test_events_written_in_order(self):
+        def fire(thread):
+            for n in range(200):
+                event_funcs.fire_event(UnitTestInfo(msg=f'{thread} {n}'))
+
+        threads = [threading.Thread(target=fire, args=(i,), name=f'fire-{i}') for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        event_funcs.flush_events()
+
+        lines = self.lines()
+        self.assertEqual(len(lines), 800)
+        for i in range(4):
+            # the thread that fired the event, not the writer's
+            fired = [line for line in lines if f'[fire-{i}    ]' in line]
+            self.assertEqual(
+                [line.rsplit(' ', 1)[-1] for line in fired],
+                [str(n) for n in range(200)],
+            )
+
+    def test_stop_drains_queue(self):
+        event_funcs.fire_event(UnitTestInfo(msg='before stop'))
+        event_funcs.stop_event_writer()
+        self.assertTrue(self.lines()[-1].endswith('Unit Test: before stop'))
+        # events fired while exiting are written right away
+        event_funcs.fire_event(UnitTestInfo(msg='after stop'))
+        self.assertTrue(self.lines()[-1].endswith('Unit Test: after stop'))
+
+    def test_broken_event_does_not_block_the_queue(self):
+        class Broken(UnitTestInfo):
+            def message(self):
+                raise ValueError('broken')
+
+        event_funcs.fire_event(Broken(msg=''))
+        event_funcs.fire_event(UnitTestInfo(msg='after broken'))
+        event_funcs.flush_events()
+        self.assertTrue(self.lines()[-1].endswith('Unit Test: after broken'))
+
+
 def MockNode():
     return ParsedModelNode(
         alias='model_one',
@@ -287,6 +419,7 @@ sample_values = [
     PartialParsingDeletedExposure(unique_id=''),
     InvalidDisabledSourceInTestNode(msg=''),
     InvalidRefInTestNode(msg=''),
+    PartialParsingDependentInputsChanged(inputs=[]),
     RunningOperationCaughtError(exc=''),
     RunningOperationUncaughtError(exc=Exception('')),
     DbtProjectError(),
@@ -320,6 +453,8 @@ sample_values = [
     CatalogWritten(path=''),
     CannotGenerateDocs(),
     BuildingCatalog(),
+    BuildingIncrementalCatalog(refreshed=0, schemas=0),
+    IncrementalCatalogUnavailable(reason=''),
     CompileComplete(),
     FreshnessCheckComplete(),
     ServingDocsPort(address='', port=0),
@@ -370,6 +505,9 @@ sample_values = [
     NodeFinished(unique_id='', node_info={}, run_result={}),
     QueryCancelationUnsupported(type=''),
     ConcurrencyLine(num_threads=0, target_name=''),
+    SchedulingEstimated(
+        policy='', timed_nodes=0, num_nodes=0, estimated_makespan=0.0, estimated_depth_makespan=0.0
+    ),
     StarterProjectPath(dir=''),
     ConfigFolderDirectory(dir=''),
     NoSampleProfileFound(adapter=''),
@@ -387,6 +525,8 @@ sample_values = [
     FoundStats(stat_line=''),
     CompilingNode(unique_id=''),
     WritingInjectedSQLForNode(unique_id=''),
+    CompiledSqlCacheLoadFailed(path='', exc=''),
+    CompiledSqlCacheStats(hits=0, misses=0, uncacheable=0),
     DisableTracking(),
     SendingEvent(kwargs=''),
     SendEventFailure(),
@@ -423,6 +563,11 @@ sample_values = [
     IntegrationTestException(msg=''),
     EventBufferFull(),
     RecordRetryException(exc=Exception('')),
+    DaemonListening(socket_path=''),
+    DaemonProjectChanged(paths=[]),
+    DaemonManifestLoadFailed(exc=''),
+    DaemonRunningCommand(args=[]),
+    JinjaTemplateCacheStats(hits=0, misses=0, evictions=0, loaded=0),
     UnitTestInfo(msg=''),
 ]
 
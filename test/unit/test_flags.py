@@ -251,6 +251,138 @@ class TestFlags(TestCase):
         delattr(self.args, 'cache_selected_only')
         self.user_config.cache_selected_only = False
 
+        # parse_workers
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 0)
+        self.user_config.parse_workers = 2
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 2)
+        os.environ['DBT_PARSE_WORKERS'] = '4'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 4)
+        setattr(self.args, 'parse_workers', 8)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 8)
+        # cleanup
+        os.environ.pop('DBT_PARSE_WORKERS')
+        delattr(self.args, 'parse_workers')
+        self.user_config.parse_workers = None
+
+        # async_logging
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        self.user_config.async_logging = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        os.environ['DBT_ASYNC_LOGGING'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        setattr(self.args, 'async_logging', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        # cleanup
+        os.environ.pop('DBT_ASYNC_LOGGING')
+        delattr(self.args, 'async_logging')
+        self.user_config.async_logging = None
+
+        # compile_ahead
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILE_AHEAD, False)
+        self.user_config.compile_ahead = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILE_AHEAD, True)
+        os.environ['DBT_COMPILE_AHEAD'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILE_AHEAD, False)
+        setattr(self.args, 'compile_ahead', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILE_AHEAD, True)
+        # cleanup
+        os.environ.pop('DBT_COMPILE_AHEAD')
+        delattr(self.args, 'compile_ahead')
+        self.user_config.compile_ahead = None
+
+        # cache_compiled_sql
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_COMPILED_SQL, False)
+        self.user_config.cache_compiled_sql = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_COMPILED_SQL, True)
+        os.environ['DBT_CACHE_COMPILED_SQL'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_COMPILED_SQL, False)
+        setattr(self.args, 'cache_compiled_sql', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_COMPILED_SQL, True)
+        # cleanup
+        os.environ.pop('DBT_CACHE_COMPILED_SQL')
+        delattr(self.args, 'cache_compiled_sql')
+        self.user_config.cache_compiled_sql = None
+
+        # cache_jinja_bytecode
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_JINJA_BYTECODE, True)
+        self.user_config.cache_jinja_bytecode = False
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_JINJA_BYTECODE, False)
+        os.environ['DBT_CACHE_JINJA_BYTECODE'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_JINJA_BYTECODE, True)
+        setattr(self.args, 'cache_jinja_bytecode', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CACHE_JINJA_BYTECODE, False)
+        # cleanup
+        os.environ.pop('DBT_CACHE_JINJA_BYTECODE')
+        delattr(self.args, 'cache_jinja_bytecode')
+        self.user_config.cache_jinja_bytecode = None
+
+        # skip_unchanged_seeds
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.SKIP_UNCHANGED_SEEDS, False)
+        self.user_config.skip_unchanged_seeds = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.SKIP_UNCHANGED_SEEDS, True)
+        os.environ['DBT_SKIP_UNCHANGED_SEEDS'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.SKIP_UNCHANGED_SEEDS, False)
+        setattr(self.args, 'skip_unchanged_seeds', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.SKIP_UNCHANGED_SEEDS, True)
+        # cleanup
+        os.environ.pop('DBT_SKIP_UNCHANGED_SEEDS')
+        delattr(self.args, 'skip_unchanged_seeds')
+        self.user_config.skip_unchanged_seeds = None
+
+        # event_buffer_bytes
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_BUFFER_BYTES, 0)
+        os.environ['DBT_EVENT_BUFFER_BYTES'] = '1000'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_BUFFER_BYTES, 1000)
+        setattr(self.args, 'event_buffer_bytes', 2000)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_BUFFER_BYTES, 2000)
+        # cleanup
+        os.environ.pop('DBT_EVENT_BUFFER_BYTES')
+        delattr(self.args, 'event_buffer_bytes')
+
+        # log_level_file
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LOG_LEVEL_FILE, 'debug')
+        self.user_config.log_level_file = 'info'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LOG_LEVEL_FILE, 'info')
+        os.environ['DBT_LOG_LEVEL_FILE'] = 'warn'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LOG_LEVEL_FILE, 'warn')
+        setattr(self.args, 'log_level_file', 'none')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.LOG_LEVEL_FILE, 'none')
+        # cleanup
+        os.environ.pop('DBT_LOG_LEVEL_FILE')
+        delattr(self.args, 'log_level_file')
+        self.user_config.log_level_file = None
+
         # target_path/log_path
         flags.set_from_args(self.args, self.user_config)
         self.assertIsNone(flags.LOG_PATH)
@@ -0,0 +1,132 @@
+import random
+import unittest
+from itertools import product
+
+import networkx as nx
+
+from dbt.graph.compact import CompactGraph
+
+
+def _eliminate_nodes(graph, selected):
+    """The subset graph, the way networkx-backed graphs built it: connect the
+    parents and children of each removed node, then remove it.
+    """
+    new_graph = graph.copy()
+    for node in graph:
+        if node not in selected:
+            sources = [source for source, _ in new_graph.in_edges(node)]
+            targets = [target for _, target in new_graph.out_edges(node)]
+            new_graph.add_edges_from(
+                (source, target) for source, target in product(sources, targets) if source != target
+            )
+            new_graph.remove_node(node)
+    return new_graph
+
+
+class CompactGraphTest(unittest.TestCase):
+    def setUp(self):
+        # a -> b -> d -> e
+        #  \-> c --^
+        # f
+        self.graph = CompactGraph(
+            'abcdef', [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'), ('d', 'e')]
+        )
+
+    def test_nodes_and_edges(self):
+        self.assertEqual(len(self.graph), 6)
+        self.assertEqual(list(self.graph), ['a', 'b', 'c', 'd', 'e', 'f'])
+        self.assertIn('f', self.graph)
+        self.assertNotIn('g', self.graph)
+        self.assertEqual(
+            list(self.graph.edges()),
+            [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'), ('d', 'e')],
+        )
+        self.assertEqual(self.graph.number_of_edges(), 5)
+        self.assertEqual(self.graph.successors('a'), ['b', 'c'])
+        self.assertEqual(self.graph.predecessors('d'), ['b', 'c'])
+        self.assertEqual(
+            self.graph.in_degrees(), {'a': 0, 'b': 1, 'c': 1, 'd': 2, 'e': 1, 'f': 0}
+        )
+
+    def test_duplicate_edges_and_new_nodes(self):
+        graph = CompactGraph(['a'], [('a', 'b'), ('a', 'b'), ('c', 'a')])
+        self.assertEqual(list(graph), ['a', 'b', 'c'])
+        self.assertEqual(list(graph.edges()), [('a', 'b'), ('c', 'a')])
+
+    def test_from_parents(self):
+        graph = CompactGraph.from_parents({'a': [], 'b': ['a'], 'c': ['a', 'b']})
+        self.assertEqual(list(graph.edges()), [('a', 'b'), ('a', 'c'), ('b', 'c')])
+        self.assertEqual(graph.predecessors('c'), ['a', 'b'])
+
+    def test_reachable(self):
+        self.assertEqual(set(self.graph.reachable(['a'])), {'b', 'c', 'd', 'e'})
+        self.assertEqual(set(self.graph.reachable(['a'], max_depth=1)), {'b', 'c'})
+        self.assertEqual(set(self.graph.reachable(['e'], reverse=True)), {'a', 'b', 'c', 'd'})
+        self.assertEqual(set(self.graph.reachable(['e'], max_depth=2, reverse=True)), {'b', 'c', 'd'})
+        self.assertEqual(self.graph.reachable(['f']), [])
+
+    def test_reachable_from_many(self):
+        # b is found from a, even though it's a source itself
+        self.assertEqual(set(self.graph.reachable(['a', 'b'], max_depth=1)), {'b', 'c', 'd'})
+        self.assertEqual(set(self.graph.reachable(['c', 'b'], max_depth=1)), {'d'})
+        self.assertEqual(set(self.graph.reachable(['c', 'e'], reverse=True)), {'a', 'b', 'c', 'd'})
+
+    def test_find_cycle(self):
+        self.assertIsNone(self.graph.find_cycle())
+        graph = CompactGraph('abcd', [('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'b')])
+        self.assertEqual(graph.find_cycle(), ['b', 'c', 'd'])
+        graph = CompactGraph('a', [('a', 'a')])
+        self.assertEqual(graph.find_cycle(), ['a'])
+
+    def test_subgraph(self):
+        graph = self.graph.subgraph(['a', 'b', 'd', 'missing'])
+        self.assertEqual(list(graph), ['a', 'b', 'd'])
+        self.assertEqual(list(graph.edges()), [('a', 'b'), ('b', 'd')])
+        self.assertIs(self.graph.subgraph(self.graph), self.graph)
+
+    def test_transitive_subgraph(self):
+        graph = self.graph.transitive_subgraph(['a', 'e', 'f'])
+        self.assertEqual(list(graph), ['a', 'e', 'f'])
+        self.assertEqual(list(graph.edges()), [('a', 'e')])
+
+        graph = self.graph.transitive_subgraph(['a', 'b', 'e'])
+        self.assertEqual(set(graph.edges()), {('a', 'b'), ('b', 'e'), ('a', 'e')})
+
+    def test_transitive_subgraph_matches_node_elimination(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            nodes = [f'n{i}' for i in range(60)]
+            edges = [
+                (nodes[rng.randrange(i)], nodes[i])
+                for i in range(1, len(nodes))
+                for _ in range(rng.randint(0, 3))
+            ]
+            selected = set(rng.sample(nodes, rng.randint(1, len(nodes))))
+            nx_graph = nx.DiGraph(edges)
+            nx_graph.add_nodes_from(nodes)
+
+            graph = CompactGraph(nodes, edges).transitive_subgraph(selected)
+            expected = _eliminate_nodes(nx_graph, selected)
+            self.assertEqual(set(graph), set(expected.nodes()))
+            self.assertEqual(set(graph.edges()), set(expected.edges()))
+
+    def test_transitive_subgraph_through_hub(self):
+        # p0, p1 -> hub -> c0 -> t0
+        #               \-> c1 -> t1
+        graph = CompactGraph(
+            ['p0', 'p1', 'hub', 'c0', 'c1', 't0', 't1'],
+            [('p0', 'hub'), ('p1', 'hub'), ('hub', 'c0'), ('hub', 'c1'),
+             ('c0', 't0'), ('c1', 't1'), ('p0', 't0')],
+        ).transitive_subgraph(['p0', 'p1', 't0', 't1'])
+        self.assertEqual(
+            set(graph.edges()),
+            {('p0', 't0'), ('p0', 't1'), ('p1', 't0'), ('p1', 't1')},
+        )
+        self.assertEqual(graph.number_of_edges(), 4)
+
+    def test_transitive_subgraph_with_cycle(self):
+        # the left out nodes b and c form a cycle
+        graph = CompactGraph(
+            'abcd', [('a', 'b'), ('b', 'c'), ('c', 'b'), ('c', 'd')]
+        ).transitive_subgraph(['a', 'd'])
+        self.assertEqual(list(graph.edges()), [('a', 'd')])
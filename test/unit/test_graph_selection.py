@@ -7,6 +7,7 @@ import string
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
 import dbt.graph.cli as graph_cli
+from dbt.contracts.graph.manifest import SelectorLookup
 from dbt.node_types import NodeType
 
 import networkx as nx
@@ -53,7 +54,10 @@ def _get_manifest(graph):
     nodes['m.X.e'].tags = ['efg', 'bcef']
     nodes['m.Y.f'].tags = ['efg', 'bcef']
     nodes['m.X.g'].tags = ['efg']
-    return mock.MagicMock(nodes=nodes)
+    manifest = mock.MagicMock(nodes=nodes)
+    manifest.expect.side_effect = nodes.__getitem__
+    manifest.selector_lookup = SelectorLookup(manifest)
+    return manifest
 
 
 @pytest.fixture
@@ -1,4 +1,5 @@
 import copy
+import json
 
 import pytest
 from unittest import mock
@@ -779,6 +780,19 @@ def test_select_config_materialized(manifest):
         'table_model', 'table_model_py', 'table_model_csv', 'union_model', 'mynamespace.union_model'}
 
 
+def test_select_config_values_of_other_types(manifest):
+    manifest.nodes['model.pkg.view_model'].config.meta = {'owner': ['a', 'b']}
+    manifest.nodes['model.pkg.table_model'].config.meta = {'owner': 1}
+    manifest.nodes['model.pkg.union_model'].config.meta = {'owner': True}
+    methods = MethodManager(manifest, None)
+    method = methods.get_method('config', ['meta', 'owner'])
+
+    assert search_manifest_using_method(manifest, method, ['a', 'b']) == {'view_model'}
+    # 1 == True, so both match, like they did before configs were indexed
+    assert search_manifest_using_method(manifest, method, 1) == {'table_model', 'union_model'}
+    assert search_manifest_using_method(manifest, method, 'a') == set()
+
+
 def test_select_test_name(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method('test_name', [])
@@ -1153,4 +1167,53 @@ def test_select_state_changed_test_macros_with_upstream_change(manifest, previou
         manifest, method, 'modified') == {'model1', 'model2'}
     assert search_manifest_using_method(
         manifest, method, 'modified.macros') == {'model1', 'model2'}
-    assert not search_manifest_using_method(manifest, method, 'new')
\ No newline at end of file
+    assert not search_manifest_using_method(manifest, method, 'new')
+
+@pytest.fixture
+def saved_state(manifest, tmp_path):
+    saved = copy.deepcopy(manifest)
+    saved.disabled = {}
+    saved.write(str(tmp_path / 'manifest.json'))
+    return PreviousState(path=tmp_path, current_path=tmp_path)
+
+
+def deserialized_nodes(manifest, state):
+    return {unique_id for unique_id in state._resources if unique_id in manifest.nodes}
+
+
+def test_select_state_saved_no_change(manifest, saved_state):
+    method = statemethod(manifest, saved_state)
+    assert not search_manifest_using_method(manifest, method, 'modified')
+    assert not search_manifest_using_method(manifest, method, 'new')
+    assert not search_manifest_using_method(manifest, method, 'modified.configs')
+    # every node had the same fingerprint, so none of the old ones were read
+    assert not deserialized_nodes(manifest, saved_state)
+    assert saved_state._manifest is None
+
+
+def test_select_state_saved_changes(manifest, saved_state, view_model, macro_default_test_not_null):
+    change_node(manifest, view_model.replace(raw_code='select 1 as id'))
+    manifest.macros[macro_default_test_not_null.unique_id] = macro_default_test_not_null.replace(macro_sql='lalala')
+    method = statemethod(manifest, saved_state)
+    assert search_manifest_using_method(
+        manifest, method, 'modified') == {'view_model', 'not_null_table_model_id'}
+    assert search_manifest_using_method(
+        manifest, method, 'modified.body') == {'view_model'}
+    assert search_manifest_using_method(
+        manifest, method, 'modified.macros') == {'not_null_table_model_id'}
+    assert not search_manifest_using_method(manifest, method, 'new')
+    assert deserialized_nodes(manifest, saved_state) == {view_model.unique_id}
+    assert saved_state._manifest is None
+
+
+def test_select_state_saved_other_version(manifest, saved_state, tmp_path, view_model):
+    path = tmp_path / 'manifest.json'
+    data = json.loads(path.read_text())
+    data['metadata']['dbt_version'] = '0.0.1'
+    path.write_text(json.dumps(data))
+    state = PreviousState(path=tmp_path, current_path=tmp_path)
+    change_node(manifest, view_model.replace(raw_code='select 1 as id'))
+    method = statemethod(manifest, state)
+    assert search_manifest_using_method(manifest, method, 'modified') == {'view_model'}
+    # the fingerprints might not be comparable, so every node was read
+    assert deserialized_nodes(manifest, state) == set(manifest.nodes)
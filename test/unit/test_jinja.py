@@ -1,4 +1,7 @@
 from contextlib import contextmanager
+from unittest import mock
+import os
+import tempfile
 import pytest
 import unittest
 import yaml
@@ -6,6 +9,7 @@ import yaml
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
+from dbt.clients.jinja import CompiledTemplateCache, compiled_template_cache
 from dbt.exceptions import CompilationException, JinjaRenderingException
 
 
@@ -425,6 +429,63 @@ class TestJinja(unittest.TestCase):
         assert value == '1991'
 
 
+class TestCompiledTemplateCache(unittest.TestCase):
+    def setUp(self):
+        compiled_template_cache.clear()
+
+    def test_reuses_code_with_each_context(self):
+        s = 'select {{ a }} as a -- cache test'
+        hits = compiled_template_cache.hits
+        self.assertEqual(get_rendered(s, {'a': 1}), 'select 1 as a -- cache test')
+        self.assertEqual(get_rendered(s, {'a': 2}), 'select 2 as a -- cache test')
+        self.assertEqual(compiled_template_cache.hits, hits + 1)
+        # native templates compile to different code
+        self.assertEqual(get_rendered('{{ a }}', {'a': 1}, native=True), 1)
+        self.assertEqual(get_rendered('{{ a }}', {'a': 1}, native=False), '1')
+
+    def test_reuses_code_with_each_environment(self):
+        s = '{{ undefined_macro() }} -- cache test'
+        get_rendered(s, {}, capture_macros=True)
+        with self.assertRaises(CompilationException):
+            get_rendered(s, {})
+
+    def test_evicts_least_recently_used(self):
+        cache = CompiledTemplateCache(max_size=2)
+        env = get_template('', {}).environment
+        first = cache.get_code(env, '{{ 1 }}')
+        cache.get_code(env, '{{ 2 }}')
+        self.assertIs(cache.get_code(env, '{{ 1 }}'), first)
+        cache.get_code(env, '{{ 3 }}')
+        self.assertEqual(cache.evictions, 1)
+        self.assertIs(cache.get_code(env, '{{ 1 }}'), first)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        # '{{ 2 }}' was dropped
+        cache.get_code(env, '{{ 2 }}')
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_persists_macro_code(self):
+        s = '{% macro cache_test(a) %}{{ a }}{% endmacro %}'
+        env = get_template('', {}).environment
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompiledTemplateCache()
+            cache.set_bytecode_directory(directory)
+            cache.get_code(env, s, persist=True)
+            # only sources that are the same from run to run are written
+            cache.get_code(env, 'select {{ a }}', persist=True)
+            cache.get_code(env, 'select {{ b }}')
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+            # a new process loads it instead of compiling it
+            cache = CompiledTemplateCache()
+            cache.set_bytecode_directory(directory)
+            with mock.patch.object(env, 'compile') as compile:
+                code = cache.get_code(env, s, persist=True)
+            compile.assert_not_called()
+            self.assertEqual(cache.loaded, 1)
+            template = env.template_class.from_code(env, code, env.make_globals({}), None)
+            self.assertEqual(template.module.dbt_macro__cache_test(1), '1')
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
@@ -9,6 +9,8 @@ try:
 except ImportError:
     from Queue import Empty
 
+from dbt.contracts.graph.manifest import SelectorLookup
+from dbt.graph import SchedulingPolicy
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
 
@@ -26,6 +28,7 @@ def _mock_manifest(nodes):
         ) for n in nodes
     })
     manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
+    manifest.selector_lookup = SelectorLookup(manifest)
     return manifest
 
 
@@ -63,11 +66,11 @@ class LinkerTest(unittest.TestCase):
         """test join() without timeout risk"""
         self.assertEqual(queue.inner.unfinished_tasks, 0)
 
-    def _get_graph_queue(self, manifest, include=None, exclude=None):
-        graph = compilation.Graph(self.linker.graph)
+    def _get_graph_queue(self, manifest, include=None, exclude=None, execution_times=None):
+        graph = compilation.Graph(self.linker.get_graph())
         selector = NodeSelector(graph, manifest)
         spec = parse_difference(include, exclude)
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, execution_times)
 
     def test_linker_add_dependency(self):
         actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'C')]
@@ -165,6 +168,88 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done('A')
         self.assert_would_join(queue_2)
 
+    def test_linker_diamond_dependencies(self):
+        actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self._get_graph_queue(_mock_manifest('ABCD'))
+        self.assertEqual(len(queue), 4)
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'D')
+        queue.mark_done('D')
+
+        second = queue.get(block=False)
+        third = queue.get(block=False)
+        self.assertEqual({second.unique_id, third.unique_id}, {'B', 'C'})
+        queue.mark_done(second.unique_id)
+        # A still waits for the other parent
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        self.assertFalse(queue.empty())
+        queue.mark_done(third.unique_id)
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        self.assertTrue(queue.empty())
+        queue.mark_done('A')
+        self.assert_would_join(queue)
+        # the graph isn't changed by running the queue
+        self.assertEqual(len(queue.graph), 4)
+
+    def _add_slow_chain(self):
+        # Z1 -> Z2 -> Z3 take 10s each, and A, B, C take 5s each
+        for node in 'ABC':
+            self.linker.add_node(node)
+        self.linker.dependency('Z2', 'Z1')
+        self.linker.dependency('Z3', 'Z2')
+        return {'A': 5.0, 'B': 5.0, 'C': 5.0, 'Z1': 10.0, 'Z2': 10.0, 'Z3': 10.0}
+
+    def test_linker_depth_scheduling(self):
+        self._add_slow_chain()
+        queue = self._get_graph_queue(_mock_manifest(['A', 'B', 'C', 'Z1', 'Z2', 'Z3']))
+        self.assertEqual(queue.policy, SchedulingPolicy.Depth)
+        self.assertEqual(queue.execution_order(), ['A', 'B', 'C', 'Z1', 'Z2', 'Z3'])
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+        self.assertIsNone(queue.estimate_makespans(2))
+
+    def test_linker_critical_path_scheduling(self):
+        execution_times = self._add_slow_chain()
+        queue = self._get_graph_queue(
+            _mock_manifest(['A', 'B', 'C', 'Z1', 'Z2', 'Z3']), execution_times=execution_times
+        )
+        self.assertEqual(queue.policy, SchedulingPolicy.CriticalPath)
+        self.assertEqual(queue.timed_nodes, 6)
+        # depth order starts the chain after A, B and C are done: 15s + 20s
+        self.assertEqual(queue.estimate_makespans(2), (30.0, 35.0))
+        self.assertEqual(queue.estimate_makespans(1), (45.0, 45.0))
+        self.assertEqual(queue.execution_order(), ['Z1', 'Z2', 'Z3', 'A', 'B', 'C'])
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'Z1')
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+        queue.mark_done('Z1')
+        self.assertEqual(queue.get(block=False).unique_id, 'Z2')
+
+    def test_linker_critical_path_unknown_times(self):
+        self._add_slow_chain()
+        queue = self._get_graph_queue(
+            _mock_manifest(['A', 'B', 'C', 'Z1', 'Z2', 'Z3']),
+            execution_times={'A': 5.0, 'B': 5.0, 'Z1': 10.0, 'model.removed': 100.0},
+        )
+        self.assertEqual(queue.timed_nodes, 3)
+        self.assertEqual(queue.execution_times['C'], 5.0)
+        self.assertEqual(queue.execution_times['Z3'], 5.0)
+        self.assertNotIn('model.removed', queue.execution_times)
+
+        queue = self._get_graph_queue(
+            _mock_manifest(['A', 'B', 'C', 'Z1', 'Z2', 'Z3']), execution_times={}
+        )
+        self.assertEqual(set(queue.execution_times.values()), {1.0})
+        # the longest chain goes first
+        self.assertEqual(queue.get(block=False).unique_id, 'Z1')
+
     def test__find_cycles__cycles(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'A')]
 
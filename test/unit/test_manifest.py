@@ -3,11 +3,13 @@ import unittest
 from unittest import mock
 
 import copy
+import json
 from collections import namedtuple
 from itertools import product
 from datetime import datetime
 
 import pytest
+import yaml
 
 import dbt.flags
 import dbt.version
@@ -33,6 +35,8 @@ from dbt.contracts.graph.unparsed import (
 )
 
 from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.clients.jinja import get_rendered
+from dbt.context.base import BaseContext
 from dbt.events.functions import get_invocation_id
 from dbt.node_types import NodeType
 import freezegun
@@ -323,9 +327,10 @@ class ManifestTest(unittest.TestCase):
                 'selectors': {},
                 'parent_map': {},
                 'child_map': {},
+                'state_fingerprints': {},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
-                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v7.json',
+                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v8.json',
                     'dbt_version': dbt.version.__version__,
                     'env': {ENV_KEY_NAME: 'value'},
                     'invocation_id': invocation_id,
@@ -425,6 +430,74 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(frozenset(node), REQUIRED_PARSED_NODE_KEYS)
 
+    def test__flat_graph_is_lazy(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={},
+                            disabled={}, files={}, exposures={},
+                            metrics={}, selectors={})
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph['nodes']
+        unique_id = 'model.snowplow.events'
+        with mock.patch.object(ParsedModelNode, 'to_dict', autospec=True,
+                               side_effect=lambda node, omit_none: {'name': node.name}) as to_dict:
+            self.assertIn(unique_id, flat_nodes)
+            self.assertEqual(len(flat_nodes), len(self.nested_nodes))
+            to_dict.assert_not_called()
+            node = flat_nodes[unique_id]
+            self.assertEqual(node, {'name': 'events'})
+            self.assertIs(flat_nodes[unique_id], node)
+            self.assertEqual(to_dict.call_count, 1)
+
+        # the graph keeps the nodes it was built with
+        manifest.nodes[unique_id] = manifest.nodes['model.root.dep']
+        self.assertEqual(flat_nodes[unique_id]['name'], 'events')
+        rendered = get_rendered(
+            '{% for node in graph.nodes.values() %}{{ node.name }} {% endfor %}',
+            {'graph': manifest.flat_graph},
+        )
+        self.assertEqual(set(rendered.split()), {n.name for n in self.nested_nodes.values()})
+
+    def test__flat_graph_is_a_dict(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={},
+                            disabled={}, files={}, exposures={},
+                            metrics={}, selectors={})
+        manifest.build_flat_graph()
+        expected = {
+            unique_id: node.to_dict(omit_none=False)
+            for unique_id, node in self.nested_nodes.items()
+        }
+
+        # macros can serialize the graph's resources
+        context = {
+            'graph': manifest.flat_graph,
+            'tojson': BaseContext.tojson,
+            'toyaml': BaseContext.toyaml,
+        }
+        rendered = get_rendered('{{ tojson(graph.nodes) }}', context)
+        self.assertEqual(json.loads(rendered), expected)
+        manifest.build_flat_graph()
+        context['graph'] = manifest.flat_graph
+        rendered = get_rendered('{{ toyaml(graph.nodes) }}', context)
+        self.assertEqual(yaml.safe_load(rendered), expected)
+
+        # and use them like any other dict
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph['nodes']
+        self.assertEqual(flat_nodes, expected)
+        self.assertEqual(dict(flat_nodes), expected)
+        copied = flat_nodes.copy()
+        self.assertIs(type(copied), dict)
+        self.assertEqual(copied, expected)
+        copied.update(flat_nodes)
+        self.assertEqual(copied, expected)
+        flat_nodes.update({'model.root.extra': {'name': 'extra'}})
+        self.assertEqual(flat_nodes.get('model.root.extra'), {'name': 'extra'})
+        self.assertEqual(
+            flat_nodes.pop('model.snowplow.events'),
+            expected['model.snowplow.events'],
+        )
+
     @mock.patch.object(tracking, 'active_user')
     def test_metadata(self, mock_user):
         mock_user.id = 'cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf'
@@ -473,10 +546,11 @@ class ManifestTest(unittest.TestCase):
                 'selectors': {},
                 'parent_map': {},
                 'child_map': {},
+                'state_fingerprints': {},
                 'docs': {},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
-                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v7.json',
+                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v8.json',
                     'dbt_version': dbt.version.__version__,
                     'project_id': '098f6bcd4621d373cade4e832627b4f6',
                     'user_id': 'cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf',
@@ -727,9 +801,10 @@ class MixedManifestTest(unittest.TestCase):
                 'selectors': {},
                 'parent_map': {},
                 'child_map': {},
+                'state_fingerprints': {},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
-                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v7.json',
+                    'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v8.json',
                     'dbt_version': dbt.version.__version__,
                     'invocation_id': '01234567-0123-0123-0123-0123456789ab',
                     'env': {ENV_KEY_NAME: 'value'},
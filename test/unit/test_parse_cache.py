@@ -0,0 +1,127 @@
+import os
+import tempfile
+from unittest import mock
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.node_types import NodeType
+from dbt.parser import ModelParser
+from dbt.parser.parse_cache import ParseCache
+
+from .test_parser import BaseParserTest, assertEqualNodes, get_abs_os_path
+from .utils import generate_name_macros, normalize
+
+
+MODEL_SQL = """
+{{ config(materialized=var('materialized')) }}
+select '{{ env_var('PARSE_CACHE_TEST_ENV', 'default') }}' as e, {{ my_macro() }} as m
+from {{ ref('other') }}
+"""
+
+
+def make_macro(sql):
+    return ParsedMacro(
+        name="my_macro",
+        resource_type=NodeType.Macro,
+        unique_id="macro.root.my_macro",
+        package_name="root",
+        original_file_path=normalize("macros/macro.sql"),
+        root_path=get_abs_os_path("./dbt_packages/root"),
+        path=normalize("macros/macro.sql"),
+        macro_sql=sql,
+    )
+
+
+class ParseCacheTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.root_project_config.cli_vars = {"materialized": "table", "unrelated": 1}
+        self.macro_sql = "{% macro my_macro() %}1{% endmacro %}"
+        self.parse_cache = ParseCache(self.root_project_config)
+
+    def parse(self):
+        manifest = Manifest(macros={m.unique_id: m for m in generate_name_macros("root")})
+        macro = make_macro(self.macro_sql)
+        manifest.macros[macro.unique_id] = macro
+        manifest._parsing_info.parse_cache = self.parse_cache
+        self.parse_cache.prepare(manifest)
+        parser = ModelParser(
+            project=self.snowplow_project_config,
+            manifest=manifest,
+            root_project=self.root_project_config,
+        )
+        block = self.file_block_for(MODEL_SQL, "model_1.sql", "models")
+        manifest.files[block.file.file_id] = block.file
+        with mock.patch.object(
+            ModelParser, "render_update", autospec=True, side_effect=ModelParser.render_update
+        ) as render_update:
+            parser.parse_file(block)
+        return manifest, render_update.called
+
+    def test_unchanged_inputs_use_cache(self):
+        manifest, rendered = self.parse()
+        self.assertTrue(rendered)
+        self.assertIn("model.snowplow.model_1", self.parse_cache.state.entries)
+
+        self.root_project_config.cli_vars = {"materialized": "table", "unrelated": 2}
+        cached_manifest, rendered = self.parse()
+        self.assertFalse(rendered)
+
+        node = manifest.nodes["model.snowplow.model_1"]
+        cached_node = cached_manifest.nodes["model.snowplow.model_1"]
+        assertEqualNodes(node, cached_node)
+        self.assertEqual(cached_node.config.materialized, "table")
+        self.assertEqual(cached_node.refs, [["other"]])
+        self.assertEqual(cached_node.depends_on.macros, ["macro.root.my_macro"])
+        source_file = cached_manifest.files[node.file_id]
+        self.assertEqual(source_file.env_vars, ["PARSE_CACHE_TEST_ENV"])
+        self.assertEqual(source_file.vars, ["materialized"])
+        self.assertEqual(cached_manifest.env_vars, manifest.env_vars)
+
+    def test_changed_var_renders(self):
+        self.parse()
+        self.root_project_config.cli_vars = {"materialized": "view"}
+        manifest, rendered = self.parse()
+        self.assertTrue(rendered)
+        self.assertEqual(manifest.nodes["model.snowplow.model_1"].config.materialized, "view")
+
+    def test_changed_env_var_renders(self):
+        self.parse()
+        with mock.patch.dict(os.environ, {"PARSE_CACHE_TEST_ENV": "set"}):
+            manifest, rendered = self.parse()
+        self.assertTrue(rendered)
+        self.assertEqual(manifest.env_vars["PARSE_CACHE_TEST_ENV"], "set")
+
+    def test_changed_macro_renders(self):
+        self.parse()
+        self.macro_sql = "{% macro my_macro() %}2{% endmacro %}"
+        _, rendered = self.parse()
+        self.assertTrue(rendered)
+
+    def test_changed_project_config_renders(self):
+        self.parse()
+        # 'model.config' holds the project configs while the node renders
+        self.root_project_config.models = {"snowplow": {"tags": ["changed"]}}
+        manifest, rendered = self.parse()
+        self.assertTrue(rendered)
+        self.assertEqual(manifest.nodes["model.snowplow.model_1"].config.tags, ["changed"])
+
+    def test_write_and_read(self):
+        manifest, _ = self.parse()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "parse_cache.msgpack")
+            with mock.patch.object(ParseCache, "path", return_value=path):
+                self.parse_cache.write(manifest)
+                read_cache = ParseCache.read(self.root_project_config)
+                self.assertEqual(read_cache.state, self.parse_cache.state)
+
+                # entries written by another dbt version are thrown away
+                with mock.patch("dbt.parser.parse_cache.__version__", "0.0.0"):
+                    read_cache = ParseCache.read(self.root_project_config)
+                self.assertEqual(read_cache.state.entries, {})
+
+                # entries for nodes that no longer exist are pruned
+                manifest.nodes = {}
+                self.parse_cache.write(manifest)
+                read_cache = ParseCache.read(self.root_project_config)
+                self.assertEqual(read_cache.state.entries, {})
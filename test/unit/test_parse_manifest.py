@@ -78,6 +78,42 @@ class TestLoader(unittest.TestCase):
             {'root': self.root_project_config}
         )
 
+    def tearDown(self):
+        self.load_state_check.stop()
+        manifest.set_hot_manifest(None)
+
+    @patch('dbt.flags.PARTIAL_PARSE', True)
+    @patch('dbt.parser.manifest.ManifestLoader.is_partial_parsable', return_value=(True, None))
+    def test_hot_manifest(self, mock_is_partial_parsable):
+        hot_manifest = self._new_manifest()
+        manifest.set_hot_manifest(
+            hot_manifest, unchanged_project_root=self.root_project_config.project_root
+        )
+        loader = manifest.ManifestLoader(
+            self.root_project_config,
+            {'root': self.root_project_config}
+        )
+        self.assertIs(loader.saved_manifest, hot_manifest)
+        self.assertTrue(loader.saved_files_unchanged)
+
+        # the project files aren't read again
+        with patch('dbt.parser.manifest.read_files') as mock_read_files:
+            self.assertIs(loader.load(), hot_manifest)
+        mock_read_files.assert_not_called()
+        self.assertTrue(loader.reused_saved_manifest)
+
+    @patch('dbt.flags.PARTIAL_PARSE', True)
+    @patch('dbt.parser.manifest.ManifestLoader.is_partial_parsable', return_value=(True, None))
+    def test_hot_manifest_changed_files(self, mock_is_partial_parsable):
+        hot_manifest = self._new_manifest()
+        manifest.set_hot_manifest(hot_manifest)
+        loader = manifest.ManifestLoader(
+            self.root_project_config,
+            {'root': self.root_project_config}
+        )
+        self.assertIs(loader.saved_manifest, hot_manifest)
+        self.assertFalse(loader.saved_files_unchanged)
+
     def _new_manifest(self):
         state_check = ManifestStateCheck(MatchingHash(), MatchingHash, [])
         manifest = Manifest({}, {}, {}, {}, {}, {}, [], {})
@@ -0,0 +1,112 @@
+import unittest
+from unittest import mock
+
+from dbt.contracts.files import FileHash, FilePath, SourceFile, ParseFileType
+from dbt.contracts.graph.manifest import Manifest, ParsingInfo
+from dbt.contracts.graph.model_config import NodeConfig
+from dbt.contracts.graph.parsed import DependsOn, ParsedModelNode
+from dbt.node_types import NodeType
+from dbt.parser import workers
+
+
+def make_model(name, enabled=True):
+    return ParsedModelNode(
+        package_name='snowplow',
+        path=f'{name}.sql',
+        original_file_path=f'models/{name}.sql',
+        root_path='/usr/src/app',
+        name=name,
+        resource_type=NodeType.Model,
+        unique_id=f'model.snowplow.{name}',
+        fqn=['snowplow', name],
+        depends_on=DependsOn(),
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        config=NodeConfig(enabled=enabled),
+        language='sql',
+        raw_code='select 1 as id',
+        checksum=FileHash.from_contents(''),
+    )
+
+
+def make_source_file(name):
+    return SourceFile(
+        path=FilePath(
+            searched_path='models',
+            relative_path=f'{name}.sql',
+            modification_time=0.0,
+            project_root='/usr/src/app',
+        ),
+        checksum=FileHash.from_contents(''),
+        project_name='snowplow',
+        parse_file_type=ParseFileType.Model,
+    )
+
+
+class TestUseParseWorkers(unittest.TestCase):
+    def test_disabled_below_two_workers(self):
+        self.assertFalse(workers.use_parse_workers(None, 1000))
+        self.assertFalse(workers.use_parse_workers(0, 1000))
+        self.assertFalse(workers.use_parse_workers(1, 1000))
+
+    def test_disabled_for_few_files(self):
+        self.assertFalse(workers.use_parse_workers(4, workers.MIN_FILES_PER_WORKER))
+
+    def test_disabled_without_fork(self):
+        with mock.patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            self.assertFalse(workers.use_parse_workers(4, 1000))
+
+    @mock.patch('multiprocessing.get_all_start_methods', return_value=['fork', 'spawn'])
+    def test_enabled(self, _):
+        self.assertTrue(workers.use_parse_workers(4, 1000))
+
+
+class TestChunkFileIds(unittest.TestCase):
+    def test_chunks_preserve_order(self):
+        file_ids = [f'file_{i}' for i in range(1000)]
+        chunks = workers.chunk_file_ids(file_ids, 4)
+        self.assertEqual(len(chunks), 4 * workers.CHUNKS_PER_WORKER)
+        self.assertEqual([f for chunk in chunks for f in chunk], file_ids)
+
+    def test_minimum_chunk_size(self):
+        file_ids = [f'file_{i}' for i in range(50)]
+        chunks = workers.chunk_file_ids(file_ids, 8)
+        self.assertEqual([len(c) for c in chunks], [20, 20, 10])
+
+
+class TestMergeChunk(unittest.TestCase):
+    def test_merge_in_file_order(self):
+        manifest = Manifest()
+        manifest._parsing_info = ParsingInfo()
+        files = [make_source_file(name) for name in ('a', 'b')]
+        for source_file in files:
+            manifest.files[source_file.file_id] = source_file
+        a = make_model('a')
+        b = make_model('b', enabled=False)
+        chunk = workers.ParsedChunkResult(
+            file_ids=[f.file_id for f in files],
+            files=[
+                workers.ParsedFileResult(
+                    file_id=files[0].file_id,
+                    nodes=[(True, a)],
+                    env_vars=['MY_VAR'],
+                    manifest_env_vars={'MY_VAR': 'value'},
+                ),
+                workers.ParsedFileResult(
+                    file_id=files[1].file_id, nodes=[(False, b)], env_vars=[]
+                ),
+            ],
+            static_analysis_path_count=2,
+            static_analysis_parsed_path_count=1,
+        )
+        workers.merge_chunk(manifest, mock.MagicMock(), chunk)
+
+        self.assertEqual(list(manifest.nodes), ['model.snowplow.a'])
+        self.assertEqual(manifest.disabled, {'model.snowplow.b': [b]})
+        self.assertEqual(files[0].nodes, ['model.snowplow.a'])
+        self.assertEqual(files[1].nodes, ['model.snowplow.b'])
+        self.assertEqual(files[0].env_vars, ['MY_VAR'])
+        self.assertEqual(manifest.env_vars, {'MY_VAR': 'value'})
+        self.assertEqual(manifest._parsing_info.static_analysis_path_count, 2)
+        self.assertEqual(manifest._parsing_info.static_analysis_parsed_path_count, 1)
@@ -0,0 +1,185 @@
+import os
+import pickle
+import tempfile
+import time
+import unittest
+
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SchemaSourceFile, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.model_config import NodeConfig
+from dbt.contracts.graph.parsed import ParsedModelNode
+from dbt.exceptions import IncompatibleSchemaException
+from dbt.node_types import NodeType
+from dbt.parser.partial_parse_file import (
+    LazySection,
+    read_partial_parse_file,
+    saved_file_checksum,
+    saved_disabled_fqns,
+    saved_file_uses_vars,
+    saved_node_relation,
+    saved_resource_fqns,
+    write_partial_parse_file,
+)
+
+
+def make_model(name, enabled=True):
+    return ParsedModelNode(
+        package_name="my_test",
+        root_path="/users/root/",
+        path=f"{name}.sql",
+        original_file_path=f"models/{name}.sql",
+        language="sql",
+        raw_code="select 1",
+        name=name,
+        resource_type=NodeType.Model,
+        unique_id=f"model.my_test.{name}",
+        fqn=["my_test", "models", name],
+        database="test_db",
+        schema="test_schema",
+        alias=name,
+        checksum=FileHash.from_contents(""),
+        config=NodeConfig(enabled=enabled),
+    )
+
+
+def make_file(name, env_vars=None):
+    return SourceFile(
+        path=FilePath(
+            project_root="/users/root",
+            searched_path="models",
+            relative_path=f"{name}.sql",
+            modification_time=time.time(),
+        ),
+        checksum=FileHash.from_contents(name),
+        project_name="my_test",
+        parse_file_type=ParseFileType.Model,
+        nodes=[f"model.my_test.{name}"],
+        env_vars=env_vars or [],
+    )
+
+
+class TestPartialParseFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "target", "partial_parse.msgpack")
+        schema_file = SchemaSourceFile(
+            path=FilePath(
+                project_root="/users/root",
+                searched_path="models",
+                relative_path="schema.yml",
+                modification_time=time.time(),
+            ),
+            checksum=FileHash.from_contents("schema"),
+            project_name="my_test",
+            parse_file_type=ParseFileType.Schema,
+            dfy={"version": 2, "models": [{"name": "model_one"}]},
+        )
+        schema_file.add_var("my_var", "models", "model_one")
+        files = [make_file("model_one", env_vars=["MY_ENV_VAR"]), make_file("model_two")]
+        files.append(schema_file)
+        self.manifest = Manifest(
+            nodes={n.unique_id: n for n in (make_model("model_one"), make_model("model_two"))},
+            files={f.file_id: f for f in files},
+            disabled={"model.my_test.disabled": [make_model("disabled", enabled=False)]},
+            env_vars={"MY_ENV_VAR": "value"},
+        )
+        self.manifest.state_check.vars_hash = FileHash.from_contents("vars")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_read_is_lazy(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = read_partial_parse_file(self.path)
+
+        self.assertIsInstance(manifest.nodes, LazySection)
+        self.assertEqual(manifest.state_check.to_dict(), self.manifest.state_check.to_dict())
+        self.assertEqual(manifest.env_vars, self.manifest.env_vars)
+        self.assertEqual(list(manifest.nodes), list(self.manifest.nodes))
+        self.assertIn("model.my_test.model_one", manifest.nodes)
+        self.assertEqual(manifest.nodes._values, {})
+
+        # the partial parsing diff only needs the file summaries
+        for file_id, source_file in self.manifest.files.items():
+            self.assertEqual(saved_file_checksum(manifest.files, file_id), source_file.checksum)
+            self.assertEqual(
+                saved_file_uses_vars(manifest.files, file_id, env_vars=True),
+                bool(source_file.env_vars),
+            )
+            self.assertEqual(
+                saved_file_uses_vars(manifest.files, file_id, env_vars=False),
+                bool(source_file.vars),
+            )
+        self.assertEqual(manifest.files._values, {})
+
+        self.assertEqual(manifest.to_dict(), self.manifest.to_dict())
+
+    def test_checks_are_lazy(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = read_partial_parse_file(self.path)
+
+        # the checks of a loaded manifest only need the summaries
+        self.assertEqual(saved_resource_fqns(manifest), self.manifest.get_resource_fqns())
+        self.assertEqual(saved_disabled_fqns(manifest), {("my_test", "models", "disabled")})
+        for unique_id in self.manifest.nodes:
+            self.assertEqual(
+                saved_node_relation(manifest.nodes, unique_id),
+                saved_node_relation(self.manifest.nodes, unique_id),
+            )
+        self.assertEqual(
+            saved_node_relation(manifest.nodes, "model.my_test.model_one"),
+            ("model_one", "test_db", "test_schema", "model_one"),
+        )
+        manifest.build_flat_graph()
+        self.assertEqual(manifest.nodes._values, {})
+        self.assertEqual(manifest.disabled._values, {})
+
+        # the graph has the nodes as they were when it was built
+        flat_nodes = manifest.flat_graph["nodes"]
+        manifest.nodes["model.my_test.model_one"].raw_code = "select 2"
+        self.assertEqual(flat_nodes["model.my_test.model_one"]["raw_code"], "select 1")
+
+        # a looked up node's summary can't be trusted, so the node is used
+        self.assertIsNone(manifest.nodes.summary("model.my_test.model_one"))
+        manifest.nodes["model.my_test.model_one"].alias = "other"
+        self.assertEqual(
+            saved_node_relation(manifest.nodes, "model.my_test.model_one"),
+            ("model_one", "test_db", "test_schema", "other"),
+        )
+
+    def test_rewrite(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = read_partial_parse_file(self.path)
+
+        # a looked up object is serialized again, with its changes
+        manifest.nodes["model.my_test.model_one"].raw_code = "select 2"
+        del manifest.nodes["model.my_test.model_two"]
+        three = make_model("model_three")
+        manifest.nodes[three.unique_id] = three
+        write_partial_parse_file(manifest, self.path)
+
+        # objects that weren't looked up are copied over as they were
+        self.assertIsNotNone(manifest.files.raw(list(manifest.files)[0]))
+
+        manifest = read_partial_parse_file(self.path)
+        self.assertEqual(
+            list(manifest.nodes), ["model.my_test.model_one", "model.my_test.model_three"]
+        )
+        self.assertEqual(manifest.nodes["model.my_test.model_one"].raw_code, "select 2")
+        self.assertEqual(manifest.nodes["model.my_test.model_three"], three)
+        self.assertEqual(manifest.files, self.manifest.files)
+        self.assertEqual(manifest.disabled, self.manifest.disabled)
+
+    def test_pickle(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = read_partial_parse_file(self.path)
+        unpickled = pickle.loads(pickle.dumps(manifest))
+        self.assertIsInstance(unpickled.nodes, dict)
+        self.assertEqual(unpickled.nodes, self.manifest.nodes)
+
+    def test_old_format(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(self.manifest.to_msgpack())
+        with self.assertRaises(IncompatibleSchemaException):
+            read_partial_parse_file(self.path)
@@ -154,3 +154,24 @@ class TestPartialParsing(unittest.TestCase):
         schema_file_model_descriptions = set([model['description'] for model in schema_file.pp_dict['models']])
         expected_model_descriptions = set(['Test model', 'python'])
         self.assertEqual(schema_file_model_descriptions, expected_model_descriptions)
+
+    def test_changed_vars(self):
+        sql_model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        schema_file_id = 'my_test://' + normalize('models/schema.yml')
+        self.saved_files[sql_model_file_id].add_var('a')
+        self.saved_files[schema_file_id].add_var('target.name', 'models', 'python_model')
+
+        # A var that no file used doesn't need any parsing
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, changed_vars=['b'])
+        self.assertTrue(partial_parsing.skip_parsing())
+
+        partial_parsing = PartialParsing(
+            self.saved_manifest, self.new_files, changed_vars=['a', 'target.name']
+        )
+        self.assertFalse(partial_parsing.skip_parsing())
+        self.assertEqual(partial_parsing.file_diff['changed'], [sql_model_file_id])
+        self.assertEqual(partial_parsing.file_diff['changed_schema_files'], [schema_file_id])
+        self.assertEqual(
+            partial_parsing.env_vars_changed_schema_files,
+            {schema_file_id: {'models': ['python_model']}},
+        )
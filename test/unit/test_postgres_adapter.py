@@ -12,7 +12,7 @@ from dbt.adapters.postgres import Plugin as PostgresPlugin
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
-from dbt.exceptions import ValidationException, DbtConfigError
+from dbt.exceptions import ValidationException, DbtConfigError, RuntimeException
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
 
@@ -326,6 +326,55 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_get_catalog_tables(self, mock_get_schemas, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name']
+        mock_execute.side_effect = [
+            agate.Table(rows=[('dbt', 'foo', 'bar')], column_names=column_names),
+            RuntimeException('boom'),
+        ]
+        mock_get_schemas.return_value.items.return_value = [
+            (mock.MagicMock(database='dbt'), {'foo'}),
+            (mock.MagicMock(database='other'), {'foo'}),
+        ]
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('dbt', 'foo')}
+
+        # each information schema's table is yielded on its own
+        exceptions = []
+        with mock.patch.object(flags, 'WARN_ERROR', False):
+            tables = list(self.adapter.get_catalog_tables(mock_manifest, exceptions))
+        self.assertEqual([list(map(tuple, table)) for table in tables], [[('dbt', 'foo', 'bar')]])
+        self.assertEqual([str(exc) for exc in exceptions], ['Runtime Error\n  boom'])
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_database_relations')
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_set_relations_cache_in_one_query(self, mock_get_schemas, mock_execute, mock_link):
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema=schema)
+            for schema in ('foo', 'Bar', 'empty')
+        }
+        mock_execute.return_value = agate.Table(
+            rows=[('postgres', 'a', 'foo', 'table'), ('postgres', 'b', 'Bar', 'view')],
+            column_names=['database', 'name', 'schema', 'type'],
+        )
+
+        self.adapter.set_relations_cache(mock.MagicMock())
+
+        mock_execute.assert_called_once_with('list_relations_in_schemas', kwargs=mock.ANY)
+        kwargs = mock_execute.call_args[1]['kwargs']
+        self.assertEqual(kwargs['schemas'], {'foo', 'bar', 'empty'})
+        self.assertEqual(kwargs['information_schema'].database, 'postgres')
+        self.assertEqual(
+            {(r.schema, r.identifier) for r in self.adapter.cache.get_relations('postgres', 'foo')},
+            {('foo', 'a')},
+        )
+        self.assertEqual(len(self.adapter.cache.get_relations('postgres', 'bar')), 1)
+        self.assertIn(('postgres', 'empty'), self.adapter.cache)
+        mock_link.assert_called_once_with({'foo', 'bar', 'empty'})
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -459,6 +508,39 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
             mock.call('/* dbt */\nalter table "postgres"."test_schema".table_a rename to table_b', None)
         ])
 
+    def test_bulk_load_copies_rows(self):
+        relation = self.adapter.Relation.create(
+            database='postgres',
+            schema='test_schema',
+            identifier='test_table',
+            type='table',
+            quote_policy=self.adapter.config.quoting,
+        )
+        table = agate.Table(
+            [[1, 'a\tb', None], [decimal.Decimal('1E+3'), 'c\\d', True]],
+            ['id', 'name', 'flag'],
+        )
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, fp, size: copied.append(fp.read())
+
+        sql = self.adapter.bulk_load(relation, table, 'id, name, flag')
+
+        self.assertTrue(self.adapter.supports_bulk_load())
+        self.assertEqual(sql, 'copy "postgres"."test_schema".test_table (id, name, flag) from stdin')
+        self.cursor.copy_expert.assert_called_once_with(sql, mock.ANY, size=mock.ANY)
+        self.assertEqual(copied, ['1\ta\\tb\t\\N\n1000\tc\\\\d\tTrue\n'])
+
+    def test_bulk_load_not_inherited(self):
+        class ConnectionManager(PostgresAdapter.ConnectionManager):
+            TYPE = 'redshift'
+
+        class RedshiftAdapter(PostgresAdapter):
+            pass
+
+        RedshiftAdapter.ConnectionManager = ConnectionManager
+        self.assertTrue(PostgresAdapter.supports_bulk_load())
+        self.assertFalse(RedshiftAdapter.supports_bulk_load())
+
     def test_debug_connection_ok(self):
         DebugTask.validate_connection(self.target_dict)
         self.mock_execute.assert_has_calls([
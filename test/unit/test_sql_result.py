@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from dbt.adapters.sql.connections import SQLConnectionManager
 
 class TestProcessSQLResult(unittest.TestCase):
@@ -16,3 +17,12 @@ class TestProcessSQLResult(unittest.TestCase):
 			SQLConnectionManager.process_results(cols_with_more_dupes, rows),
 			[{"a": 1, "a_2": 2, "a_3": 3, "b": 4}]
 		)
+
+	def test_columnar_result(self):
+		cursor = mock.MagicMock()
+		cursor.description = [('a',), ('b',), ('a',)]
+		cursor.fetchall.return_value = [(1, 'x', 3)]
+		table = SQLConnectionManager.get_columnar_result_from_cursor(cursor)
+		self.assertEqual(table.column_names, ('a', 'b', 'a_2'))
+		self.assertEqual(table.columns['a_2'].values(), (3,))
+		self.assertEqual(list(table.rows[0]), [1, 'x', 3])
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from dbt.tests.util import run_dbt, write_file
+
+
+model_sql = """
+select 1 as id
+"""
+
+other_model_sql = """
+{{ config(schema="other") }}
+select 1 as id, 'a' as name
+"""
+
+changed_model_sql = """
+select 1 as id, 2 as amount
+"""
+
+
+def catalog_entries(catalog):
+    return {
+        "nodes": {key: table.to_dict() for key, table in catalog.nodes.items()},
+        "sources": {key: table.to_dict() for key, table in catalog.sources.items()},
+    }
+
+
+class TestDocsGenerateIncremental:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"model.sql": model_sql, "other_model.sql": other_model_sql}
+
+    def test_generate_incremental(self, project):
+        run_dbt(["run"])
+        # there's no previous catalog, so the whole catalog is read
+        full = run_dbt(["docs", "generate", "--incremental"])
+        assert os.path.exists(os.path.join("target", "catalog_versions.json"))
+
+        # nothing changed
+        incremental = run_dbt(["docs", "generate", "--incremental"])
+        assert catalog_entries(incremental) == catalog_entries(full)
+
+        # one model changed, the other's entry is carried forward
+        write_file(changed_model_sql, project.project_root, "models", "model.sql")
+        run_dbt(["run", "--select", "model"])
+        incremental = run_dbt(["docs", "generate", "--incremental"])
+        assert "amount" in incremental.nodes["model.test.model"].columns
+        full = run_dbt(["docs", "generate"])
+        assert catalog_entries(incremental) == catalog_entries(full)
+
+        # a docs generate without --incremental removes the versions, so the
+        # next incremental one reads the whole catalog again
+        assert not os.path.exists(os.path.join("target", "catalog_versions.json"))
+        incremental = run_dbt(["docs", "generate", "--incremental"])
+        assert catalog_entries(incremental) == catalog_entries(full)
@@ -0,0 +1,40 @@
+import pytest
+
+from dbt.tests.util import run_dbt
+
+
+# the sleep keeps the parent running while the child would be compiled ahead
+parent_sql = """
+{{ config(materialized='table') }}
+select {{ var('value', 1) }} as value from (select pg_sleep(1)) as slept
+"""
+
+child_sql = """
+{{ config(materialized='table') }}
+{% if execute %}
+  {% set result = run_query('select value from ' ~ ref('parent')) %}
+  select {{ result.columns[0].values()[0] }} as value
+{% else %}
+  select 0 as value
+{% endif %}
+"""
+
+
+class TestCompileAheadQueriesParents:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"parent.sql": parent_sql, "child.sql": child_sql}
+
+    def child_value(self, project):
+        return project.run_sql(f"select value from {project.test_schema}.child", fetch="one")[0]
+
+    def test_child_sees_rebuilt_parent(self, project):
+        # the parent doesn't exist yet when the child is compiled ahead
+        results = run_dbt(["run", "--compile-ahead", "--threads", "4"])
+        assert len(results) == 2
+        assert self.child_value(project) == 1
+
+        # the parent exists, but with the value from the last run
+        results = run_dbt(["run", "--compile-ahead", "--threads", "4", "--vars", "value: 2"])
+        assert len(results) == 2
+        assert self.child_value(project) == 2
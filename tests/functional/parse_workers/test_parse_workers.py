@@ -0,0 +1,80 @@
+import pytest
+
+from dbt.tests.util import run_dbt, get_manifest
+
+
+MODEL_COUNT = 60
+
+schema_yml = """
+version: 2
+models:
+  - name: model_{i}
+    description: "model {i}"
+    columns:
+      - name: id
+        tests:
+          - unique
+          - not_null
+          - accepted_values:
+              values: [1, 2]
+"""
+
+snapshot_sql = """
+{{% snapshot snapshot_{i} %}}
+{{{{ config(target_schema=schema, unique_key='id', strategy='check', check_cols='all') }}}}
+select * from {{{{ ref('model_{i}') }}}}
+{{% endsnapshot %}}
+"""
+
+
+def model_sql(i):
+    if i == 0:
+        return "select 1 as id"
+    return "{{ config(tags=['tag_%s']) }} select * from {{ ref('model_%s') }}" % (i % 3, i // 2)
+
+
+def scrubbed(manifest):
+    def scrub(value):
+        if isinstance(value, dict):
+            return {
+                k: scrub(v)
+                for k, v in value.items()
+                if k not in ("created_at", "generated_at", "invocation_id")
+            }
+        if isinstance(value, list):
+            return [scrub(v) for v in value]
+        return value
+
+    return scrub(manifest.writable_manifest().to_dict())
+
+
+class TestParseWorkers:
+    @pytest.fixture(scope="class")
+    def models(self):
+        models = {"disabled_model.sql": "{{ config(enabled=false) }} select 1 as id"}
+        for i in range(MODEL_COUNT):
+            models[f"model_{i}.sql"] = model_sql(i)
+            models[f"model_{i}.yml"] = schema_yml.format(i=i)
+        return models
+
+    @pytest.fixture(scope="class")
+    def snapshots(self):
+        return {f"snapshot_{i}.sql": snapshot_sql.format(i=i) for i in range(MODEL_COUNT)}
+
+    @pytest.fixture(scope="class")
+    def tests(self):
+        return {
+            f"singular_{i}.sql": "select * from {{ ref('model_%s') }} where id < 0" % i
+            for i in range(MODEL_COUNT)
+        }
+
+    def test_parse_workers_matches_serial(self, project):
+        run_dbt(["--no-partial-parse", "parse"])
+        serial = get_manifest(project.project_root)
+
+        run_dbt(["--no-partial-parse", "--parse-workers", "2", "parse"])
+        parallel = get_manifest(project.project_root)
+
+        assert len(parallel.nodes) == len(serial.nodes)
+        assert list(parallel.nodes) == list(serial.nodes)
+        assert scrubbed(parallel) == scrubbed(serial)
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from dbt.parser.parse_cache import PARSE_CACHE_FILE_NAME
+from dbt.tests.util import run_dbt, get_manifest, update_config_file, write_file
+
+var_model_sql = """
+{{ config(materialized=var('materialized', 'view')) }}
+select * from {{ ref('model_one') }}
+"""
+
+env_var_model_sql = """
+{{ config(tags=[env_var('TEST_PARSE_CACHE_TAG', 'default')]) }}
+select * from {{ ref('model_one') }}
+"""
+
+project_config_model_sql = """
+{% if model.config.materialized == 'table' %}
+select * from {{ ref('model_one') }}
+{% else %}
+select 1 as fun
+{% endif %}
+"""
+
+
+class TestParseCache:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "model_one.sql": "select 1 as fun",
+            "var_model.sql": var_model_sql,
+            "env_var_model.sql": env_var_model_sql,
+        }
+
+    def test_parse_cache(self, project):
+        run_dbt(["parse", "--vars", "{materialized: table}"])
+        cache_path = os.path.join(project.project_root, "target", PARSE_CACHE_FILE_NAME)
+        assert os.path.exists(cache_path)
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.var_model"].config.materialized == "table"
+
+        # changing vars forces a full reparse, which uses the parse cache
+        run_dbt(["parse", "--vars", "{materialized: incremental}"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.var_model"].config.materialized == "incremental"
+        assert manifest.nodes["model.test.var_model"].refs == [["model_one"]]
+        assert manifest.nodes["model.test.env_var_model"].config.tags == ["default"]
+        assert manifest.nodes["model.test.env_var_model"].refs == [["model_one"]]
+
+        os.environ["TEST_PARSE_CACHE_TAG"] = "from_env"
+        try:
+            run_dbt(["parse", "--vars", "{materialized: table}"])
+        finally:
+            del os.environ["TEST_PARSE_CACHE_TAG"]
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.var_model"].config.materialized == "table"
+        assert manifest.nodes["model.test.env_var_model"].config.tags == ["from_env"]
+
+        # a changed file is rendered again
+        write_file(
+            "{{ config(materialized='view') }} select 2 as fun",
+            project.project_root,
+            "models",
+            "var_model.sql",
+        )
+        run_dbt(["parse", "--vars", "{materialized: incremental}"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.var_model"].config.materialized == "view"
+        assert manifest.nodes["model.test.var_model"].refs == []
+
+
+class TestParseCacheProjectConfig:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "model_one.sql": "select 1 as fun",
+            "config_model.sql": project_config_model_sql,
+        }
+
+    def test_project_config_change(self, project):
+        run_dbt(["parse"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.config_model"].refs == []
+
+        # changing dbt_project.yml forces a full reparse, and the node read
+        # the changed config while it rendered
+        update_config_file(
+            {"models": {"test": {"config_model": {"+materialized": "table"}}}},
+            project.project_root,
+            "dbt_project.yml",
+        )
+        run_dbt(["parse"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.config_model"].config.materialized == "table"
+        assert manifest.nodes["model.test.config_model"].refs == [["model_one"]]
@@ -0,0 +1,71 @@
+import pytest
+
+from dbt.tests.util import run_dbt, get_manifest
+
+model_a_sql = """
+select {{ var('a') }} as a
+"""
+
+model_b_sql = """
+select {{ var('b') }} as b
+"""
+
+model_target_sql = """
+select '{{ target.threads }}' as threads
+"""
+
+schema_yml = """
+version: 2
+models:
+  - name: model_b
+    description: "b is {{ var('c') }}"
+"""
+
+
+class TestPartialParsingChangedVars:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "model_a.sql": model_a_sql,
+            "model_b.sql": model_b_sql,
+            "model_target.sql": model_target_sql,
+            "schema.yml": schema_yml,
+        }
+
+    def test_changed_vars(self, project):
+        run_dbt(["parse", "--vars", "{a: 1, b: 1, c: 1}"])
+        manifest = get_manifest(project.project_root)
+        created_at = {unique_id: node.created_at for unique_id, node in manifest.nodes.items()}
+        model_b_file = manifest.files[manifest.nodes["model.test.model_b"].file_id]
+        assert model_b_file.vars == ["b"]
+        model_target_file = manifest.files[manifest.nodes["model.test.model_target"].file_id]
+        assert model_target_file.vars == ["target.threads"]
+
+        # only the file that used 'a' is reparsed
+        run_dbt(["parse", "--vars", "{a: 2, b: 1, c: 1}"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.model_a"].created_at != created_at["model.test.model_a"]
+        assert manifest.nodes["model.test.model_b"].created_at == created_at["model.test.model_b"]
+        assert (
+            manifest.nodes["model.test.model_target"].created_at
+            == created_at["model.test.model_target"]
+        )
+
+        # a var used in a description reparses the model it describes
+        run_dbt(["parse", "--vars", "{a: 2, b: 1, c: 2}"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.model_b"].description == "b is 2"
+        assert (
+            manifest.nodes["model.test.model_target"].created_at
+            == created_at["model.test.model_target"]
+        )
+
+        # changing the threads only reparses the file that used target.threads
+        created_at_a = manifest.nodes["model.test.model_a"].created_at
+        run_dbt(["parse", "--vars", "{a: 2, b: 1, c: 2}", "--threads", "7"])
+        manifest = get_manifest(project.project_root)
+        assert manifest.nodes["model.test.model_a"].created_at == created_at_a
+        assert (
+            manifest.nodes["model.test.model_target"].created_at
+            != created_at["model.test.model_target"]
+        )
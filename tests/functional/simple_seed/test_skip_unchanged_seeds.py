@@ -0,0 +1,74 @@
+import pytest
+
+from dbt.tests.util import run_dbt, write_file
+
+
+seed_csv = """id,name
+1,Alice
+2,Bob
+"""
+
+changed_seed_csv = """id,name
+1,Alice
+2,Bob
+3,Carol
+"""
+
+
+def seed_messages(results):
+    return {result.node.name: result.message for result in results}
+
+
+class TestSkipUnchangedSeeds:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": seed_csv, "other_seed.csv": seed_csv}
+
+    def row_count(self, project, name):
+        sql = f"select count(*) from {project.test_schema}.{name}"
+        return project.run_sql(sql, fetch="one")[0]
+
+    def test_skip_unchanged_seeds(self, project):
+        results = run_dbt(["--skip-unchanged-seeds", "seed"])
+        assert seed_messages(results) == {"my_seed": "INSERT 2", "other_seed": "INSERT 2"}
+
+        results = run_dbt(["--skip-unchanged-seeds", "seed"])
+        assert seed_messages(results) == {"my_seed": "UNCHANGED", "other_seed": "UNCHANGED"}
+
+        # only the seed whose file changed is reloaded
+        write_file(changed_seed_csv, project.project_root, "seeds", "my_seed.csv")
+        results = run_dbt(["--skip-unchanged-seeds", "seed"])
+        assert seed_messages(results) == {"my_seed": "INSERT 3", "other_seed": "UNCHANGED"}
+        assert self.row_count(project, "my_seed") == 3
+
+        # a dropped seed is loaded again
+        project.run_sql(f"drop table {project.test_schema}.other_seed")
+        results = run_dbt(["--skip-unchanged-seeds", "seed"])
+        assert seed_messages(results) == {"my_seed": "UNCHANGED", "other_seed": "INSERT 2"}
+
+        # without the flag, or with --full-refresh, every seed is loaded
+        results = run_dbt(["seed"])
+        assert seed_messages(results) == {"my_seed": "INSERT 3", "other_seed": "INSERT 2"}
+        results = run_dbt(["--skip-unchanged-seeds", "seed", "--full-refresh"])
+        assert seed_messages(results) == {"my_seed": "CREATE 3", "other_seed": "CREATE 2"}
+
+
+class TestSkipUnchangedSeedsThreads:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {f"seed_{i}.csv": seed_csv for i in range(8)}
+
+    def test_skip_unchanged_seeds_threads(self, project):
+        # the seeds' threads share one checksums table, which is created
+        # before they run
+        results = run_dbt(["--skip-unchanged-seeds", "seed", "--threads", "4"])
+        assert set(seed_messages(results).values()) == {"INSERT 2"}
+
+        results = run_dbt(["--skip-unchanged-seeds", "seed", "--threads", "4"])
+        assert set(seed_messages(results).values()) == {"UNCHANGED"}
+
+        write_file(changed_seed_csv, project.project_root, "seeds", "seed_3.csv")
+        results = run_dbt(["--skip-unchanged-seeds", "build", "--threads", "4"])
+        messages = seed_messages(results)
+        assert messages.pop("seed_3") == "INSERT 3"
+        assert set(messages.values()) == {"UNCHANGED"}
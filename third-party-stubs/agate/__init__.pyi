@@ -2,7 +2,10 @@ from collections.abc import Sequence
 
 from typing import Any, Optional, Callable, Iterable, Dict, Union
 
+from . import csv as csv
 from . import data_types as data_types
+from . import exceptions as exceptions
+from . import utils as utils
 from .data_types import (
     Text as Text,
     Number as Number,
@@ -30,6 +33,18 @@ class MappedSequence(Sequence):
 
 class Row(MappedSequence): ...
 
+class Column(MappedSequence):
+    def __init__(
+        self, index: Any, name: Any, data_type: Any, rows: Any, row_names: Optional[Any] = ...
+    ) -> None: ...
+    @property
+    def index(self): ...
+    @property
+    def name(self): ...
+    @property
+    def data_type(self): ...
+    def values(self): ...
+
 class Table:
     def __init__(
         self,
@@ -0,0 +1,3 @@
+from typing import Any, Iterator, List
+
+def reader(*args: Any, **kwargs: Any) -> Iterator[List[Any]]: ...